@@ -9,16 +9,203 @@
         original database creating a master-slave replication setup.
 
     Usage:
-        mysql_clone.py -c mysql_cfg_master -t mysql_cfg_slave -d path
-            [-n [-r]] [-p path] [-y flavor_id]
-            [-v | -h]
+        mysql_clone.py -c mysql_cfg_master -t mysql_cfg_slave[,...] -d path
+            [-n [-r]] [-j workers [-k chunk_mb] | -e [-l [-b commit_mb]] [-x]]
+            [-s dir_path [-j workers] [-x] | -i] [-f] [-z level] [-p path]
+            [-g host:port -S secret_file] [-m mysql_cfg_replica]
+            [-u rates | -u ctl_file]
+            [-o [-w mysql_cfg_replica[,...]]] [-q cpus[:priority]] [-B]
+            [-H] [-R seconds] [-y flavor_id] [-v | -h]
+        mysql_clone.py -c mysql_cfg_master -d path -a address:port
+            -S secret_file -j workers [-k chunk_mb] [-n [-r]] [-p path]
+            [-y flavor_id]
 
     Arguments:
         -c filename => Source/Master configuration file.  Required arg.
-        -t filename => Clone/Slave configuration file.  Required arg.
+        -t filename[,filename...] => Clone/Slave configuration file.
+            Required arg.  Several clones are separated by commas and are all
+            loaded from a single dump of the source, each by its own load
+            process.  A clone whose load falls behind has the rest of the
+            dump spilled to a file in the temporary directory ($TMPDIR) so
+            it does not hold back the others.  Every clone is set up with
+            the same replication coordinates.  Not used with the -i, -j, -e,
+            -s, -g or -f options.
         -d dir_path => Directory path to config files.  Required arg.
         -n => No replication, create a clone of the master database.
         -r => Remove GTID entries from dump file.  Requires the -n option.
+        -j workers => Dump and load the databases in parallel using this
+            number of workers.  Small databases are packed together into
+            tasks of about the same size, each task is dumped and loaded by a
+            single mysqldump/mysql pair, largest first, and all the tasks are
+            dumped from a single consistent snapshot of the source.  Each
+            task holds a connection to the source for the whole dump, so
+            there are never more tasks than workers.  The binary log and GTID
+            coordinates of the snapshot are used to set up replication.  On
+            MySQL 8.0.26 and above the snapshot is taken under LOCK INSTANCE
+            FOR BACKUP, which does not block the source's writes, and its
+            coordinates are read from performance_schema.log_status
+            (BACKUP_ADMIN privilege).  If a write is committed while the
+            sessions open their snapshots they are opened again, and after 5
+            tries, or if the backup lock is not allowed, FLUSH TABLES WITH
+            READ LOCK is used instead.  The time the lock is held is
+            reported.  The same applies to the -e, -s and -a options.
+        -k chunk_mb => Split databases larger than this size in megabytes
+            into tasks of about this size.  InnoDB tables larger than this
+            size with an integer or temporal leading primary key column are
+            split into primary key ranges and the other tables are batched
+            together.  The smallest of these databases are dumped whole if
+            their tasks do not fit the -j option's workers.  Requires the -j
+            option.
+        -e => Dump the databases with the native dump engine instead of
+            mysqldump.  Rows are streamed from the source and written as
+            insert statements sized to the clone's max_allowed_packet.  The
+            binary log and GTID coordinates of the snapshot are used to set up
+            replication.  Not used with the -j or -s options.
+        -l => Load the databases with the native loader over the clone's
+            connection instead of the mysql program.  The inserts are grouped
+            into large transactions and the rows loaded into each table are
+            reported.  Requires the -e option.
+        -b commit_mb => Size in megabytes of the inserts in each transaction
+            of the native loader.  Default is 64.  Requires the -l option.
+        -s dir_path => Dump each table into a tab separated file in this
+            staging directory and load the files into the clone with LOAD
+            DATA LOCAL INFILE, several times faster than inserts.  The files
+            are loaded in parallel by the -j number of workers (default 4)
+            as they are written and removed once loaded.  The files are
+            dumped from a single consistent snapshot of the source and its
+            binary log and GTID coordinates are used to set up replication.
+            Requires local_infile to be enabled on the clone.
+        -x => Create the tables without their secondary indexes and build
+            the indexes once the data is loaded, with one alter table per
+            table so InnoDB sorts and builds them in a single pass.  The
+            tables are built in parallel by the -j number of workers
+            (default 4) and the time taken is reported.  Unique keys, full
+            text and spatial indexes and the indexes of tables with foreign
+            keys are created with the tables.  Used with the -e or -s option.
+        -f => Apply a bulk load profile to the clone for the length of the
+            load.  The load sessions run without foreign key and unique
+            checks, and without the binary log if the clone has no replicas
+            of its own.  The redo log is flushed once a second instead of at
+            each commit, the binary log is not synced and on MySQL 8.0.21 and
+            above the redo log is disabled.  The settings are restored when
+            the load completes or fails and checked against the replication
+            requirements.  A clone that crashes while its redo log is
+            disabled cannot be recovered, only use on a clone that can be
+            rebuilt.  Not used with the -i option.
+        -z level => Compress the connections of the mysqldump and mysql
+            programs with zstd at this compression level (1 to 22), falling
+            back to zlib if the server or client does not support zstd.  The
+            compression ratio, the bytes of the dump streams over the bytes
+            the source sent to the account of the dump sessions, and the
+            throughput of the dump-load are reported.  The native dump
+            engine's connection (-e and -s options) is not compressed.  Not
+            used with the -i option.
+        -i => Physical clone of the source instance with the MySQL 8 clone
+            plugin (8.0.17 and above) instead of a dump and load.  The clone
+            plugin must be active on both servers, the source user needs the
+            BACKUP_ADMIN privilege and the clone user the CLONE_ADMIN
+            privilege.  The clone is restarted with the source's data,
+            including its users, and must be run under a supervisor (e.g.
+            systemd) that restarts it.  The binary log and GTID position of
+            the copy are used to set up replication.
+        -a address:port => Run as an agent next to the source, listening on
+            this address and port for the clone's receiver (-g option).  The
+            receiver must prove it holds the shared secret of the -S option
+            before anything is sent, a connection that does not is closed and
+            the agent waits for the next one.  The databases are dumped in
+            parallel from a single consistent snapshot as with the -j option
+            and streamed to the receiver over a single connection as
+            compressed, checksummed blocks, one stream per task.  The agent
+            serves one receiver and exits.  The -n and -r options must match
+            the receiver's.  Requires the -j and -S options.
+        -g host:port => Load the databases streamed by the agent (-a option)
+            running on this host and port instead of dumping them from here.
+            The agent must prove it holds the shared secret of the -S option
+            before anything is loaded.  The snapshot coordinates of the agent
+            are used to set up replication.  Requires the -S option.
+            NOTE:  The transport is authenticated but not encrypted, only use
+                it on a trusted network.
+        -S filename => File holding the secret shared by the agent (-a
+            option) and its receiver (-g option).  Each side proves it holds
+            the secret with an HMAC-SHA256 of the other side's random
+            challenge, so the secret is never sent.  The file should only be
+            readable by the user running the program.
+        -m filename => Replica configuration file.  Dump the databases from
+            this replica of the source instead of the source, keeping the
+            long running dump transaction off the source.  The replica's SQL
+            thread is stopped for the length of the dump and restarted once
+            the dump-load completes or fails.  The source coordinates the
+            replica has executed up to (Relay_Master_Log_File and
+            Exec_Master_Log_Pos, or the executed GTID set) are used to set up
+            replication of the clone with the source (-c option).  The
+            replica must replicate directly from the source.  Not used with
+            the -i or -g options.
+        -u rates | ctl_file => Throttle the dump to this many megabytes a
+            second, optionally followed by a comma and a number of rows a
+            second (i.e. 50 or 50,20000, 0 is not limited).  The limits are
+            shared by all of the dump streams.  The megabytes are counted on
+            the mysqldump streams and the native dump engine's inserts (-e
+            option) and the rows on the native dump engine (-e and -s
+            options).  If the value is a file, the rates are read from the
+            file and re-read within a second of the file changing, so the
+            throttle can be changed while the dump runs.  The rates of the
+            dump against the limits and the time spent waiting on the
+            throttle are reported.  Not used with the -i or -g options.
+        -o => Adapt the throttle of the dump to the health of the server
+            being dumped.  Every 5 seconds its Threads_running, row lock
+            waits a second and InnoDB history list length, and the lag of
+            the replicas of the -w option, are sampled.  A reading over its
+            limit halves the rates, a reading over twice its limit pauses
+            the dump and readings all under half of their limits raise the
+            rates by half again, up to the -u option's limits.  The history
+            list only slows the dump down, as the dump's own consistent
+            snapshot keeps it from being purged, and once the dump has been
+            paused for 600 seconds in total it is only slowed down.  Without
+            the -u option the first slow down halves the measured rate, but
+            not under a floor of 5 MB and 5000 rows a second.  Every
+            decision is logged with the readings and the reason.  The limits
+            are set in health_cfg in main: Threads_running 32, row lock
+            waits 10 a second, history list 1000000 and replica lag 60
+            seconds.  Not used with the -i or -g options.
+        -w filename[,filename...] => Replica configuration files.  The lag of
+            these replicas is watched by the -o option.  Requires the -o
+            option.
+        -q cpus[:priority] => Run the dump sessions in a MySQL 8 resource
+            group on the server being dumped, bound to this list of CPUs and
+            at this thread priority (0 to 19, default 19 the lowest), so the
+            dump cannot take the CPUs of the server's workload (i.e. 2-3,
+            2-3,6:10 or :19 for all CPUs).  The group is created or reused
+            as mysql_clone_flavor_id (-y option), the mysqldump sessions and
+            the native dump engine's session (-e and -s options) are moved
+            into it as they connect and it is dropped once the dump
+            completes.  Requires MySQL 8.0.3 and above and the
+            RESOURCE_GROUP_ADMIN privilege, otherwise the dump runs without
+            it.  The thread priority is ignored unless mysqld has the
+            CAP_SYS_NICE capability.  Not used with the -i or -g options.
+        -B => Guard the buffer pool of the server being dumped against the
+            dump's table scans.  The pages in the buffer pool are saved with
+            innodb_buffer_pool_dump_now before the dump starts (the hottest
+            innodb_buffer_pool_dump_pct percent of them, 25 by default) and
+            reloaded with innodb_buffer_pool_load_now once the dump
+            completes or fails, waiting up to 10 minutes for the load before
+            leaving it to complete in the background.  The buffer pool hit
+            ratio is reported up to the dump, during the dump and during the
+            reload.  Not used with the -i option.
+        -H => Warm the buffer pool of each clone once it is loaded, before
+            its replication is started.  The indexes with the most pages in
+            the source's buffer pool are sampled before the dump (from
+            innodb_cached_indexes on MySQL 8, otherwise from a scan of
+            innodb_buffer_page_lru) and read whole on the clone, hottest
+            first and in parallel by the -j option's number of workers (4
+            by default), for as many of them as fit in 75 percent of the
+            clone's buffer pool.  The time taken by the warm phase is
+            reported.  Requires the PROCESS privilege on the source.
+        -R seconds => Number of seconds to wait for the clone's replication
+            IO and SQL threads to start running once the slave is started,
+            default is 60.  The threads are checked after a tenth of a
+            second and then at doubling intervals of up to 5 seconds, and
+            the wait ends early if either thread reports an error.  Not used
+            with the -n option.
         -p dir_path => Directory path to mysql programs.  Only required if the
             mysql binary programs do not run properly.  (i.e. not in the $PATH
             variable.)
@@ -28,6 +215,28 @@
             NOTE:  -v or -h overrides the other options.
 
     Notes:
+        Undo guard:  While the databases are dumped, the InnoDB history list
+            length and the size of the undo tablespaces (MySQL 8.0.14 and
+            above) of the server being dumped are sampled every 10 seconds,
+            as the dump's read view keeps purge from removing old undo.  Over
+            the warn threshold a warning is logged, over the throttle
+            threshold the -u option's rates are halved (checked only with the
+            -u option, the -o option throttles on the history list itself)
+            and over the abort threshold the mysqldump sessions started by
+            the run are killed.  The thresholds are set in undo_cfg in main,
+            0 is not checked:  warn at a history list of 1000000 or 4096 MB
+            of undo, throttle at 2000000 or 8192 MB and abort is off.  The
+            peak readings are reported.
+
+        Snapshot lock:  On MySQL 8.0.26 and above a single clone is dumped
+            from a snapshot taken under LOCK INSTANCE FOR BACKUP, as with the
+            -j option, which needs the BACKUP_ADMIN, SYSTEM_VARIABLES_ADMIN
+            (to raise net_write_timeout) and PROCESS (to see the dump
+            sessions' snapshots) privileges on the source.  Without the
+            SYSTEM_VARIABLES_ADMIN or PROCESS privilege the dump falls back to
+            mysqldump --source-data, which takes FLUSH TABLES WITH READ LOCK.
+            Several clones (-t option) are always dumped with --source-data.
+
         Master and Slave config file format (config/mysql_cfg.py.TEMPLATE):
             # Configuration file for database server:
             user = 'USER'
@@ -89,15 +298,54 @@
 
     Example:
         mysql_clone.py -c master_cfg -t slave_cfg -d config
+        mysql_clone.py -c master_cfg -t slave_cfg -d config -j 8
+        mysql_clone.py -c master_cfg -t slave_cfg -d config -e
+        mysql_clone.py -c master_cfg -t slave_cfg -d config -e -l -b 128
+        mysql_clone.py -c master_cfg -t slave_cfg -d config -s /stage -j 8
+        mysql_clone.py -c master_cfg -t slave_cfg -d config -e -l -x
+        mysql_clone.py -c master_cfg -t slave_cfg -d config -j 8 -f
+        mysql_clone.py -c master_cfg -t slave_cfg -d config -j 8 -z 3
+        mysql_clone.py -c master_cfg -t slave_cfg -d config -i
+        mysql_clone.py -c master_cfg -t slave1_cfg,slave2_cfg -d config
+        mysql_clone.py -c master_cfg -d config -a 10.0.0.1:5000 -S secret -j 8
+        mysql_clone.py -c master_cfg -t slave_cfg -d config -g master:5000 \
+            -S secret
+        mysql_clone.py -c master_cfg -t slave_cfg -d config -m replica_cfg
+        mysql_clone.py -c master_cfg -t slave_cfg -d config -j 8 -u 50,20000
+        mysql_clone.py -c master_cfg -t slave_cfg -d config -j 8 -o -w rep_cfg
+        mysql_clone.py -c master_cfg -t slave_cfg -d config -j 8 -q 2-3:19
+        mysql_clone.py -c master_cfg -t slave_cfg -d config -j 8 -B
+        mysql_clone.py -c master_cfg -t slave_cfg -d config -j 8 -H
+        mysql_clone.py -c master_cfg -t slave_cfg -d config -R 120
 
 """
+# pylint:disable=C0302
 
 # Libraries and Global Variables
 
 # Standard
 import sys
+import os
+import re
 import subprocess
 import time
+import json
+import io
+import stat
+import errno
+import queue
+import zlib
+import socket
+import struct
+import tempfile
+import threading
+import collections
+import decimal
+import datetime
+import functools
+import hmac
+import hashlib
+import concurrent.futures
 
 # Local
 try:
@@ -116,6 +364,34 @@ except (ValueError, ImportError) as err:
 
 __version__ = version.__version__
 
+# Data types dumped in hex by the tab separated dump
+BIN_TYPES = [
+    "binary", "varbinary", "tinyblob", "blob", "mediumblob", "longblob",
+    "geometry", "point", "linestring", "polygon", "multipoint",
+    "multilinestring", "multipolygon", "geometrycollection", "geomcollection"]
+
+# Primary key data types split into chunks, ordered the same by the server
+# under any collation and by Python
+CHUNK_TYPES = [
+    "tinyint", "smallint", "mediumint", "int", "bigint", "year", "date",
+    "datetime", "timestamp", "time"]
+
+# InnoDB statistics tables of the mysql schema, merged into the clone's
+# tables the way mysqldump does instead of replacing them
+STATS_TBLS = ["innodb_index_stats", "innodb_table_stats"]
+
+# Privilege the dump user needs to read the definition of a stored object
+OBJ_PRIVS = {
+    "Trigger": "TRIGGER", "Procedure": "SHOW_ROUTINE",
+    "Function": "SHOW_ROUTINE", "Event": "EVENT"}
+
+# Compressed block header: compressed length and CRC32 of the block
+FRAME = struct.Struct(">II")
+
+# Agent transport message header: stream id, message type and length
+MSG = struct.Struct(">IBI")
+MSG_META, MSG_OPEN, MSG_DATA, MSG_END, MSG_DONE, MSG_AUTH = range(6)
+
 
 def help_message():
 
@@ -158,50 +434,4986 @@ def cfg_chk(func_call, cfg_dict):
                 if item == "read_only":
                     print(f"Warning: {item} not set for slave.")
 
-                else:
-                    cfg_flag = False
-                    print(f"Error:  {item} not set correctly.")
+                else:
+                    cfg_flag = False
+                    print(f"Error:  {item} not set correctly.")
+
+        else:
+            cfg_flag = False
+            print("Error:  Missing option in class.")
+
+    return cfg_flag
+
+
+def crt_dump_cmd(server, args, opt_arg_list, opt_dump_list):
+
+    """Function:  crt_dump_cmd
+
+    Description:  Create the database dump command line.
+
+    Arguments:
+        (input) server -> Database server instance
+        (input) args -> ArgParser class instance
+        (input) opt_arg_list -> List of commands to add to cmd line
+        (input) opt_dump_list -> Dictionary of additional options
+        (output) -> Database dump command line
+
+    """
+
+    opt_arg_list = list(opt_arg_list)
+    opt_dump_list = dict(opt_dump_list)
+    dump_args = mysql_libs.crt_cmd(
+        server, args.arg_set_path("-p", cmd="mysqldump"))
+
+    # Add arguments to dump command
+    for arg in opt_arg_list:
+        dump_args = gen_libs.add_cmd(dump_args, arg=arg)
+
+    # Append additional options to command
+    return gen_libs.is_add_cmd(args, dump_args, opt_dump_list)
+
+
+def fetch_algs(server):
+
+    """Function:  fetch_algs
+
+    Description:  Return the compression algorithms the server allows for
+        client connections.  Servers before MySQL 8.0.18 only support zlib.
+
+    Arguments:
+        (input) server -> Database server instance
+        (output) List of compression algorithm names
+
+    """
+
+    if server.version < (8, 0, 18):
+        return ["zlib"]
+
+    return server.col_sql(
+        "select @@global.protocol_compression_algorithms as val")[0][
+            "val"].lower().split(",")
+
+
+def crt_compress(server, prog, level):
+
+    """Function:  crt_compress
+
+    Description:  Return the options that compress a mysql client program's
+        connection to the server with the best algorithm both of them
+        support: zstd at the compression level, zlib or the --compress
+        option of older clients.  No options are returned if they have no
+        algorithm in common.
+
+    Arguments:
+        (input) server -> Database server instance
+        (input) prog -> Path to the mysql client program
+        (input) level -> zstd compression level
+        (output) List of compression options
+
+    """
+
+    algs = fetch_algs(server)
+    proc = subprocess.Popen(                            # pylint:disable=R1732
+        [prog, "--help"], stdout=subprocess.PIPE, stderr=subprocess.DEVNULL,
+        encoding="UTF-8")
+    usage, _ = proc.communicate()
+
+    if "--compression-algorithms" in usage:
+        if "zstd" in algs and "zstd" in usage:
+            return ["--compression-algorithms=zstd",
+                    f"--zstd-compression-level={level}"]
+
+        if "zlib" in algs:
+            return ["--compression-algorithms=zlib"]
+
+    elif "--compress" in usage and "zlib" in algs:
+        return ["--compress"]
+
+    print(f"Warning:  {os.path.basename(prog)} and {server.name} have no"
+          f" compression algorithm in common, not compressed.")
+
+    return []
+
+
+def chk_no_log(clone, args, set_gtid):
+
+    """Function:  chk_no_log
+
+    Description:  Check whether the load can be left out of the clone's
+        binary log.  It can if the loaded data is covered by the source's
+        GTIDs or, with the bulk load profile (-f option), if the clone has
+        no replicas of its own that need the data.
+
+    Arguments:
+        (input) clone -> Destination server instance
+        (input) args -> ArgParser class instance
+        (input) set_gtid -> True|False - Source's GTIDs are set on the clone
+        (output) True|False - Load is not written to the binary log
+
+    """
+
+    if set_gtid:
+        return True
+
+    if not args.arg_exist("-f"):
+        return False
+
+    cmd = "show replicas" if clone.version >= (8, 0, 22) \
+        else "show slave hosts"
+
+    return not clone.col_sql(cmd)
+
+
+def crt_load_cmd(clone, args, no_log):
+
+    """Function:  crt_load_cmd
+
+    Description:  Create the mysql load command line, with the session
+        settings of the bulk load profile (-f option), the binary log
+        turned off for the load session if required and the connection
+        compressed with the -z option.
+
+    Arguments:
+        (input) clone -> Destination server instance
+        (input) args -> ArgParser class instance
+        (input) no_log -> True|False - Do not write the load to the binary log
+        (output) load_cmd -> Database load command line
+
+    """
+
+    load_cmd = mysql_libs.crt_cmd(clone, args.arg_set_path("-p", cmd="mysql"))
+    sess = ["foreign_key_checks=0", "unique_checks=0"] \
+        if args.arg_exist("-f") else []
+
+    if no_log:
+        sess.append("sql_log_bin=0")
+
+    if sess:
+        load_cmd = gen_libs.add_cmd(
+            load_cmd, arg=f"--init-command=SET SESSION {', '.join(sess)}")
+
+    if args.arg_exist("-z"):
+        load_cmd = load_cmd + crt_compress(
+            clone, args.arg_set_path("-p", cmd="mysql"), args.get_val("-z"))
+
+    return load_cmd
+
+
+def fetch_dbs(server, **kwargs):
+
+    """Function:  fetch_dbs
+
+    Description:  Return the list of databases on the server that are part of
+        a clone, excluding the system databases that mysqldump skips with the
+        --all-databases option.
+
+    Arguments:
+        (input) server -> Database server instance
+        (input) **kwargs:
+            sys_dbs -> List of databases to exclude
+        (output) db_list -> List of database names
+
+    """
+
+    sys_dbs = list(kwargs.get(
+        "sys_dbs",
+        ["information_schema", "performance_schema", "sys", "ndbinfo"]))
+
+    return [item["Database"] for item in mysql_libs.fetch_db_dict(server)
+            if item["Database"] not in sys_dbs]
+
+
+def fetch_tbls(server, dbs):
+
+    """Function:  fetch_tbls
+
+    Description:  Return the base tables in the databases along with their
+        size (data and index length) and the leading column of their primary
+        key and its data type, if they have one.
+
+    Arguments:
+        (input) server -> Database server instance
+        (input) dbs -> List of database names
+        (output) List of table dictionaries
+
+    """
+
+    dbs = list(dbs)
+    cmd = "select t.table_schema as db, t.table_name as tbl," \
+          " t.engine as engine, t.table_rows as tbl_rows," \
+          " coalesce(t.data_length, 0) as data_len," \
+          " coalesce(t.data_length, 0) + coalesce(t.index_length, 0)" \
+          " as size, s.column_name as col, c.data_type as col_type" \
+          " from information_schema.tables t" \
+          " left join information_schema.statistics s" \
+          " on s.table_schema = t.table_schema" \
+          " and s.table_name = t.table_name" \
+          " and s.index_name = 'PRIMARY' and s.seq_in_index = 1" \
+          " left join information_schema.columns c" \
+          " on c.table_schema = s.table_schema" \
+          " and c.table_name = s.table_name" \
+          " and c.column_name = s.column_name" \
+          " where t.table_type = 'BASE TABLE'"
+
+    return [row for row in server.col_sql(cmd) if row["db"] in dbs]
+
+
+def pack_items(items, max_size):
+
+    """Function:  pack_items
+
+    Description:  Pack the items into bins of up to the maximum size using
+        first fit decreasing.  Items larger than the maximum size are placed
+        in a bin of their own.
+
+    Arguments:
+        (input) items -> List of dictionaries with a size entry
+        (input) max_size -> Maximum size of a bin
+        (output) List of bins, each a list of items
+
+    """
+
+    bins = []
+
+    for item in sorted(list(items), key=lambda item: -int(item["size"])):
+        for pbin in bins:
+            if pbin["size"] + int(item["size"]) <= max_size:
+                pbin["size"] += int(item["size"])
+                pbin["items"].append(item)
+                break
+
+        else:
+            bins.append({"size": int(item["size"]), "items": [item]})
+
+    return [pbin["items"] for pbin in bins]
+
+
+def spread_items(items, cnt):
+
+    """Function:  spread_items
+
+    Description:  Spread the items over a number of bins, placing the largest
+        item first into the least filled bin.  Bins left empty are dropped.
+
+    Arguments:
+        (input) items -> List of dictionaries with a size entry
+        (input) cnt -> Number of bins
+        (output) List of bins, each a list of items
+
+    """
+
+    bins = [{"size": 0, "items": []} for _ in range(max(cnt, 1))]
+
+    for item in sorted(list(items), key=lambda item: -int(item["size"])):
+        pbin = min(bins, key=lambda pbin: pbin["size"])
+        pbin["size"] += int(item["size"])
+        pbin["items"].append(item)
+
+    return [pbin["items"] for pbin in bins if pbin["items"]]
+
+
+def val_str(val):
+
+    """Function:  val_str
+
+    Description:  Convert a column value into its string form as read by the
+        server.
+
+    Arguments:
+        (input) val -> Column value
+        (output) String form of the value
+
+    """
+
+    if isinstance(val, datetime.timedelta):
+        usecs = abs((val.days * 86400 + val.seconds) * 1000000
+                    + val.microseconds)
+        secs = usecs // 1000000
+
+        return f"{'-' if val.days < 0 else ''}{secs // 3600}:" \
+               f"{secs // 60 % 60:02d}:{secs % 60:02d}.{usecs % 1000000:06d}"
+
+    if isinstance(val, (set, frozenset)):
+        return ",".join(sorted(val))
+
+    # The exponent form of a decimal is read as an approximate value
+    if isinstance(val, decimal.Decimal):
+        return format(val, "f")
+
+    return str(val)
+
+
+def sql_lit(val):
+
+    """Function:  sql_lit
+
+    Description:  Convert a column value into a SQL literal.
+
+    Arguments:
+        (input) val -> Column value
+        (output) SQL literal string
+
+    """
+
+    if val is None:
+        return "NULL"
+
+    if isinstance(val, decimal.Decimal):
+        return val_str(val)
+
+    if isinstance(val, (int, float)) and not isinstance(val, bool):
+        return str(val)
+
+    if isinstance(val, (bytes, bytearray)):
+        return "0x" + bytes(val).hex() if val else "''"
+
+    return "'" + val_str(val).replace("\\", "\\\\").replace(
+        "'", "\\'").replace("\0", "\\0") + "'"
+
+
+def tsv_val(val, **kwargs):
+
+    """Function:  tsv_val
+
+    Description:  Convert a column value into a field of a tab separated file
+        in the default LOAD DATA format.  Byte values are written as they
+        are, so bytes that are not valid UTF-8 fail the load instead of
+        being replaced.
+
+    Arguments:
+        (input) val -> Column value
+        (input) **kwargs:
+            hexed -> True|False - Write the value in hex
+        (output) Field bytes
+
+    """
+
+    if val is None:
+        return b"\\N"
+
+    if isinstance(val, (bytes, bytearray)):
+        val = bytes(val)
+
+    else:
+        val = val_str(val).encode("UTF-8")
+
+    if kwargs.get("hexed", False):
+        return val.hex().encode("ascii")
+
+    return val.replace(b"\\", b"\\\\").replace(b"\t", b"\\t").replace(
+        b"\n", b"\\n").replace(b"\r", b"\\r").replace(b"\0", b"\\0")
+
+
+def sql_ident(name):
+
+    """Function:  sql_ident
+
+    Description:  Quote a database object name as a SQL identifier.
+
+    Arguments:
+        (input) name -> Object name
+        (output) Quoted identifier string
+
+    """
+
+    return "`" + str(name).replace("`", "``") + "`"
+
+
+def hist_bounds(server, tbl, cnt):
+
+    """Function:  hist_bounds
+
+    Description:  Return the chunk boundary values from a MySQL 8 histogram on
+        the table's leading primary key column.  Only numeric histograms are
+        used, an empty list is returned if there is no usable histogram.
+
+    Arguments:
+        (input) server -> Database server instance
+        (input) tbl -> Table dictionary
+        (input) cnt -> Number of chunks
+        (output) bounds -> List of boundary values
+
+    """
+
+    tbl = dict(tbl)
+    bounds = []
+    cmd = "select histogram from information_schema.column_statistics" \
+          " where schema_name = %s and table_name = %s and column_name = %s"
+    data = server.col_sql(cmd, params=(tbl["db"], tbl["tbl"], tbl["col"])) \
+        if server.version >= (8, 0, 0) else []
+
+    if not data:
+        return bounds
+
+    hist = data[0]["histogram"]
+
+    if isinstance(hist, (bytes, str)):
+        hist = json.loads(hist)
+
+    # Equi-height buckets: [lower, upper, cum_freq, ndv], singleton: [val, cum]
+    points = [(bucket[1], bucket[2]) if len(bucket) == 4
+              else (bucket[0], bucket[1])
+              for bucket in hist.get("buckets", [])]
+
+    if not points or not all(
+            isinstance(val, (int, float)) for val, _ in points):
+        return bounds
+
+    for cnt_idx in range(1, cnt):
+        bounds.append(next(
+            val for val, freq in points + [(points[-1][0], 1.0)]
+            if freq >= float(cnt_idx) / cnt))
+
+    return bounds
+
+
+def range_rows(server, tbl, val):
+
+    """Function:  range_rows
+
+    Description:  Return the optimizer's estimate of the number of rows with
+        a leading primary key value below a value.  The estimate comes from
+        dives into the primary key index and does not read the table.
+
+    Arguments:
+        (input) server -> Database server instance
+        (input) tbl -> Table dictionary
+        (input) val -> Primary key value
+        (output) Estimated number of rows
+
+    """
+
+    return int(server.col_sql(
+        f"explain select 1 from {sql_ident(tbl['db'])}.{sql_ident(tbl['tbl'])}"
+        f" force index (primary) where {sql_ident(tbl['col'])} <"
+        f" {sql_lit(val)}")[0]["rows"] or 0)
+
+
+def mid_val(low, high):
+
+    """Function:  mid_val
+
+    Description:  Return the value halfway between two integer or temporal
+        values, rounded down.
+
+    Arguments:
+        (input) low -> Lower value
+        (input) high -> Higher value
+        (output) Middle value
+
+    """
+
+    if isinstance(low, int):
+        return low + (high - low) // 2
+
+    return low + (high - low) / 2
+
+
+def fetch_bounds(server, tbl, cnt, **kwargs):
+
+    """Function:  fetch_bounds
+
+    Description:  Return the primary key values that split a table into
+        chunks with roughly the same number of rows.  The values come from a
+        histogram if available, otherwise each one is found by a binary
+        search between the lowest and highest key on the optimizer's
+        estimate of the rows below it, so skewed keys still give evenly
+        sized chunks without the table being read.  Only used for integer
+        and temporal keys, whose order is the same in the server and here.
+
+    Arguments:
+        (input) server -> Database server instance
+        (input) tbl -> Table dictionary
+        (input) cnt -> Number of chunks
+        (input) **kwargs:
+            tolerance -> Fraction of a chunk the estimate may be off by
+        (output) bounds -> Sorted list of unique boundary values
+
+    """
+
+    tbl = dict(tbl)
+    bounds = hist_bounds(server, tbl, cnt)
+
+    if bounds:
+        return sorted(set(bounds))
+
+    col = sql_ident(tbl["col"])
+    row = server.col_sql(
+        f"select min({col}) as low, max({col}) as high from"
+        f" {sql_ident(tbl['db'])}.{sql_ident(tbl['tbl'])}")[0]
+
+    if row["low"] is None or row["low"] == row["high"]:
+        return bounds
+
+    total = max(range_rows(server, tbl, row["high"]), 1)
+    slack = total / cnt * kwargs.get("tolerance", 0.05)
+    low = row["low"]
+
+    for idx in range(1, cnt):
+        target = total * idx / cnt
+        high = row["high"]
+
+        while True:
+            mid = mid_val(low, high)
+
+            if mid in [low, high]:
+                break
+
+            rows = range_rows(server, tbl, mid)
+
+            if abs(rows - target) <= slack:
+                high = mid
+                break
+
+            if rows < target:
+                low = mid
+
+            else:
+                high = mid
+
+        bounds.append(high)
+        low = high
+
+    return sorted(set(bounds))
+
+
+def crt_chunks(server, tbl, chunk_size):
+
+    """Function:  crt_chunks
+
+    Description:  Create the data tasks that dump and load a large table in
+        primary key ranges.
+
+    Arguments:
+        (input) server -> Database server instance
+        (input) tbl -> Table dictionary
+        (input) chunk_size -> Size of each chunk in bytes
+        (output) tasks -> List of chunk task dictionaries
+
+    """
+
+    tbl = dict(tbl)
+    col = sql_ident(tbl["col"])
+    bounds = fetch_bounds(
+        server, tbl, max(1, -(-int(tbl["data_len"]) // chunk_size)))
+    wheres = [f"{col} < {sql_lit(bounds[0])}"] if bounds else [None]
+    wheres.extend(
+        f"{col} >= {sql_lit(low)} and {col} < {sql_lit(high)}"
+        for low, high in zip(bounds, bounds[1:]))
+
+    if bounds:
+        wheres.append(f"{col} >= {sql_lit(bounds[-1])}")
+
+    # Table locks in the dump would serialize the chunk loads
+    return [{"name": f"{tbl['db']}.{tbl['tbl']}#{idx}", "db": tbl["db"],
+             "tables": [tbl["tbl"]], "phase": 2,
+             "size": int(tbl["size"]) // len(wheres),
+             "args": ["--no-create-info", "--skip-triggers",
+                      "--skip-routines", "--skip-events", "--skip-add-locks"]
+             + ([f"--where={where}"] if where else []),
+             "load_args": [f"--database={tbl['db']}"]}
+            for idx, where in enumerate(wheres)]
+
+
+def crt_tasks(server, args):                            # pylint:disable=R0914
+
+    """Function:  crt_tasks
+
+    Description:  Create the list of parallel dump-load tasks.  Databases
+        larger than the chunk size (-k option) are split into a schema task,
+        chunk tasks for the InnoDB tables larger than the chunk size with an
+        integer or temporal leading primary key column, batch tasks packing
+        the remaining tables into tasks of about the chunk size and a
+        triggers task, loaded in that order of phases so the triggers do not
+        fire while the data is loaded.  The routines and events of a split
+        database are dumped only once, by its triggers task.  The other
+        databases are packed into tasks of about the same size so the dump
+        and load process startup is paid per task and not per database.  As
+        each task holds a dump session on the source for the whole dump,
+        there are no more tasks than workers (-j option): the smallest split
+        databases are dumped whole until the split tasks fit and the other
+        databases are spread over the workers left.  The tasks in each phase
+        are ordered largest first so the workers finish at about the same
+        time.
+
+    Arguments:
+        (input) server -> Database server instance
+        (input) args -> ArgParser class instance
+        (output) tasks -> List of task dictionaries
+
+    """
+
+    dbs = fetch_dbs(server)
+    chunk_size = int(args.get_val("-k", def_val=0)) * 1024 * 1024
+    workers = int(args.get_val("-j", def_val=1))
+    tbls = fetch_tbls(server, dbs)
+    sizes = {dbn: sum(int(tbl["size"]) for tbl in tbls if tbl["db"] == dbn)
+             for dbn in dbs}
+    splits = {dbn: [tbl for tbl in tbls if tbl["db"] == dbn
+                    and tbl["engine"] == "InnoDB"
+                    and tbl["col_type"] in CHUNK_TYPES
+                    and int(tbl["data_len"]) > chunk_size]
+              for dbn in dbs if chunk_size and sizes[dbn] > chunk_size}
+
+    # Most tasks of a split database: schema, chunks, batches and triggers
+    counts = {dbn: 2 + sum(max(1, -(-int(tbl["data_len"]) // chunk_size))
+                           for tbl in big_tbls)
+              + len(pack_items([tbl for tbl in tbls if tbl["db"] == dbn
+                                and tbl not in big_tbls], chunk_size))
+              for dbn, big_tbls in splits.items()}
+
+    for dbn in sorted(counts, key=lambda dbn: sizes[dbn]):
+        if sum(counts.values()) + (len(counts) < len(dbs)) <= workers:
+            break
+
+        del counts[dbn]
+
+    small_dbs = [{"name": dbn, "size": sizes[dbn]} for dbn in dbs
+                 if dbn not in counts]
+    tasks = []
+
+    for dbn in counts:
+        db_tbls = [tbl for tbl in tbls if tbl["db"] == dbn]
+        big_tbls = splits[dbn]
+        tasks.append({"name": f"{dbn}:schema", "dbs": [dbn], "phase": 1,
+                      "size": 0, "args": [
+                          "--no-data", "--skip-triggers", "--skip-routines",
+                          "--skip-events"]})
+
+        for tbl in big_tbls:
+            tasks.extend(crt_chunks(server, tbl, chunk_size))
+
+        for idx, batch in enumerate(pack_items(
+                [tbl for tbl in db_tbls if tbl not in big_tbls], chunk_size)):
+            tasks.append({
+                "name": f"{dbn}:batch#{idx}", "db": dbn,
+                "tables": [tbl["tbl"] for tbl in batch], "phase": 2,
+                "size": sum(int(tbl["size"]) for tbl in batch),
+                "args": ["--no-create-info", "--skip-triggers",
+                         "--skip-routines", "--skip-events"],
+                "load_args": [f"--database={dbn}"]})
+
+        tasks.append({
+            "name": f"{dbn}:triggers", "dbs": [dbn], "phase": 3, "size": 0,
+            "args": ["--no-data", "--no-create-info", "--no-create-db",
+                     "--triggers"]})
+
+    slots = workers - sum(counts.values())
+    bins = pack_items(small_dbs, chunk_size) if chunk_size else []
+
+    if not chunk_size or len(bins) > slots:
+        bins = spread_items(small_dbs, slots)
+
+    for idx, pbin in enumerate(bins):
+        tasks.append({
+            "name": pbin[0]["name"] if len(pbin) == 1 else f"bin#{idx}",
+            "dbs": [item["name"] for item in pbin], "phase": 2,
+            "size": sum(item["size"] for item in pbin)})
+
+    # Longest processing time first scheduling within each phase
+    return sorted(tasks, key=lambda task: (task["phase"], -task["size"]))
+
+
+def crt_task_cmd(server, args, opt_arg_list, task, **kwargs):
+
+    """Function:  crt_task_cmd
+
+    Description:  Create the database dump command line for a single parallel
+        task.  The --all-databases option is replaced by the task's options
+        and its list of databases or tables and the GTID purged entry is
+        always excluded from the dump as it is set on the clone once all the
+        tasks have been loaded.
+
+    Arguments:
+        (input) server -> Database server instance
+        (input) args -> ArgParser class instance
+        (input) opt_arg_list -> List of commands to add to cmd line
+        (input) task -> Dictionary of the task to be dumped
+        (input) **kwargs:
+            opt_dump_list -> Dictionary of additional options
+        (output) dump_args -> Database dump command line
+
+    """
+
+    opt_arg_list = [
+        arg for arg in list(opt_arg_list) if arg != "--all-databases"
+        and not arg.startswith(("--source-data=", "--master-data="))]
+    task = dict(task)
+    dump_args = crt_dump_cmd(
+        server, args, opt_arg_list, dict(kwargs.get("opt_dump_list", {})))
+
+    if "--set-gtid-purged=OFF" not in dump_args:
+        dump_args = gen_libs.add_cmd(dump_args, arg="--set-gtid-purged=OFF")
+
+    dump_args = dump_args + task.get("args", [])
+
+    if "dbs" in task:
+        return dump_args + ["--databases"] + task["dbs"]
+
+    return dump_args + [task["db"]] + task["tables"]
+
+
+def wait_snap(server, cnt, lock_time, **kwargs):
+
+    """Function:  wait_snap
+
+    Description:  Wait until the dump sessions have opened their consistent
+        snapshot transactions on the server.
+
+    Arguments:
+        (input) server -> Database server instance
+        (input) cnt -> Number of dump sessions to wait on
+        (input) lock_time -> Server time the global read lock was taken
+        (input) **kwargs:
+            timeout -> Number of seconds to wait before giving up
+        (output) status -> True|False - All snapshots are open
+
+    """
+
+    cmd = "select count(*) as cnt from information_schema.innodb_trx t" \
+          " join information_schema.processlist p" \
+          " on p.id = t.trx_mysql_thread_id" \
+          " where p.user = %s and t.trx_started >= %s" \
+          " and p.id <> connection_id()"
+    end_time = time.time() + kwargs.get("timeout", 60)
+
+    while time.time() < end_time:
+        if int(server.col_sql(cmd, params=(
+                server.sql_user, lock_time))[0]["cnt"]) >= cnt:
+            return True
+
+        time.sleep(0.2)
+
+    return False
+
+
+def load_task(dump_proc, load_cmd, task, **kwargs):
+
+    """Function:  load_task
+
+    Description:  Pipe a dump task process into a load process and wait until
+        both have completed.  With a throttle the dump is relayed into the
+        load process at the throttle's rate.
+
+    Arguments:
+        (input) dump_proc -> Dump process instance for the task
+        (input) load_cmd -> Database load command line
+        (input) task -> Dictionary of the task being loaded
+        (input) **kwargs:
+            throttle -> Throttle class instance
+        (output) status -> True|False - Task loaded successfully
+
+    """
+
+    task = dict(task)
+    load_cmd = list(load_cmd) + task.get("load_args", [])
+    throttle = kwargs.get("throttle")
+    proc = subprocess.Popen(                            # pylint:disable=R1732
+        load_cmd, stdin=subprocess.PIPE if throttle else dump_proc.stdout)
+
+    if throttle:
+        try:
+            relay(dump_proc.stdout, proc.stdin, tick=throttle.take)
+
+        except BrokenPipeError:
+            # Load process exited before the end of the dump
+            dump_proc.kill()
+
+        finally:
+            proc.stdin.close()
+
+    dump_proc.stdout.close()
+    proc.wait()
+    dump_proc.wait()
+
+    if proc.returncode or dump_proc.returncode:
+        print(f"Error:  Task {task['name']} failed: dump rc:"
+              f" {dump_proc.returncode} load rc: {proc.returncode}")
+
+        return False
+
+    return True
+
+
+class SnapshotCoord():                                  # pylint:disable=R0902
+
+    """Class:  SnapshotCoord
+
+    Description:  Coordinates a single consistent snapshot across a number of
+        dump sessions on the source.  A brief lock is taken, the binary log
+        and GTID coordinates are captured, the dump sessions open their
+        consistent snapshot transactions and the lock is then released.  On
+        MySQL 8.0.26 and above the lock is a backup lock, which does not
+        block the source's writes, and the coordinates are read from
+        performance_schema.log_status.  As the writes go on, the snapshots
+        only match the coordinates if none were committed while they were
+        opened, otherwise they are opened again, falling back to a global
+        read lock after a number of tries.
+
+    Methods:
+        __init__
+        lock
+        read_coords
+        wait_sessions
+        settled
+        unlock
+
+    """
+
+    def __init__(self, server, **kwargs):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+            (input) server -> Source server instance
+            (input) **kwargs:
+                timeout -> Seconds to wait for the sessions to open snapshots
+                tries -> Tries under the backup lock before falling back to
+                    the global read lock
+
+        """
+
+        self.server = server
+        self.timeout = kwargs.get("timeout", 60)
+        self.tries = kwargs.get("tries", 5)
+        self.backup = server.version >= (8, 0, 26)
+        self.coords = {}
+        self.lock_time = None
+        self.net_timeout = None
+        self.locked = False
+        self.mode = None
+        self.start = None
+        self.held = 0.0
+
+    def lock(self):
+
+        """Method:  lock
+
+        Description:  Take the backup lock, or the global read lock, on the
+            source and capture the binary log and GTID coordinates of the
+            snapshot.  A backup lock that cannot be taken falls back to the
+            global read lock.  The net_write_timeout raised for the dump
+            sessions is put back if no lock is taken.
+
+        Arguments:
+            (output) coords -> Dictionary of the snapshot coordinates
+
+        """
+
+        # Idle dump sessions must survive until a worker reads from them
+        self.net_timeout = self.server.col_sql(
+            "select @@global.net_write_timeout as val")[0]["val"]
+        self.server.cmd_sql("set global net_write_timeout = 86400")
+
+        try:
+            if self.backup:
+                try:
+                    self.server.cmd_sql("lock instance for backup")
+
+                except Exception as err:                # pylint:disable=W0718
+                    print(f"Warning:  Backup lock not taken, using a global"
+                          f" read lock: {err}")
+                    self.backup = False
+
+            if not self.backup:
+                self.server.cmd_sql("flush tables with read lock")
+
+            self.mode = "backup" if self.backup else "global read"
+            self.locked = True
+
+        finally:
+            # Once locked, unlock restores the timeout
+            if not self.locked:
+                self.server.cmd_sql(
+                    f"set global net_write_timeout = {self.net_timeout}")
+
+        self.start = time.monotonic()
+        self.lock_time = self.server.col_sql("select now() as now")[0]["now"]
+        self.coords = self.read_coords()
+
+        return dict(self.coords)
+
+    def read_coords(self):
+
+        """Method:  read_coords
+
+        Description:  Read the source's binary log and GTID coordinates, from
+            performance_schema.log_status under the backup lock, otherwise
+            from the binary log status.
+
+        Arguments:
+            (output) coords -> Dictionary of the coordinates
+
+        """
+
+        if self.backup:
+            data = self.server.col_sql(
+                "select `local` as val from performance_schema.log_status")
+            data = data[0]["val"] if data else {}
+            data = data if isinstance(data, dict) else json.loads(data)
+
+            return {"file": data["binary_log_file"],
+                    "pos": data["binary_log_position"],
+                    "gtid": data.get("gtid_executed", "").replace("\n", "")} \
+                if data.get("binary_log_file") else {}
+
+        status_cmd = "show binary log status" \
+            if self.server.version >= (8, 2, 0) else "show master status"
+        data = self.server.col_sql(status_cmd)
+
+        return {"file": data[0]["File"], "pos": data[0]["Position"],
+                "gtid": data[0]["Executed_Gtid_Set"].replace("\n", "")} \
+            if data else {}
+
+    def wait_sessions(self, cnt):
+
+        """Method:  wait_sessions
+
+        Description:  Wait until the dump sessions have opened their consistent
+            snapshot transactions while the lock is still held.
+
+        Arguments:
+            (input) cnt -> Number of dump sessions
+            (output) status -> True|False - All snapshots are open
+
+        """
+
+        return wait_snap(
+            self.server, cnt, self.lock_time, timeout=self.timeout)
+
+    def settled(self):
+
+        """Method:  settled
+
+        Description:  Check the snapshots opened since the lock was taken
+            match the coordinates, that is no transaction was committed while
+            they were opened.  Always the case under the global read lock.
+            Once the tries are used up the next lock is the global read lock.
+
+        Arguments:
+            (output) True|False - Snapshots match the coordinates
+
+        """
+
+        if self.mode != "backup" or self.read_coords() == self.coords:
+            return True
+
+        self.tries -= 1
+
+        if self.tries <= 0:
+            print("Warning:  Source writes did not settle under the backup"
+                  " lock, using a global read lock.")
+            self.backup = False
+
+        return False
+
+    def unlock(self):
+
+        """Method:  unlock
+
+        Description:  Release the lock, restore the source's
+            net_write_timeout setting and report how long the lock was held.
+
+        Arguments:
+
+        """
+
+        if self.locked:
+            self.server.cmd_sql(
+                "unlock instance" if self.mode == "backup"
+                else "unlock tables")
+            self.server.cmd_sql(
+                f"set global net_write_timeout = {self.net_timeout}")
+            self.locked = False
+            self.held = time.monotonic() - self.start
+            print(f"Snapshot lock:  {self.mode} lock held"
+                  f" {self.held:.3f} seconds")
+
+
+class LevelCtl():                                       # pylint:disable=R0903
+
+    """Class:  LevelCtl
+
+    Description:  Adapts the compression level of a compressed stream to
+        where its bottleneck is.  If the stream waits on the compressors, or
+        the host has no CPU headroom, the level is lowered.  If the stream
+        waits on the link and there is CPU headroom, the level is raised.
+
+    Methods:
+        __init__
+        update
+
+    """
+
+    def __init__(self, **kwargs):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+            (input) **kwargs:
+                level -> Starting compression level
+                min_level -> Lowest compression level
+                max_level -> Highest compression level
+                interval -> Number of blocks between level changes
+
+        """
+
+        self.min_level = kwargs.get("min_level", 1)
+        self.max_level = kwargs.get("max_level", 9)
+        self.level = min(max(kwargs.get("level", 3), self.min_level),
+                         self.max_level)
+        self.interval = kwargs.get("interval", 16)
+        self.comp_wait = 0.0
+        self.link_wait = 0.0
+        self.cnt = 0
+
+    def update(self, comp_wait, link_wait):
+
+        """Method:  update
+
+        Description:  Record the time a block waited on the compressors and
+            on the link, and change the compression level once every interval
+            of blocks.
+
+        Arguments:
+            (input) comp_wait -> Seconds waited for the block to be compressed
+            (input) link_wait -> Seconds waited for the block to be sent
+            (output) level -> Compression level
+
+        """
+
+        self.comp_wait += comp_wait
+        self.link_wait += link_wait
+        self.cnt += 1
+
+        if self.cnt >= self.interval:
+            headroom = os.getloadavg()[0] < (os.cpu_count() or 1)
+
+            if self.comp_wait > self.link_wait or not headroom:
+                self.level = max(self.level - 1, self.min_level)
+
+            elif self.link_wait > 2 * self.comp_wait:
+                self.level = min(self.level + 1, self.max_level)
+
+            self.comp_wait = self.link_wait = 0.0
+            self.cnt = 0
+
+        return self.level
+
+
+def compress_block(block, level):
+
+    """Function:  compress_block
+
+    Description:  Compress a block into a frame of the compressed stream.
+
+    Arguments:
+        (input) block -> Bytes to compress
+        (input) level -> Compression level
+        (output) Frame of the header and compressed block
+
+    """
+
+    data = zlib.compress(block, level)
+
+    return FRAME.pack(len(data), zlib.crc32(block)) + data
+
+
+def compress_stream(src, **kwargs):
+
+    """Function:  compress_stream
+
+    Description:  Generator that reads a stream in fixed size blocks,
+        compresses the blocks in parallel on a pool of threads and returns
+        the frames in the order of the stream.  The number of blocks read
+        ahead is bounded so memory use does not depend on the stream size and
+        the level controller is told how long each frame waited on the
+        compressors and on the consumer.
+
+    Arguments:
+        (input) src -> Binary file object to read
+        (input) **kwargs:
+            block_size -> Size of the blocks in bytes
+            workers -> Number of compression threads
+            ctl -> LevelCtl class instance
+        (output) frame -> Frame of the header and compressed block
+
+    """
+
+    block_size = kwargs.get("block_size", 1024 * 1024)
+    workers = kwargs.get("workers", os.cpu_count() or 1)
+    ctl = kwargs.get("ctl") or LevelCtl()
+    pending = collections.deque()
+    eof = False
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as pool:
+        while True:
+            while not eof and len(pending) < 2 * workers:
+                block = src.read(block_size)
+                eof = not block
+
+                if block:
+                    pending.append(
+                        pool.submit(compress_block, block, ctl.level))
+
+            if not pending:
+                break
+
+            start = time.time()
+            frame = pending.popleft().result()
+            comp_wait = time.time() - start
+            start = time.time()
+            yield frame
+            ctl.update(comp_wait, time.time() - start)
+
+
+def read_frames(src):
+
+    """Function:  read_frames
+
+    Description:  Generator that reads the frames of a compressed stream and
+        returns the decompressed blocks, checking each block against its
+        checksum.
+
+    Arguments:
+        (input) src -> Binary file object to read
+        (output) block -> Decompressed block
+
+    """
+
+    while True:
+        head = src.read(FRAME.size)
+
+        if not head:
+            break
+
+        if len(head) < FRAME.size:
+            raise ValueError("Truncated frame header in compressed stream")
+
+        length, crc = FRAME.unpack(head)
+        data = src.read(length)
+
+        if len(data) < length:
+            raise ValueError("Truncated frame in compressed stream")
+
+        block = zlib.decompress(data)
+
+        if zlib.crc32(block) != crc:
+            raise ValueError("Checksum mismatch in compressed stream")
+
+        yield block
+
+
+class BufPool():
+
+    """Class:  BufPool
+
+    Description:  Fixed set of recycled buffers.  Taking a buffer blocks while
+        all of them are in use, which bounds the memory of a relay and holds
+        back its reader until the writer catches up.
+
+    Methods:
+        __init__
+        get
+        put
+
+    """
+
+    def __init__(self, **kwargs):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+            (input) **kwargs:
+                count -> Number of buffers
+                size -> Size of each buffer in bytes
+
+        """
+
+        self.count = kwargs.get("count", 8)
+        self.size = kwargs.get("size", 1024 * 1024)
+        self.free = queue.Queue()
+
+        for _ in range(self.count):
+            self.free.put(bytearray(self.size))
+
+    def get(self):
+
+        """Method:  get
+
+        Description:  Take a free buffer, waiting for one to be returned if
+            all of them are in use.
+
+        Arguments:
+            (output) buf -> Buffer
+
+        """
+
+        return self.free.get()
+
+    def put(self, buf):
+
+        """Method:  put
+
+        Description:  Return a buffer to the pool.
+
+        Arguments:
+            (input) buf -> Buffer
+
+        """
+
+        self.free.put(buf)
+
+
+def parse_rates(text):
+
+    """Function:  parse_rates
+
+    Description:  Parse the throttle rates, megabytes a second followed by
+        an optional rows a second separated by a comma.  A rate of 0 is not
+        limited.
+
+    Arguments:
+        (input) text -> Throttle rates, such as "50" or "50,20000"
+        (output) mb_rate -> Megabytes a second
+        (output) row_rate -> Rows a second
+
+    """
+
+    vals = [float(val) if val.strip() else 0.0
+            for val in str(text).strip().split(",")]
+
+    if not 1 <= len(vals) <= 2 \
+       or any(not 0 <= val < float("inf") for val in vals):
+
+        raise ValueError(f"Invalid throttle rates: {text}")
+
+    return vals[0], vals[1] if len(vals) > 1 else 0.0
+
+
+class Throttle():                                       # pylint:disable=R0902
+
+    """Class:  Throttle
+
+    Description:  Token bucket shared by the dump streams, limiting them to
+        a number of megabytes and rows a second.  A stream takes tokens for
+        what it has moved and sleeps off any shortfall, so the streams
+        together keep to the rates.  The rates are either fixed or read from
+        a control file that is checked for changes once a second, so they
+        can be changed while the dump runs.  The rates can be scaled down or
+        the streams paused by a controller.
+
+    Methods:
+        __init__
+        reload
+        scale
+        take
+        report
+
+    """
+
+    def __init__(self, rates, **kwargs):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+            (input) rates -> Throttle rates or name of the control file
+            (input) **kwargs:
+                burst -> Seconds of tokens the buckets hold
+
+        """
+
+        self.ctl_file = rates if os.path.isfile(str(rates)) else None
+        self.mb_rate, self.row_rate = (0.0, 0.0) if self.ctl_file \
+            else parse_rates(rates)
+        self.burst = kwargs.get("burst", 1.0)
+        self.lock = threading.Lock()
+        self.tokens = {"bytes": 0.0, "rows": 0.0}
+        self.totals = {"bytes": 0, "rows": 0}
+        self.waited = 0.0
+        self.ctl_mtime = None
+        self.checked = 0.0
+        self.start = None
+        self.last = None
+        self.end = None
+        self.factor = 1.0
+        self.resume = threading.Event()
+        self.resume.set()
+        self.reload()
+
+    def reload(self):
+
+        """Method:  reload
+
+        Description:  Read the rates from the control file if it has changed
+            since it was last read.  An unreadable or invalid file leaves the
+            rates unchanged.
+
+        Arguments:
+
+        """
+
+        now = time.monotonic()
+
+        if not self.ctl_file or now - self.checked < 1.0:
+            return
+
+        self.checked = now
+
+        try:
+            mtime = os.stat(self.ctl_file).st_mtime
+
+            if mtime == self.ctl_mtime:
+                return
+
+            with open(self.ctl_file, mode="r", encoding="UTF-8") as fhandle:
+                rates = parse_rates(fhandle.read())
+
+        except (OSError, ValueError) as err:
+            print(f"Warning:  Throttle control file not read: {err}")
+            self.ctl_mtime = None
+
+            return
+
+        self.ctl_mtime = mtime
+
+        with self.lock:
+            if rates != (self.mb_rate, self.row_rate):
+                self.mb_rate, self.row_rate = rates
+                print(f"Throttle set to {rates[0]:g} MB/s,"
+                      f" {rates[1]:g} rows/s")
+
+    def scale(self, factor):
+
+        """Method:  scale
+
+        Description:  Scale the rates by a factor, a factor of 0 pausing the
+            streams until the rates are scaled again.
+
+        Arguments:
+            (input) factor -> Fraction of the rates, 0 to 1
+
+        """
+
+        with self.lock:
+            self.factor = factor
+
+        if factor:
+            self.resume.set()
+
+        else:
+            self.resume.clear()
+
+    def take(self, size=0, rows=0):
+
+        """Method:  take
+
+        Description:  Take the tokens for the bytes and rows a stream has
+            moved and sleep until the buckets are back in credit.  A paused
+            stream waits until it is resumed.
+
+        Arguments:
+            (input) size -> Number of bytes moved
+            (input) rows -> Number of rows moved
+
+        """
+
+        self.reload()
+        self.resume.wait()
+        wait = 0.0
+
+        with self.lock:
+            now = time.monotonic()
+            self.start = self.start or now
+            elapsed = now - (self.last or now)
+            self.last = now
+            self.totals["bytes"] += size
+            self.totals["rows"] += rows
+
+            for key, rate, cnt in [
+                    ("bytes", self.mb_rate * 1024 * 1024 * self.factor, size),
+                    ("rows", self.row_rate * self.factor, rows)]:
+
+                if rate:
+                    self.tokens[key] = min(
+                        self.tokens[key] + elapsed * rate,
+                        rate * self.burst) - cnt
+                    wait = max(wait, -self.tokens[key] / rate)
+
+            self.waited += wait
+            self.end = max(self.end or now, now + wait)
+
+        if wait > 0:
+            time.sleep(wait)
+
+    def report(self):
+
+        """Method:  report
+
+        Description:  Return the rates the streams ran at against the
+            limits and the time spent waiting on the throttle.
+
+        Arguments:
+            (output) Report line
+
+        """
+
+        secs = max((self.end or 0.0) - (self.start or 0.0), 0.001)
+        line = []
+
+        for name, total, rate in [
+                ("MB/s", self.totals["bytes"] / 1024 / 1024, self.mb_rate),
+                ("rows/s", self.totals["rows"], self.row_rate)]:
+
+            if total:
+                line.append(f"{total / secs:.1f} {name}" + (
+                    f" of {rate:g} {name} limit"
+                    f" ({100 * total / secs / rate:.0f}%)" if rate else ""))
+
+        return f"Throttle:  {', '.join(line) or 'nothing moved'}," \
+               f" waited {self.waited:.1f} seconds"
+
+
+class HealthCtl():                                      # pylint:disable=R0902
+
+    """Class:  HealthCtl
+
+    Description:  Adapts the throttle of the dump streams to the health of
+        the server being dumped.  A monitor thread samples the server's
+        running threads, row lock waits and InnoDB history list length, and
+        the lag of the watched replicas, once an interval.  A reading over
+        its limit halves the rates, a reading over twice its limit pauses
+        the streams and readings all under half of their limits raise the
+        rates back towards the throttle's own limits.  The history list
+        length never pauses the streams, as the dump's own read view keeps
+        it from being purged, and the total pause time is capped.  Each
+        decision is logged with its reason.
+
+    Methods:
+        __init__
+        sample
+        decide
+        apply
+        run
+        start
+        stop
+
+    """
+
+    def __init__(self, server, throttle, health_cfg, **kwargs):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+            (input) server -> Server instance of the server being dumped
+            (input) throttle -> Throttle class instance
+            (input) health_cfg -> Dictionary of the limits, the interval,
+                the total pause time allowed and the floors of unlimited rates
+            (input) **kwargs:
+                replicas -> List of replica instances whose lag is watched
+
+        """
+
+        health_cfg = dict(health_cfg)
+        self.server = server
+        self.throttle = throttle
+        self.replicas = list(kwargs.get("replicas", []))
+        self.interval = health_cfg.pop("interval", 5)
+        self.max_pause = health_cfg.pop("max_pause", 600)
+        self.floors = {"bytes": health_cfg.pop("floor_mb", 5),
+                       "rows": health_cfg.pop("floor_rows", 5000)}
+        self.limits = health_cfg
+        self.factor = 1.0
+        self.paused = False
+        self.pause_time = 0
+        self.prev = {}
+        self.counts = collections.Counter()
+        self.done = threading.Event()
+        self.thr = threading.Thread(target=self.run, daemon=True)
+
+    def sample(self):
+
+        """Method:  sample
+
+        Description:  Read the health of the server and the lag of the
+            replicas.  The row lock waits are returned a second since the
+            last sample.
+
+        Arguments:
+            (output) readings -> Dictionary of the readings
+
+        """
+
+        data = {row["Variable_name"]: int(row["Value"])
+                for row in self.server.col_sql(
+                    "show global status where variable_name in"
+                    " ('Threads_running', 'Innodb_row_lock_waits')")}
+        now = time.monotonic()
+        waits = data.get("Innodb_row_lock_waits", 0)
+        readings = {
+            "threads_running": data.get("Threads_running", 0),
+            "row_lock_waits": (waits - self.prev["waits"]) / max(
+                now - self.prev["time"], 0.001) if "waits" in self.prev
+            else 0.0,
+            "history_len": int(self.server.col_sql(
+                "select count as val from information_schema.innodb_metrics"
+                " where name = 'trx_rseg_history_len'")[0]["val"])}
+        self.prev.update({"waits": waits, "time": now})
+        lags = []
+
+        for replica in self.replicas:
+            replica.upd_slv_status()
+
+            if replica.secs_behind is not None:
+                lags.append(int(replica.secs_behind))
+
+        if lags:
+            readings["replica_lag"] = max(lags)
+
+        return readings
+
+    def decide(self, readings):
+
+        """Method:  decide
+
+        Description:  Decide how to change the throttle from the readings
+            against their limits.  The history list length does not pause the
+            streams, as the dump's own read view holds it, and a pause is
+            turned into a slow down once the pause time allowed is used up.
+
+        Arguments:
+            (input) readings -> Dictionary of the readings
+            (output) action -> pause|slow|speed|hold
+            (output) reason -> Readings behind the decision
+
+        """
+
+        over = [(key, val, self.limits[key])
+                for key, val in readings.items()
+                if self.limits.get(key) and val >= self.limits[key]]
+        pause = [(key, val, 2 * limit) for key, val, limit in over
+                 if val >= 2 * limit and key != "history_len"]
+        under = all(val < self.limits[key] / 2
+                    for key, val in readings.items() if self.limits.get(key))
+
+        if pause and self.pause_time >= self.max_pause:
+            action = "slow"
+            reason = ", ".join(f"{key} {round(val, 1)} >= {limit}"
+                               for key, val, limit in pause) \
+                + f", paused {self.pause_time} seconds already"
+
+        elif pause or over:
+            action = "pause" if pause else "slow"
+            reason = ", ".join(f"{key} {round(val, 1)} >= {limit}"
+                               for key, val, limit in pause or over)
+
+        elif under and (self.factor < 1.0 or self.paused):
+            action = "speed"
+            reason = "all readings under half of their limits"
+
+        elif under:
+            action = "hold"
+            reason = "all readings under half of their limits, at full rate"
+
+        else:
+            action = "hold"
+            reason = "readings between half of and their limits"
+
+        return action, reason
+
+    def apply(self, action):
+
+        """Method:  apply
+
+        Description:  Change the throttle for a decision.  The first slow
+            down of an unlimited rate limits it to half of the rate measured
+            since the last sample, but not under the rate's floor, so a
+            noisy sample cannot stall the streams.  The time paused is added
+            up against the pause time allowed.
+
+        Arguments:
+            (input) action -> pause|slow|speed|hold
+
+        """
+
+        if action == "slow":
+            self.factor = max(self.factor / 2, 0.05)
+
+            for key, attr, div in [("bytes", "mb_rate", 1024 * 1024),
+                                   ("rows", "row_rate", 1)]:
+                moved = self.throttle.totals[key] \
+                    - self.prev.get(key, self.throttle.totals[key])
+
+                if not getattr(self.throttle, attr):
+                    setattr(self.throttle, attr,
+                            max(moved / div / self.interval / 2,
+                                self.floors[key]) / self.factor)
+
+        elif action == "speed":
+            self.factor = min(self.factor * 1.5, 1.0)
+
+        elif action == "pause":
+            self.pause_time += self.interval
+
+        self.paused = action == "pause"
+        self.throttle.scale(0 if self.paused else self.factor)
+
+    def run(self):
+
+        """Method:  run
+
+        Description:  Sample the health once an interval and apply the
+            decisions until stopped.  A failed sample resumes the streams.
+
+        Arguments:
+
+        """
+
+        while not self.done.wait(self.interval):
+            try:
+                readings = self.sample()
+                action, reason = self.decide(readings)
+
+            except Exception as err:                    # pylint:disable=W0718
+                readings, action, reason = {}, "hold", f"sample failed: {err}"
+
+            self.apply(action)
+            self.prev.update(self.throttle.totals)
+            self.counts[action] += 1
+            vals = ", ".join(
+                f"{key}={round(val, 1)}" for key, val in readings.items())
+            print(f"{time.strftime('%H:%M:%S')} Health:  {action},"
+                  f" rates at {0 if self.paused else self.factor:.0%}:"
+                  f" {reason} ({vals})")
+
+    def start(self):
+
+        """Method:  start
+
+        Description:  Start the monitor thread.
+
+        Arguments:
+
+        """
+
+        self.thr.start()
+
+    def stop(self):
+
+        """Method:  stop
+
+        Description:  Stop the monitor thread, resume the streams and report
+            the decisions taken.
+
+        Arguments:
+
+        """
+
+        self.done.set()
+
+        if self.thr.is_alive():
+            self.thr.join()
+
+        self.throttle.scale(1.0)
+        print(f"Health:  {sum(self.counts.values())} decisions, "
+              + ", ".join(f"{cnt} {action}"
+                          for action, cnt in sorted(self.counts.items())))
+
+
+class UndoGuard():                                      # pylint:disable=R0902
+
+    """Class:  UndoGuard
+
+    Description:  Watches the undo history left behind by the read view of a
+        long dump on the server being dumped.  A watchdog thread samples the
+        InnoDB history list length and the size of the undo tablespaces once
+        an interval and acts on the highest threshold reached: warn, halve
+        the throttle's rates or abort the dump by killing the sessions this
+        run started, which releases the read view.  The throttle threshold
+        is only checked with a throttle to slow down.  The peak readings are
+        reported.
+
+    Methods:
+        __init__
+        sample
+        decide
+        act
+        run
+        start
+        stop
+
+    """
+
+    def __init__(self, server, undo_cfg, **kwargs):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+            (input) server -> Server instance of the server being dumped
+            (input) undo_cfg -> Dictionary of the thresholds and the interval
+            (input) **kwargs:
+                throttle -> Throttle class instance slowed down by the guard
+                sessions -> List of connection ids of the native dump engine
+                pids -> List of the process ids of the run's mysqldump
+                    processes, shared with and added to by the dump
+
+        """
+
+        self.server = server
+        self.throttle = kwargs.get("throttle")
+        self.limits = {level: dict(undo_cfg.get(level, {}))
+                       for level in ["abort", "throttle", "warn"]
+                       if level != "throttle" or self.throttle}
+        self.interval = undo_cfg.get("interval", 10)
+        self.sessions = list(kwargs.get("sessions", []))
+        self.pids = kwargs.get("pids", [])
+        self.level = "ok"
+        self.aborted = False
+        self.peaks = {}
+        self.counts = collections.Counter()
+        self.done = threading.Event()
+        self.thr = threading.Thread(target=self.run, daemon=True)
+
+    def sample(self):
+
+        """Method:  sample
+
+        Description:  Read the history list length and, on MySQL 8.0.14 and
+            above, the size of the undo tablespaces in megabytes, and keep
+            their peaks.
+
+        Arguments:
+            (output) readings -> Dictionary of the readings
+
+        """
+
+        readings = {"history_len": int(self.server.col_sql(
+            "select count as val from information_schema.innodb_metrics"
+            " where name = 'trx_rseg_history_len'")[0]["val"])}
+
+        if self.server.version >= (8, 0, 14):
+            readings["undo_mb"] = int(self.server.col_sql(
+                "select coalesce(sum(file_size), 0) as val"
+                " from information_schema.innodb_tablespaces"
+                " where space_type = 'Undo'")[0]["val"]) / 1024 / 1024
+
+        for key, val in readings.items():
+            self.peaks[key] = max(self.peaks.get(key, val), val)
+
+        return readings
+
+    def decide(self, readings):
+
+        """Method:  decide
+
+        Description:  Return the highest threshold reached by the readings.
+            A threshold of 0 is not checked.
+
+        Arguments:
+            (input) readings -> Dictionary of the readings
+            (output) level -> abort|throttle|warn|ok
+            (output) reason -> Readings over the threshold
+
+        """
+
+        for level, limits in self.limits.items():
+            over = [f"{key} {round(val, 1)} >= {limits[key]}"
+                    for key, val in readings.items()
+                    if limits.get(key) and val >= limits[key]]
+
+            if over:
+                return level, ", ".join(over)
+
+        return "ok", "all readings under their thresholds"
+
+    def act(self, level, reason):
+
+        """Method:  act
+
+        Description:  Act on the level reached.  A change of level is logged,
+            the throttle is halved while at the throttle level or above and
+            restored below it, and the first time the abort level is reached
+            the dump sessions are killed.
+
+        Arguments:
+            (input) level -> abort|throttle|warn|ok
+            (input) reason -> Readings over the threshold
+
+        """
+
+        slow = level in ["abort", "throttle"]
+
+        if self.throttle and slow != (self.level in ["abort", "throttle"]):
+            self.throttle.scale(0.5 if slow else 1.0)
+
+        if level != self.level:
+            print(f"{time.strftime('%H:%M:%S')} Undo guard:  {level}:"
+                  f" {reason}")
+
+        if level == "abort" and not self.aborted:
+            self.aborted = True
+
+            # The native dump engine's session is still used after the dump
+            for sid in self.sessions:
+                self.server.cmd_sql(f"kill query {int(sid)}")
+
+            for row in fetch_dump_ids(self.server, self.pids):
+                self.server.cmd_sql(f"kill {int(row['id'])}")
+
+        self.level = level
+        self.counts[level] += 1
+
+    def run(self):
+
+        """Method:  run
+
+        Description:  Sample the undo history once an interval and act on the
+            thresholds until stopped.  A failed sample is logged when its
+            error changes and leaves the level as it is.
+
+        Arguments:
+
+        """
+
+        error = None
+
+        while not self.done.wait(self.interval):
+            try:
+                self.act(*self.decide(self.sample()))
+                error = None
+
+            except Exception as err:                    # pylint:disable=W0718
+                if str(err) != error:
+                    print(f"Warning:  Undo guard sample failed: {err}")
+
+                error = str(err)
+
+    def start(self):
+
+        """Method:  start
+
+        Description:  Start the watchdog thread.
+
+        Arguments:
+
+        """
+
+        self.thr.start()
+
+    def stop(self):
+
+        """Method:  stop
+
+        Description:  Stop the watchdog thread, restore the throttle and
+            report the peak readings and the levels reached.
+
+        Arguments:
+
+        """
+
+        self.done.set()
+
+        if self.thr.is_alive():
+            self.thr.join()
+
+        if self.throttle and self.level in ["abort", "throttle"]:
+            self.throttle.scale(1.0)
+
+        line = [f"peak {key} {round(val, 1)}"
+                for key, val in self.peaks.items()]
+        line.extend(f"{cnt} {level}"
+                    for level, cnt in sorted(self.counts.items()))
+
+        if self.aborted:
+            line.append("dump aborted")
+
+        print(f"Undo guard:  {', '.join(line) or 'not sampled'}")
+
+
+def fetch_dump_ids(server, pids):
+
+    """Function:  fetch_dump_ids
+
+    Description:  Return the ids of the mysqldump sessions started by this
+        run, found by the client process id they connect with, so the
+        sessions of other programs and runs are left alone.
+
+    Arguments:
+        (input) server -> Database server instance
+        (input) pids -> List of the process ids of the mysqldump processes
+        (output) List of dictionaries of the processlist and thread ids
+
+    """
+
+    if not pids:
+        return []
+
+    return server.col_sql(
+        "select t.processlist_id as id, t.thread_id as thr_id"
+        " from performance_schema.threads t"
+        " join performance_schema.session_connect_attrs a"
+        " on a.processlist_id = t.processlist_id"
+        " join performance_schema.session_connect_attrs p"
+        " on p.processlist_id = t.processlist_id"
+        " where a.attr_name = 'program_name' and a.attr_value = 'mysqldump'"
+        " and p.attr_name = '_pid' and p.attr_value in ("
+        + ", ".join(["%s"] * len(pids)) + ")",
+        params=tuple(str(pid) for pid in pids))
+
+
+def parse_rsc_grp(text):
+
+    """Function:  parse_rsc_grp
+
+    Description:  Parse the resource group of the dump sessions, a CPU list
+        followed by an optional thread priority separated by a colon.  An
+        empty CPU list is not bound to any CPUs and the default priority is
+        the lowest, 19.
+
+    Arguments:
+        (input) text -> Resource group, such as "2-3", "2-3,6:10" or ":19"
+        (output) vcpus -> CPU list, such as "2-3,6"
+        (output) priority -> Thread priority, 0 to 19
+
+    """
+
+    vcpus, _, priority = str(text).strip().partition(":")
+
+    if not re.fullmatch(r"(\d+(-\d+)?(,\d+(-\d+)?)*)?", vcpus) \
+       or not re.fullmatch(r"\d*", priority) \
+       or not 0 <= int(priority or 19) <= 19:
+
+        raise ValueError(f"Invalid resource group: {text}")
+
+    return vcpus, int(priority or 19)
+
+
+class RscGroup():                                       # pylint:disable=R0902
+
+    """Class:  RscGroup
+
+    Description:  MySQL 8 resource group capping the CPU of the dump sessions
+        on the server being dumped.  The group is bound to a list of CPUs
+        and runs its threads at a low priority.  A thread moves the
+        mysqldump sessions started by this run into the group as they
+        connect, and the group is dropped once the dump completes.
+
+    Methods:
+        __init__
+        create
+        assign
+        run
+        start
+        stop
+
+    """
+
+    def __init__(self, server, name, vcpus, priority, **kwargs):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+            (input) server -> Server instance of the server being dumped
+            (input) name -> Name of the resource group
+            (input) vcpus -> CPU list or empty for all CPUs
+            (input) priority -> Thread priority, 0 to 19
+            (input) **kwargs:
+                interval -> Seconds between the checks for new sessions
+                pids -> List of the process ids of the run's mysqldump
+                    processes, shared with and added to by the dump
+
+        """
+
+        self.server = server
+        self.name = name
+        self.vcpus = vcpus
+        self.priority = priority
+        self.interval = kwargs.get("interval", 1)
+        self.pids = kwargs.get("pids", [])
+        self.assigned = set()
+        self.done = threading.Event()
+        self.thr = threading.Thread(target=self.run, daemon=True)
+
+    def create(self):
+
+        """Method:  create
+
+        Description:  Create the resource group, or reuse it with the CPU
+            list and priority if it was left by an earlier run.
+
+        Arguments:
+
+        """
+
+        attrs = (f" vcpu = {self.vcpus}" if self.vcpus else "") \
+            + f" thread_priority = {self.priority}"
+
+        if int(self.server.col_sql(
+                "select count(*) as cnt"
+                " from information_schema.resource_groups"
+                " where resource_group_name = %s",
+                params=(self.name,))[0]["cnt"]):
+
+            self.server.cmd_sql(
+                f"alter resource group {sql_ident(self.name)}{attrs} enable")
+
+        else:
+            self.server.cmd_sql(
+                f"create resource group {sql_ident(self.name)} type = user"
+                f"{attrs}")
+
+    def assign(self):
+
+        """Method:  assign
+
+        Description:  Move the run's mysqldump sessions not yet in the
+            resource group into it.
+
+        Arguments:
+            (output) Number of sessions moved
+
+        """
+
+        ids = [str(row["thr_id"])
+               for row in fetch_dump_ids(self.server, self.pids)
+               if str(row["thr_id"]) not in self.assigned]
+
+        if ids:
+            self.server.cmd_sql(
+                f"set resource group {sql_ident(self.name)}"
+                f" for {', '.join(ids)}")
+            self.assigned.update(ids)
+
+        return len(ids)
+
+    def run(self):
+
+        """Method:  run
+
+        Description:  Move new dump sessions into the resource group once an
+            interval until stopped.  A failed check is retried and its error
+            logged when it changes.
+
+        Arguments:
+
+        """
+
+        error = None
+
+        while not self.done.wait(self.interval):
+            try:
+                self.assign()
+                error = None
+
+            except Exception as err:                    # pylint:disable=W0718
+                if str(err) != error:
+                    print(f"Warning:  Dump sessions not assigned to resource"
+                          f" group {self.name}: {err}")
+
+                error = str(err)
+
+    def start(self):
+
+        """Method:  start
+
+        Description:  Start the assignment thread.
+
+        Arguments:
+
+        """
+
+        self.thr.start()
+
+    def stop(self):
+
+        """Method:  stop
+
+        Description:  Stop the assignment thread, drop the resource group,
+            moving any session still in it back to the default group, and
+            report the sessions assigned.
+
+        Arguments:
+
+        """
+
+        self.done.set()
+
+        if self.thr.is_alive():
+            self.thr.join()
+
+        self.server.cmd_sql(
+            f"drop resource group {sql_ident(self.name)} force")
+        print(f"Resource group:  {self.name} (vcpu {self.vcpus or 'all'},"
+              f" thread priority {self.priority}),"
+              f" {len(self.assigned)} dump sessions assigned")
+
+
+class XferMeter():
+
+    """Class:  XferMeter
+
+    Description:  Measures the bytes the server being dumped sends to the
+        run's dump sessions from the Bytes_sent status of their account, as
+        the server's Bytes_sent counts all of its clients.  The dump
+        sessions connect with the meter's own account, whose status adds up
+        the sessions that have disconnected as well as those still
+        connected, so every session is counted to its end.  Other sessions
+        of the account while the dump runs are counted as well.
+
+    Methods:
+        __init__
+        sample
+        start
+        stop
+
+    """
+
+    def __init__(self, server):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+            (input) server -> Server instance of the server being dumped
+
+        """
+
+        self.server = server
+        self.base = None
+
+    def sample(self):
+
+        """Method:  sample
+
+        Description:  Read the bytes sent to the sessions of the meter's
+            account.
+
+        Arguments:
+            (output) Total bytes sent to the account
+
+        """
+
+        return int(self.server.col_sql(
+            "select coalesce(sum(s.variable_value), 0) as val"
+            " from performance_schema.status_by_account s"
+            " join performance_schema.threads t"
+            " on t.processlist_user = s.user and t.processlist_host = s.host"
+            " where t.processlist_id = connection_id()"
+            " and s.variable_name = 'Bytes_sent'")[0]["val"])
+
+    def start(self):
+
+        """Method:  start
+
+        Description:  Take the reading the bytes sent are measured from.
+
+        Arguments:
+
+        """
+
+        try:
+            self.base = self.sample()
+
+        except Exception as err:                        # pylint:disable=W0718
+            print(f"Warning:  Transfer sample failed: {err}")
+
+    def stop(self):
+
+        """Method:  stop
+
+        Description:  Take the last reading, once the dump sessions have
+            disconnected.
+
+        Arguments:
+            (output) Total bytes sent to the dump sessions
+
+        """
+
+        if self.base is None:
+            return 0
+
+        try:
+            return max(self.sample() - self.base, 0)
+
+        except Exception as err:                        # pylint:disable=W0718
+            print(f"Warning:  Transfer sample failed: {err}")
+
+            return 0
+
+
+def kernel_relay(src_fd, dst_fd, size, tick):
+
+    """Function:  kernel_relay
+
+    Description:  Copy a stream between file descriptors inside the kernel
+        without passing the bytes through user space.  A regular file is
+        copied with sendfile and a pipe with splice.
+
+    Arguments:
+        (input) src_fd -> File descriptor to read
+        (input) dst_fd -> File descriptor to write
+        (input) size -> Maximum number of bytes moved per call
+        (input) tick -> Function called with the number of bytes moved
+        (output) total -> Number of bytes copied or None if the kernel
+            cannot copy between the descriptors
+
+    """
+
+    if stat.S_ISREG(os.fstat(src_fd).st_mode) and hasattr(os, "sendfile"):
+        func = functools.partial(os.sendfile, dst_fd, src_fd, None, size)
+
+    elif hasattr(os, "splice"):
+        func = functools.partial(os.splice, src_fd, dst_fd, size)
+
+    else:
+        return None
+
+    total = 0
+
+    while True:
+        try:
+            cnt = func()                                # pylint:disable=E1111
+
+        except OSError as err:
+            # Descriptors the kernel cannot copy between fail on the first call
+            if total or err.errno not in (errno.EINVAL, errno.ENOSYS):
+                raise
+
+            return None
+
+        if not cnt:
+            break
+
+        total += cnt
+        tick(cnt)
+
+    return total
+
+
+def pool_relay(src_fd, dst_fd, pool, tick):
+
+    """Function:  pool_relay
+
+    Description:  Copy a stream between file descriptors through a pool of
+        recycled buffers.  A reader thread fills the buffers while the
+        calling thread writes them out, and the reader waits when all of the
+        buffers are in use.
+
+    Arguments:
+        (input) src_fd -> File descriptor to read
+        (input) dst_fd -> File descriptor to write
+        (input) pool -> BufPool class instance
+        (input) tick -> Function called with the number of bytes written
+        (output) total -> Number of bytes copied
+
+    """
+
+    filled = queue.Queue()
+    stop = threading.Event()
+
+    def reader():
+        while not stop.is_set():
+            buf = pool.get()
+
+            try:
+                cnt = os.readv(src_fd, [buf])
+
+            except OSError as err:
+                cnt = err
+
+            if stop.is_set():
+                pool.put(buf)
+                break
+
+            filled.put((buf, cnt))
+
+            if isinstance(cnt, OSError) or not cnt:
+                break
+
+    thr = threading.Thread(target=reader, daemon=True)
+    thr.start()
+    total = 0
+
+    try:
+        while True:
+            buf, cnt = filled.get()
+
+            if isinstance(cnt, OSError):
+                pool.put(buf)
+                raise cnt
+
+            if not cnt:
+                pool.put(buf)
+                break
+
+            view = memoryview(buf)[:cnt]
+
+            while view:
+                view = view[os.write(dst_fd, view):]
+
+            pool.put(buf)
+            total += cnt
+            tick(cnt)
+
+    finally:
+        # Return the unwritten buffers so a waiting reader can stop
+        stop.set()
+
+        while not filled.empty():
+            pool.put(filled.get()[0])
+
+    return total
+
+
+def relay(src, dst, **kwargs):
+
+    """Function:  relay
+
+    Description:  Copy a stream from one file to another until the end of the
+        stream.  The kernel moves the bytes where it can (splice between
+        pipes, sendfile from a regular file), otherwise they are copied
+        through a bounded pool of recycled buffers.
+
+    Arguments:
+        (input) src -> File object or descriptor to read
+        (input) dst -> File object or descriptor to write
+        (input) **kwargs:
+            pool -> BufPool class instance
+            tick -> Function called with the number of bytes of each chunk
+        (output) total -> Number of bytes copied
+
+    """
+
+    src_fd = src if isinstance(src, int) else src.fileno()
+    dst_fd = dst if isinstance(dst, int) else dst.fileno()
+    pool = kwargs.get("pool") or BufPool()
+    tick = kwargs.get("tick") or (lambda cnt: None)
+    total = kernel_relay(src_fd, dst_fd, pool.size, tick)
+
+    if total is None:
+        total = pool_relay(src_fd, dst_fd, pool, tick)
+
+    return total
+
+
+def stream_rows(server, cmd, **kwargs):
+
+    """Function:  stream_rows
+
+    Description:  Generator that streams the rows of a query with an
+        unbuffered cursor, so the rows are read from the server as they are
+        consumed and the result set is never held in memory.
+
+    Arguments:
+        (input) server -> Database server instance
+        (input) cmd -> Select statement
+        (input) **kwargs:
+            params -> Parameters for the select statement
+            fetch_size -> Number of rows to fetch at a time
+            throttle -> Throttle class instance
+        (output) row -> Tuple of column values
+
+    """
+
+    fetch_size = kwargs.get("fetch_size", 1000)
+    throttle = kwargs.get("throttle")
+    cur = server.conn.cursor(buffered=False)
+    done = False
+
+    try:
+        cur.execute(cmd, kwargs.get("params"))
+        rows = cur.fetchmany(fetch_size)
+
+        while rows:
+            if throttle:
+                throttle.take(rows=len(rows))
+
+            yield from rows
+            rows = cur.fetchmany(fetch_size)
+
+        done = True
+
+    finally:
+        # An unread result set blocks the connection for the next query
+        while not done and cur.with_rows and cur.fetchmany(fetch_size):
+            pass
+
+        cur.close()
+
+
+def fetch_cols(server, dbn, tbl, **kwargs):
+
+    """Function:  fetch_cols
+
+    Description:  Return the columns of a table that hold data, in table
+        order.  Generated columns are skipped as they cannot be inserted.
+
+    Arguments:
+        (input) server -> Database server instance
+        (input) dbn -> Database name
+        (input) tbl -> Table name
+        (input) **kwargs:
+            types -> True|False - Return (column, data type) tuples
+        (output) List of column names
+
+    """
+
+    cmd = "select column_name as col, data_type as type" \
+          " from information_schema.columns" \
+          " where table_schema = %s and table_name = %s" \
+          " and coalesce(generation_expression, '') = ''" \
+          " order by ordinal_position"
+    data = server.col_sql(cmd, params=(dbn, tbl))
+
+    if kwargs.get("types", False):
+        return [(row["col"], row["type"].lower()) for row in data]
+
+    return [row["col"] for row in data]
+
+
+def crt_inserts(tbl_ref, cols, rows, max_len, **kwargs):
+
+    """Function:  crt_inserts
+
+    Description:  Generator that groups rows into multi-row insert statements
+        of up to the maximum length in bytes.  A row longer than the maximum
+        is placed in a statement of its own.
+
+    Arguments:
+        (input) tbl_ref -> Quoted table name
+        (input) cols -> List of column names
+        (input) rows -> Iterable of row tuples
+        (input) max_len -> Maximum statement length in bytes
+        (input) **kwargs:
+            ignore -> True|False - Skip the rows of duplicate keys
+        (output) stmt -> Insert statement
+
+    """
+
+    verb = "INSERT IGNORE INTO" if kwargs.get("ignore", False) \
+        else "INSERT INTO"
+    prefix = f"{verb} {tbl_ref} ({','.join(map(sql_ident, cols))})" \
+             f" VALUES "
+    stmt_len = len(prefix.encode("UTF-8"))
+    vals = []
+
+    for row in rows:
+        val = "(" + ",".join(map(sql_lit, row)) + ")"
+        val_len = len(val.encode("UTF-8")) + 1
+
+        if vals and stmt_len + val_len > max_len:
+            yield prefix + ",".join(vals)
+            stmt_len = len(prefix.encode("UTF-8"))
+            vals = []
+
+        vals.append(val)
+        stmt_len += val_len
+
+    if vals:
+        yield prefix + ",".join(vals)
+
+
+def crt_obj_stmts(server, obj_type, dbn, name):
+
+    """Function:  crt_obj_stmts
+
+    Description:  Return the statements that recreate a trigger, routine or
+        event under the SQL mode it was created with.  The server returns no
+        definition when the dump user lacks the privilege to read it.
+
+    Arguments:
+        (input) server -> Database server instance
+        (input) obj_type -> Trigger, Procedure, Function or Event
+        (input) dbn -> Database name
+        (input) name -> Object name
+        (output) List of statements
+
+    """
+
+    ref = f"{sql_ident(dbn)}.{sql_ident(name)}"
+    data = server.col_sql(f"show create {obj_type.lower()} {ref}")[0]
+    create = data.get(f"Create {obj_type}",
+                      data.get("SQL Original Statement"))
+
+    if create is None:
+        raise ValueError(
+            f"No definition returned for {obj_type.lower()} {ref}, the dump"
+            f" user needs the {OBJ_PRIVS[obj_type]} privilege")
+
+    return [f"DROP {obj_type.upper()} IF EXISTS {ref}",
+            f"SET SESSION sql_mode = '{data['sql_mode']}'", create,
+            "SET SESSION sql_mode = 'NO_AUTO_VALUE_ON_ZERO'"]
+
+
+def split_indexes(create):
+
+    """Function:  split_indexes
+
+    Description:  Remove the secondary indexes from a create table statement
+        so they can be built after the data is loaded.  Only plain indexes
+        are removed, unique keys are kept as they enforce constraints and
+        may be used as the clustered index, full text and spatial indexes
+        cannot be added together and tables with foreign keys keep all of
+        their indexes.  An index starting with the AUTO_INCREMENT column is
+        kept, as the column must be the first column of an index.
+
+    Arguments:
+        (input) create -> Create table statement from show create table
+        (output) create -> Create table statement without the indexes
+        (output) keys -> List of the index definitions removed
+
+    """
+
+    lines = create.split("\n")
+    autos = [match.group(1) for match in (
+        re.match(r"  `((?:[^`]|``)*)` .* AUTO_INCREMENT\b", line)
+        for line in lines) if match]
+    split = [line for line in lines if line.startswith("  KEY ")
+             and not any(line.split("(", 1)[1].startswith(f"`{col}`")
+                         for col in autos)]
+    keys = [line.strip().rstrip(",") for line in split]
+
+    if not keys or "FOREIGN KEY" in create:
+        return create, []
+
+    end = max(idx for idx, line in enumerate(lines) if line.startswith(")"))
+    defs = [line.rstrip(",") for line in lines[1:end] if line not in split]
+
+    return "\n".join([lines[0], ",\n".join(defs)] + lines[end:]), keys
+
+
+def native_dump_tbl(server, dbn, tbl, max_len, **kwargs):
+
+    """Function:  native_dump_tbl
+
+    Description:  Generator that dumps a table as SQL statements.  The rows
+        are streamed from the server into multi-row insert statements so the
+        memory used does not depend on the size of the table.  A merged
+        table is created only if it is missing from the clone and its rows
+        are inserted alongside the clone's own.
+
+    Arguments:
+        (input) server -> Database server instance
+        (input) dbn -> Database name
+        (input) tbl -> Table name
+        (input) max_len -> Maximum statement length in bytes
+        (input) **kwargs:
+            no_create -> True|False - Skip the table definition
+            no_data -> True|False - Skip the table data
+            where -> Where clause limiting the rows dumped
+            merge -> True|False - Merge the rows into the clone's table
+            triggers -> True|False - Dump the table's triggers
+            deferred -> List to add the statements that build the deferred
+                secondary indexes to, None to create them with the table
+            throttle -> Throttle class instance
+        (output) stmt -> SQL statement
+
+    """
+
+    ref = f"{sql_ident(dbn)}.{sql_ident(tbl)}"
+    deferred = kwargs.get("deferred")
+    throttle = kwargs.get("throttle")
+    merge = kwargs.get("merge", False)
+    yield f"USE {sql_ident(dbn)}"
+
+    if not kwargs.get("no_create", False):
+        create = server.col_sql(f"show create table {ref}")[0]["Create Table"]
+
+        if merge:
+            create = create.replace(
+                "CREATE TABLE ", "CREATE TABLE IF NOT EXISTS ", 1)
+
+        elif deferred is not None:
+            create, keys = split_indexes(create)
+
+            if keys:
+                deferred.append(
+                    f"ALTER TABLE {ref} "
+                    + ", ".join(f"ADD {key}" for key in keys))
+
+        if not merge:
+            yield f"DROP TABLE IF EXISTS {sql_ident(tbl)}"
+
+        yield create
+
+    cols = [] if kwargs.get("no_data", False) \
+        else fetch_cols(server, dbn, tbl)
+
+    if cols:
+        cmd = f"select {','.join(map(sql_ident, cols))} from {ref}"
+
+        if kwargs.get("where"):
+            cmd = f"{cmd} where {kwargs['where']}"
+
+        for stmt in crt_inserts(
+                sql_ident(tbl), cols,
+                stream_rows(server, cmd, throttle=throttle), max_len,
+                ignore=merge):
+
+            if throttle:
+                throttle.take(len(stmt))
+
+            yield stmt
+
+    if kwargs.get("triggers", False):
+        cmd = "select trigger_name as name from information_schema.triggers" \
+              " where event_object_schema = %s and event_object_table = %s" \
+              " order by action_order"
+
+        for row in server.col_sql(cmd, params=(dbn, tbl)):
+            yield from crt_obj_stmts(server, "Trigger", dbn, row["name"])
+
+
+def native_dump(server, dbs, max_len, **kwargs):
+
+    """Function:  native_dump
+
+    Description:  Generator that dumps the databases as SQL statements over
+        the server's connection, in the order mysqldump would.  Views are
+        created as placeholder tables and replaced by the views once all the
+        databases are dumped, so views on other views or databases load.  As
+        with mysqldump, the InnoDB statistics tables of the mysql schema are
+        merged into the clone's instead of replacing them.
+
+    Arguments:
+        (input) server -> Database server instance
+        (input) dbs -> List of database names
+        (input) max_len -> Maximum statement length in bytes
+        (input) **kwargs:
+            ignore -> List of db.table names to skip
+            no_data -> True|False - Skip the table data
+            triggers -> True|False - Dump the triggers
+            routines -> True|False - Dump the stored procedures and functions
+            events -> True|False - Dump the events
+            deferred -> List to add the statements that build the deferred
+                secondary indexes to, None to create them with the tables
+            throttle -> Throttle class instance
+        (output) stmt -> SQL statement
+
+    """
+
+    ignore = list(kwargs.get("ignore", []))
+    cmd = "select table_name as name, table_type as type" \
+          " from information_schema.tables where table_schema = %s" \
+          " order by table_name"
+    views = []
+
+    yield "SET NAMES utf8mb4"
+    yield "SET TIME_ZONE = '+00:00'"
+    yield "SET SESSION sql_mode = 'NO_AUTO_VALUE_ON_ZERO'"
+    yield "SET FOREIGN_KEY_CHECKS = 0"
+    yield "SET UNIQUE_CHECKS = 0"
+
+    for dbn in list(dbs):
+        yield server.col_sql(
+            f"show create database {sql_ident(dbn)}")[0][
+                "Create Database"].replace(
+                    "CREATE DATABASE ", "CREATE DATABASE IF NOT EXISTS ", 1)
+
+        for obj in server.col_sql(cmd, params=(dbn,)):
+            if f"{dbn}.{obj['name']}" in ignore:
+                continue
+
+            if obj["type"] == "VIEW":
+                views.append((dbn, obj["name"]))
+                cols = ",".join(
+                    f"{sql_ident(col)} tinyint"
+                    for col in fetch_cols(server, dbn, obj["name"]))
+                yield f"USE {sql_ident(dbn)}"
+                yield f"DROP TABLE IF EXISTS {sql_ident(obj['name'])}"
+                yield f"DROP VIEW IF EXISTS {sql_ident(obj['name'])}"
+                yield f"CREATE TABLE {sql_ident(obj['name'])} ({cols})"
+
+            else:
+                yield from native_dump_tbl(
+                    server, dbn, obj["name"], max_len,
+                    no_data=kwargs.get("no_data", False),
+                    merge=dbn == "mysql" and obj["name"] in STATS_TBLS,
+                    triggers=kwargs.get("triggers", False),
+                    deferred=kwargs.get("deferred"),
+                    throttle=kwargs.get("throttle"))
+
+        if kwargs.get("routines", False):
+            for row in server.col_sql(
+                    "select routine_name as name, routine_type as type"
+                    " from information_schema.routines"
+                    " where routine_schema = %s", params=(dbn,)):
+                yield from crt_obj_stmts(
+                    server, row["type"].title(), dbn, row["name"])
+
+        if kwargs.get("events", False):
+            for row in server.col_sql(
+                    "select event_name as name from information_schema.events"
+                    " where event_schema = %s", params=(dbn,)):
+                yield from crt_obj_stmts(server, "Event", dbn, row["name"])
+
+    for dbn, view in views:
+        yield f"USE {sql_ident(dbn)}"
+        yield f"DROP TABLE IF EXISTS {sql_ident(view)}"
+        yield server.col_sql(
+            f"show create view {sql_ident(dbn)}.{sql_ident(view)}")[0][
+                "Create View"]
+
+
+def write_stmts(stmts, fhandle):
+
+    """Function:  write_stmts
+
+    Description:  Write SQL statements in the format read by the mysql client.
+        Statements with a body, such as triggers and routines, are written
+        with a different delimiter.
+
+    Arguments:
+        (input) stmts -> Iterable of SQL statements
+        (input) fhandle -> File handle to write to
+        (output) cnt -> Number of statements written
+
+    """
+
+    cnt = 0
+
+    for stmt in stmts:
+        if ";" in stmt \
+           and not stmt.startswith(("INSERT INTO ", "INSERT IGNORE INTO ")):
+            fhandle.write(f"DELIMITER ;;\n{stmt};;\nDELIMITER ;\n")
+
+        else:
+            fhandle.write(f"{stmt};\n")
+
+        cnt += 1
+
+    return cnt
+
+
+def native_cfg(clone, args, opt_arg_list):
+
+    """Function:  native_cfg
+
+    Description:  Return the settings shared by the native dump engine modes:
+        the load command, whether the GTIDs are set on the clone, whether the
+        load is written to its binary log, the maximum statement length and
+        the native_dump options matching the mysqldump options.  Statements
+        are sized to the clone's max_allowed_packet, up to the mysql client's
+        default of 16MB.
+
+    Arguments:
+        (input) clone -> Destination server instance
+        (input) args -> ArgParser class instance
+        (input) opt_arg_list -> List of options to add to dump cmd line
+        (output) cfg -> Dictionary of the native dump settings
+
+    """
+
+    opt_arg_list = list(opt_arg_list)
+    set_gtid = clone.gtid_mode and not args.arg_exist("-r")
+    no_log = chk_no_log(clone, args, set_gtid)
+    cfg = {
+        "load_cmd": crt_load_cmd(clone, args, no_log),
+        "set_gtid": set_gtid,
+        "no_log": no_log,
+        "max_len": min(16 * 1024 * 1024, int(clone.col_sql(
+            "select @@global.max_allowed_packet as val")[0]["val"])) - 1024,
+        "dump_args": {
+            "ignore": ["mysql.general_log", "mysql.slow_log"] + [
+                arg.split("=", 1)[1] for arg in opt_arg_list
+                if arg.startswith("--ignore-table=")],
+            "triggers": "--triggers" in opt_arg_list,
+            "routines": "--routines" in opt_arg_list,
+            "events": "--events" in opt_arg_list}}
+
+    return cfg
+
+
+def native_snap(source):
+
+    """Function:  native_snap
+
+    Description:  Open a consistent snapshot transaction on the source's
+        connection under the snapshot coordinator's lock, for the native dump
+        engine to read from.  The snapshot is opened again if it does not
+        match the coordinates.
+
+    Arguments:
+        (input) source -> Source server instance
+        (output) coords -> Dictionary of the snapshot coordinates
+
+    """
+
+    snap = SnapshotCoord(source)
+
+    # Slow loads stall the stream, dump temporal values in UTC
+    source.cmd_sql("set session net_write_timeout = 86400")
+    source.cmd_sql("set session time_zone = '+00:00'")
+    source.cmd_sql("set session transaction isolation level repeatable read")
+
+    settled = False
+
+    while not settled:
+        try:
+            coords = snap.lock()
+            source.cmd_sql("start transaction with consistent snapshot")
+            settled = snap.settled()
+
+        finally:
+            snap.unlock()
+
+        if not settled:
+            source.cmd_sql("rollback")
+
+    print(f"Snapshot coordinates:  File: {coords.get('file')}"
+          f"  Position: {coords.get('pos')}  GTID: {coords.get('gtid')}")
+
+    return coords
+
+
+def pipe_stmts(load_cmd, stmts):
+
+    """Function:  pipe_stmts
+
+    Description:  Pipe SQL statements into a mysql load process and wait
+        until it has completed.  The load process is killed if the statements
+        are not all written, so a partial dump is not left loaded.
+
+    Arguments:
+        (input) load_cmd -> Database load command line
+        (input) stmts -> Iterable of SQL statements
+        (output) status -> True|False - Statements loaded successfully
+
+    """
+
+    proc = subprocess.Popen(                            # pylint:disable=R1732
+        list(load_cmd), stdin=subprocess.PIPE, encoding="UTF-8")
+    status = True
+
+    try:
+        write_stmts(stmts, proc.stdin)
+        proc.stdin.close()
+
+    except BrokenPipeError:
+        status = False
+
+    except ValueError as err:
+        print(f"Error:  Dump failed: {err}")
+        status = False
+
+    finally:
+        if not proc.stdin.closed:
+            proc.kill()
+
+        proc.wait()
+
+    if proc.returncode:
+        print(f"Error:  Load process failed: rc: {proc.returncode}")
+        status = False
+
+    return status
+
+
+def exec_stmt(load_cmd, stmt):
+
+    """Function:  exec_stmt
+
+    Description:  Run a SQL statement with the mysql program.
+
+    Arguments:
+        (input) load_cmd -> Database load command line
+        (input) stmt -> SQL statement
+        (output) status -> True|False - Statement ran successfully
+
+    """
+
+    proc = subprocess.Popen(                            # pylint:disable=R1732
+        list(load_cmd) + ["-e", stmt])
+    proc.wait()
+
+    if proc.returncode:
+        print(f"Error:  Statement failed: rc: {proc.returncode}: {stmt[:100]}")
+
+        return False
+
+    return True
+
+
+def build_indexes(load_cmd, stmts, workers):
+
+    """Function:  build_indexes
+
+    Description:  Build the deferred secondary indexes, one alter table per
+        table so InnoDB sorts and builds all of a table's indexes in a single
+        pass, with the tables built in parallel by a pool of workers.  The
+        time taken by the index build phase is reported.
+
+    Arguments:
+        (input) load_cmd -> Database load command line
+        (input) stmts -> List of alter table statements
+        (input) workers -> Number of tables to build in parallel
+        (output) status -> True|False - All indexes built successfully
+
+    """
+
+    stmts = list(stmts)
+    start = time.time()
+    print(f"Index build phase:  Building indexes on {len(stmts)} tables")
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as pool:
+        results = list(pool.map(exec_stmt, [load_cmd] * len(stmts), stmts))
+
+    print(f"Index build phase:  Completed in {time.time() - start:.1f}"
+          f" seconds")
+
+    return all(results)
+
+
+def native_load(clone, stmts, **kwargs):     # pylint:disable=R0912,R0914,R0915
+
+    """Function:  native_load
+
+    Description:  Apply SQL statements to the clone over its connection.  The
+        insert statements are grouped into transactions of about the commit
+        size and the number of rows loaded into each table is reported as
+        each table completes.  The session settings changed by the load
+        (foreign_key_checks, unique_checks, the character sets of SET NAMES,
+        time_zone, sql_mode and sql_log_bin) are restored to their values
+        before the load.
+
+    Arguments:
+        (input) clone -> Destination server instance
+        (input) stmts -> Iterable of SQL statements
+        (input) **kwargs:
+            commit_size -> Bytes of inserts per transaction
+            no_log -> True|False - Do not write the load to the binary log
+        (output) status -> True|False - Statements loaded successfully
+        (output) counts -> Dictionary of rows loaded per table
+
+    """
+
+    commit_size = kwargs.get("commit_size", 64 * 1024 * 1024)
+    ident = r"`(?:[^`]|``)+`"
+
+    # Session settings changed by the statements, by the statement prefix
+    settings = {
+        "SET FOREIGN_KEY_CHECKS = ": ["foreign_key_checks"],
+        "SET UNIQUE_CHECKS = ": ["unique_checks"],
+        "SET NAMES ": ["character_set_client", "character_set_results",
+                       "collation_connection"],
+        "SET TIME_ZONE = ": ["time_zone"],
+        "SET SESSION sql_mode = ": ["sql_mode"]}
+    names = [name for items in settings.values() for name in items] \
+        + ["sql_log_bin"]
+    cur = clone.conn.cursor()
+    cur.execute(
+        "select " + ", ".join(f"@@session.{name}" for name in names))
+    prior = dict(zip(names, cur.fetchone()))
+    changed = []
+    counts = {}
+    dbn = tbl = None
+    stmt = ""
+    pending = 0
+    status = True
+
+    if kwargs.get("no_log", False):
+        cur.execute("set session sql_log_bin = 0")
+        changed.append("sql_log_bin")
+
+    try:
+        for stmt in stmts:
+            use = re.match(f"USE ({ident})$", stmt)
+            ins = re.match(f"INSERT (?:IGNORE )?INTO ({ident}) ", stmt)
+
+            for prefix, items in settings.items():
+                if stmt.startswith(prefix):
+                    changed.extend(items)
+
+            if use:
+                dbn = use.group(1)
+
+            elif ins and f"{dbn}.{ins.group(1)}" != tbl:
+                if tbl:
+                    print(f"Loaded {tbl}: {counts[tbl]} rows")
+
+                tbl = f"{dbn}.{ins.group(1)}"
+                counts.setdefault(tbl, 0)
+
+            cur.execute(stmt)
+
+            if ins:
+                counts[tbl] += cur.rowcount
+                pending += len(stmt)
+
+                # Fewer, larger transactions cut the redo log flushes
+                if pending >= commit_size:
+                    clone.conn.commit()
+                    pending = 0
+
+        clone.conn.commit()
+
+        if tbl:
+            print(f"Loaded {tbl}: {counts[tbl]} rows")
+
+    except Exception as err:                            # pylint:disable=W0718
+        clone.conn.rollback()
+        print(f"Error:  Load failed on statement: {stmt[:100]}")
+        print(f"\tMessage:  {err}")
+        status = False
+
+    finally:
+        restore = [
+            f"{name} = {sql_lit(val)}" for name, val in prior.items()
+            if name in changed]
+
+        # A failed restore must not hide the error that ended the load
+        try:
+            if restore:
+                cur.execute("set session " + ", ".join(restore))
+
+        except Exception as err:                        # pylint:disable=W0718
+            print(f"Error:  Session settings not restored: {err}")
+            status = False
+
+        cur.close()
+
+    return status, counts
+
+
+def native_dump_load(source, clone, args, opt_arg_list, **kwargs):
+
+    """Function:  native_dump_load
+
+    Description:  Dumps the databases with the native dump engine from a
+        consistent snapshot of the source and pipes the statements into the
+        mysql load process, or into the native loader with the -l option.
+        The -x option builds the secondary indexes after the data is loaded.
+
+    Arguments:
+        (input) source -> Source server instance
+        (input) clone -> Destination server instance
+        (input) args -> ArgParser class instance
+        (input) opt_arg_list -> List of options to add to dump cmd line
+        (input) **kwargs:
+            throttle -> Throttle class instance
+        (output) status -> True|False - Databases loaded successfully
+        (output) coords -> Dictionary of the snapshot coordinates
+
+    """
+
+    cfg = native_cfg(clone, args, opt_arg_list)
+    deferred = [] if args.arg_exist("-x") else None
+    coords = native_snap(source)
+    stmts = native_dump(
+        source, fetch_dbs(source), cfg["max_len"], deferred=deferred,
+        throttle=kwargs.get("throttle"), **cfg["dump_args"])
+
+    try:
+        if args.arg_exist("-l"):
+            status, _ = native_load(
+                clone, stmts, no_log=cfg["no_log"],
+                commit_size=int(args.get_val("-b", def_val=64)) * 1024 * 1024)
+
+        else:
+            status = pipe_stmts(cfg["load_cmd"], stmts)
+
+    finally:
+        source.cmd_sql("commit")
+
+    if status and deferred:
+        status = build_indexes(
+            cfg["load_cmd"], deferred, int(args.get_val("-j", def_val=4)))
+
+    if cfg["set_gtid"] and coords.get("gtid") and status:
+        clone.cmd_sql(f"set global gtid_purged = '{coords['gtid']}'")
+
+    return status, coords
+
+
+def tab_dump_tbl(server, dbn, tbl, cols, fname, **kwargs):
+
+    """Function:  tab_dump_tbl
+
+    Description:  Write the rows of a table into a tab separated file in the
+        default LOAD DATA format, streaming them from the server.  Binary
+        columns are written in hex and bit columns as their decimal value,
+        both converted back by the load (crt_load_data).
+
+    Arguments:
+        (input) server -> Database server instance
+        (input) dbn -> Database name
+        (input) tbl -> Table name
+        (input) cols -> List of (column, data type) tuples
+        (input) fname -> Name of the file to write
+        (input) **kwargs:
+            throttle -> Throttle class instance
+        (output) cnt -> Number of rows written
+
+    """
+
+    cols = list(cols)
+    hexed = [typ in BIN_TYPES for _, typ in cols]
+    cmd = f"select {','.join(sql_ident(col) for col, _ in cols)}" \
+          f" from {sql_ident(dbn)}.{sql_ident(tbl)}"
+    cnt = 0
+
+    with open(fname, mode="wb") as fhandle:
+        for row in stream_rows(server, cmd, throttle=kwargs.get("throttle")):
+            fhandle.write(b"\t".join(
+                tsv_val(val, hexed=flag) for val, flag in zip(row, hexed))
+                + b"\n")
+            cnt += 1
+
+    return cnt
+
+
+def crt_load_data(dbn, tbl, cols, fname):
+
+    """Function:  crt_load_data
+
+    Description:  Create the statements that load a tab separated file into
+        a table with LOAD DATA LOCAL INFILE, in the session settings of the
+        native dump.
+
+    Arguments:
+        (input) dbn -> Database name
+        (input) tbl -> Table name
+        (input) cols -> List of (column, data type) tuples
+        (input) fname -> Name of the file to load
+        (output) SQL statements separated by semicolons
+
+    """
+
+    fields = []
+    sets = []
+
+    for col, typ in list(cols):
+        if typ in BIN_TYPES or typ == "bit":
+            var = f"@v{len(sets)}"
+            fields.append(var)
+            sets.append(
+                f"{sql_ident(col)} = cast({var} as unsigned)" if typ == "bit"
+                else f"{sql_ident(col)} = unhex({var})")
+
+        else:
+            fields.append(sql_ident(col))
+
+    stmt = f"LOAD DATA LOCAL INFILE {sql_lit(fname)}" \
+           f" INTO TABLE {sql_ident(dbn)}.{sql_ident(tbl)}" \
+           f" CHARACTER SET utf8mb4 ({','.join(fields)})"
+
+    if sets:
+        stmt = f"{stmt} SET {', '.join(sets)}"
+
+    return "SET SESSION foreign_key_checks = 0, unique_checks = 0," \
+           " time_zone = '+00:00', sql_mode = 'NO_AUTO_VALUE_ON_ZERO';" \
+           f" {stmt}"
+
+
+def load_file(load_cmd, stmt, fname):
+
+    """Function:  load_file
+
+    Description:  Run a LOAD DATA LOCAL INFILE statement with the mysql
+        program and remove the file once it is loaded.
+
+    Arguments:
+        (input) load_cmd -> Database load command line
+        (input) stmt -> Load data statements
+        (input) fname -> Name of the file being loaded
+        (output) status -> True|False - File loaded successfully
+
+    """
+
+    proc = subprocess.Popen(                            # pylint:disable=R1732
+        list(load_cmd) + ["--local-infile=1", "-e", stmt])
+    proc.wait()
+
+    if proc.returncode:
+        print(f"Error:  Load of {fname} failed: rc: {proc.returncode}")
+
+        return False
+
+    os.remove(fname)
+
+    return True
+
+
+def tab_dump_load(                                      # pylint:disable=R0914
+        source, clone, args, opt_arg_list, **kwargs):
+
+    """Function:  tab_dump_load
+
+    Description:  Dumps the databases from a consistent snapshot of the source
+        into tab separated files in the staging directory (-s option) and
+        loads them with LOAD DATA LOCAL INFILE.  The schema is loaded first,
+        each table is loaded by a pool of workers as soon as its file is
+        written and the triggers are loaded last so they do not fire on the
+        loaded rows.  At most twice as many files as workers wait to load, so
+        the dump waits on the loads, and it stops once a load fails.  The -x
+        option builds the secondary indexes after the data is loaded.
+
+    Arguments:
+        (input) source -> Source server instance
+        (input) clone -> Destination server instance
+        (input) args -> ArgParser class instance
+        (input) opt_arg_list -> List of options to add to dump cmd line
+        (input) **kwargs:
+            throttle -> Throttle class instance
+        (output) status -> True|False - Databases loaded successfully
+        (output) coords -> Dictionary of the snapshot coordinates
+
+    """
+
+    cfg = native_cfg(clone, args, opt_arg_list)
+    dump_args = dict(cfg["dump_args"], triggers=False)
+    deferred = [] if args.arg_exist("-x") else None
+    coords = native_snap(source)
+    dbs = fetch_dbs(source)
+    tbls = [tbl for tbl in fetch_tbls(source, dbs)
+            if f"{tbl['db']}.{tbl['tbl']}" not in dump_args["ignore"]]
+    workers = int(args.get_val("-j", def_val=4))
+    pending = collections.deque()
+
+    try:
+        status = pipe_stmts(
+            cfg["load_cmd"], native_dump(               # pylint:disable=E1132
+                source, dbs, cfg["max_len"], no_data=True, deferred=deferred,
+                **dump_args))
+
+        with concurrent.futures.ThreadPoolExecutor(
+                max_workers=workers) as pool:
+
+            for idx, tbl in enumerate(tbls if status else []):
+                # Bound the files waiting to load in the staging directory
+                while status and len(pending) >= 2 * workers:
+                    status = pending.popleft().result()
+
+                if not status:
+                    break
+
+                cols = fetch_cols(source, tbl["db"], tbl["tbl"], types=True)
+                fname = os.path.join(args.get_val("-s"), f"{idx:06d}.txt")
+
+                if cols and tab_dump_tbl(
+                        source, tbl["db"], tbl["tbl"], cols, fname,
+                        throttle=kwargs.get("throttle")):
+                    pending.append(pool.submit(
+                        load_file, cfg["load_cmd"],
+                        crt_load_data(tbl["db"], tbl["tbl"], cols, fname),
+                        fname))
+
+                elif cols:
+                    os.remove(fname)
+
+            status = all(result.result() for result in pending) and status
+
+        if status and cfg["dump_args"]["triggers"]:
+            status = pipe_stmts(cfg["load_cmd"], (
+                stmt for tbl in tbls for stmt in native_dump_tbl(
+                    source, tbl["db"], tbl["tbl"], cfg["max_len"],
+                    no_create=True, no_data=True, triggers=True)))
+
+    finally:
+        source.cmd_sql("commit")
+
+    if status and deferred:
+        status = build_indexes(
+            cfg["load_cmd"], deferred, int(args.get_val("-j", def_val=4)))
+
+    if cfg["set_gtid"] and coords.get("gtid") and status:
+        clone.cmd_sql(f"set global gtid_purged = '{coords['gtid']}'")
+
+    return status, coords
+
+
+def free_conns(server):
+
+    """Function:  free_conns
+
+    Description:  Return the number of connections the server will still
+        accept, that is max_connections less the connections already open.
+
+    Arguments:
+        (input) server -> Database server instance
+        (output) free -> Number of free connections
+
+    """
+
+    max_conn = int(server.col_sql(
+        "select @@global.max_connections as val")[0]["val"])
+    used = int(server.col_sql(
+        "show global status like 'Threads_connected'")[0]["Value"])
+
+    return max_conn - used
+
+
+def chk_snap_privs(server):
+
+    """Function:  chk_snap_privs
+
+    Description:  Check the server's user can coordinate the snapshot of the
+        dump sessions, that is it can set the global net_write_timeout
+        (SYSTEM_VARIABLES_ADMIN) and read the open transactions (PROCESS).
+        Both are tried without changing anything.
+
+    Arguments:
+        (input) server -> Database server instance
+        (output) status -> True|False - User has the privileges
+
+    """
+
+    try:
+        server.cmd_sql(
+            "set global net_write_timeout = @@global.net_write_timeout")
+        server.col_sql(
+            "select count(*) as cnt from information_schema.innodb_trx")
+
+    except Exception as err:                            # pylint:disable=W0718
+        print(f"Warning:  Snapshot lock not allowed, using --source-data:"
+              f" {err}")
+
+        return False
+
+    return True
+
+
+def start_dumps(source, args, opt_arg_list, err_file, **kwargs):
+
+    """Function:  start_dumps
+
+    Description:  Start a dump process for each parallel task.  All of the dump
+        sessions are started under the snapshot coordinator's lock so they all
+        share the same point in time and the lock is then released.  The dump
+        processes are killed if they do not all open their snapshots or an
+        error is raised, and started again if their snapshots do not match the
+        coordinates.  Nothing is started if the source does not have a free
+        connection for every task, the coordinator's lock being taken over the
+        source's own connection.
+
+    Arguments:
+        (input) source -> Source server instance
+        (input) args -> ArgParser class instance
+        (input) opt_arg_list -> List of options to add to dump cmd line
+        (input) err_file -> File handler for the dump error messages
+        (input) **kwargs:
+            opt_dump_list -> Dictionary of additional options
+            tasks -> List of task dictionaries, default is from crt_tasks
+            pids -> List the dump process ids are added to
+        (output) status -> True|False - All dump sessions share the snapshot
+        (output) tasks -> List of task dictionaries
+        (output) procs -> List of dump processes, in task order
+        (output) coords -> Dictionary of the snapshot coordinates
+
+    """
+
+    opt_arg_list = list(opt_arg_list)
+    opt_dump_list = dict(kwargs.get("opt_dump_list", {}))
+    tasks = list(kwargs["tasks"]) if "tasks" in kwargs \
+        else crt_tasks(source, args)
+    free = free_conns(source)
+
+    # One dump session per task, the coordinator locks over the source's own
+    if len(tasks) > free:
+        print(f"Error:  {len(tasks)} dump sessions exceed the {free} free"
+              f" connections on the source, lower the workers (-j option)"
+              f" or raise max_connections.")
+
+        return False, [], [], {}
+
+    snap = SnapshotCoord(source)
+    status = settled = False
+
+    while not settled:
+        procs = []
+        status = False
+
+        try:
+            coords = snap.lock()
+
+            for task in tasks:
+                procs.append(subprocess.Popen(          # pylint:disable=R1732
+                    crt_task_cmd(source, args, opt_arg_list, task,
+                                 opt_dump_list=opt_dump_list),
+                    stdout=subprocess.PIPE, stderr=err_file))
+                kwargs.get("pids", []).append(procs[-1].pid)
+
+            status = snap.wait_sessions(len(procs))
+            settled = not status or snap.settled()
+
+        finally:
+            try:
+                snap.unlock()
+
+            finally:
+                # No dump is left holding a snapshot on the source
+                for proc in procs if not status or not settled else []:
+                    proc.kill()
+                    proc.wait()
+
+    if not status:
+        print("Error:  Dump sessions did not open a consistent snapshot.")
+
+        return False, [], [], {}
+
+    print(f"Snapshot coordinates:  File: {coords.get('file')}"
+          f"  Position: {coords.get('pos')}  GTID: {coords.get('gtid')}")
+
+    return True, tasks, procs, coords
+
+
+def par_dump_load(                                      # pylint:disable=R0914
+        source, clone, args, opt_arg_list, err_file, **kwargs):
+
+    """Function:  par_dump_load
+
+    Description:  Dumps and loads the databases in parallel.  All of the dump
+        sessions are started from a single consistent snapshot and then the
+        tasks are loaded into the clone by a pool of workers, one phase at a
+        time.
+
+    Arguments:
+        (input) source -> Source server instance
+        (input) clone -> Destination server instance
+        (input) args -> ArgParser class instance
+        (input) opt_arg_list -> List of options to add to dump cmd line
+        (input) err_file -> File handler for the dump error messages
+        (input) **kwargs:
+            opt_dump_list -> Dictionary of additional options
+            throttle -> Throttle class instance
+            tasks -> List of task dictionaries, default is from crt_tasks
+            pids -> List the dump process ids are added to
+        (output) status -> True|False - All tasks loaded successfully
+        (output) coords -> Dictionary of the snapshot coordinates
+
+    """
+
+    set_gtid = clone.gtid_mode and not args.arg_exist("-r")
+
+    # Loaded data covered by the source's GTIDs is not logged again
+    load_cmd = crt_load_cmd(clone, args, chk_no_log(clone, args, set_gtid))
+    status, tasks, procs, coords = start_dumps(
+        source, args, opt_arg_list, err_file,
+        opt_dump_list=kwargs.get("opt_dump_list", {}),
+        pids=kwargs.get("pids", []),
+        **({"tasks": kwargs["tasks"]} if "tasks" in kwargs else {}))
+
+    if not status:
+        return False, {}
+
+    results = []
+
+    with concurrent.futures.ThreadPoolExecutor(
+            max_workers=int(args.get_val("-j", def_val=1))) as pool:
+
+        for phase in sorted({task["phase"] for task in tasks}):
+            idx_list = [idx for idx, task in enumerate(tasks)
+                        if task["phase"] == phase]
+            results.extend(pool.map(
+                functools.partial(load_task, throttle=kwargs.get("throttle")),
+                [procs[idx] for idx in idx_list],
+                [load_cmd] * len(idx_list), [tasks[idx] for idx in idx_list]))
+
+    if set_gtid and coords.get("gtid") and all(results):
+        clone.cmd_sql(f"set global gtid_purged = '{coords['gtid']}'")
+
+    return all(results), coords
+
+
+def send_msg(sock, lock, sid, kind, payload):
+
+    """Function:  send_msg
+
+    Description:  Send a message of the agent transport.  The lock keeps the
+        messages of the streams sharing the connection whole.
+
+    Arguments:
+        (input) sock -> Connected socket
+        (input) lock -> Lock shared by the streams of the connection
+        (input) sid -> Stream id
+        (input) kind -> Message type
+        (input) payload -> Message payload in bytes
+
+    """
+
+    with lock:
+        sock.sendall(MSG.pack(sid, kind, len(payload)) + payload)
+
+
+def recv_exact(sock, size):
+
+    """Function:  recv_exact
+
+    Description:  Receive a number of bytes from a socket, fewer only if the
+        connection is closed.
+
+    Arguments:
+        (input) sock -> Connected socket
+        (input) size -> Number of bytes to receive
+        (output) data -> Bytes received
+
+    """
+
+    data = bytearray()
+
+    while len(data) < size:
+        chunk = sock.recv(min(size - len(data), 1024 * 1024))
+
+        if not chunk:
+            break
+
+        data.extend(chunk)
+
+    return bytes(data)
+
+
+def recv_msg(sock, **kwargs):
+
+    """Function:  recv_msg
+
+    Description:  Receive a message of the agent transport.
+
+    Arguments:
+        (input) sock -> Connected socket
+        (input) **kwargs:
+            max_len -> Largest payload accepted, in bytes
+        (output) msg -> (stream id, message type, payload) or None if the
+            connection is closed
+
+    """
+
+    head = recv_exact(sock, MSG.size)
+
+    if not head:
+        return None
+
+    if len(head) < MSG.size:
+        raise ValueError("Truncated message header from agent")
+
+    sid, kind, length = MSG.unpack(head)
+
+    if length > kwargs.get("max_len", length):
+        raise ValueError(f"Message of {length} bytes too long from agent")
+
+    payload = recv_exact(sock, length)
+
+    if len(payload) < length:
+        raise ValueError("Truncated message from agent")
+
+    return sid, kind, payload
+
+
+def read_secret(fname):
+
+    """Function:  read_secret
+
+    Description:  Read the secret shared by the agent and its receiver from
+        its file (-S option).
+
+    Arguments:
+        (input) fname -> Name of the secret file
+        (output) secret -> Shared secret in bytes
+
+    """
+
+    with open(fname, mode="rb") as fhdr:
+        secret = fhdr.read().strip()
+
+    if not secret:
+        raise ValueError(f"Shared secret file is empty: {fname}")
+
+    return secret
+
+
+def auth_digest(secret, role, nonce, peer_nonce):
+
+    """Function:  auth_digest
+
+    Description:  Return the HMAC-SHA256 a side of the agent transport sends
+        to prove it holds the shared secret.  The role keeps a side's digest
+        from being replayed as the other side's.
+
+    Arguments:
+        (input) secret -> Shared secret in bytes
+        (input) role -> agent|receiver
+        (input) nonce -> Challenge of the side being answered
+        (input) peer_nonce -> Challenge of the side answering
+        (output) digest -> Digest in bytes
+
+    """
+
+    return hmac.new(secret, role.encode("UTF-8") + nonce + peer_nonce,
+                    hashlib.sha256).digest()
+
+
+def agent_auth(sock, secret):
+
+    """Function:  agent_auth
+
+    Description:  Agent side of the transport handshake.  The agent sends a
+        random challenge, checks the receiver's answer and then answers the
+        receiver's own challenge, so each side knows the other holds the
+        shared secret before anything is sent.
+
+    Arguments:
+        (input) sock -> Connected socket
+        (input) secret -> Shared secret in bytes
+        (output) True|False - Receiver authenticated
+
+    """
+
+    lock = threading.Lock()
+    nonce = os.urandom(32)
+
+    try:
+        send_msg(sock, lock, 0, MSG_AUTH, nonce)
+        msg = recv_msg(sock, max_len=64)
+
+        if not msg or msg[1] != MSG_AUTH or len(msg[2]) != 64 \
+           or not hmac.compare_digest(msg[2][32:], auth_digest(
+               secret, "receiver", nonce, msg[2][:32])):
+            return False
+
+        send_msg(sock, lock, 0, MSG_AUTH,
+                 auth_digest(secret, "agent", msg[2][:32], nonce))
+
+    except (OSError, ValueError):
+        return False
+
+    return True
+
+
+def recv_auth(sock, secret):
+
+    """Function:  recv_auth
+
+    Description:  Receiver side of the transport handshake.  The receiver
+        answers the agent's challenge along with a challenge of its own and
+        checks the agent's answer.
+
+    Arguments:
+        (input) sock -> Connected socket
+        (input) secret -> Shared secret in bytes
+        (output) True|False - Agent authenticated
+
+    """
+
+    nonce = os.urandom(32)
+
+    try:
+        msg = recv_msg(sock, max_len=32)
+
+        if not msg or msg[1] != MSG_AUTH or len(msg[2]) != 32:
+            return False
+
+        send_msg(sock, threading.Lock(), 0, MSG_AUTH, nonce + auth_digest(
+            secret, "receiver", msg[2], nonce))
+        reply = recv_msg(sock, max_len=32)
+
+    except (OSError, ValueError):
+        return False
+
+    return bool(reply) and reply[1] == MSG_AUTH and hmac.compare_digest(
+        reply[2], auth_digest(secret, "agent", nonce, msg[2]))
+
+
+def agent_task(sock, lock, sid, proc, task):
+
+    """Function:  agent_task
+
+    Description:  Stream a task's dump over the agent transport as
+        compressed, checksummed frames on its own stream id.
+
+    Arguments:
+        (input) sock -> Connected socket
+        (input) lock -> Lock shared by the streams of the connection
+        (input) sid -> Stream id of the task
+        (input) proc -> Dump process of the task
+        (input) task -> Dictionary of the task
+        (output) status -> True|False - Task dumped successfully
+
+    """
+
+    send_msg(sock, lock, sid, MSG_OPEN, json.dumps(
+        {"name": task["name"],
+         "load_args": task.get("load_args", [])}).encode("UTF-8"))
+
+    for frame in compress_stream(proc.stdout):
+        send_msg(sock, lock, sid, MSG_DATA, frame)
+
+    proc.stdout.close()
+    proc.wait()
+    send_msg(sock, lock, sid, MSG_END,
+             json.dumps({"rc": proc.returncode}).encode("UTF-8"))
+
+    return proc.returncode == 0
+
+
+def agent_send(                                         # pylint:disable=R0914
+        sock, source, args, opt_arg_list, err_file, **kwargs):
+
+    """Function:  agent_send
+
+    Description:  Dump the databases next to the source and stream them to
+        the receiver over one connection.  The tasks are dumped from a single
+        consistent snapshot and streamed in parallel on their own stream ids,
+        one phase at a time.
+
+    Arguments:
+        (input) sock -> Connected socket
+        (input) source -> Source server instance
+        (input) args -> ArgParser class instance
+        (input) opt_arg_list -> List of options to add to dump cmd line
+        (input) err_file -> File handler for the dump error messages
+        (input) **kwargs:
+            opt_dump_list -> Dictionary of additional options
+        (output) status -> True|False - All tasks dumped successfully
+
+    """
+
+    lock = threading.Lock()
+    status, tasks, procs, coords = start_dumps(
+        source, args, opt_arg_list, err_file,
+        opt_dump_list=kwargs.get("opt_dump_list", {}))
+    send_msg(sock, lock, 0, MSG_META, json.dumps(
+        {"status": status, "coords": coords}).encode("UTF-8"))
+    results = []
+
+    with concurrent.futures.ThreadPoolExecutor(
+            max_workers=int(args.get_val("-j"))) as pool:
+
+        for phase in sorted({task["phase"] for task in tasks}):
+            idx_list = [idx for idx, task in enumerate(tasks)
+                        if task["phase"] == phase]
+            results.extend(pool.map(
+                agent_task, [sock] * len(idx_list), [lock] * len(idx_list),
+                [idx + 1 for idx in idx_list],
+                [procs[idx] for idx in idx_list],
+                [tasks[idx] for idx in idx_list]))
+
+    status = status and all(results)
+    send_msg(sock, lock, 0, MSG_DONE,
+             json.dumps({"status": status}).encode("UTF-8"))
+
+    return status
+
+
+def chk_load_args(load_args):
+
+    """Function:  chk_load_args
+
+    Description:  Check the load arguments of a stream from the agent are
+        no more than a single --database=<identifier> option.
+
+    Arguments:
+        (input) load_args -> List of load arguments of the stream
+        (output) True|False - Load arguments are allowed
+
+    """
+
+    return isinstance(load_args, list) and len(load_args) <= 1 \
+        and all(isinstance(arg, str)
+                and re.fullmatch(r"--database=[\w$-]{1,64}", arg)
+                for arg in load_args)
+
+
+def agent_recv(sock, load_cmd):
+
+    """Function:  agent_recv
+
+    Description:  Receive the streams of the agent and feed each of them into
+        its own load process.  The blocks are checked against their
+        checksums as they are decompressed.  A stream whose load arguments
+        are anything but a --database option fails the receive.
+
+    Arguments:
+        (input) sock -> Connected socket
+        (input) load_cmd -> Database load command line
+        (output) status -> True|False - All streams loaded successfully
+        (output) coords -> Dictionary of the snapshot coordinates
+
+    """
+
+    msg = recv_msg(sock)
+    meta = json.loads(msg[2]) if msg and msg[1] == MSG_META else {}
+    status = meta.get("status", False)
+    procs = {}
+    results = []
+
+    try:
+        while status:
+            msg = recv_msg(sock)
+
+            if msg is None:
+                print("Error:  Agent closed the connection before the dump"
+                      " completed.")
+                status = False
+
+            elif msg[1] == MSG_OPEN:
+                info = json.loads(msg[2])
+
+                # Only the handshake is authenticated, so the stream cannot
+                # be trusted to pass any other client option
+                if not chk_load_args(info.get("load_args")):
+                    print(f"Error:  Task {info.get('name')} rejected, invalid"
+                          f" load arguments: {info.get('load_args')}")
+                    status = False
+                    break
+
+                procs[msg[0]] = (subprocess.Popen(  # pylint:disable=R1732
+                    list(load_cmd) + info["load_args"],
+                    stdin=subprocess.PIPE), info["name"])
+
+            elif msg[1] == MSG_DATA:
+                for block in read_frames(io.BytesIO(msg[2])):
+                    procs[msg[0]][0].stdin.write(block)
+
+            elif msg[1] == MSG_END:
+                proc, name = procs.pop(msg[0])
+                proc.stdin.close()
+                proc.wait()
+                dump_rc = json.loads(msg[2])["rc"]
+                results.append(dump_rc == 0 and proc.returncode == 0)
+
+                if not results[-1]:
+                    print(f"Error:  Task {name} failed: dump rc: {dump_rc}"
+                          f"  load rc: {proc.returncode}")
+
+            elif msg[1] == MSG_DONE:
+                status = json.loads(msg[2])["status"] and all(results)
+                break
+
+    finally:
+        for proc, _ in procs.values():
+            proc.kill()
+            proc.wait()
+
+    return status, meta.get("coords", {})
+
+
+def agent_dump_load(clone, args):
+
+    """Function:  agent_dump_load
+
+    Description:  Connects to the agent running next to the source (-g
+        option), authenticates it with the shared secret (-S option) and
+        loads the databases it streams into the clone.
+
+    Arguments:
+        (input) clone -> Destination server instance
+        (input) args -> ArgParser class instance
+        (output) status -> True|False - Databases loaded successfully
+        (output) coords -> Dictionary of the snapshot coordinates
+
+    """
+
+    host, port = args.get_val("-g").rsplit(":", 1)
+    set_gtid = clone.gtid_mode and not args.arg_exist("-r")
+
+    # Loaded data covered by the source's GTIDs is not logged again
+    load_cmd = crt_load_cmd(clone, args, chk_no_log(clone, args, set_gtid))
+
+    secret = read_secret(args.get_val("-S"))
+
+    with socket.create_connection((host, int(port)), timeout=30) as sock:
+        if not recv_auth(sock, secret):
+            print("Error:  Agent failed to authenticate with the shared"
+                  " secret.")
+
+            return False, {}
+
+        sock.settimeout(None)
+        status, coords = agent_recv(sock, load_cmd)
+
+    if set_gtid and coords.get("gtid") and status:
+        clone.cmd_sql(f"set global gtid_purged = '{coords['gtid']}'")
+
+    return status, coords
+
+
+def chk_clone_plugin(server):
+
+    """Function:  chk_clone_plugin
+
+    Description:  Check the server supports the clone plugin (MySQL 8.0.17
+        and above) and that the plugin is active.
+
+    Arguments:
+        (input) server -> Database server instance
+        (output) True|False - Clone plugin is active
+
+    """
+
+    if server.version < (8, 0, 17):
+        return False
+
+    data = server.col_sql(
+        "select plugin_status as status from information_schema.plugins"
+        " where plugin_name = 'clone'")
+
+    return bool(data) and data[0]["status"] == "ACTIVE"
+
+
+def clone_stat(server):
+
+    """Function:  clone_stat
+
+    Description:  Return the status of the last clone operation on the server.
+
+    Arguments:
+        (input) server -> Database server instance
+        (output) Dictionary of the clone status, empty if no clone was run
+
+    """
+
+    data = server.col_sql(
+        "select state, begin_time, error_no, error_message, binlog_file,"
+        " binlog_position, gtid_executed from performance_schema.clone_status")
+
+    return data[0] if data else {}
+
+
+def wait_clone(clone, begin_time, **kwargs):
+
+    """Function:  wait_clone
+
+    Description:  Wait for the clone to restart after the clone operation and
+        return the operation's final status.  The server is reconnected as it
+        drops the connection when it restarts.
+
+    Arguments:
+        (input) clone -> Destination server instance
+        (input) begin_time -> Begin time of the clone operation before this one
+        (input) **kwargs:
+            timeout -> Number of seconds to wait before giving up
+            interval -> Number of seconds between checks
+        (output) row -> Dictionary of the clone status, empty on timeout
+
+    """
+
+    end_time = time.time() + kwargs.get("timeout", 600)
+
+    while time.time() < end_time:
+        try:
+            if not clone.is_connected():
+                clone.connect(silent=True)
+
+            row = clone_stat(clone) if clone.is_connected() else {}
+
+            if row.get("begin_time") != begin_time \
+               and row.get("state") in ["Completed", "Failed"]:
+                return row
+
+        except Exception:                               # pylint:disable=W0718
+            # Server is shutting down for the restart
+            pass
+
+        time.sleep(kwargs.get("interval", 5))
+
+    return {}
+
+
+def phys_clone(source, clone, **kwargs):
+
+    """Function:  phys_clone
+
+    Description:  Clone the source instance into the clone with the MySQL 8
+        clone plugin, a page-level copy of the source instead of a logical
+        dump and load.  The clone replaces its data with the source's and
+        restarts, so the user in the clone's configuration file must exist on
+        the source.  The clone fails if the operation reports an error, even
+        once the data is copied.  The binary log and GTID position of the
+        copy are returned for the replication setup.
+
+    Arguments:
+        (input) source -> Source server instance
+        (input) clone -> Destination server instance
+        (input) **kwargs:
+            timeout -> Number of seconds to wait for the clone to restart
+        (output) status -> True|False - Instance cloned successfully
+        (output) coords -> Dictionary of the clone's coordinates
+
+    """
+
+    for server in [source, clone]:
+        if not chk_clone_plugin(server):
+            print(f"Error:  Clone plugin is not active on {server.name} or"
+                  f" version is below 8.0.17.")
+
+            return False, {}
+
+    begin_time = clone_stat(clone).get("begin_time")
+    err_msg = None
+    clone.cmd_sql(
+        f"set global clone_valid_donor_list = '{source.host}:{source.port}'")
+
+    try:
+        clone.cmd_sql(
+            f"clone instance from {sql_lit(source.sql_user)}"
+            f"@{sql_lit(source.host)}:{source.port}"
+            f" identified by {sql_lit(source.sql_pass)}")
+
+    except Exception as err:                            # pylint:disable=W0718
+        # The connection is dropped when the clone restarts
+        err_msg = err
+
+    row = wait_clone(clone, begin_time, timeout=kwargs.get("timeout", 600))
+
+    # A completed copy can still report an error, e.g. 3707 when the clone
+    # is not restarted by a supervisor
+    if row.get("state") != "Completed" or int(row.get("error_no") or 0):
+        print(f"Error:  Physical clone failed: {row.get('error_no')}"
+              f" {row.get('error_message') or err_msg}")
+
+        return False, {}
+
+    return True, {"file": row["binlog_file"], "pos": row["binlog_position"],
+                  "gtid": row["gtid_executed"].replace("\n", "")}
+
+
+def xfer_report(start, dumped, sent):
+
+    """Function:  xfer_report
+
+    Description:  Report the compression ratio and throughput of the
+        dump-load phase.  The ratio is the bytes of the dump streams over
+        the bytes the source sent to the run's dump sessions.  The dump
+        streams of the -s and -g options are not counted in bytes, so only
+        the bytes sent are reported for them.
+
+    Arguments:
+        (input) start -> Start time of the dump-load phase
+        (input) dumped -> Bytes of the uncompressed dump streams
+        (input) sent -> Bytes sent to the dump sessions
+        (output) stats -> Dictionary of the transfer statistics
+
+    """
+
+    mbyte = 1024 * 1024
+    secs = max(time.time() - start, 0.001)
+    sent = max(sent, 1)
+    stats = {"dumped": dumped, "sent": sent, "secs": secs,
+             "ratio": dumped / sent if dumped else None}
+
+    if dumped:
+        print(f"Transfer:  {dumped / mbyte:.1f} MB dumped in"
+              f" {sent / mbyte:.1f} MB sent, compression ratio:"
+              f" {stats['ratio']:.2f}")
+        print(f"Throughput:  {dumped / mbyte / secs:.1f} MB/s dumped,"
+              f" {sent / mbyte / secs:.1f} MB/s sent, {secs:.1f} seconds")
+
+    else:
+        print(f"Transfer:  {sent / mbyte:.1f} MB sent, dump bytes not"
+              f" counted")
+        print(f"Throughput:  {sent / mbyte / secs:.1f} MB/s sent,"
+              f" {secs:.1f} seconds")
+
+    return stats
+
+
+def fetch_bulk_cfg(clone):
+
+    """Function:  fetch_bulk_cfg
+
+    Description:  Return the clone's global settings changed by the bulk
+        load profile.
+
+    Arguments:
+        (input) clone -> Destination server instance
+        (output) cfg -> Dictionary of the global settings
+
+    """
+
+    cfg = {key: str(val) for key, val in clone.col_sql(
+        "select @@global.innodb_flush_log_at_trx_commit as"
+        " innodb_flush_log_at_trx_commit,"
+        " @@global.sync_binlog as sync_binlog")[0].items()}
+
+    if clone.version >= (8, 0, 21):
+        cfg["innodb_redo_log_enabled"] = clone.col_sql(
+            "show global status like 'Innodb_redo_log_enabled'")[0]["Value"]
+
+    return cfg
+
+
+def set_bulk_cfg(clone, cfg):
+
+    """Function:  set_bulk_cfg
+
+    Description:  Apply the global settings of the bulk load profile to the
+        clone: the redo log is flushed once a second instead of at each
+        commit, the binary log is not synced and on MySQL 8.0.21 and above
+        the redo log is disabled.
+
+    Arguments:
+        (input) clone -> Destination server instance
+        (input) cfg -> Dictionary of the clone's original global settings
+
+    """
+
+    clone.cmd_sql("set global innodb_flush_log_at_trx_commit = 2")
+    clone.cmd_sql("set global sync_binlog = 0")
+
+    if cfg.get("innodb_redo_log_enabled") == "ON":
+        clone.cmd_sql("alter instance disable innodb redo_log")
+
+    print("Bulk load profile applied to the clone.")
+
+
+def rst_bulk_cfg(clone, cfg, **kwargs):
+
+    """Function:  rst_bulk_cfg
+
+    Description:  Restore the clone's global settings changed by the bulk
+        load profile and check they match the original settings and, if
+        passed, the required replication settings.
+
+    Arguments:
+        (input) clone -> Destination server instance
+        (input) cfg -> Dictionary of the clone's original global settings
+        (input) **kwargs:
+            req_cfg -> Required replication config settings of the clone
+        (output) status -> True|False - Settings restored successfully
+
+    """
+
+    cfg = dict(cfg)
+    clone.cmd_sql(
+        "set global innodb_flush_log_at_trx_commit ="
+        f" {int(cfg['innodb_flush_log_at_trx_commit'])}")
+    clone.cmd_sql(f"set global sync_binlog = {int(cfg['sync_binlog'])}")
+
+    if cfg.get("innodb_redo_log_enabled") == "ON":
+        clone.cmd_sql("alter instance enable innodb redo_log")
+
+    status = cfg_chk(functools.partial(fetch_bulk_cfg, clone), cfg)
+
+    if kwargs.get("req_cfg"):
+        clone.upd_slv_rep_stat()
+        status = cfg_chk(clone.fetch_slv_rep_cfg, kwargs["req_cfg"]) \
+            and status
+
+    print("Bulk load profile restored on the clone.")
+
+    return status
+
+
+def fetch_bp_stat(server):
+
+    """Function:  fetch_bp_stat
+
+    Description:  Return the server's buffer pool read counters and the
+        status of its buffer pool dump and load.
+
+    Arguments:
+        (input) server -> Database server instance
+        (output) stat -> Dictionary of the status variables
+
+    """
+
+    return {row["Variable_name"]: row["Value"] for row in server.col_sql(
+        "show global status where variable_name in"
+        " ('Innodb_buffer_pool_read_requests', 'Innodb_buffer_pool_reads',"
+        " 'Innodb_buffer_pool_dump_status',"
+        " 'Innodb_buffer_pool_load_status')")}
+
+
+def wait_bp(server, kind, prev, **kwargs):
+
+    """Function:  wait_bp
+
+    Description:  Wait for a buffer pool dump or load to complete, that is
+        for its status to report completed and differ from the status before
+        it was started.
+
+    Arguments:
+        (input) server -> Database server instance
+        (input) kind -> dump|load
+        (input) prev -> Status before the dump or load was started
+        (input) **kwargs:
+            timeout -> Number of seconds to wait before giving up
+            interval -> Number of seconds between checks
+        (output) status -> True|False - Dump or load completed
+        (output) msg -> Last status of the dump or load
+
+    """
+
+    name = f"Innodb_buffer_pool_{kind}_status"
+    end_time = time.time() + kwargs.get("timeout", 600)
+    msg = prev
+
+    while time.time() < end_time:
+        msg = fetch_bp_stat(server).get(name, "")
+
+        if msg != prev and "completed" in msg:
+            return True, msg
+
+        if re.search("error|abort", msg, re.IGNORECASE):
+            return False, msg
+
+        time.sleep(kwargs.get("interval", 1))
+
+    return False, msg
+
+
+def dump_bp(server, **kwargs):
+
+    """Function:  dump_bp
+
+    Description:  Save the list of pages in the server's buffer pool to its
+        buffer pool dump file before the dump scans the tables.
+
+    Arguments:
+        (input) server -> Database server instance
+        (input) **kwargs:
+            timeout -> Number of seconds to wait for the dump
+        (output) status -> True|False - Buffer pool saved
+
+    """
+
+    prev = fetch_bp_stat(server).get("Innodb_buffer_pool_dump_status", "")
+    server.cmd_sql("set global innodb_buffer_pool_dump_now = on")
+    status, msg = wait_bp(
+        server, "dump", prev, timeout=kwargs.get("timeout", 600))
+    print(f"Buffer pool:  {msg}" if status
+          else f"Warning:  Buffer pool not saved: {msg}")
+
+    return status
+
+
+def load_bp(server, **kwargs):
+
+    """Function:  load_bp
+
+    Description:  Reload the pages saved by dump_bp into the server's buffer
+        pool and wait for the load to complete.  A load still running at the
+        timeout carries on in the background.
+
+    Arguments:
+        (input) server -> Database server instance
+        (input) **kwargs:
+            timeout -> Number of seconds to wait for the load
+        (output) status -> True|False - Buffer pool reloaded
+
+    """
+
+    start = time.time()
+    prev = fetch_bp_stat(server).get("Innodb_buffer_pool_load_status", "")
+    server.cmd_sql("set global innodb_buffer_pool_load_now = on")
+    status, msg = wait_bp(
+        server, "load", prev, timeout=kwargs.get("timeout", 600))
+    print(f"Buffer pool:  {msg}, reloaded in {time.time() - start:.1f}"
+          f" seconds" if status
+          else f"Warning:  Buffer pool not reloaded: {msg}")
+
+    return status
+
+
+def bp_report(stats):
+
+    """Function:  bp_report
+
+    Description:  Return the buffer pool hit ratio of the server since it
+        started up to the first sample and between each of the next samples.
+
+    Arguments:
+        (input) stats -> List of (name, fetch_bp_stat dictionary) samples
+        (output) Report line
+
+    """
+
+    line = []
+
+    for idx, (name, row) in enumerate(stats):
+        prev = stats[idx - 1][1] if idx else {}
+        requests = int(row.get("Innodb_buffer_pool_read_requests", 0)) \
+            - int(prev.get("Innodb_buffer_pool_read_requests", 0))
+        reads = int(row.get("Innodb_buffer_pool_reads", 0)) \
+            - int(prev.get("Innodb_buffer_pool_reads", 0))
+        line.append(
+            f"{name} {100 - 100 * reads / max(requests, 1):.2f}%"
+            f" ({reads} reads of {requests} requests)")
+
+    return f"Buffer pool hit ratio:  {', '.join(line)}"
+
+
+def split_innodb_name(name):
+
+    """Function:  split_innodb_name
+
+    Description:  Split an InnoDB table name into its database and table
+        names, either of the db/tbl form with its special characters encoded
+        as @xxxx or of the `db`.`tbl` form, and drop any partition suffix.
+
+    Arguments:
+        (input) name -> InnoDB table name
+        (output) (dbn, tbl) -> Database and table names
+
+    """
+
+    match = re.match(r"`((?:[^`]|``)*)`\.`((?:[^`]|``)*)`", name)
+
+    if match:
+        return tuple(part.replace("``", "`") for part in match.groups())
+
+    dbn, _, tbl = name.partition("/")
+    tbl = re.split("#p#", tbl, flags=re.IGNORECASE)[0]
+
+    return tuple(
+        re.sub("@([0-9a-f]{4})", lambda code: chr(int(code.group(1), 16)),
+               part) for part in (dbn, tbl))
+
+
+def fetch_hot_idx(server, **kwargs):
+
+    """Function:  fetch_hot_idx
+
+    Description:  Return the indexes with the most pages in the server's
+        buffer pool, hottest first.  On MySQL 8 the page counts are read from
+        innodb_cached_indexes, otherwise they are counted from a scan of
+        innodb_buffer_page_lru.  The pages of a partitioned table are added
+        together and the system and full-text index tables are left out.
+
+    Arguments:
+        (input) server -> Database server instance
+        (input) **kwargs:
+            limit -> Maximum number of indexes to read
+        (output) hot -> List of dictionaries of db, tbl, idx and pages
+
+    """
+
+    limit = int(kwargs.get("limit", 200))
+
+    if server.version >= (8, 0, 0):
+        rows = server.col_sql(
+            "select t.name as tbl, i.name as idx, c.n_cached_pages as pages"
+            " from information_schema.innodb_cached_indexes c"
+            " join information_schema.innodb_indexes i"
+            " on i.index_id = c.index_id and i.space = c.space_id"
+            " join information_schema.innodb_tables t"
+            " on t.table_id = i.table_id"
+            f" order by c.n_cached_pages desc limit {limit}")
+
+    else:
+        rows = server.col_sql(
+            "select table_name as tbl, index_name as idx, count(*) as pages"
+            " from information_schema.innodb_buffer_page_lru"
+            " where table_name is not null and index_name is not null"
+            f" group by table_name, index_name order by pages desc"
+            f" limit {limit}")
+
+    pages = collections.OrderedDict()
+
+    for row in rows:
+        dbn, tbl = split_innodb_name(row["tbl"])
+
+        if tbl and dbn not in ["mysql", "sys"] \
+           and not re.match("fts_[0-9a-f]{16}_", tbl):
+            key = (dbn, tbl, row["idx"])
+            pages[key] = pages.get(key, 0) + int(row["pages"])
+
+    return [{"db": key[0], "tbl": key[1], "idx": key[2], "pages": cnt}
+            for key, cnt in sorted(
+                pages.items(), key=lambda item: item[1], reverse=True)]
+
+
+def fetch_idx_size(server):
+
+    """Function:  fetch_idx_size
+
+    Description:  Return the size in pages of each index on the server from
+        its persistent statistics, with the partitions of a table added
+        together.
+
+    Arguments:
+        (input) server -> Database server instance
+        (output) sizes -> Dictionary of (db, tbl, idx) and number of pages
+
+    """
+
+    sizes = {}
+
+    for row in server.col_sql(
+            "select database_name as db, table_name as tbl,"
+            " index_name as idx, stat_value as pages"
+            " from mysql.innodb_index_stats where stat_name = 'size'"):
+        key = split_innodb_name(f"{row['db']}/{row['tbl']}") + (row["idx"],)
+        sizes[key] = sizes.get(key, 0) + int(row["pages"])
+
+    return sizes
+
+
+def warm_stmt(item):
+
+    """Function:  warm_stmt
+
+    Description:  Return a statement that reads every page of an index,
+        with the clustered index of a table without a primary key read
+        through a scan of the table.
+
+    Arguments:
+        (input) item -> Dictionary of db, tbl and idx
+        (output) Select statement
+
+    """
+
+    hint = "" if item["idx"] == "GEN_CLUST_INDEX" \
+        else f" force index ({sql_ident(item['idx'])})"
+
+    return (f"select count(*) into @warm from {sql_ident(item['db'])}."
+            f"{sql_ident(item['tbl'])}{hint}")
+
+
+def warm_clone(clone, args, hot, **kwargs):
+
+    """Function:  warm_clone
+
+    Description:  Warm the buffer pool of a newly loaded clone by reading
+        the source's hottest indexes into it, hottest first, with the
+        indexes read in parallel by a pool of workers (-j option, 4 by
+        default).  Indexes are read whole, so only those that fit in a share
+        of the clone's buffer pool are warmed and the rest are skipped.  The
+        time taken by the warm phase is reported.
+
+    Arguments:
+        (input) clone -> Destination server instance
+        (input) args -> ArgParser class instance
+        (input) hot -> List of hot indexes from fetch_hot_idx
+        (input) **kwargs:
+            pct -> Percent of the clone's buffer pool to fill
+        (output) status -> True|False - All indexes warmed successfully
+
+    """
+
+    budget = int(clone.col_sql(
+        "select @@innodb_buffer_pool_size div @@innodb_page_size as pages")[0]
+        ["pages"]) * kwargs.get("pct", 75) // 100
+    sizes = fetch_idx_size(clone)
+    stmts = []
+    pages = 0
+
+    for item in hot:
+        size = sizes.get((item["db"], item["tbl"], item["idx"]), item["pages"])
+
+        if pages + size <= budget:
+            pages += size
+            stmts.append(warm_stmt(item))
+
+    load_cmd = mysql_libs.crt_cmd(clone, args.arg_set_path("-p", cmd="mysql"))
+    start = time.time()
+    print(f"Warm phase:  Warming {len(stmts)} of {len(hot)} hot indexes"
+          f" ({pages} pages) on {clone.name}")
+
+    with concurrent.futures.ThreadPoolExecutor(
+            max_workers=int(args.get_val("-j", def_val=4))) as pool:
+        results = list(pool.map(exec_stmt, [load_cmd] * len(stmts), stmts))
+
+    print(f"Warm phase:  Completed in {time.time() - start:.1f} seconds")
+
+    return all(results)
+
+
+def dump_coords(head):
+
+    """Function:  dump_coords
+
+    Description:  Returns the binary log and GTID coordinates written at the
+        head of a mysqldump stream by the source data option.
+
+    Arguments:
+        (input) head -> Bytes at the head of the dump stream
+        (output) coords -> Dictionary of the dump coordinates
+
+    """
+
+    coords = {}
+    text = head.decode("UTF-8", errors="replace")
+    pos = re.search(
+        r"(?:MASTER|SOURCE)_LOG_FILE='([^']+)', *(?:MASTER|SOURCE)_LOG_POS="
+        r"(\d+)", text)
+    gtid = re.search(
+        r"GTID_PURGED=(?:/\*!80000 '\+'\*/ )?'([^']*)'", text)
+
+    if pos:
+        coords = {"file": pos.group(1), "pos": int(pos.group(2))}
+
+    if gtid:
+        coords["gtid"] = gtid.group(1).replace("\n", "")
+
+    return coords
+
+
+class TeeSink():                                        # pylint:disable=R0902
+
+    """Class:  TeeSink
+
+    Description:  One branch of a dump stream teed into several load
+        processes.  The chunks are queued for a writer thread up to a bounded
+        depth.  If the load process falls behind and the queue fills, the
+        rest of the stream is spilled to a temporary file that the writer
+        reads back at the load process's own pace, so a slow clone does not
+        hold back the others.
+
+    Methods:
+        __init__
+        put
+        close
+        run
+        wait
+
+    """
+
+    def __init__(self, proc, **kwargs):
+
+        """Method:  __init__
+
+        Description:  Class initialization and start of the writer thread.
+
+        Arguments:
+            (input) proc -> Load process reading from its stdin
+            (input) **kwargs:
+                depth -> Number of chunks queued before spilling to disk
+                spill_dir -> Directory of the spill file
+
+        """
+
+        self.proc = proc
+        self.queue = queue.Queue(maxsize=kwargs.get("depth", 32))
+        self.spill_dir = kwargs.get("spill_dir")
+        self.spill = None
+        self.spilled = 0
+        self.done = False
+        self.error = None
+        self.cond = threading.Condition()
+        self.thr = threading.Thread(target=self.run, daemon=True)
+        self.thr.start()
+
+    def put(self, chunk):
+
+        """Method:  put
+
+        Description:  Add a chunk of the stream, spilling it to disk once the
+            queue has filled.
+
+        Arguments:
+            (input) chunk -> Bytes of the stream
+
+        """
+
+        if self.error:
+            return
+
+        if self.spill is None:
+            try:
+                self.queue.put_nowait(chunk)
+
+                return
+
+            except queue.Full:
+                self.spill = tempfile.TemporaryFile(   # pylint:disable=R1732
+                    dir=self.spill_dir)
+
+        os.pwrite(self.spill.fileno(), chunk, self.spilled)
+
+        with self.cond:
+            self.spilled += len(chunk)
+            self.cond.notify()
+
+    def close(self):
+
+        """Method:  close
+
+        Description:  Mark the end of the stream.
+
+        Arguments:
+
+        """
+
+        with self.cond:
+            self.done = True
+            self.cond.notify()
+
+    def run(self):
+
+        """Method:  run
+
+        Description:  Writer thread that feeds the queued chunks and then the
+            spill file into the load process.
+
+        Arguments:
+
+        """
+
+        try:
+            while True:
+                try:
+                    chunk = self.queue.get(timeout=0.1)
+
+                except queue.Empty:
+                    # No more chunks are queued once spilling or closed
+                    if self.spill is not None or self.done:
+                        break
+
+                    continue
+
+                self.proc.stdin.write(chunk)
+
+            offset = 0
+
+            while self.spill is not None:
+                with self.cond:
+                    while offset == self.spilled and not self.done:
+                        self.cond.wait()
+
+                    end = self.spilled
+
+                if offset == end:
+                    break
+
+                data = os.pread(
+                    self.spill.fileno(), min(end - offset, 1024 * 1024),
+                    offset)
+                self.proc.stdin.write(data)
+                offset += len(data)
+
+        except OSError as err:
+            self.error = err
+
+        finally:
+            try:
+                self.proc.stdin.close()
+
+            except OSError:
+                pass
+
+    def wait(self):
+
+        """Method:  wait
+
+        Description:  Wait for the writer thread and the load process to
+            complete and remove the spill file.
+
+        Arguments:
+            (output) status -> True|False - Stream loaded successfully
+
+        """
+
+        self.thr.join()
+        self.proc.wait()
+
+        if self.spill is not None:
+            self.spill.close()
+
+        return self.error is None and self.proc.returncode == 0
+
+
+def fan_dump_load(dump_cmd, loads, err_file, **kwargs):
+
+    """Function:  fan_dump_load
+
+    Description:  Dumps the databases once and tees the dump stream into a
+        load process for each clone.  The coordinates written at the head of
+        the dump are returned so every clone is pointed at the same position.
+
+    Arguments:
+        (input) dump_cmd -> Database dump command line
+        (input) loads -> List of clone names and load command lines
+        (input) err_file -> File handler for the dump error messages
+        (input) **kwargs:
+            spill_dir -> Directory of the spill files
+            throttle -> Throttle class instance
+            pids -> List the dump process id is added to
+        (output) status -> True|False - All clones loaded successfully
+        (output) coords -> Dictionary of the dump coordinates
+
+    """
+
+    chunk_size = 1024 * 1024
+    proc = subprocess.Popen(                            # pylint:disable=R1732
+        dump_cmd, stdout=subprocess.PIPE, stderr=err_file)
+    kwargs.get("pids", []).append(proc.pid)
+    sinks = [TeeSink(subprocess.Popen(                  # pylint:disable=R1732
+        load_cmd, stdin=subprocess.PIPE), spill_dir=kwargs.get("spill_dir"))
+             for _, load_cmd in loads]
+    throttle = kwargs.get("throttle")
+    head = b""
+    coords = {}
+
+    try:
+        while True:
+            chunk = proc.stdout.read(chunk_size)
+
+            if not chunk:
+                break
+
+            if throttle:
+                throttle.take(len(chunk))
+
+            if not coords and len(head) < chunk_size:
+                head += chunk
+                coords = dump_coords(head)
+
+            for sink in sinks:
+                sink.put(chunk)
+
+    finally:
+        proc.stdout.close()
+
+        for sink in sinks:
+            sink.close()
+
+    status = True
+
+    for (name, _), sink in zip(loads, sinks):
+        if not sink.wait():
+            print(f"Error:  Load into clone {name} failed.")
+            status = False
+
+    proc.wait()
+
+    return status and proc.returncode == 0, coords
+
+
+def relay_dump_load(dump_cmd, load_cmd, err_file, **kwargs):
+
+    """Function:  relay_dump_load
+
+    Description:  Dumps the databases and relays the dump into the load
+        process, then reports the size and rate of the dump.
+
+    Arguments:
+        (input) dump_cmd -> Database dump command line
+        (input) load_cmd -> Database load command line
+        (input) err_file -> File handler for the dump error messages
+        (input) **kwargs:
+            throttle -> Throttle class instance
+            pids -> List the dump process id is added to
+        (output) status -> True|False - Dump and load completed successfully
+
+    """
+
+    mbyte = 1024 * 1024
+    proc1 = subprocess.Popen(                           # pylint:disable=R1732
+        dump_cmd, stdout=subprocess.PIPE, stderr=err_file)
+    kwargs.get("pids", []).append(proc1.pid)
+    proc2 = subprocess.Popen(                           # pylint:disable=R1732
+        load_cmd, stdin=subprocess.PIPE)
+    start = time.time()
+    total = 0
+
+    try:
+        total = relay(
+            proc1.stdout, proc2.stdin,
+            tick=kwargs["throttle"].take if kwargs.get("throttle") else None)
+
+    except BrokenPipeError:
+        # Load process exited before the end of the dump
+        proc1.kill()
+
+    finally:
+        proc1.stdout.close()
+        proc2.stdin.close()
+
+    proc2.wait()
+    proc1.wait()
+    secs = max(time.time() - start, 0.001)
+    print(f"Dump relayed:  {total / mbyte:.1f} MB in {secs:.1f} seconds,"
+          f" {total / mbyte / secs:.1f} MB/s")
+
+    return proc1.returncode == 0 and proc2.returncode == 0
+
+
+def crt_health(args, throttle, health_cfg):
+
+    """Function:  crt_health
+
+    Description:  Creates the health controller of the -o option, connected
+        to the server being dumped and to the replicas of the -w option whose
+        lag is watched.
+
+    Arguments:
+        (input) args -> ArgParser class instance
+        (input) throttle -> Throttle class instance
+        (input) health_cfg -> Dictionary of the limits and the interval
+        (output) health -> HealthCtl class instance or None if a server did
+            not connect
+
+    """
+
+    server = mysql_libs.create_instance(
+        args.get_val("-m", def_val=args.get_val("-c")), args.get_val("-d"),
+        mysql_class.Server)
+    replicas = [
+        mysql_libs.create_instance(
+            cfg, args.get_val("-d"), mysql_class.SlaveRep)
+        for cfg in args.get_val("-w", def_val="").split(",") if cfg]
+
+    for item in [server] + replicas:
+        item.connect(silent=True)
+
+    if any(item.conn_msg for item in [server] + replicas):
+        print("Warning:  Health control not started, connection error:")
+
+        for item in [server] + replicas:
+            if item.conn_msg:
+                print(f"\t{item.conn_msg}")
+
+        mysql_libs.disconnect(server, *replicas)
+
+        return None
+
+    return HealthCtl(server, throttle, health_cfg, replicas=replicas)
+
+
+def crt_rsc_grp(args, **kwargs):
+
+    """Function:  crt_rsc_grp
+
+    Description:  Creates the resource group of the -q option on the server
+        being dumped, over a connection of its own.  Resource groups require
+        MySQL 8.0.3 and above and the RESOURCE_GROUP_ADMIN privilege.
+
+    Arguments:
+        (input) args -> ArgParser class instance
+        (input) **kwargs:
+            pids -> List of the process ids of the run's mysqldump processes
+        (output) rsc_grp -> RscGroup class instance or None if the group was
+            not created
+
+    """
+
+    server = mysql_libs.create_instance(
+        args.get_val("-m", def_val=args.get_val("-c")), args.get_val("-d"),
+        mysql_class.Server)
+    server.connect(silent=True)
+
+    if server.conn_msg:
+        print(f"Warning:  Resource group not created, connection error:"
+              f" {server.conn_msg}")
+
+        return None
+
+    vcpus, priority = parse_rsc_grp(args.get_val("-q"))
+    rsc_grp = RscGroup(
+        server, "mysql_clone" + (
+            "_" + args.get_val("-y") if args.arg_exist("-y") else ""),
+        vcpus, priority, pids=kwargs.get("pids", []))
+
+    try:
+        if server.version < (8, 0, 3):
+            raise ValueError("requires MySQL 8.0.3 and above")
+
+        rsc_grp.create()
+
+    except Exception as err:                            # pylint:disable=W0718
+        print(f"Warning:  Resource group not created: {err}")
+        mysql_libs.disconnect(server)
+
+        return None
+
+    return rsc_grp
+
+
+def crt_undo_guard(args, undo_cfg, **kwargs):
+
+    """Function:  crt_undo_guard
+
+    Description:  Creates the undo guard of the dump, connected to the server
+        being dumped.
+
+    Arguments:
+        (input) args -> ArgParser class instance
+        (input) undo_cfg -> Dictionary of the thresholds and the interval
+        (input) **kwargs:
+            throttle -> Throttle class instance slowed down by the guard
+            pids -> List of the process ids of the run's mysqldump processes
+        (output) guard -> UndoGuard class instance or None if the server did
+            not connect
+
+    """
+
+    server = mysql_libs.create_instance(
+        args.get_val("-m", def_val=args.get_val("-c")), args.get_val("-d"),
+        mysql_class.Server)
+    server.connect(silent=True)
 
-        else:
-            cfg_flag = False
-            print("Error:  Missing option in class.")
+    if server.conn_msg:
+        print(f"Warning:  Undo guard not started, connection error:"
+              f" {server.conn_msg}")
 
-    return cfg_flag
+        return None
 
+    return UndoGuard(server, undo_cfg, throttle=kwargs.get("throttle"),
+                     pids=kwargs.get("pids", []))
 
-def crt_dump_cmd(server, args, opt_arg_list, opt_dump_list):
 
-    """Function:  crt_dump_cmd
+def crt_xfer_meter(args):
 
-    Description:  Create the database dump command line.
+    """Function:  crt_xfer_meter
+
+    Description:  Creates the transfer meter of the -z option, connected to
+        the server being dumped with the account of the dump sessions.
 
     Arguments:
-        (input) server -> Database server instance
         (input) args -> ArgParser class instance
-        (input) opt_arg_list -> List of commands to add to cmd line
-        (input) opt_dump_list -> Dictionary of additional options
-        (output) -> Database dump command line
+        (output) meter -> XferMeter class instance or None if the server did
+            not connect
 
     """
 
-    opt_arg_list = list(opt_arg_list)
-    opt_dump_list = dict(opt_dump_list)
-    dump_args = mysql_libs.crt_cmd(
-        server, args.arg_set_path("-p", cmd="mysqldump"))
+    server = mysql_libs.create_instance(
+        args.get_val("-m", def_val=args.get_val("-c")), args.get_val("-d"),
+        mysql_class.Server)
+    server.connect(silent=True)
 
-    # Add arguments to dump command
-    for arg in opt_arg_list:
-        dump_args = gen_libs.add_cmd(dump_args, arg=arg)
+    if server.conn_msg:
+        print(f"Warning:  Transfer not measured, connection error:"
+              f" {server.conn_msg}")
 
-    # Append additional options to command
-    return gen_libs.is_add_cmd(args, dump_args, opt_dump_list)
+        return None
 
+    return XferMeter(server)
 
-def dump_load_dbs(source, clone, args, req_rep_cfg, opt_arg_list, **kwargs):
+
+def dump_load_dbs(                           # pylint:disable=R0912,R0914,R0915
+        source, clone, args, req_rep_cfg, opt_arg_list, **kwargs):
 
     """Function:  dump_load_dbs
 
-    Description:  Dumps and loads all databases in a single transaction.
+    Description:  Dumps and loads all databases in a single transaction.  If
+        the -j option is used, the databases are dumped and loaded in parallel
+        from a single consistent snapshot and the snapshot's coordinates are
+        returned for the replication setup.  The -e option does the same for a
+        single stream using the native dump engine and the -l option loads that
+        stream with the native loader.  The -s option dumps tab separated files
+        loaded with LOAD DATA.  The -g option loads the databases streamed by
+        an agent next to the source.  The -f option applies the bulk load
+        profile to the clone for the length of the load.  On MySQL 8.0.26 and
+        above the single stream is dumped from a snapshot taken under a backup
+        lock, which does not block the source's writes, if the source's user
+        has the privileges to coordinate it.  Several clones are dumped under
+        --source-data.  The -z option compresses the connections of the mysql
+        programs and reports the compression ratio and throughput.  The -u
+        option throttles the dump streams and reports their rates against the
+        limits, and the -o option adapts the throttle to the health of the
+        server being dumped.  The -q option runs the dump sessions in a
+        resource group capping their CPU on the server being dumped.  The undo
+        guard watches the history left behind by the dump's read view when
+        undo_cfg is passed.  The -B option saves the buffer pool of the server
+        being dumped before the dump and reloads it after the dump, reporting
+        the hit ratio.  Additional clones passed in fan_out are loaded from the
+        same dump stream as the clone.  The dump-load fails if any of its steps
+        fail or the undo guard aborts the dump.
 
     Arguments:
         (input) source -> Source server instance
@@ -211,40 +5423,283 @@ def dump_load_dbs(source, clone, args, req_rep_cfg, opt_arg_list, **kwargs):
         (input) opt_arg_list -> List of options to add to dump cmd line
         (input) **kwargs:
             opt_dump_list -> Dictionary of additional options
+            fan_out -> List of additional destination server instances
+            health_cfg -> Dictionary of the health limits and interval
+            undo_cfg -> Dictionary of the undo guard thresholds and interval
+        (output) status -> True|False - Dump and load completed successfully
+        (output) coords -> Dictionary of the snapshot coordinates
 
     """
 
     req_rep_cfg = dict(req_rep_cfg)
     opt_arg_list = list(opt_arg_list)
+    clones = [clone] + list(kwargs.get("fan_out", []))
+    status = False
+    coords = {}
+    start = time.time()
+    meter = None
+    sent = 0
+
+    # Process ids of the dump processes, shared with the guard and group
+    pids = []
+
+    if args.arg_exist("-z"):
+        opt_arg_list.extend(crt_compress(
+            source, args.arg_set_path("-p", cmd="mysqldump"),
+            args.get_val("-z")))
+        meter = crt_xfer_meter(args)
+
     dump_cmd = crt_dump_cmd(
         source, args, opt_arg_list, list(kwargs.get("opt_dump_list", [])))
     efile = gen_libs.crt_file_time("mysql_clone_err_log", "/" + "tmp")
     err_file = open(efile, mode="w", encoding="UTF-8")  # pylint:disable=R1732
 
-    if source.gtid_mode != clone.gtid_mode and not clone.gtid_mode \
+    if source.gtid_mode and not all(item.gtid_mode for item in clones) \
        and args.arg_exist("-n") and not args.arg_exist("-r"):
 
         dump_cmd = gen_libs.is_add_cmd(
             {"-r": "True"}, dump_cmd, list(kwargs.get("opt_dump_list", [])))
 
-    load_cmd = mysql_libs.crt_cmd(
-        clone, args.arg_set_path("-p", cmd="mysql"))
+    load_cmd = crt_load_cmd(clone, args, chk_no_log(clone, args, False))
+    bulk_cfg = fetch_bulk_cfg(clone) if args.arg_exist("-f") else {}
+    limited = args.arg_exist("-u") or args.arg_exist("-o")
 
-    if clone.gtid_mode:
-        mysql_libs.reset_master(clone)
+    # Without limits the throttle only counts the bytes dumped for the meter
+    throttle = Throttle(args.get_val("-u", def_val="0")) \
+        if limited or meter else None
+    health = crt_health(args, throttle, kwargs.get("health_cfg", {})) \
+        if args.arg_exist("-o") else None
+    rsc_grp = crt_rsc_grp(args, pids=pids) if args.arg_exist("-q") else None
 
-    # Dump databases, pipe into load, and wait until completed
-    proc1 = subprocess.Popen(                           # pylint:disable=R1732
-        dump_cmd, stdout=subprocess.PIPE, stderr=err_file)
-    proc2 = subprocess.Popen(                           # pylint:disable=R1732
-        load_cmd, stdin=proc1.stdout)
-    proc2.wait()
+    # The health controller throttles on the history list itself
+    guard = crt_undo_guard(
+        args, kwargs["undo_cfg"],
+        throttle=throttle if args.arg_exist("-u") and not health else None,
+        pids=pids) if kwargs.get("undo_cfg") else None
+
+    bp_stats = [("up to the dump", fetch_bp_stat(source))] \
+        if args.arg_exist("-B") else []
+
+    for item in clones:
+        if item.gtid_mode:
+            mysql_libs.reset_master(item)
+
+    if bp_stats:
+        dump_bp(source)
+
+    try:
+        if bulk_cfg:
+            set_bulk_cfg(clone, bulk_cfg)
+
+        if health:
+            health.start()
+
+        # The native dump engine's session is guarded as well
+        if guard and (args.arg_exist("-e") or args.arg_exist("-s")):
+            guard.sessions.append(source.col_sql(
+                "select connection_id() as id")[0]["id"])
+
+        if guard:
+            guard.start()
+
+        if meter:
+            meter.start()
+
+        if rsc_grp:
+            rsc_grp.start()
+
+            # The native dump engine dumps over the source's own session
+            if args.arg_exist("-e") or args.arg_exist("-s"):
+                source.cmd_sql(
+                    f"set resource group {sql_ident(rsc_grp.name)}")
+
+        if args.arg_exist("-g"):
+            status, coords = agent_dump_load(clone, args)
+
+            if not status:
+                print("Error:  Agent dump-load failed.")
+
+        elif args.arg_exist("-s"):
+            status, coords = tab_dump_load(
+                source, clone, args, opt_arg_list, throttle=throttle)
+
+            if not status:
+                print("Error:  Tab separated dump-load failed.")
+
+        elif args.arg_exist("-j"):
+            status, coords = par_dump_load(
+                source, clone, args, opt_arg_list, err_file,
+                opt_dump_list=kwargs.get("opt_dump_list", {}),
+                throttle=throttle, pids=pids)
+
+            if not status:
+                print("Error:  One or more parallel dump-load tasks failed.")
+
+        elif args.arg_exist("-e"):
+            status, coords = native_dump_load(
+                source, clone, args, opt_arg_list, throttle=throttle)
+
+            if not status:
+                print("Error:  Native dump-load failed.")
+
+        elif len(clones) > 1:
+            status, coords = fan_dump_load(dump_cmd, [
+                (item.name, crt_load_cmd(
+                    item, args, chk_no_log(item, args, False)))
+                for item in clones], err_file, throttle=throttle, pids=pids)
+
+            if not status:
+                print("Error:  Fan-out dump-load failed.")
+
+        elif source.version >= (8, 0, 26) and chk_snap_privs(source):
+            # A backup lock does not block the writes as --source-data does
+            status, coords = par_dump_load(
+                source, clone, args, opt_arg_list, err_file,
+                opt_dump_list=kwargs.get("opt_dump_list", {}),
+                throttle=throttle, pids=pids, tasks=[{
+                    "name": "all", "dbs": fetch_dbs(source), "phase": 1,
+                    "size": 0}])
+
+            if not status:
+                print("Error:  Dump-load failed.")
+
+        else:
+            # Dump databases, relay into load, and wait until completed
+            status = relay_dump_load(
+                dump_cmd, load_cmd, err_file, throttle=throttle, pids=pids)
+
+            if not status:
+                print("Error:  Dump-load failed.")
+
+    finally:
+        # Restored first so a failed cleanup step cannot leave the clone
+        # without its durability settings
+        if bulk_cfg:
+            # Long term processes can cause connection timeouts
+            connect_chk(clone)
+
+            if not rst_bulk_cfg(
+                    clone, bulk_cfg, req_cfg=None if args.arg_exist("-n")
+                    else req_rep_cfg["slave"]):
+                print("Error:  Clone settings not restored after the bulk"
+                      " load.")
+
+        if health:
+            health.stop()
+            mysql_libs.disconnect(health.server, *health.replicas)
+
+        if rsc_grp:
+            rsc_grp.stop()
+            mysql_libs.disconnect(rsc_grp.server)
+
+        if guard:
+            guard.stop()
+            mysql_libs.disconnect(guard.server)
+
+            if guard.aborted:
+                print("Error:  Dump aborted by the undo guard.")
+                status = False
+
+        if meter:
+            sent = meter.stop()
+            mysql_libs.disconnect(meter.server)
+
+        if bp_stats:
+            # Long term processes can cause connection timeouts
+            connect_chk(source)
+            bp_stats.append(("during the dump", fetch_bp_stat(source)))
+            load_bp(source)
+            bp_stats.append(("during the reload", fetch_bp_stat(source)))
+            print(bp_report(bp_stats))
+
+    if meter:
+        xfer_report(start, throttle.totals["bytes"], sent)
+
+    if limited:
+        print(throttle.report())
 
     err_file.close()
 
     if not gen_libs.is_empty_file(efile):
         print(f"Review the contents of error file: {efile}")
 
+    return status, coords
+
+
+def replica_sql_thread(replica, action):
+
+    """Function:  replica_sql_thread
+
+    Description:  Starts or stops the SQL thread of a replica, leaving its IO
+        thread running.
+
+    Arguments:
+        (input) replica -> Replica server instance
+        (input) action -> start|stop
+
+    """
+
+    cmd = f"{action} replica sql_thread" if replica.version >= (8, 0, 22) \
+        else f"{action} slave sql_thread"
+    replica.cmd_sql(cmd)
+
+
+def replica_dump_load(replica, clone, args, req_rep_cfg, opt_arg_list,
+                      **kwargs):
+
+    """Function:  replica_dump_load
+
+    Description:  Dumps the databases from a replica of the source instead
+        of the source itself (-m option).  The replica's SQL thread is
+        stopped for the length of the dump so its data stays at the source
+        coordinates it has executed up to, which are returned for the
+        replication setup.  The SQL thread is restarted once the dump-load
+        completes or fails.
+
+    Arguments:
+        (input) replica -> Replica server instance
+        (input) clone -> Destination server instance
+        (input) args -> ArgParser class instance
+        (input) req_rep_cfg -> Required replication config settings
+        (input) opt_arg_list -> List of options to add to dump cmd line
+        (input) **kwargs:
+            opt_dump_list -> Dictionary of additional options
+            fan_out -> List of additional destination server instances
+        (output) status -> True|False - Dump and load completed successfully
+        (output) coords -> Dictionary of the source coordinates
+
+    """
+
+    # Coordinates in the dump would be the replica's own binary log
+    opt_arg_list = [
+        opt for opt in opt_arg_list
+        if not opt.startswith(("--source-data", "--master-data"))]
+    replica.upd_slv_status()
+    _, _, sql_thr, _ = replica.get_thr_stat()
+    running = gen_libs.is_true(sql_thr)
+
+    if running:
+        replica_sql_thread(replica, "stop")
+
+    try:
+        replica.upd_slv_status()
+        _, relay_file, _, exec_pos = replica.get_log_info()
+        coords = {"file": relay_file, "pos": exec_pos,
+                  "gtid": str(replica.exe_gtid).replace("\n", "")
+                  if replica.gtid_mode else ""}
+        print(f"Replica {replica.get_name()} stopped at {relay_file}"
+              f" {exec_pos}")
+        status, _ = dump_load_dbs(
+            replica, clone, args, req_rep_cfg, opt_arg_list, **kwargs)
+
+    finally:
+        if running:
+            # Long term processes can cause connection timeouts
+            connect_chk(replica)
+            replica_sql_thread(replica, "start")
+
+    return status, coords
+
 
 def stop_clr_rep(clone, args):
 
@@ -479,19 +5934,71 @@ def chk_mst_log(master, slave, **kwargs):
         print("\nchk_mst_log:  Warning:  Missing Master and Slave instances.")
 
 
-def chk_rep(clone, args):
+def wait_slv(slave, **kwargs):
+
+    """Function:  wait_slv
+
+    Description:  Wait for the slave's IO and SQL threads to start running
+        after a start slave, polling its status on a backoff that starts
+        short and doubles up to a cap.  Gives up as soon as either thread
+        reports an error.  The slave's status is left updated by the last
+        poll.
+
+    Arguments:
+        (input) slave -> Slave instance
+        (input) **kwargs:
+            timeout -> Number of seconds to wait before giving up
+            interval -> Number of seconds of the first wait
+            max_interval -> Longest number of seconds between checks
+        (output) status -> True|False - IO and SQL threads are running
+
+    """
+
+    end_time = time.time() + kwargs.get("timeout", 60)
+    wait = kwargs.get("interval", 0.1)
+
+    while True:
+        slave.upd_slv_status()
+        _, io_thr, sql_thr, _ = slave.get_thr_stat()
+        ioerr, sqlerr = slave.get_err_stat()[:2]
+
+        if ioerr or sqlerr:
+            return False
+
+        if gen_libs.is_true(io_thr) and gen_libs.is_true(sql_thr):
+            return True
+
+        if time.time() >= end_time:
+            return False
+
+        time.sleep(min(wait, max(end_time - time.time(), 0)))
+        wait = min(wait * 2, kwargs.get("max_interval", 5))
+
+
+def chk_rep(clone, args, **kwargs):
 
     """Function:  chk_rep
 
     Description:  Create master and slave instances and check the status of the
-        replication system between the two servers.
+        replication system between the two servers.  If snapshot coordinates
+        were captured during the dump, they are used for the change master
+        to instead of the coordinates written into the dump file.  Once the
+        slave is started its IO and SQL threads are polled until they are
+        running, report an error or the -R option's deadline passes, and the
+        time replication took to start is reported.
 
     Arguments:
         (input) clone -> Destination server instance
         (input) args -> ArgParser class instance
+        (input) **kwargs:
+            coords -> Dictionary of the snapshot coordinates
+            clone_cfg -> Clone configuration file, default is the -t option
 
     """
 
+    coords = dict(kwargs.get("coords", {}))
+    clone_cfg = kwargs.get("clone_cfg", args.get_val("-t"))
+
     if not args.arg_exist("-n"):
         master = mysql_libs.create_instance(
             args.get_val("-c"), args.get_val("-d"), mysql_class.MasterRep)
@@ -503,9 +6010,13 @@ def chk_rep(clone, args):
             print("Warning: No Change Master To was executed")
 
         else:
+            if coords.get("file"):
+                master.file = coords["file"]
+                master.pos = coords["pos"]
+
             mysql_libs.change_master_to(master, clone)
             slave = mysql_libs.create_instance(
-                args.get_val("-t"), args.get_val("-d"), mysql_class.SlaveRep)
+                clone_cfg, args.get_val("-d"), mysql_class.SlaveRep)
             slave.connect(silent=True)
 
             if slave.conn_msg:
@@ -515,11 +6026,19 @@ def chk_rep(clone, args):
                 mysql_libs.disconnect(master)
 
             else:
+                start = time.time()
                 slave.start_slave()
-                # Wait for slave to start
-                time.sleep(5)
+
+                if wait_slv(
+                        slave, timeout=int(args.get_val("-R", def_val=60))):
+                    print(f"Replication started in {time.time() - start:.1f}"
+                          f" seconds")
+
+                else:
+                    print(f"Warning:  Replication not running after"
+                          f" {time.time() - start:.1f} seconds")
+
                 master.upd_mst_status()
-                slave.upd_slv_status()
                 chk_slv_err([slave])
                 chk_slv_thr([slave])
                 chk_mst_log(master, [slave])
@@ -542,13 +6061,20 @@ def connect_chk(server):
         server.connect()
 
 
-def run_program(args, req_rep_cfg, opt_arg_list, **kwargs):
+def run_program(                             # pylint:disable=R0912,R0914,R0915
+        args, req_rep_cfg, opt_arg_list, **kwargs):
 
     """Function:  run_program
 
     Description:  Creates class instance(s) and controls flow of the program.
         Also determines whether the cloning operation is for replication or as
-        a stand-along server.
+        a stand-along server and whether it is a physical clone (-i option)
+        or a dump and load.  Several clones (-t option) are all loaded from
+        one dump of the source, which is taken from a replica of the source
+        with the -m option.  With the -H option each clone's buffer pool is
+        warmed from the source's hottest indexes, sampled before the dump,
+        before its replication is checked.  The clones are neither warmed
+        nor set up for replication if the clone or dump-load fails.
 
     Arguments:
         (input) args -> ArgParser class instance
@@ -556,36 +6082,45 @@ def run_program(args, req_rep_cfg, opt_arg_list, **kwargs):
         (input) opt_arg_list -> List of options to add to dump cmd line
         (input) **kwargs:
             opt_dump_list -> Dictionary of additional options
+        (output) status -> True|False - Clone completed successfully
 
     """
 
     req_rep_cfg = dict(req_rep_cfg)
     opt_arg_list = list(opt_arg_list)
+    clone_cfgs = args.get_val("-t").split(",")
     source = mysql_libs.create_instance(
         args.get_val("-c"), args.get_val("-d"), mysql_class.Server)
-    clone = mysql_libs.create_instance(
-        args.get_val("-t"), args.get_val("-d"), mysql_class.Server)
+    clones = [mysql_libs.create_instance(
+        cfg, args.get_val("-d"), mysql_class.Server) for cfg in clone_cfgs]
     source.connect(silent=True)
-    clone.connect(silent=True)
 
-    if source.conn_msg or clone.conn_msg:
+    for clone in clones:
+        clone.connect(silent=True)
+
+    if source.conn_msg or any(clone.conn_msg for clone in clones):
         print("run_program: Error encountered with connection of source/clone")
         print(f"\tSource:  {source.conn_msg}")
-        print(f"\tClone:  {clone.conn_msg}")
-        mysql_libs.disconnect(source, clone)
 
-        return
+        for clone in clones:
+            print(f"\tClone:  {clone.conn_msg}")
+
+        mysql_libs.disconnect(source, *clones)
+
+        return False
 
     source.set_srv_gtid()
-    clone.set_srv_gtid()
 
-    status, status_msg = mysql_libs.is_cfg_valid([source, clone])
+    for clone in clones:
+        clone.set_srv_gtid()
+
+    status, status_msg = mysql_libs.is_cfg_valid([source] + clones)
 
     # Master cannot be set to loopback IP if setting up replication
     if source.host in ["127.0.0.1", "localhost"] \
        and not args.arg_exist("-n"):
 
-        mysql_libs.disconnect(source, clone)
+        mysql_libs.disconnect(source, *clones)
         print("Error:  Detected problem in the configuration file.")
         print("Master host entry has incorrect entry.")
         print(f"Master host: {source.host}")
@@ -593,38 +6128,336 @@ def run_program(args, req_rep_cfg, opt_arg_list, **kwargs):
         for msg in status_msg:
             print(msg)
 
-        return
+        return False
 
     # Do not proceed if GTID modes don't match
-    if source.gtid_mode != clone.gtid_mode and not args.arg_exist("-n"):
-        print(f"Error:  Source {source.gtid_mode} and Clone"
-              f" {clone.gtid_mode} GTID modes do not match.")
-        mysql_libs.disconnect(source, clone)
+    for clone in clones:
+        if source.gtid_mode != clone.gtid_mode and not args.arg_exist("-n"):
+            print(f"Error:  Source {source.gtid_mode} and Clone"
+                  f" {clone.gtid_mode} GTID modes do not match.")
+            mysql_libs.disconnect(source, *clones)
+
+            return False
+
+    dump_arg_list = opt_arg_list
+    rep_status = []
+
+    for clone in clones:
+        stop_clr_rep(clone, args)
+        # Add to argument list array based on rep config
+        dump_arg_list, clone_status = chk_rep_cfg(
+            source, clone, args, req_rep_cfg, opt_arg_list)
+        rep_status.append(clone_status)
+
+    status = all(rep_status)
+    replica = None
+
+    if status and args.arg_exist("-m"):
+        replica = mysql_libs.create_instance(
+            args.get_val("-m"), args.get_val("-d"), mysql_class.SlaveRep)
+        replica.connect(silent=True)
 
-        return
+        if replica.conn_msg:
+            print("run_program: Error encountered with connection of replica")
+            print(f"\tReplica:  {replica.conn_msg}")
+            mysql_libs.disconnect(source, *clones)
 
-    stop_clr_rep(clone, args)
-    # Add to argument list array based on rep config
-    opt_arg_list, status = chk_rep_cfg(
-        source, clone, args, req_rep_cfg, opt_arg_list)
+            return False
+
+        replica.set_srv_gtid()
+        replica.upd_slv_status()
+
+        if not replica.get_log_info()[1]:
+            print(f"Error:  {replica.get_name()} is not a replica.")
+            mysql_libs.disconnect(source, replica, *clones)
+
+            return False
 
     if status:
-        print("Starting dump-load process...")
-        dump_load_dbs(
-            source, clone, args, req_rep_cfg, opt_arg_list, **kwargs)
-        print("Finished dump-load process...")
+        hot = fetch_hot_idx(source) if args.arg_exist("-H") else []
+
+        if args.arg_exist("-i"):
+            print("Starting physical clone process...")
+            status, coords = phys_clone(source, clones[0])
+            print("Finished physical clone process...")
+
+        elif replica:
+            print("Starting dump-load process from replica...")
+            status, coords = replica_dump_load(
+                replica, clones[0], args, req_rep_cfg, dump_arg_list,
+                fan_out=clones[1:], **kwargs)
+            print("Finished dump-load process...")
+
+        else:
+            print("Starting dump-load process...")
+            status, coords = dump_load_dbs(
+                source, clones[0], args, req_rep_cfg, dump_arg_list,
+                fan_out=clones[1:], **kwargs)
+            print("Finished dump-load process...")
+
+        for cfg, clone in zip(clone_cfgs, clones):
+            # Long term processes can cause connection timeouts
+            connect_chk(clone)
 
-        # Long term processes can cause connection timeouts
-        connect_chk(clone)
-        chk_rep(clone, args)
-        mysql_libs.disconnect(source, clone)
+            if status:
+                if hot:
+                    warm_clone(clone, args, hot)
+
+                chk_rep(clone, args, coords=coords, clone_cfg=cfg)
+
+        if not status:
+            print("Error:  Clone failed, replication not set up.")
+
+        mysql_libs.disconnect(source, *clones)
+
+        if replica:
+            mysql_libs.disconnect(replica)
 
     else:
         print("Error: Master and/or Slave rep config did not pass.")
-        mysql_libs.disconnect(source, clone)
+        mysql_libs.disconnect(source, *clones)
+
+    return status
+
+
+def run_agent(args, opt_arg_list, **kwargs):
+
+    """Function:  run_agent
 
+    Description:  Runs the program as an agent next to the source (-a
+        option).  The agent listens on the address and port of the -a
+        option and waits for a receiver that authenticates with the shared
+        secret (-S option), then dumps the databases in parallel from a
+        single consistent snapshot and streams them to the receiver over the
+        connection.
 
-def main():
+    Arguments:
+        (input) args -> ArgParser class instance
+        (input) opt_arg_list -> List of options to add to dump cmd line
+        (input) **kwargs:
+            opt_dump_list -> Dictionary of additional options
+        (output) status -> True|False - Databases sent successfully
+
+    """
+
+    source = mysql_libs.create_instance(
+        args.get_val("-c"), args.get_val("-d"), mysql_class.Server)
+    source.connect(silent=True)
+
+    if source.conn_msg:
+        print("run_agent: Error encountered with connection of source")
+        print(f"\tSource:  {source.conn_msg}")
+
+        return False
+
+    source.set_srv_gtid()
+    secret = read_secret(args.get_val("-S"))
+    host, port = args.get_val("-a").rsplit(":", 1)
+    efile = gen_libs.crt_file_time("mysql_clone_err_log", "/" + "tmp")
+
+    with socket.create_server((host, int(port))) as server, \
+            open(efile, mode="w", encoding="UTF-8") as err_file:
+
+        print(f"Agent waiting for a receiver on {host}:{port}")
+        sock, addr = server.accept()
+
+        # Connections without the shared secret are turned away
+        while True:
+            with sock:
+                sock.settimeout(30)
+
+                if agent_auth(sock, secret):
+                    sock.settimeout(None)
+                    print(f"Receiver connected from {addr[0]}")
+
+                    status = agent_send(
+                        sock, source, args, opt_arg_list, err_file,
+                        opt_dump_list=kwargs.get("opt_dump_list", {}))
+
+                    if not status:
+                        print("Error:  Agent dump failed.")
+
+                    break
+
+            print(f"Warning:  Connection from {addr[0]} failed to"
+                  f" authenticate, closed.")
+            sock, addr = server.accept()
+
+    if not gen_libs.is_empty_file(efile):
+        print(f"Review the contents of error file: {efile}")
+
+    mysql_libs.disconnect(source)
+
+    return status
+
+
+def chk_int_opts(args, opt_int_list):
+
+    """Function:  chk_int_opts
+
+    Description:  Checks the options that require a positive integer value.
+
+    Arguments:
+        (input) args -> ArgParser class instance
+        (input) opt_int_list -> List of options requiring integer values
+        (output) status -> True|False - All option values are valid
+
+    """
+
+    status = True
+
+    for opt in list(opt_int_list):
+        if args.arg_exist(opt):
+            val = str(args.get_val(opt))
+
+            if not val.isdigit() or int(val) < 1:
+                print(f"Error:  {opt} requires a positive integer: {val}")
+                status = False
+
+    return status
+
+
+def chk_agent_opts(args):
+
+    """Function:  chk_agent_opts
+
+    Description:  Checks the address and port of the agent (-a option) and
+        of its receiver (-g option), and the shared secret file of the -S
+        option.
+
+    Arguments:
+        (input) args -> ArgParser class instance
+        (output) status -> True|False - Option values are valid
+
+    """
+
+    status = True
+
+    for opt in ["-a", "-g"]:
+        if args.arg_exist(opt):
+            host, _, port = str(args.get_val(opt)).rpartition(":")
+
+            if not host or not port.isdigit() or not 0 < int(port) < 65536:
+                print(f"Error:  {opt} requires host:port:"
+                      f" {args.get_val(opt)}")
+                status = False
+
+    if args.arg_exist("-S"):
+        try:
+            read_secret(args.get_val("-S"))
+
+        except (OSError, ValueError) as err:
+            print(f"Error:  -S shared secret not read: {err}")
+            status = False
+
+    return status
+
+
+def chk_xor_opts(args, opt_xor_dict):
+
+    """Function:  chk_xor_opts
+
+    Description:  Checks the options that cannot be used together.
+
+    Arguments:
+        (input) args -> ArgParser class instance
+        (input) opt_xor_dict -> Dictionary of the options not used with each
+            option
+        (output) status -> True|False - Options are valid
+
+    """
+
+    status = True
+
+    for opt, excl in dict(opt_xor_dict).items():
+        for item in list(excl):
+            if args.arg_exist(opt) and args.arg_exist(item):
+                print(f"Error:  {opt} cannot be used with {item}")
+                status = False
+
+    return status
+
+
+def chk_fan_opts(args, opt_fan_excl):
+
+    """Function:  chk_fan_opts
+
+    Description:  Checks the options that cannot be used when several clones
+        are passed to the -t option.
+
+    Arguments:
+        (input) args -> ArgParser class instance
+        (input) opt_fan_excl -> List of options not used with several clones
+        (output) status -> True|False - Options are valid
+
+    """
+
+    status = True
+
+    if args.arg_exist("-t") and "," in args.get_val("-t"):
+        for opt in list(opt_fan_excl):
+            if args.arg_exist(opt):
+                print(f"Error:  {opt} cannot be used with several clones"
+                      f" (-t option)")
+                status = False
+
+    return status
+
+
+def chk_rate_opts(args):
+
+    """Function:  chk_rate_opts
+
+    Description:  Checks the throttle rates of the -u option, unless its
+        value is a control file.
+
+    Arguments:
+        (input) args -> ArgParser class instance
+        (output) status -> True|False - Option value is valid
+
+    """
+
+    status = True
+
+    if args.arg_exist("-u") and not os.path.isfile(args.get_val("-u")):
+        try:
+            parse_rates(args.get_val("-u"))
+
+        except ValueError:
+            print(f"Error:  -u requires MB/s[,rows/s] or a control file:"
+                  f" {args.get_val('-u')}")
+            status = False
+
+    return status
+
+
+def chk_rsc_opts(args):
+
+    """Function:  chk_rsc_opts
+
+    Description:  Checks the resource group of the -q option.
+
+    Arguments:
+        (input) args -> ArgParser class instance
+        (output) status -> True|False - Option value is valid
+
+    """
+
+    status = True
+
+    if args.arg_exist("-q"):
+        try:
+            parse_rsc_grp(args.get_val("-q"))
+
+        except ValueError:
+            print(f"Error:  -q requires cpus[:priority], priority 0 to 19:"
+                  f" {args.get_val('-q')}")
+            status = False
+
+    return status
+
+
+def main():                                             # pylint:disable=R0914
 
     """Function:  main
 
@@ -633,26 +6466,54 @@ def main():
 
     Variables:
         dir_perms_chk -> contains directories and their octal permissions
+        opt_fan_excl -> contains options not used with several clones
         opt_arg_list -> contains arguments to add to command line by default
         opt_con_req_list -> contains the options that require other options
         opt_dump_list -> contains optional arguments for mysqldump command
+        opt_int_list -> contains options which require integer values
+        opt_req_agent -> contains the options that are required for the agent
         opt_req_list -> contains the options that are required for the program
         opt_val_list -> contains options which require values
+        opt_xor_dict -> contains the options not used with each option
+        health_cfg -> contains the health limits, sample interval, pause
+            time allowed and floors of unlimited rates
+        undo_cfg -> contains the undo guard thresholds and sample interval
         req_rep_cfg -> contains replication config settings got master/slave
 
     Arguments:
         (input) argv -> Arguments from the command line
+        (output) Exit status, non-zero if the clone failed
 
     """
 
-    dir_perms_chk = {"-d": 5, "-p": 5}
+    status = True
+    dir_perms_chk = {"-d": 5, "-p": 5, "-s": 7}
+    opt_fan_excl = ["-i", "-j", "-e", "-s", "-g", "-f"]
     opt_arg_list = [
         "--single-transaction", "--all-databases", "--triggers", "--routines",
         "--events", "--ignore-table=mysql.event"]
-    opt_con_req_list = {"-r": ["-n"]}
+    opt_con_req_list = {
+        "-r": ["-n"], "-k": ["-j"], "-l": ["-e"], "-b": ["-l"],
+        "-a": ["-j", "-S"], "-g": ["-S"], "-w": ["-o"]}
     opt_dump_list = {"-r": "--set-gtid-purged=OFF"}
+    opt_int_list = ["-j", "-k", "-b", "-z", "-R"]
+    opt_req_agent = ["-c", "-d"]
     opt_req_list = ["-c", "-t", "-d"]
-    opt_val_list = ["-c", "-t", "-d", "-p", "-y"]
+    opt_val_list = [
+        "-c", "-t", "-d", "-p", "-y", "-j", "-k", "-b", "-s", "-z", "-a",
+        "-g", "-m", "-u", "-w", "-q", "-R", "-S"]
+    opt_xor_dict = {
+        "-e": ["-j", "-s"], "-f": ["-i"], "-z": ["-i"], "-B": ["-i"],
+        "-m": ["-i", "-g"], "-u": ["-i", "-g"], "-o": ["-i", "-g"],
+        "-q": ["-i", "-g"], "-R": ["-n"]}
+    health_cfg = {
+        "threads_running": 32, "row_lock_waits": 10, "history_len": 1000000,
+        "replica_lag": 60, "interval": 5, "max_pause": 600, "floor_mb": 5,
+        "floor_rows": 5000}
+    undo_cfg = {
+        "warn": {"history_len": 1000000, "undo_mb": 4096},
+        "throttle": {"history_len": 2000000, "undo_mb": 8192},
+        "abort": {"history_len": 0, "undo_mb": 0}, "interval": 10}
     req_rep_cfg = {
         "master": {
             "log_bin": "ON", "sync_binlog": "1",
@@ -665,23 +6526,42 @@ def main():
     # Process argument list from command line
     args = gen_class.ArgParser(sys.argv, opt_val=opt_val_list)
 
+    # pylint:disable=R0916
     if args.arg_parse2()                                            \
        and not gen_libs.help_func(args, __version__, help_message)  \
        and args.arg_cond_req(opt_con_req=opt_con_req_list)          \
-       and args.arg_require(opt_req=opt_req_list)                   \
-       and args.arg_dir_chk(dir_perms_chk=dir_perms_chk):
+       and args.arg_require(opt_req=opt_req_agent if args.arg_exist("-a")
+                            else opt_req_list)                      \
+       and args.arg_dir_chk(dir_perms_chk=dir_perms_chk)            \
+       and chk_int_opts(args, opt_int_list)                         \
+       and chk_agent_opts(args)                                     \
+       and chk_xor_opts(args, opt_xor_dict)                         \
+       and chk_fan_opts(args, opt_fan_excl)                         \
+       and chk_rate_opts(args)                                      \
+       and chk_rsc_opts(args):
 
         try:
             proglock = gen_class.ProgramLock(
                 sys.argv, args.get_val("-y", def_val=""))
-            run_program(
-                args, req_rep_cfg, opt_arg_list, opt_dump_list=opt_dump_list)
+
+            if args.arg_exist("-a"):
+                status = run_agent(
+                    args, opt_arg_list, opt_dump_list=opt_dump_list)
+
+            else:
+                status = run_program(
+                    args, req_rep_cfg, opt_arg_list,
+                    opt_dump_list=opt_dump_list, health_cfg=health_cfg,
+                    undo_cfg=undo_cfg)
+
             del proglock
 
         except gen_class.SingleInstanceException:
             print(f'WARNING:  lock in place for mysql_clone with id of:'
                   f' {args.get_val("-y", def_val="")}')
 
+    return 0 if status else 1
+
 
 if __name__ == "__main__":
     sys.exit(main())
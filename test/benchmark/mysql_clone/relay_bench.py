@@ -0,0 +1,161 @@
+#!/usr/bin/python
+# Classification (U)
+
+"""Program:  relay_bench.py
+
+    Description:  Throughput benchmark of the dump stream relay in
+        mysql_clone.py.  A stream of zeros is piped from a producer process
+        into a consumer process directly, through the kernel relay
+        (splice) and through the buffer pool relay, and the throughput of
+        each is reported.
+
+    Usage:
+        test/benchmark/mysql_clone/relay_bench.py [size_mb [rounds]]
+
+    Arguments:
+        size_mb => Size of the stream in megabytes.  Default is 2048.
+        rounds => Number of runs of each method, the best is reported.
+            Default is 3.
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import time
+import subprocess
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_clone                              # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+def producer(size_mb):
+
+    """Function:  producer
+
+    Description:  Start a process writing a stream of zeros to its stdout.
+
+    Arguments:
+        (input) size_mb -> Size of the stream in megabytes
+        (output) proc -> Producer process
+
+    """
+
+    return subprocess.Popen(                            # pylint:disable=R1732
+        ["dd", "if=/dev/zero", "bs=1M", f"count={size_mb}"],
+        stdout=subprocess.PIPE, stderr=subprocess.DEVNULL)
+
+
+def consumer(stdin):
+
+    """Function:  consumer
+
+    Description:  Start a process reading a stream from its stdin.
+
+    Arguments:
+        (input) stdin -> Stream to read
+        (output) proc -> Consumer process
+
+    """
+
+    return subprocess.Popen(                            # pylint:disable=R1732
+        ["cat"], stdin=stdin, stdout=subprocess.DEVNULL)
+
+
+def run_direct(size_mb):
+
+    """Function:  run_direct
+
+    Description:  Pipe the producer directly into the consumer.
+
+    Arguments:
+        (input) size_mb -> Size of the stream in megabytes
+
+    """
+
+    proc1 = producer(size_mb)
+    proc2 = consumer(proc1.stdout)
+    proc1.stdout.close()
+    proc2.wait()
+    proc1.wait()
+
+
+def run_relay(size_mb, func):
+
+    """Function:  run_relay
+
+    Description:  Relay the producer into the consumer.
+
+    Arguments:
+        (input) size_mb -> Size of the stream in megabytes
+        (input) func -> Relay function called with the two pipes
+
+    """
+
+    proc1 = producer(size_mb)
+    proc2 = consumer(subprocess.PIPE)
+    func(proc1.stdout, proc2.stdin)
+    proc1.stdout.close()
+    proc2.stdin.close()
+    proc2.wait()
+    proc1.wait()
+
+
+def pool_only(src, dst):
+
+    """Function:  pool_only
+
+    Description:  Relay through the buffer pool without the kernel relay.
+
+    Arguments:
+        (input) src -> File object to read
+        (input) dst -> File object to write
+
+    """
+
+    mysql_clone.pool_relay(
+        src.fileno(), dst.fileno(), mysql_clone.BufPool(), lambda cnt: None)
+
+
+def main():
+
+    """Function:  main
+
+    Description:  Run each method and print its best throughput.
+
+    Variables:
+        size_mb -> Size of the stream in megabytes
+        rounds -> Number of runs of each method
+
+    Arguments:
+        (input) argv -> Arguments from the command line
+
+    """
+
+    size_mb = int(sys.argv[1]) if len(sys.argv) > 1 else 2048
+    rounds = int(sys.argv[2]) if len(sys.argv) > 2 else 3
+    methods = [
+        ("direct pipe", run_direct),
+        ("relay", lambda size: run_relay(size, mysql_clone.relay)),
+        ("buffer pool", lambda size: run_relay(size, pool_only))]
+
+    for name, func in methods:
+        best = None
+
+        for _ in range(rounds):
+            start = time.time()
+            func(size_mb)
+            secs = time.time() - start
+            best = secs if best is None else min(best, secs)
+
+        print(f"{name:12}  {size_mb / best:8.1f} MB/s  ({best:.2f} seconds)")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
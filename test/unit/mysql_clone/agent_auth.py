@@ -0,0 +1,167 @@
+# Classification (U)
+
+"""Program:  agent_auth.py
+
+    Description:  Unit testing of agent_auth in mysql_clone.py.
+
+    Usage:
+        test/unit/mysql_clone/agent_auth.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import socket
+import threading
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_clone                              # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        tearDown
+        receiver
+        handshake
+        test_wrong_secret
+        test_bad_answer
+        test_closed
+        test_auth
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.sock, self.peer = socket.socketpair()
+        self.results = {}
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Clean up of unit testing.
+
+        Arguments:
+
+        """
+
+        self.sock.close()
+        self.peer.close()
+
+    def receiver(self, secret):
+
+        """Function:  receiver
+
+        Description:  Run the receiver side of the handshake.
+
+        Arguments:
+
+        """
+
+        self.results["receiver"] = mysql_clone.recv_auth(self.peer, secret)
+
+    def handshake(self, secret, peer_secret):
+
+        """Function:  handshake
+
+        Description:  Run the receiver side of the handshake in a thread and
+            the agent side here.
+
+        Arguments:
+
+        """
+
+        thr = threading.Thread(target=self.receiver, args=(peer_secret,))
+        thr.start()
+        status = mysql_clone.agent_auth(self.sock, secret)
+
+        # A rejected receiver sees the connection closed
+        if not status:
+            self.sock.shutdown(socket.SHUT_RDWR)
+
+        thr.join()
+
+        return status
+
+    def test_wrong_secret(self):
+
+        """Function:  test_wrong_secret
+
+        Description:  Test with a receiver holding another secret.
+
+        Arguments:
+
+        """
+
+        self.assertFalse(self.handshake(b"secret", b"guess"))
+        self.assertFalse(self.results["receiver"])
+
+    def test_bad_answer(self):
+
+        """Function:  test_bad_answer
+
+        Description:  Test with an answer of the wrong length.
+
+        Arguments:
+
+        """
+
+        self.peer.sendall(
+            mysql_clone.MSG.pack(0, mysql_clone.MSG_AUTH, 3) + b"abc")
+
+        self.assertFalse(mysql_clone.agent_auth(self.sock, b"secret"))
+
+    def test_closed(self):
+
+        """Function:  test_closed
+
+        Description:  Test with the connection closed before the answer.
+
+        Arguments:
+
+        """
+
+        self.peer.close()
+
+        self.assertFalse(mysql_clone.agent_auth(self.sock, b"secret"))
+
+    def test_auth(self):
+
+        """Function:  test_auth
+
+        Description:  Test with both sides holding the shared secret.
+
+        Arguments:
+
+        """
+
+        self.assertTrue(self.handshake(b"secret", b"secret"))
+        self.assertTrue(self.results["receiver"])
+
+
+if __name__ == "__main__":
+    unittest.main()
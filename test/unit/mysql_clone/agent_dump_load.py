@@ -0,0 +1,247 @@
+# Classification (U)
+
+"""Program:  agent_dump_load.py
+
+    Description:  Unit testing of agent_dump_load in mysql_clone.py.
+
+    Usage:
+        test/unit/mysql_clone/agent_dump_load.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_clone                              # pylint:disable=E0401,C0413
+import lib.gen_libs as gen_libs             # pylint:disable=E0401,C0413,R0402
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class ArgParser():
+
+    """Class:  ArgParser
+
+    Description:  Class stub holder for gen_class.ArgParser class.
+
+    Methods:
+        __init__
+        arg_exist
+        get_val
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.cmdline = None
+        self.args_array = {"-g": "master:5000", "-S": "secret_file"}
+
+    def arg_exist(self, arg):
+
+        """Method:  arg_exist
+
+        Description:  Method stub holder for gen_class.ArgParser.arg_exist.
+
+        Arguments:
+
+        """
+
+        return arg in self.args_array
+
+    def get_val(self, skey, def_val=None):
+
+        """Method:  get_val
+
+        Description:  Method stub holder for gen_class.ArgParser.get_val.
+
+        Arguments:
+
+        """
+
+        return self.args_array.get(skey, def_val)
+
+
+class Server():                                         # pylint:disable=R0903
+
+    """Class:  Server
+
+    Description:  Class stub holder for mysql_class.Server class.
+
+    Methods:
+        __init__
+        cmd_sql
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.gtid_mode = True
+        self.cmds = []
+
+    def cmd_sql(self, cmd):
+
+        """Method:  cmd_sql
+
+        Description:  Method stub holder for mysql_class.Server.cmd_sql.
+
+        Arguments:
+
+        """
+
+        self.cmds.append(cmd)
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_auth_failed
+        test_load_failed
+        test_remove_gtid
+        test_loaded
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.clone = Server()
+        self.args = ArgParser()
+        self.coords = {"file": "binlog.000001", "pos": 1234,
+                       "gtid": "uuid:1-10"}
+
+    @mock.patch("mysql_clone.recv_auth", mock.Mock(return_value=False))
+    @mock.patch("mysql_clone.read_secret", mock.Mock(return_value=b"secret"))
+    @mock.patch("mysql_clone.crt_load_cmd", mock.Mock(return_value=["mysql"]))
+    @mock.patch("mysql_clone.chk_no_log", mock.Mock(return_value=True))
+    @mock.patch("mysql_clone.socket.create_connection", mock.MagicMock())
+    @mock.patch("mysql_clone.agent_recv")
+    def test_auth_failed(self, mock_recv):
+
+        """Function:  test_auth_failed
+
+        Description:  Test with the agent failing to authenticate.
+
+        Arguments:
+
+        """
+
+        with gen_libs.no_std_out():
+            self.assertEqual(
+                mysql_clone.agent_dump_load(self.clone, self.args),
+                (False, {}))
+
+        mock_recv.assert_not_called()
+
+    @mock.patch("mysql_clone.recv_auth", mock.Mock(return_value=True))
+    @mock.patch("mysql_clone.read_secret", mock.Mock(return_value=b"secret"))
+    @mock.patch("mysql_clone.crt_load_cmd", mock.Mock(return_value=["mysql"]))
+    @mock.patch("mysql_clone.chk_no_log", mock.Mock(return_value=True))
+    @mock.patch("mysql_clone.socket.create_connection", mock.MagicMock())
+    @mock.patch("mysql_clone.agent_recv")
+    def test_load_failed(self, mock_recv):
+
+        """Function:  test_load_failed
+
+        Description:  Test with the streams failing to load.
+
+        Arguments:
+
+        """
+
+        mock_recv.return_value = (False, self.coords)
+
+        self.assertEqual(
+            mysql_clone.agent_dump_load(self.clone, self.args),
+            (False, self.coords))
+        self.assertEqual(self.clone.cmds, [])
+
+    @mock.patch("mysql_clone.recv_auth", mock.Mock(return_value=True))
+    @mock.patch("mysql_clone.read_secret", mock.Mock(return_value=b"secret"))
+    @mock.patch("mysql_clone.crt_load_cmd", mock.Mock(return_value=["mysql"]))
+    @mock.patch("mysql_clone.chk_no_log")
+    @mock.patch("mysql_clone.socket.create_connection", mock.MagicMock())
+    @mock.patch("mysql_clone.agent_recv")
+    def test_remove_gtid(self, mock_recv, mock_log):
+
+        """Function:  test_remove_gtid
+
+        Description:  Test with the -r option removing the GTID entries.
+
+        Arguments:
+
+        """
+
+        self.args.args_array["-r"] = True
+        mock_recv.return_value = (True, self.coords)
+
+        mysql_clone.agent_dump_load(self.clone, self.args)
+
+        self.assertFalse(mock_log.call_args[0][2])
+        self.assertEqual(self.clone.cmds, [])
+
+    @mock.patch("mysql_clone.recv_auth", mock.Mock(return_value=True))
+    @mock.patch("mysql_clone.read_secret", mock.Mock(return_value=b"secret"))
+    @mock.patch("mysql_clone.crt_load_cmd", mock.Mock(return_value=["mysql"]))
+    @mock.patch("mysql_clone.chk_no_log", mock.Mock(return_value=True))
+    @mock.patch("mysql_clone.socket.create_connection")
+    @mock.patch("mysql_clone.agent_recv")
+    def test_loaded(self, mock_recv, mock_conn):
+
+        """Function:  test_loaded
+
+        Description:  Test with the streams loaded and the GTID set.
+
+        Arguments:
+
+        """
+
+        mock_recv.return_value = (True, self.coords)
+
+        self.assertEqual(
+            mysql_clone.agent_dump_load(self.clone, self.args),
+            (True, self.coords))
+        self.assertEqual(mock_conn.call_args[0][0], ("master", 5000))
+        self.assertEqual(
+            self.clone.cmds, ["set global gtid_purged = 'uuid:1-10'"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,351 @@
+# Classification (U)
+
+"""Program:  agent_recv.py
+
+    Description:  Unit testing of agent_recv in mysql_clone.py.
+
+    Usage:
+        test/unit/mysql_clone/agent_recv.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import json
+import socket
+import threading
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_clone                              # pylint:disable=E0401,C0413
+import lib.gen_libs as gen_libs             # pylint:disable=E0401,C0413,R0402
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class Stdin():
+
+    """Class:  Stdin
+
+    Description:  Class stub holder for a process stdin pipe.
+
+    Methods:
+        __init__
+        write
+        close
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.data = b""
+        self.closed = False
+
+    def write(self, data):
+
+        """Method:  write
+
+        Description:  Stub holder for write method.
+
+        Arguments:
+
+        """
+
+        self.data += data
+
+    def close(self):
+
+        """Method:  close
+
+        Description:  Stub holder for close method.
+
+        Arguments:
+
+        """
+
+        self.closed = True
+
+
+class Popen():
+
+    """Class:  Popen
+
+    Description:  Class stub holder for subprocess.Popen class.
+
+    Methods:
+        __init__
+        kill
+        wait
+
+    """
+
+    def __init__(self, returncode=0):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.stdin = Stdin()
+        self.returncode = returncode
+        self.killed = False
+
+    def kill(self):
+
+        """Method:  kill
+
+        Description:  Kill function.
+
+        Arguments:
+
+        """
+
+        self.killed = True
+
+    def wait(self):
+
+        """Method:  wait
+
+        Description:  Wait function.
+
+        Arguments:
+
+        """
+
+        return self.returncode
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        tearDown
+        send_json
+        send_stream
+        test_no_snapshot
+        test_agent_closed
+        test_bad_load_args
+        test_load_failed
+        test_dump_failed
+        test_stream_loaded
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.sock, self.peer = socket.socketpair()
+        self.lock = threading.Lock()
+        self.load_cmd = ["mysql", "-u", "user"]
+        self.coords = {"file": "binlog.000001", "pos": 1234,
+                       "gtid": "uuid:1-10"}
+        self.proc = Popen()
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Clean up of unit testing.
+
+        Arguments:
+
+        """
+
+        self.sock.close()
+        self.peer.close()
+
+    def send_json(self, sid, kind, data):
+
+        """Function:  send_json
+
+        Description:  Send a message with a JSON payload to the receiver.
+
+        Arguments:
+
+        """
+
+        mysql_clone.send_msg(
+            self.peer, self.lock, sid, kind, json.dumps(data).encode("UTF-8"))
+
+    def send_stream(self, rc=0):
+
+        """Function:  send_stream
+
+        Description:  Send a whole stream to the receiver.
+
+        Arguments:
+
+        """
+
+        self.send_json(0, mysql_clone.MSG_META,
+                       {"status": True, "coords": self.coords})
+        self.send_json(1, mysql_clone.MSG_OPEN,
+                       {"name": "db1", "load_args": ["--database=db1"]})
+        mysql_clone.send_msg(
+            self.peer, self.lock, 1, mysql_clone.MSG_DATA,
+            mysql_clone.compress_block(b"insert data", 1))
+        self.send_json(1, mysql_clone.MSG_END, {"rc": rc})
+
+    def test_no_snapshot(self):
+
+        """Function:  test_no_snapshot
+
+        Description:  Test with the agent's dump sessions not opening a
+            snapshot.
+
+        Arguments:
+
+        """
+
+        self.send_json(0, mysql_clone.MSG_META, {"status": False,
+                                                 "coords": {}})
+
+        self.assertEqual(
+            mysql_clone.agent_recv(self.sock, self.load_cmd), (False, {}))
+
+    @mock.patch("mysql_clone.subprocess.Popen")
+    def test_agent_closed(self, mock_popen):
+
+        """Function:  test_agent_closed
+
+        Description:  Test with the agent closing the connection before the
+            dump completed.
+
+        Arguments:
+
+        """
+
+        mock_popen.return_value = self.proc
+        self.send_json(0, mysql_clone.MSG_META,
+                       {"status": True, "coords": self.coords})
+        self.send_json(1, mysql_clone.MSG_OPEN,
+                       {"name": "db1", "load_args": []})
+        self.peer.close()
+
+        with gen_libs.no_std_out():
+            status, _ = mysql_clone.agent_recv(self.sock, self.load_cmd)
+
+        self.assertFalse(status)
+        self.assertTrue(self.proc.killed)
+
+    @mock.patch("mysql_clone.subprocess.Popen")
+    def test_bad_load_args(self, mock_popen):
+
+        """Function:  test_bad_load_args
+
+        Description:  Test with a stream passing other client options.
+
+        Arguments:
+
+        """
+
+        self.send_json(0, mysql_clone.MSG_META,
+                       {"status": True, "coords": self.coords})
+        self.send_json(1, mysql_clone.MSG_OPEN,
+                       {"name": "db1",
+                        "load_args": ["--init-command=drop database db1"]})
+
+        with gen_libs.no_std_out():
+            status, _ = mysql_clone.agent_recv(self.sock, self.load_cmd)
+
+        self.assertFalse(status)
+        mock_popen.assert_not_called()
+
+    @mock.patch("mysql_clone.subprocess.Popen")
+    def test_load_failed(self, mock_popen):
+
+        """Function:  test_load_failed
+
+        Description:  Test with the load process failing.
+
+        Arguments:
+
+        """
+
+        mock_popen.return_value = Popen(returncode=1)
+        self.send_stream()
+        self.send_json(0, mysql_clone.MSG_DONE, {"status": True})
+
+        with gen_libs.no_std_out():
+            status, _ = mysql_clone.agent_recv(self.sock, self.load_cmd)
+
+        self.assertFalse(status)
+
+    @mock.patch("mysql_clone.subprocess.Popen")
+    def test_dump_failed(self, mock_popen):
+
+        """Function:  test_dump_failed
+
+        Description:  Test with the agent's dump process failing.
+
+        Arguments:
+
+        """
+
+        mock_popen.return_value = self.proc
+        self.send_stream(rc=2)
+        self.send_json(0, mysql_clone.MSG_DONE, {"status": False})
+
+        with gen_libs.no_std_out():
+            status, _ = mysql_clone.agent_recv(self.sock, self.load_cmd)
+
+        self.assertFalse(status)
+
+    @mock.patch("mysql_clone.subprocess.Popen")
+    def test_stream_loaded(self, mock_popen):
+
+        """Function:  test_stream_loaded
+
+        Description:  Test with a stream loaded into its own load process.
+
+        Arguments:
+
+        """
+
+        mock_popen.return_value = self.proc
+        self.send_stream()
+        self.send_json(0, mysql_clone.MSG_DONE, {"status": True})
+
+        self.assertEqual(
+            mysql_clone.agent_recv(self.sock, self.load_cmd),
+            (True, self.coords))
+        self.assertEqual(
+            mock_popen.call_args[0][0],
+            ["mysql", "-u", "user", "--database=db1"])
+        self.assertEqual(self.proc.stdin.data, b"insert data")
+        self.assertTrue(self.proc.stdin.closed)
+        self.assertFalse(self.proc.killed)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,211 @@
+# Classification (U)
+
+"""Program:  agent_send.py
+
+    Description:  Unit testing of agent_send in mysql_clone.py.
+
+    Usage:
+        test/unit/mysql_clone/agent_send.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import json
+import socket
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_clone                              # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class ArgParser():                                      # pylint:disable=R0903
+
+    """Class:  ArgParser
+
+    Description:  Class stub holder for gen_class.ArgParser class.
+
+    Methods:
+        __init__
+        get_val
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.cmdline = None
+        self.args_array = {"-j": "2"}
+
+    def get_val(self, skey, def_val=None):
+
+        """Method:  get_val
+
+        Description:  Method stub holder for gen_class.ArgParser.get_val.
+
+        Arguments:
+
+        """
+
+        return self.args_array.get(skey, def_val)
+
+
+def recv_json(sock):
+
+    """Function:  recv_json
+
+    Description:  Receive a message and decode its payload.
+
+    Arguments:
+
+    """
+
+    sid, kind, payload = mysql_clone.recv_msg(sock)
+
+    return sid, kind, json.loads(payload)
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        tearDown
+        test_no_snapshot
+        test_task_failed
+        test_phases
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.sock, self.peer = socket.socketpair()
+        self.args = ArgParser()
+        self.opt_arg_list = ["--single-transaction", "--all-databases"]
+        self.coords = {"file": "binlog.000001", "pos": 1234,
+                       "gtid": "uuid:1-10"}
+        self.tasks = [
+            {"name": "a:triggers", "phase": 3}, {"name": "a:data", "phase": 2},
+            {"name": "a:schema", "phase": 1}]
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Clean up of unit testing.
+
+        Arguments:
+
+        """
+
+        self.sock.close()
+        self.peer.close()
+
+    @mock.patch("mysql_clone.agent_task")
+    @mock.patch("mysql_clone.start_dumps",
+                mock.Mock(return_value=(False, [], [], {})))
+    def test_no_snapshot(self, mock_task):
+
+        """Function:  test_no_snapshot
+
+        Description:  Test with dump sessions not opening a snapshot.
+
+        Arguments:
+
+        """
+
+        self.assertFalse(
+            mysql_clone.agent_send(
+                self.sock, "Source", self.args, self.opt_arg_list, "ErrFile"))
+        self.assertEqual(
+            recv_json(self.peer),
+            (0, mysql_clone.MSG_META, {"status": False, "coords": {}}))
+        self.assertEqual(
+            recv_json(self.peer),
+            (0, mysql_clone.MSG_DONE, {"status": False}))
+        self.assertFalse(mock_task.called)
+
+    @mock.patch("mysql_clone.agent_task", mock.Mock(side_effect=[True, False]))
+    @mock.patch("mysql_clone.start_dumps")
+    def test_task_failed(self, mock_start):
+
+        """Function:  test_task_failed
+
+        Description:  Test with a task failing to dump.
+
+        Arguments:
+
+        """
+
+        mock_start.return_value = (
+            True, [{"name": "a", "phase": 2}, {"name": "b", "phase": 2}],
+            ["Proc1", "Proc2"], self.coords)
+
+        self.assertFalse(
+            mysql_clone.agent_send(
+                self.sock, "Source", self.args, self.opt_arg_list, "ErrFile"))
+        self.assertEqual(
+            recv_json(self.peer),
+            (0, mysql_clone.MSG_META, {"status": True,
+                                       "coords": self.coords}))
+        self.assertEqual(
+            recv_json(self.peer),
+            (0, mysql_clone.MSG_DONE, {"status": False}))
+
+    @mock.patch("mysql_clone.agent_task")
+    @mock.patch("mysql_clone.start_dumps")
+    def test_phases(self, mock_start, mock_task):
+
+        """Function:  test_phases
+
+        Description:  Test with tasks sent in order of phases on their own
+            stream ids.
+
+        Arguments:
+
+        """
+
+        mock_start.return_value = (
+            True, self.tasks, ["Proc1", "Proc2", "Proc3"], self.coords)
+        mock_task.return_value = True
+
+        self.assertTrue(
+            mysql_clone.agent_send(
+                self.sock, "Source", self.args, self.opt_arg_list, "ErrFile"))
+        self.assertEqual(
+            [(call[0][2], call[0][3], call[0][4]["name"])
+             for call in mock_task.call_args_list],
+            [(3, "Proc3", "a:schema"), (2, "Proc2", "a:data"),
+             (1, "Proc1", "a:triggers")])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,160 @@
+# Classification (U)
+
+"""Program:  agent_task.py
+
+    Description:  Unit testing of agent_task in mysql_clone.py.
+
+    Usage:
+        test/unit/mysql_clone/agent_task.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import io
+import json
+import socket
+import threading
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_clone                              # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class Popen():                                          # pylint:disable=R0903
+
+    """Class:  Popen
+
+    Description:  Class stub holder for subprocess.Popen class.
+
+    Methods:
+        __init__
+        wait
+
+    """
+
+    def __init__(self, data, returncode=0):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.stdout = io.BytesIO(data)
+        self.returncode = returncode
+
+    def wait(self):
+
+        """Method:  wait
+
+        Description:  Wait function.
+
+        Arguments:
+
+        """
+
+        return self.returncode
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        tearDown
+        test_dump_failed
+        test_task_sent
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.sock, self.peer = socket.socketpair()
+        self.lock = threading.Lock()
+        self.task = {"name": "db1.t1#0", "load_args": ["--database=db1"]}
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Clean up of unit testing.
+
+        Arguments:
+
+        """
+
+        self.sock.close()
+        self.peer.close()
+
+    def test_dump_failed(self):
+
+        """Function:  test_dump_failed
+
+        Description:  Test with the dump process failing.
+
+        Arguments:
+
+        """
+
+        self.assertFalse(
+            mysql_clone.agent_task(
+                self.sock, self.lock, 1, Popen(b"", returncode=2), self.task))
+        mysql_clone.recv_msg(self.peer)
+
+        self.assertEqual(
+            mysql_clone.recv_msg(self.peer),
+            (1, mysql_clone.MSG_END, json.dumps({"rc": 2}).encode("UTF-8")))
+
+    def test_task_sent(self):
+
+        """Function:  test_task_sent
+
+        Description:  Test with the task dump sent as compressed frames.
+
+        Arguments:
+
+        """
+
+        self.assertTrue(
+            mysql_clone.agent_task(
+                self.sock, self.lock, 4, Popen(b"insert data"), self.task))
+
+        sid, kind, payload = mysql_clone.recv_msg(self.peer)
+        self.assertEqual((sid, kind), (4, mysql_clone.MSG_OPEN))
+        self.assertEqual(json.loads(payload), self.task)
+
+        sid, kind, payload = mysql_clone.recv_msg(self.peer)
+        self.assertEqual((sid, kind), (4, mysql_clone.MSG_DATA))
+        self.assertEqual(
+            list(mysql_clone.read_frames(io.BytesIO(payload))),
+            [b"insert data"])
+
+        self.assertEqual(
+            mysql_clone.recv_msg(self.peer)[:2], (4, mysql_clone.MSG_END))
+
+
+if __name__ == "__main__":
+    unittest.main()
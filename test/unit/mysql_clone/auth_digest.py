@@ -0,0 +1,92 @@
+# Classification (U)
+
+"""Program:  auth_digest.py
+
+    Description:  Unit testing of auth_digest in mysql_clone.py.
+
+    Usage:
+        test/unit/mysql_clone/auth_digest.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import hmac
+import hashlib
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_clone                              # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_roles
+        test_digest
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.nonce = b"a" * 32
+        self.peer_nonce = b"b" * 32
+
+    def test_roles(self):
+
+        """Function:  test_roles
+
+        Description:  Test with the agent's and receiver's digests differing
+            for the same challenges.
+
+        Arguments:
+
+        """
+
+        self.assertNotEqual(
+            mysql_clone.auth_digest(
+                b"secret", "agent", self.nonce, self.peer_nonce),
+            mysql_clone.auth_digest(
+                b"secret", "receiver", self.nonce, self.peer_nonce))
+
+    def test_digest(self):
+
+        """Function:  test_digest
+
+        Description:  Test with the HMAC-SHA256 of the role and challenges.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            mysql_clone.auth_digest(
+                b"secret", "agent", self.nonce, self.peer_nonce),
+            hmac.new(b"secret", b"agent" + self.nonce + self.peer_nonce,
+                     hashlib.sha256).digest())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,81 @@
+# Classification (U)
+
+"""Program:  bp_report.py
+
+    Description:  Unit testing of bp_report in mysql_clone.py.
+
+    Usage:
+        test/unit/mysql_clone/bp_report.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_clone                              # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        test_no_requests
+        test_report
+
+    """
+
+    def test_no_requests(self):
+
+        """Function:  test_no_requests
+
+        Description:  Test with no read requests between samples.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            mysql_clone.bp_report([("during the dump", {})]),
+            "Buffer pool hit ratio:  during the dump 100.00%"
+            " (0 reads of 0 requests)")
+
+    def test_report(self):
+
+        """Function:  test_report
+
+        Description:  Test with the hit ratio since startup and between the
+            samples.
+
+        Arguments:
+
+        """
+
+        stats = [
+            ("up to the dump", {"Innodb_buffer_pool_read_requests": "10000",
+                                "Innodb_buffer_pool_reads": "10"}),
+            ("during the dump", {"Innodb_buffer_pool_read_requests": "20000",
+                                 "Innodb_buffer_pool_reads": "1010"})]
+
+        self.assertEqual(
+            mysql_clone.bp_report(stats),
+            "Buffer pool hit ratio:  up to the dump 99.90%"
+            " (10 reads of 10000 requests), during the dump 90.00%"
+            " (1000 reads of 10000 requests)")
+
+
+if __name__ == "__main__":
+    unittest.main()
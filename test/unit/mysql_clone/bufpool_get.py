@@ -0,0 +1,93 @@
+# Classification (U)
+
+"""Program:  bufpool_get.py
+
+    Description:  Unit testing of BufPool.get in mysql_clone.py.
+
+    Usage:
+        test/unit/mysql_clone/bufpool_get.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import threading
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_clone                              # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_wait_for_put
+        test_free_buffer
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.pool = mysql_clone.BufPool(count=1, size=4)
+
+    def test_wait_for_put(self):
+
+        """Function:  test_wait_for_put
+
+        Description:  Test with all of the buffers in use.
+
+        Arguments:
+
+        """
+
+        buf = self.pool.get()
+        got = []
+        thr = threading.Thread(target=lambda: got.append(self.pool.get()))
+        thr.start()
+        thr.join(0.1)
+
+        self.assertEqual(got, [])
+
+        self.pool.put(buf)
+        thr.join()
+
+        self.assertIs(got[0], buf)
+
+    def test_free_buffer(self):
+
+        """Function:  test_free_buffer
+
+        Description:  Test with a free buffer.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(self.pool.get(), bytearray(4))
+        self.assertEqual(self.pool.free.qsize(), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,74 @@
+# Classification (U)
+
+"""Program:  bufpool_init.py
+
+    Description:  Unit testing of BufPool.__init__ in mysql_clone.py.
+
+    Usage:
+        test/unit/mysql_clone/bufpool_init.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_clone                              # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        test_kwargs
+        test_default
+
+    """
+
+    def test_kwargs(self):
+
+        """Function:  test_kwargs
+
+        Description:  Test with the number and size of the buffers passed.
+
+        Arguments:
+
+        """
+
+        pool = mysql_clone.BufPool(count=3, size=16)
+
+        self.assertEqual((pool.count, pool.size), (3, 16))
+        self.assertEqual(pool.free.qsize(), 3)
+        self.assertEqual(len(pool.get()), 16)
+
+    def test_default(self):
+
+        """Function:  test_default
+
+        Description:  Test with the default settings.
+
+        Arguments:
+
+        """
+
+        pool = mysql_clone.BufPool()
+
+        self.assertEqual((pool.count, pool.size), (8, 1024 * 1024))
+        self.assertEqual(pool.free.qsize(), 8)
+
+
+if __name__ == "__main__":
+    unittest.main()
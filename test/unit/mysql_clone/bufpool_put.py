@@ -0,0 +1,59 @@
+# Classification (U)
+
+"""Program:  bufpool_put.py
+
+    Description:  Unit testing of BufPool.put in mysql_clone.py.
+
+    Usage:
+        test/unit/mysql_clone/bufpool_put.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_clone                              # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        test_put
+
+    """
+
+    def test_put(self):
+
+        """Function:  test_put
+
+        Description:  Test with a buffer returned to the pool.
+
+        Arguments:
+
+        """
+
+        pool = mysql_clone.BufPool(count=1, size=4)
+        buf = pool.get()
+        pool.put(buf)
+
+        self.assertEqual(pool.free.qsize(), 1)
+        self.assertIs(pool.get(), buf)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,100 @@
+# Classification (U)
+
+"""Program:  build_indexes.py
+
+    Description:  Unit testing of build_indexes in mysql_clone.py.
+
+    Usage:
+        test/unit/mysql_clone/build_indexes.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_clone                              # pylint:disable=E0401,C0413
+import lib.gen_libs as gen_libs             # pylint:disable=E0401,C0413,R0402
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_failed
+        test_built
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.load_cmd = ["mysql"]
+        self.stmts = ["ALTER TABLE `db1`.`t1` ADD KEY `a` (`a`)",
+                      "ALTER TABLE `db1`.`t2` ADD KEY `b` (`b`)"]
+
+    @mock.patch("mysql_clone.exec_stmt")
+    def test_failed(self, mock_exec):
+
+        """Function:  test_failed
+
+        Description:  Test with an index build failing.
+
+        Arguments:
+
+        """
+
+        mock_exec.side_effect = [True, False]
+
+        with gen_libs.no_std_out():
+            self.assertFalse(
+                mysql_clone.build_indexes(self.load_cmd, self.stmts, 2))
+
+        self.assertEqual(mock_exec.call_count, 2)
+
+    @mock.patch("mysql_clone.exec_stmt")
+    def test_built(self, mock_exec):
+
+        """Function:  test_built
+
+        Description:  Test with all of the indexes built.
+
+        Arguments:
+
+        """
+
+        mock_exec.return_value = True
+
+        with gen_libs.no_std_out():
+            self.assertTrue(
+                mysql_clone.build_indexes(self.load_cmd, self.stmts, 2))
+
+        self.assertEqual(
+            sorted(call[0][1] for call in mock_exec.call_args_list),
+            self.stmts)
+
+
+if __name__ == "__main__":
+    unittest.main()
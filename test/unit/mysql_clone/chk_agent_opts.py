@@ -0,0 +1,186 @@
+# Classification (U)
+
+"""Program:  chk_agent_opts.py
+
+    Description:  Unit testing of chk_agent_opts in mysql_clone.py.
+
+    Usage:
+        test/unit/mysql_clone/chk_agent_opts.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_clone                              # pylint:disable=E0401,C0413
+import lib.gen_libs as gen_libs             # pylint:disable=E0401,C0413,R0402
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class ArgParser():
+
+    """Class:  ArgParser
+
+    Description:  Class stub holder for gen_class.ArgParser class.
+
+    Methods:
+        __init__
+        get_val
+        arg_exist
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.cmdline = None
+        self.args_array = {}
+
+    def get_val(self, skey, def_val=None):
+
+        """Method:  get_val
+
+        Description:  Method stub holder for gen_class.ArgParser.get_val.
+
+        Arguments:
+
+        """
+
+        return self.args_array.get(skey, def_val)
+
+    def arg_exist(self, arg):
+
+        """Method:  arg_exist
+
+        Description:  Method stub holder for gen_class.ArgParser.arg_exist.
+
+        Arguments:
+
+        """
+
+        return arg in self.args_array
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_no_opts
+        test_no_host
+        test_bad_port
+        test_no_secret
+        test_valid
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.args = ArgParser()
+
+    def test_no_opts(self):
+
+        """Function:  test_no_opts
+
+        Description:  Test with neither the agent nor the receiver options.
+
+        Arguments:
+
+        """
+
+        self.assertTrue(mysql_clone.chk_agent_opts(self.args))
+
+    def test_no_host(self):
+
+        """Function:  test_no_host
+
+        Description:  Test with the agent's port without an address.
+
+        Arguments:
+
+        """
+
+        self.args.args_array = {"-a": "5000"}
+
+        with gen_libs.no_std_out():
+            self.assertFalse(mysql_clone.chk_agent_opts(self.args))
+
+    def test_bad_port(self):
+
+        """Function:  test_bad_port
+
+        Description:  Test with a port out of range.
+
+        Arguments:
+
+        """
+
+        self.args.args_array = {"-g": "master:70000"}
+
+        with gen_libs.no_std_out():
+            self.assertFalse(mysql_clone.chk_agent_opts(self.args))
+
+    @mock.patch("mysql_clone.read_secret",
+                mock.Mock(side_effect=OSError("No such file")))
+    def test_no_secret(self):
+
+        """Function:  test_no_secret
+
+        Description:  Test with the shared secret file not read.
+
+        Arguments:
+
+        """
+
+        self.args.args_array = {"-g": "master:5000", "-S": "secret_file"}
+
+        with gen_libs.no_std_out():
+            self.assertFalse(mysql_clone.chk_agent_opts(self.args))
+
+    @mock.patch("mysql_clone.read_secret", mock.Mock(return_value=b"secret"))
+    def test_valid(self):
+
+        """Function:  test_valid
+
+        Description:  Test with valid agent options.
+
+        Arguments:
+
+        """
+
+        self.args.args_array = {"-a": "10.0.0.1:5000", "-S": "secret_file"}
+
+        self.assertTrue(mysql_clone.chk_agent_opts(self.args))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,150 @@
+# Classification (U)
+
+"""Program:  chk_clone_plugin.py
+
+    Description:  Unit testing of chk_clone_plugin in mysql_clone.py.
+
+    Usage:
+        test/unit/mysql_clone/chk_clone_plugin.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_clone                              # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class Server():                                         # pylint:disable=R0903
+
+    """Class:  Server
+
+    Description:  Class stub holder for mysql_class.Server class.
+
+    Methods:
+        __init__
+        col_sql
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.version = (8, 0, 30)
+        self.data = [{"status": "ACTIVE"}]
+
+    def col_sql(self, cmd):                   # pylint:disable=W0613
+
+        """Method:  col_sql
+
+        Description:  Method stub holder for mysql_class.Server.col_sql.
+
+        Arguments:
+
+        """
+
+        return self.data
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_old_version
+        test_not_installed
+        test_not_active
+        test_active
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.server = Server()
+
+    def test_old_version(self):
+
+        """Function:  test_old_version
+
+        Description:  Test with a version before the clone plugin.
+
+        Arguments:
+
+        """
+
+        self.server.version = (8, 0, 16)
+
+        self.assertFalse(mysql_clone.chk_clone_plugin(self.server))
+
+    def test_not_installed(self):
+
+        """Function:  test_not_installed
+
+        Description:  Test with the clone plugin not installed.
+
+        Arguments:
+
+        """
+
+        self.server.data = []
+
+        self.assertFalse(mysql_clone.chk_clone_plugin(self.server))
+
+    def test_not_active(self):
+
+        """Function:  test_not_active
+
+        Description:  Test with the clone plugin disabled.
+
+        Arguments:
+
+        """
+
+        self.server.data = [{"status": "DISABLED"}]
+
+        self.assertFalse(mysql_clone.chk_clone_plugin(self.server))
+
+    def test_active(self):
+
+        """Function:  test_active
+
+        Description:  Test with the clone plugin active.
+
+        Arguments:
+
+        """
+
+        self.assertTrue(mysql_clone.chk_clone_plugin(self.server))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,154 @@
+# Classification (U)
+
+"""Program:  chk_fan_opts.py
+
+    Description:  Unit testing of chk_fan_opts in mysql_clone.py.
+
+    Usage:
+        test/unit/mysql_clone/chk_fan_opts.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_clone                              # pylint:disable=E0401,C0413
+import lib.gen_libs as gen_libs             # pylint:disable=E0401,C0413,R0402
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class ArgParser():
+
+    """Class:  ArgParser
+
+    Description:  Class stub holder for gen_class.ArgParser class.
+
+    Methods:
+        __init__
+        get_val
+        arg_exist
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.cmdline = None
+        self.args_array = {}
+
+    def get_val(self, skey, def_val=None):
+
+        """Method:  get_val
+
+        Description:  Method stub holder for gen_class.ArgParser.get_val.
+
+        Arguments:
+
+        """
+
+        return self.args_array.get(skey, def_val)
+
+    def arg_exist(self, arg):
+
+        """Method:  arg_exist
+
+        Description:  Method stub holder for gen_class.ArgParser.arg_exist.
+
+        Arguments:
+
+        """
+
+        return arg in self.args_array
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_excluded_opt
+        test_single_clone
+        test_several_clones
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.args = ArgParser()
+        self.opt_fan_excl = ["-i", "-j", "-e"]
+
+    def test_excluded_opt(self):
+
+        """Function:  test_excluded_opt
+
+        Description:  Test with an excluded option and several clones.
+
+        Arguments:
+
+        """
+
+        self.args.args_array = {"-t": "cfg1,cfg2", "-j": "4"}
+
+        with gen_libs.no_std_out():
+            self.assertFalse(
+                mysql_clone.chk_fan_opts(self.args, self.opt_fan_excl))
+
+    def test_single_clone(self):
+
+        """Function:  test_single_clone
+
+        Description:  Test with an excluded option and a single clone.
+
+        Arguments:
+
+        """
+
+        self.args.args_array = {"-t": "cfg1", "-j": "4"}
+
+        self.assertTrue(mysql_clone.chk_fan_opts(self.args, self.opt_fan_excl))
+
+    def test_several_clones(self):
+
+        """Function:  test_several_clones
+
+        Description:  Test with several clones and no excluded options.
+
+        Arguments:
+
+        """
+
+        self.args.args_array = {"-t": "cfg1,cfg2", "-n": True}
+
+        self.assertTrue(mysql_clone.chk_fan_opts(self.args, self.opt_fan_excl))
+
+
+if __name__ == "__main__":
+    unittest.main()
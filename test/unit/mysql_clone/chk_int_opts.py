@@ -0,0 +1,169 @@
+# Classification (U)
+
+"""Program:  chk_int_opts.py
+
+    Description:  Unit testing of chk_int_opts in mysql_clone.py.
+
+    Usage:
+        test/unit/mysql_clone/chk_int_opts.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_clone                              # pylint:disable=E0401,C0413
+import lib.gen_libs as gen_libs             # pylint:disable=E0401,C0413,R0402
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class ArgParser():
+
+    """Class:  ArgParser
+
+    Description:  Class stub holder for gen_class.ArgParser class.
+
+    Methods:
+        __init__
+        get_val
+        arg_exist
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.cmdline = None
+        self.args_array = {}
+
+    def get_val(self, skey, def_val=None):
+
+        """Method:  get_val
+
+        Description:  Method stub holder for gen_class.ArgParser.get_val.
+
+        Arguments:
+
+        """
+
+        return self.args_array.get(skey, def_val)
+
+    def arg_exist(self, arg):
+
+        """Method:  arg_exist
+
+        Description:  Method stub holder for gen_class.ArgParser.arg_exist.
+
+        Arguments:
+
+        """
+
+        return arg in self.args_array
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_zero_value
+        test_non_integer
+        test_valid_value
+        test_no_option
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.args = ArgParser()
+        self.opt_int_list = ["-j"]
+
+    def test_zero_value(self):
+
+        """Function:  test_zero_value
+
+        Description:  Test with a zero value.
+
+        Arguments:
+
+        """
+
+        self.args.args_array = {"-j": "0"}
+
+        with gen_libs.no_std_out():
+            self.assertFalse(
+                mysql_clone.chk_int_opts(self.args, self.opt_int_list))
+
+    def test_non_integer(self):
+
+        """Function:  test_non_integer
+
+        Description:  Test with a non-integer value.
+
+        Arguments:
+
+        """
+
+        self.args.args_array = {"-j": "four"}
+
+        with gen_libs.no_std_out():
+            self.assertFalse(
+                mysql_clone.chk_int_opts(self.args, self.opt_int_list))
+
+    def test_valid_value(self):
+
+        """Function:  test_valid_value
+
+        Description:  Test with a valid integer value.
+
+        Arguments:
+
+        """
+
+        self.args.args_array = {"-j": "4"}
+
+        self.assertTrue(mysql_clone.chk_int_opts(self.args, self.opt_int_list))
+
+    def test_no_option(self):
+
+        """Function:  test_no_option
+
+        Description:  Test with the option not passed.
+
+        Arguments:
+
+        """
+
+        self.assertTrue(mysql_clone.chk_int_opts(self.args, self.opt_int_list))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,122 @@
+# Classification (U)
+
+"""Program:  chk_load_args.py
+
+    Description:  Unit testing of chk_load_args in mysql_clone.py.
+
+    Usage:
+        test/unit/mysql_clone/chk_load_args.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_clone                              # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        test_other_option
+        test_two_databases
+        test_bad_database
+        test_not_list
+        test_no_args
+        test_database
+
+    """
+
+    def test_other_option(self):
+
+        """Function:  test_other_option
+
+        Description:  Test with a client option other than --database.
+
+        Arguments:
+
+        """
+
+        self.assertFalse(mysql_clone.chk_load_args(
+            ["--defaults-file=/tmp/my.cnf"]))
+
+    def test_two_databases(self):
+
+        """Function:  test_two_databases
+
+        Description:  Test with more than one argument.
+
+        Arguments:
+
+        """
+
+        self.assertFalse(mysql_clone.chk_load_args(
+            ["--database=db1", "--database=db2"]))
+
+    def test_bad_database(self):
+
+        """Function:  test_bad_database
+
+        Description:  Test with a database name that is not an identifier.
+
+        Arguments:
+
+        """
+
+        self.assertFalse(mysql_clone.chk_load_args(
+            ["--database=db1 --init-command=select 1"]))
+
+    def test_not_list(self):
+
+        """Function:  test_not_list
+
+        Description:  Test with load arguments that are not a list.
+
+        Arguments:
+
+        """
+
+        self.assertFalse(mysql_clone.chk_load_args("--database=db1"))
+
+    def test_no_args(self):
+
+        """Function:  test_no_args
+
+        Description:  Test with no load arguments.
+
+        Arguments:
+
+        """
+
+        self.assertTrue(mysql_clone.chk_load_args([]))
+
+    def test_database(self):
+
+        """Function:  test_database
+
+        Description:  Test with a single --database option.
+
+        Arguments:
+
+        """
+
+        self.assertTrue(mysql_clone.chk_load_args(["--database=my_db-1"]))
+
+
+if __name__ == "__main__":
+    unittest.main()
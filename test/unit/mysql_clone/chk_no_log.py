@@ -0,0 +1,210 @@
+# Classification (U)
+
+"""Program:  chk_no_log.py
+
+    Description:  Unit testing of chk_no_log in mysql_clone.py.
+
+    Usage:
+        test/unit/mysql_clone/chk_no_log.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_clone                              # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class ArgParser():
+
+    """Class:  ArgParser
+
+    Description:  Class stub holder for gen_class.ArgParser class.
+
+    Methods:
+        __init__
+        arg_exist
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.cmdline = None
+        self.args_array = {}
+
+    def arg_exist(self, arg):
+
+        """Method:  arg_exist
+
+        Description:  Method stub holder for gen_class.ArgParser.arg_exist.
+
+        Arguments:
+
+        """
+
+        return arg in self.args_array
+
+
+class Server():                                         # pylint:disable=R0903
+
+    """Class:  Server
+
+    Description:  Class stub holder for mysql_class.Server class.
+
+    Methods:
+        __init__
+        col_sql
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.version = (8, 0, 30)
+        self.replicas = []
+        self.cmds = []
+
+    def col_sql(self, cmd):
+
+        """Method:  col_sql
+
+        Description:  Method stub holder for mysql_class.Server.col_sql.
+
+        Arguments:
+
+        """
+
+        self.cmds.append(cmd)
+
+        return self.replicas
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_pre_8022
+        test_has_replicas
+        test_no_replicas
+        test_no_bulk
+        test_set_gtid
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.clone = Server()
+        self.args = ArgParser()
+        self.args.args_array["-f"] = True
+
+    def test_pre_8022(self):
+
+        """Function:  test_pre_8022
+
+        Description:  Test with a clone before MySQL 8.0.22.
+
+        Arguments:
+
+        """
+
+        self.clone.version = (5, 7, 40)
+
+        self.assertTrue(mysql_clone.chk_no_log(self.clone, self.args, False))
+        self.assertEqual(self.clone.cmds, ["show slave hosts"])
+
+    def test_has_replicas(self):
+
+        """Function:  test_has_replicas
+
+        Description:  Test with a clone that has replicas of its own.
+
+        Arguments:
+
+        """
+
+        self.clone.replicas = [{"Server_Id": 3}]
+
+        self.assertFalse(mysql_clone.chk_no_log(self.clone, self.args, False))
+
+    def test_no_replicas(self):
+
+        """Function:  test_no_replicas
+
+        Description:  Test with a clone that has no replicas of its own.
+
+        Arguments:
+
+        """
+
+        self.assertTrue(mysql_clone.chk_no_log(self.clone, self.args, False))
+        self.assertEqual(self.clone.cmds, ["show replicas"])
+
+    def test_no_bulk(self):
+
+        """Function:  test_no_bulk
+
+        Description:  Test without the bulk load profile.
+
+        Arguments:
+
+        """
+
+        self.args.args_array = {}
+
+        self.assertFalse(mysql_clone.chk_no_log(self.clone, self.args, False))
+        self.assertEqual(self.clone.cmds, [])
+
+    def test_set_gtid(self):
+
+        """Function:  test_set_gtid
+
+        Description:  Test with the source's GTIDs set on the clone.
+
+        Arguments:
+
+        """
+
+        self.assertTrue(mysql_clone.chk_no_log(self.clone, self.args, True))
+        self.assertEqual(self.clone.cmds, [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -17,6 +17,7 @@
 import sys
 import os
 import unittest
+import io
 import mock
 
 # Local
@@ -171,6 +172,8 @@ class Master():
         """
 
         self.conn_msg = None
+        self.file = "binlog.000009"
+        self.pos = 999
 
     def upd_mst_status(self):
 
@@ -247,6 +250,9 @@ class UnitTest(unittest.TestCase):
         test_with_no_slave_connect
         test_with_no_master_connect
         test_with_replication
+        test_with_coords
+        test_clone_cfg
+        test_not_started
         test_no_replication
 
     """
@@ -319,6 +325,7 @@ class UnitTest(unittest.TestCase):
                 mock.Mock(return_value=True))
     @mock.patch("mysql_clone.chk_slv_err",
                 mock.Mock(return_value=True))
+    @mock.patch("mysql_clone.wait_slv", mock.Mock(return_value=True))
     @mock.patch("mysql_clone.mysql_libs.change_master_to",
                 mock.Mock(return_value=True))
     @mock.patch("mysql_clone.mysql_libs.create_instance")
@@ -334,7 +341,102 @@ class UnitTest(unittest.TestCase):
 
         mock_inst.side_effect = [self.master, self.slave]
 
+        with gen_libs.no_std_out():
+            self.assertFalse(mysql_clone.chk_rep(self.clone, self.args))
+
+    @mock.patch("mysql_clone.mysql_libs.disconnect",
+                mock.Mock(return_value=True))
+    @mock.patch("mysql_clone.chk_mst_log",
+                mock.Mock(return_value=True))
+    @mock.patch("mysql_clone.chk_slv_thr",
+                mock.Mock(return_value=True))
+    @mock.patch("mysql_clone.chk_slv_err",
+                mock.Mock(return_value=True))
+    @mock.patch("mysql_clone.wait_slv", mock.Mock(return_value=True))
+    @mock.patch("mysql_clone.mysql_libs.change_master_to",
+                mock.Mock(return_value=True))
+    @mock.patch("mysql_clone.mysql_libs.create_instance")
+    def test_with_coords(self, mock_inst):
+
+        """Function:  test_with_coords
+
+        Description:  Test with snapshot coordinates passed.
+
+        Arguments:
+
+        """
+
+        mock_inst.side_effect = [self.master, self.slave]
+
+        with gen_libs.no_std_out():
+            self.assertFalse(
+                mysql_clone.chk_rep(
+                    self.clone, self.args,
+                    coords={"file": "binlog.000002", "pos": 4, "gtid": ""}))
+        self.assertEqual(
+            (self.master.file, self.master.pos), ("binlog.000002", 4))
+
+    @mock.patch("mysql_clone.mysql_libs.disconnect",
+                mock.Mock(return_value=True))
+    @mock.patch("mysql_clone.chk_mst_log",
+                mock.Mock(return_value=True))
+    @mock.patch("mysql_clone.chk_slv_thr",
+                mock.Mock(return_value=True))
+    @mock.patch("mysql_clone.chk_slv_err",
+                mock.Mock(return_value=True))
+    @mock.patch("mysql_clone.wait_slv", mock.Mock(return_value=True))
+    @mock.patch("mysql_clone.mysql_libs.change_master_to",
+                mock.Mock(return_value=True))
+    @mock.patch("mysql_clone.mysql_libs.create_instance")
+    def test_clone_cfg(self, mock_inst):
+
+        """Function:  test_clone_cfg
+
+        Description:  Test with the clone configuration file passed.
+
+        Arguments:
+
+        """
+
+        mock_inst.side_effect = [self.master, self.slave]
+
+        with gen_libs.no_std_out():
+            self.assertFalse(
+                mysql_clone.chk_rep(
+                    self.clone, self.args, clone_cfg="mysql_cfg3"))
+        self.assertEqual(mock_inst.call_args[0][0], "mysql_cfg3")
+
+    @mock.patch("mysql_clone.mysql_libs.disconnect",
+                mock.Mock(return_value=True))
+    @mock.patch("mysql_clone.chk_mst_log",
+                mock.Mock(return_value=True))
+    @mock.patch("mysql_clone.chk_slv_thr",
+                mock.Mock(return_value=True))
+    @mock.patch("mysql_clone.chk_slv_err",
+                mock.Mock(return_value=True))
+    @mock.patch("mysql_clone.wait_slv")
+    @mock.patch("mysql_clone.mysql_libs.change_master_to",
+                mock.Mock(return_value=True))
+    @mock.patch("mysql_clone.mysql_libs.create_instance")
+    @mock.patch("sys.stdout", new_callable=io.StringIO)
+    def test_not_started(self, mock_out, mock_inst, mock_wait):
+
+        """Function:  test_not_started
+
+        Description:  Test with replication not running by the deadline set
+            by the -R option.
+
+        Arguments:
+
+        """
+
+        self.args.args_array["-R"] = "120"
+        mock_inst.side_effect = [self.master, self.slave]
+        mock_wait.return_value = False
+
         self.assertFalse(mysql_clone.chk_rep(self.clone, self.args))
+        self.assertEqual(mock_wait.call_args[1]["timeout"], 120)
+        self.assertIn("Replication not running", mock_out.getvalue())
 
     def test_no_replication(self):
 
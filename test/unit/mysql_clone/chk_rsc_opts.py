@@ -0,0 +1,153 @@
+# Classification (U)
+
+"""Program:  chk_rsc_opts.py
+
+    Description:  Unit testing of chk_rsc_opts in mysql_clone.py.
+
+    Usage:
+        test/unit/mysql_clone/chk_rsc_opts.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_clone                              # pylint:disable=E0401,C0413
+import lib.gen_libs as gen_libs             # pylint:disable=E0401,C0413,R0402
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class ArgParser():
+
+    """Class:  ArgParser
+
+    Description:  Class stub holder for gen_class.ArgParser class.
+
+    Methods:
+        __init__
+        get_val
+        arg_exist
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.cmdline = None
+        self.args_array = {}
+
+    def get_val(self, skey, def_val=None):
+
+        """Method:  get_val
+
+        Description:  Method stub holder for gen_class.ArgParser.get_val.
+
+        Arguments:
+
+        """
+
+        return self.args_array.get(skey, def_val)
+
+    def arg_exist(self, arg):
+
+        """Method:  arg_exist
+
+        Description:  Method stub holder for gen_class.ArgParser.arg_exist.
+
+        Arguments:
+
+        """
+
+        return arg in self.args_array
+
+
+
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_invalid_group
+        test_group
+        test_no_group
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.args = ArgParser()
+
+    def test_invalid_group(self):
+
+        """Function:  test_invalid_group
+
+        Description:  Test with an invalid resource group.
+
+        Arguments:
+
+        """
+
+        self.args.args_array = {"-q": "2-3:20"}
+
+        with gen_libs.no_std_out():
+            self.assertFalse(mysql_clone.chk_rsc_opts(self.args))
+
+    def test_group(self):
+
+        """Function:  test_group
+
+        Description:  Test with a valid resource group.
+
+        Arguments:
+
+        """
+
+        self.args.args_array = {"-q": "2-3,6:10"}
+
+        self.assertTrue(mysql_clone.chk_rsc_opts(self.args))
+
+    def test_no_group(self):
+
+        """Function:  test_no_group
+
+        Description:  Test without the -q option.
+
+        Arguments:
+
+        """
+
+        self.assertTrue(mysql_clone.chk_rsc_opts(self.args))
+
+
+if __name__ == "__main__":
+    unittest.main()
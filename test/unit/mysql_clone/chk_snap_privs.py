@@ -0,0 +1,159 @@
+# Classification (U)
+
+"""Program:  chk_snap_privs.py
+
+    Description:  Unit testing of chk_snap_privs in mysql_clone.py.
+
+    Usage:
+        test/unit/mysql_clone/chk_snap_privs.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_clone                              # pylint:disable=E0401,C0413
+import lib.gen_libs as gen_libs             # pylint:disable=E0401,C0413,R0402
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class Server():
+
+    """Class:  Server
+
+    Description:  Class stub holder for mysql_class.Server class.
+
+    Methods:
+        __init__
+        cmd_sql
+        col_sql
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.cmds = []
+        self.fail = None
+
+    def cmd_sql(self, cmd):
+
+        """Method:  cmd_sql
+
+        Description:  Method stub holder for mysql_class.Server.cmd_sql.
+
+        Arguments:
+
+        """
+
+        if self.fail and self.fail in cmd:
+            raise ValueError("Access denied")
+
+        self.cmds.append(cmd)
+
+    def col_sql(self, cmd):
+
+        """Method:  col_sql
+
+        Description:  Method stub holder for mysql_class.Server.col_sql.
+
+        Arguments:
+
+        """
+
+        self.cmd_sql(cmd)
+
+        return [{"cnt": 0}]
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_no_system_variables_admin
+        test_no_process
+        test_privileges
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.server = Server()
+
+    def test_no_system_variables_admin(self):
+
+        """Function:  test_no_system_variables_admin
+
+        Description:  Test with the global variable not allowed to be set.
+
+        Arguments:
+
+        """
+
+        self.server.fail = "set global"
+
+        with gen_libs.no_std_out():
+            self.assertFalse(mysql_clone.chk_snap_privs(self.server))
+
+    def test_no_process(self):
+
+        """Function:  test_no_process
+
+        Description:  Test with the open transactions not allowed to be read.
+
+        Arguments:
+
+        """
+
+        self.server.fail = "innodb_trx"
+
+        with gen_libs.no_std_out():
+            self.assertFalse(mysql_clone.chk_snap_privs(self.server))
+
+    def test_privileges(self):
+
+        """Function:  test_privileges
+
+        Description:  Test with the privileges tried without a change.
+
+        Arguments:
+
+        """
+
+        self.assertTrue(mysql_clone.chk_snap_privs(self.server))
+        self.assertEqual(
+            self.server.cmds[0],
+            "set global net_write_timeout = @@global.net_write_timeout")
+
+
+if __name__ == "__main__":
+    unittest.main()
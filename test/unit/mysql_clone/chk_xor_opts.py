@@ -0,0 +1,158 @@
+# Classification (U)
+
+"""Program:  chk_xor_opts.py
+
+    Description:  Unit testing of chk_xor_opts in mysql_clone.py.
+
+    Usage:
+        test/unit/mysql_clone/chk_xor_opts.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_clone                              # pylint:disable=E0401,C0413
+import lib.gen_libs as gen_libs             # pylint:disable=E0401,C0413,R0402
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class ArgParser():
+
+    """Class:  ArgParser
+
+    Description:  Class stub holder for gen_class.ArgParser class.
+
+    Methods:
+        __init__
+        get_val
+        arg_exist
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.cmdline = None
+        self.args_array = {}
+
+    def get_val(self, skey, def_val=None):
+
+        """Method:  get_val
+
+        Description:  Method stub holder for gen_class.ArgParser.get_val.
+
+        Arguments:
+
+        """
+
+        return self.args_array.get(skey, def_val)
+
+    def arg_exist(self, arg):
+
+        """Method:  arg_exist
+
+        Description:  Method stub holder for gen_class.ArgParser.arg_exist.
+
+        Arguments:
+
+        """
+
+        return arg in self.args_array
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_excluded_opts
+        test_excluded_opt
+        test_no_excluded_opts
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.args = ArgParser()
+        self.opt_xor_dict = {"-e": ["-j", "-s"], "-R": ["-n"]}
+
+    def test_excluded_opts(self):
+
+        """Function:  test_excluded_opts
+
+        Description:  Test with an option used with two options it is not
+            used with.
+
+        Arguments:
+
+        """
+
+        self.args.args_array = {"-e": True, "-j": "4", "-s": "/stage"}
+
+        with gen_libs.no_std_out():
+            self.assertFalse(
+                mysql_clone.chk_xor_opts(self.args, self.opt_xor_dict))
+
+    def test_excluded_opt(self):
+
+        """Function:  test_excluded_opt
+
+        Description:  Test with an option used with an option it is not used
+            with.
+
+        Arguments:
+
+        """
+
+        self.args.args_array = {"-R": "30", "-n": True}
+
+        with gen_libs.no_std_out():
+            self.assertFalse(
+                mysql_clone.chk_xor_opts(self.args, self.opt_xor_dict))
+
+    def test_no_excluded_opts(self):
+
+        """Function:  test_no_excluded_opts
+
+        Description:  Test with the excluded options used on their own.
+
+        Arguments:
+
+        """
+
+        self.args.args_array = {"-j": "4", "-s": "/stage", "-n": True}
+
+        self.assertTrue(mysql_clone.chk_xor_opts(self.args, self.opt_xor_dict))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,120 @@
+# Classification (U)
+
+"""Program:  clone_stat.py
+
+    Description:  Unit testing of clone_stat in mysql_clone.py.
+
+    Usage:
+        test/unit/mysql_clone/clone_stat.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_clone                              # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class Server():                                         # pylint:disable=R0903
+
+    """Class:  Server
+
+    Description:  Class stub holder for mysql_class.Server class.
+
+    Methods:
+        __init__
+        col_sql
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.data = []
+
+    def col_sql(self, cmd):                   # pylint:disable=W0613
+
+        """Method:  col_sql
+
+        Description:  Method stub holder for mysql_class.Server.col_sql.
+
+        Arguments:
+
+        """
+
+        return self.data
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_no_clone
+        test_clone
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.server = Server()
+
+    def test_no_clone(self):
+
+        """Function:  test_no_clone
+
+        Description:  Test with no clone operation run.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(mysql_clone.clone_stat(self.server), {})
+
+    def test_clone(self):
+
+        """Function:  test_clone
+
+        Description:  Test with the last clone operation returned.
+
+        Arguments:
+
+        """
+
+        self.server.data = [{"state": "Completed"}]
+
+        self.assertEqual(
+            mysql_clone.clone_stat(self.server), {"state": "Completed"})
+
+
+if __name__ == "__main__":
+    unittest.main()
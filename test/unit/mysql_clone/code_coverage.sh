@@ -8,20 +8,165 @@ coverage erase
 
 echo ""
 echo "Running unit test modules in conjunction with coverage"
+coverage run -a --source=mysql_clone test/unit/mysql_clone/agent_auth.py
+coverage run -a --source=mysql_clone test/unit/mysql_clone/agent_dump_load.py
+coverage run -a --source=mysql_clone test/unit/mysql_clone/agent_recv.py
+coverage run -a --source=mysql_clone test/unit/mysql_clone/agent_send.py
+coverage run -a --source=mysql_clone test/unit/mysql_clone/agent_task.py
+coverage run -a --source=mysql_clone test/unit/mysql_clone/auth_digest.py
+coverage run -a --source=mysql_clone test/unit/mysql_clone/bp_report.py
+coverage run -a --source=mysql_clone test/unit/mysql_clone/bufpool_get.py
+coverage run -a --source=mysql_clone test/unit/mysql_clone/bufpool_init.py
+coverage run -a --source=mysql_clone test/unit/mysql_clone/bufpool_put.py
+coverage run -a --source=mysql_clone test/unit/mysql_clone/build_indexes.py
 coverage run -a --source=mysql_clone test/unit/mysql_clone/cfg_chk.py
+coverage run -a --source=mysql_clone test/unit/mysql_clone/chk_agent_opts.py
+coverage run -a --source=mysql_clone test/unit/mysql_clone/chk_clone_plugin.py
+coverage run -a --source=mysql_clone test/unit/mysql_clone/chk_fan_opts.py
+coverage run -a --source=mysql_clone test/unit/mysql_clone/chk_int_opts.py
+coverage run -a --source=mysql_clone test/unit/mysql_clone/chk_load_args.py
 coverage run -a --source=mysql_clone test/unit/mysql_clone/chk_mst_log.py
+coverage run -a --source=mysql_clone test/unit/mysql_clone/chk_no_log.py
+coverage run -a --source=mysql_clone test/unit/mysql_clone/chk_rate_opts.py
 coverage run -a --source=mysql_clone test/unit/mysql_clone/chk_rep.py
 coverage run -a --source=mysql_clone test/unit/mysql_clone/chk_rep_cfg.py
+coverage run -a --source=mysql_clone test/unit/mysql_clone/chk_rsc_opts.py
 coverage run -a --source=mysql_clone test/unit/mysql_clone/chk_slv.py
 coverage run -a --source=mysql_clone test/unit/mysql_clone/chk_slv_err.py
 coverage run -a --source=mysql_clone test/unit/mysql_clone/chk_slv_thr.py
+coverage run -a --source=mysql_clone test/unit/mysql_clone/chk_snap_privs.py
+coverage run -a --source=mysql_clone test/unit/mysql_clone/chk_xor_opts.py
+coverage run -a --source=mysql_clone test/unit/mysql_clone/clone_stat.py
+coverage run -a --source=mysql_clone test/unit/mysql_clone/compress_block.py
+coverage run -a --source=mysql_clone test/unit/mysql_clone/compress_stream.py
 coverage run -a --source=mysql_clone test/unit/mysql_clone/connect_chk.py
+coverage run -a --source=mysql_clone test/unit/mysql_clone/crt_chunks.py
+coverage run -a --source=mysql_clone test/unit/mysql_clone/crt_compress.py
 coverage run -a --source=mysql_clone test/unit/mysql_clone/crt_dump_cmd.py
+coverage run -a --source=mysql_clone test/unit/mysql_clone/crt_health.py
+coverage run -a --source=mysql_clone test/unit/mysql_clone/crt_inserts.py
+coverage run -a --source=mysql_clone test/unit/mysql_clone/crt_load_cmd.py
+coverage run -a --source=mysql_clone test/unit/mysql_clone/crt_load_data.py
+coverage run -a --source=mysql_clone test/unit/mysql_clone/crt_obj_stmts.py
+coverage run -a --source=mysql_clone test/unit/mysql_clone/crt_rsc_grp.py
+coverage run -a --source=mysql_clone test/unit/mysql_clone/crt_task_cmd.py
+coverage run -a --source=mysql_clone test/unit/mysql_clone/crt_tasks.py
+coverage run -a --source=mysql_clone test/unit/mysql_clone/crt_undo_guard.py
+coverage run -a --source=mysql_clone test/unit/mysql_clone/crt_xfer_meter.py
+coverage run -a --source=mysql_clone test/unit/mysql_clone/dump_bp.py
+coverage run -a --source=mysql_clone test/unit/mysql_clone/dump_coords.py
 coverage run -a --source=mysql_clone test/unit/mysql_clone/dump_load_dbs.py
+coverage run -a --source=mysql_clone test/unit/mysql_clone/exec_stmt.py
+coverage run -a --source=mysql_clone test/unit/mysql_clone/fan_dump_load.py
+coverage run -a --source=mysql_clone test/unit/mysql_clone/fetch_algs.py
+coverage run -a --source=mysql_clone test/unit/mysql_clone/fetch_bounds.py
+coverage run -a --source=mysql_clone test/unit/mysql_clone/fetch_bp_stat.py
+coverage run -a --source=mysql_clone test/unit/mysql_clone/fetch_bulk_cfg.py
+coverage run -a --source=mysql_clone test/unit/mysql_clone/fetch_cols.py
+coverage run -a --source=mysql_clone test/unit/mysql_clone/fetch_dbs.py
+coverage run -a --source=mysql_clone test/unit/mysql_clone/fetch_dump_ids.py
+coverage run -a --source=mysql_clone test/unit/mysql_clone/fetch_hot_idx.py
+coverage run -a --source=mysql_clone test/unit/mysql_clone/fetch_idx_size.py
+coverage run -a --source=mysql_clone test/unit/mysql_clone/fetch_tbls.py
+coverage run -a --source=mysql_clone test/unit/mysql_clone/free_conns.py
+coverage run -a --source=mysql_clone test/unit/mysql_clone/healthctl_apply.py
+coverage run -a --source=mysql_clone test/unit/mysql_clone/healthctl_decide.py
+coverage run -a --source=mysql_clone test/unit/mysql_clone/healthctl_init.py
+coverage run -a --source=mysql_clone test/unit/mysql_clone/healthctl_run.py
+coverage run -a --source=mysql_clone test/unit/mysql_clone/healthctl_sample.py
+coverage run -a --source=mysql_clone test/unit/mysql_clone/healthctl_start.py
+coverage run -a --source=mysql_clone test/unit/mysql_clone/healthctl_stop.py
 coverage run -a --source=mysql_clone test/unit/mysql_clone/help_message.py
+coverage run -a --source=mysql_clone test/unit/mysql_clone/hist_bounds.py
+coverage run -a --source=mysql_clone test/unit/mysql_clone/kernel_relay.py
+coverage run -a --source=mysql_clone test/unit/mysql_clone/levelctl_init.py
+coverage run -a --source=mysql_clone test/unit/mysql_clone/levelctl_update.py
+coverage run -a --source=mysql_clone test/unit/mysql_clone/load_bp.py
+coverage run -a --source=mysql_clone test/unit/mysql_clone/load_file.py
+coverage run -a --source=mysql_clone test/unit/mysql_clone/load_task.py
 coverage run -a --source=mysql_clone test/unit/mysql_clone/main.py
+coverage run -a --source=mysql_clone test/unit/mysql_clone/mid_val.py
+coverage run -a --source=mysql_clone test/unit/mysql_clone/native_cfg.py
+coverage run -a --source=mysql_clone test/unit/mysql_clone/native_dump.py
+coverage run -a --source=mysql_clone test/unit/mysql_clone/native_dump_load.py
+coverage run -a --source=mysql_clone test/unit/mysql_clone/native_dump_tbl.py
+coverage run -a --source=mysql_clone test/unit/mysql_clone/native_load.py
+coverage run -a --source=mysql_clone test/unit/mysql_clone/native_snap.py
+coverage run -a --source=mysql_clone test/unit/mysql_clone/pack_items.py
+coverage run -a --source=mysql_clone test/unit/mysql_clone/par_dump_load.py
+coverage run -a --source=mysql_clone test/unit/mysql_clone/parse_rates.py
+coverage run -a --source=mysql_clone test/unit/mysql_clone/parse_rsc_grp.py
+coverage run -a --source=mysql_clone test/unit/mysql_clone/phys_clone.py
+coverage run -a --source=mysql_clone test/unit/mysql_clone/pipe_stmts.py
+coverage run -a --source=mysql_clone test/unit/mysql_clone/pool_relay.py
+coverage run -a --source=mysql_clone test/unit/mysql_clone/range_rows.py
+coverage run -a --source=mysql_clone test/unit/mysql_clone/read_frames.py
+coverage run -a --source=mysql_clone test/unit/mysql_clone/read_secret.py
+coverage run -a --source=mysql_clone test/unit/mysql_clone/recv_auth.py
+coverage run -a --source=mysql_clone test/unit/mysql_clone/recv_exact.py
+coverage run -a --source=mysql_clone test/unit/mysql_clone/recv_msg.py
+coverage run -a --source=mysql_clone test/unit/mysql_clone/relay.py
+coverage run -a --source=mysql_clone test/unit/mysql_clone/relay_dump_load.py
+coverage run -a --source=mysql_clone test/unit/mysql_clone/replica_dump_load.py
+coverage run -a --source=mysql_clone test/unit/mysql_clone/replica_sql_thread.py
+coverage run -a --source=mysql_clone test/unit/mysql_clone/rscgroup_assign.py
+coverage run -a --source=mysql_clone test/unit/mysql_clone/rscgroup_create.py
+coverage run -a --source=mysql_clone test/unit/mysql_clone/rscgroup_init.py
+coverage run -a --source=mysql_clone test/unit/mysql_clone/rscgroup_run.py
+coverage run -a --source=mysql_clone test/unit/mysql_clone/rscgroup_start.py
+coverage run -a --source=mysql_clone test/unit/mysql_clone/rscgroup_stop.py
+coverage run -a --source=mysql_clone test/unit/mysql_clone/rst_bulk_cfg.py
+coverage run -a --source=mysql_clone test/unit/mysql_clone/run_agent.py
 coverage run -a --source=mysql_clone test/unit/mysql_clone/run_program.py
+coverage run -a --source=mysql_clone test/unit/mysql_clone/send_msg.py
+coverage run -a --source=mysql_clone test/unit/mysql_clone/set_bulk_cfg.py
+coverage run -a --source=mysql_clone test/unit/mysql_clone/snapshotcoord_init.py
+coverage run -a --source=mysql_clone test/unit/mysql_clone/snapshotcoord_lock.py
+coverage run -a --source=mysql_clone test/unit/mysql_clone/snapshotcoord_read_coords.py
+coverage run -a --source=mysql_clone test/unit/mysql_clone/snapshotcoord_settled.py
+coverage run -a --source=mysql_clone test/unit/mysql_clone/snapshotcoord_unlock.py
+coverage run -a --source=mysql_clone test/unit/mysql_clone/snapshotcoord_wait_sessions.py
+coverage run -a --source=mysql_clone test/unit/mysql_clone/split_indexes.py
+coverage run -a --source=mysql_clone test/unit/mysql_clone/split_innodb_name.py
+coverage run -a --source=mysql_clone test/unit/mysql_clone/spread_items.py
+coverage run -a --source=mysql_clone test/unit/mysql_clone/sql_ident.py
+coverage run -a --source=mysql_clone test/unit/mysql_clone/sql_lit.py
+coverage run -a --source=mysql_clone test/unit/mysql_clone/start_dumps.py
 coverage run -a --source=mysql_clone test/unit/mysql_clone/stop_clr_rep.py
+coverage run -a --source=mysql_clone test/unit/mysql_clone/stream_rows.py
+coverage run -a --source=mysql_clone test/unit/mysql_clone/tab_dump_load.py
+coverage run -a --source=mysql_clone test/unit/mysql_clone/tab_dump_tbl.py
+coverage run -a --source=mysql_clone test/unit/mysql_clone/teesink_close.py
+coverage run -a --source=mysql_clone test/unit/mysql_clone/teesink_init.py
+coverage run -a --source=mysql_clone test/unit/mysql_clone/teesink_put.py
+coverage run -a --source=mysql_clone test/unit/mysql_clone/teesink_run.py
+coverage run -a --source=mysql_clone test/unit/mysql_clone/teesink_wait.py
+coverage run -a --source=mysql_clone test/unit/mysql_clone/throttle_init.py
+coverage run -a --source=mysql_clone test/unit/mysql_clone/throttle_reload.py
+coverage run -a --source=mysql_clone test/unit/mysql_clone/throttle_report.py
+coverage run -a --source=mysql_clone test/unit/mysql_clone/throttle_scale.py
+coverage run -a --source=mysql_clone test/unit/mysql_clone/throttle_take.py
+coverage run -a --source=mysql_clone test/unit/mysql_clone/tsv_val.py
+coverage run -a --source=mysql_clone test/unit/mysql_clone/undoguard_act.py
+coverage run -a --source=mysql_clone test/unit/mysql_clone/undoguard_decide.py
+coverage run -a --source=mysql_clone test/unit/mysql_clone/undoguard_init.py
+coverage run -a --source=mysql_clone test/unit/mysql_clone/undoguard_run.py
+coverage run -a --source=mysql_clone test/unit/mysql_clone/undoguard_sample.py
+coverage run -a --source=mysql_clone test/unit/mysql_clone/undoguard_start.py
+coverage run -a --source=mysql_clone test/unit/mysql_clone/undoguard_stop.py
+coverage run -a --source=mysql_clone test/unit/mysql_clone/val_str.py
+coverage run -a --source=mysql_clone test/unit/mysql_clone/wait_bp.py
+coverage run -a --source=mysql_clone test/unit/mysql_clone/wait_clone.py
+coverage run -a --source=mysql_clone test/unit/mysql_clone/wait_slv.py
+coverage run -a --source=mysql_clone test/unit/mysql_clone/wait_snap.py
+coverage run -a --source=mysql_clone test/unit/mysql_clone/warm_clone.py
+coverage run -a --source=mysql_clone test/unit/mysql_clone/warm_stmt.py
+coverage run -a --source=mysql_clone test/unit/mysql_clone/write_stmts.py
+coverage run -a --source=mysql_clone test/unit/mysql_clone/xfer_report.py
+coverage run -a --source=mysql_clone test/unit/mysql_clone/xfermeter_init.py
+coverage run -a --source=mysql_clone test/unit/mysql_clone/xfermeter_sample.py
+coverage run -a --source=mysql_clone test/unit/mysql_clone/xfermeter_start.py
+coverage run -a --source=mysql_clone test/unit/mysql_clone/xfermeter_stop.py
 
 echo ""
 echo "Producing code coverage report"
@@ -0,0 +1,74 @@
+# Classification (U)
+
+"""Program:  compress_block.py
+
+    Description:  Unit testing of compress_block in mysql_clone.py.
+
+    Usage:
+        test/unit/mysql_clone/compress_block.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import zlib
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_clone                              # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_frame
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.block = b"INSERT INTO `t1` VALUES (1),(2);\n" * 100
+
+    def test_frame(self):
+
+        """Function:  test_frame
+
+        Description:  Test with the block compressed into a frame.
+
+        Arguments:
+
+        """
+
+        frame = mysql_clone.compress_block(self.block, 6)
+        length, crc = mysql_clone.FRAME.unpack(frame[:mysql_clone.FRAME.size])
+
+        self.assertEqual(length, len(frame) - mysql_clone.FRAME.size)
+        self.assertEqual(crc, zlib.crc32(self.block))
+        self.assertEqual(
+            zlib.decompress(frame[mysql_clone.FRAME.size:]), self.block)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,108 @@
+# Classification (U)
+
+"""Program:  compress_stream.py
+
+    Description:  Unit testing of compress_stream in mysql_clone.py.
+
+    Usage:
+        test/unit/mysql_clone/compress_stream.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import io
+import zlib
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_clone                              # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_level_ctl
+        test_empty
+        test_in_order
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.data = b"".join(
+            f"INSERT INTO `t1` VALUES ({idx});\n".encode()
+            for idx in range(2000))
+
+    def test_level_ctl(self):
+
+        """Function:  test_level_ctl
+
+        Description:  Test with the level controller told of each frame.
+
+        Arguments:
+
+        """
+
+        ctl = mysql_clone.LevelCtl(interval=1000)
+        frames = list(mysql_clone.compress_stream(
+            io.BytesIO(self.data), block_size=1024, workers=2, ctl=ctl))
+
+        self.assertEqual(ctl.cnt, len(frames))
+
+    def test_empty(self):
+
+        """Function:  test_empty
+
+        Description:  Test with an empty stream.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            list(mysql_clone.compress_stream(io.BytesIO(b""))), [])
+
+    def test_in_order(self):
+
+        """Function:  test_in_order
+
+        Description:  Test with the blocks returned in stream order.
+
+        Arguments:
+
+        """
+
+        frames = list(mysql_clone.compress_stream(
+            io.BytesIO(self.data), block_size=1024, workers=4))
+
+        self.assertEqual(len(frames), -(-len(self.data) // 1024))
+        self.assertEqual(
+            b"".join(zlib.decompress(frame[mysql_clone.FRAME.size:])
+                     for frame in frames), self.data)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,118 @@
+# Classification (U)
+
+"""Program:  crt_chunks.py
+
+    Description:  Unit testing of crt_chunks in mysql_clone.py.
+
+    Usage:
+        test/unit/mysql_clone/crt_chunks.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_clone                              # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_no_bounds
+        test_chunk_count
+        test_chunks
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.server = "Server"
+        self.tbl = {"db": "db1", "tbl": "t1", "tbl_rows": 1000,
+                    "data_len": 3000, "size": 6000, "col": "id"}
+
+    @mock.patch("mysql_clone.fetch_bounds", mock.Mock(return_value=[]))
+    def test_no_bounds(self):
+
+        """Function:  test_no_bounds
+
+        Description:  Test with no boundary values for the table.
+
+        Arguments:
+
+        """
+
+        tasks = mysql_clone.crt_chunks(self.server, self.tbl, 1000)
+
+        self.assertEqual(len(tasks), 1)
+        self.assertEqual(
+            tasks[0]["args"],
+            ["--no-create-info", "--skip-triggers", "--skip-routines",
+             "--skip-events", "--skip-add-locks"])
+
+    @mock.patch("mysql_clone.fetch_bounds")
+    def test_chunk_count(self, mock_bounds):
+
+        """Function:  test_chunk_count
+
+        Description:  Test with the number of chunks requested.
+
+        Arguments:
+
+        """
+
+        mock_bounds.return_value = [10, 20]
+        mysql_clone.crt_chunks(self.server, self.tbl, 1024)
+
+        mock_bounds.assert_called_once_with(self.server, self.tbl, 3)
+
+    @mock.patch("mysql_clone.fetch_bounds")
+    def test_chunks(self, mock_bounds):
+
+        """Function:  test_chunks
+
+        Description:  Test with chunks created from boundary values.
+
+        Arguments:
+
+        """
+
+        mock_bounds.return_value = [10, "a"]
+        tasks = mysql_clone.crt_chunks(self.server, self.tbl, 1000)
+
+        self.assertEqual(
+            [task["args"][-1] for task in tasks],
+            ["--where=`id` < 10", "--where=`id` >= 10 and `id` < 'a'",
+             "--where=`id` >= 'a'"])
+        self.assertEqual(
+            (tasks[1]["name"], tasks[1]["db"], tasks[1]["tables"],
+             tasks[1]["phase"], tasks[1]["size"], tasks[1]["load_args"]),
+            ("db1.t1#1", "db1", ["t1"], 2, 2000, ["--database=db1"]))
+
+
+if __name__ == "__main__":
+    unittest.main()
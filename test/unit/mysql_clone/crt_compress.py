@@ -0,0 +1,228 @@
+# Classification (U)
+
+"""Program:  crt_compress.py
+
+    Description:  Unit testing of crt_compress in mysql_clone.py.
+
+    Usage:
+        test/unit/mysql_clone/crt_compress.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_clone                              # pylint:disable=E0401,C0413
+import lib.gen_libs as gen_libs             # pylint:disable=E0401,C0413,R0402
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class Popen():                                          # pylint:disable=R0903
+
+    """Class:  Popen
+
+    Description:  Class stub holder for subprocess.Popen class.
+
+    Methods:
+        __init__
+        communicate
+
+    """
+
+    def __init__(self, usage):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.usage = usage
+
+    def communicate(self):
+
+        """Method:  communicate
+
+        Description:  Stub holder for communicate method.
+
+        Arguments:
+
+        """
+
+        return self.usage, None
+
+
+class Server():                                         # pylint:disable=R0903
+
+    """Class:  Server
+
+    Description:  Class stub holder for mysql_class.Server class.
+
+    Methods:
+        __init__
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.name = "ServerName"
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_no_common
+        test_old_client
+        test_zlib_server
+        test_zlib_client
+        test_zstd
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.server = Server()
+        self.prog = "/usr/bin/mysqldump"
+        self.new_usage = "  --compress  Use compression in server/client" \
+            " protocol.\n  --compression-algorithms=name  Use compression" \
+            " algorithm in server/client protocol. Valid values are any" \
+            " combination of 'zstd','zlib','uncompressed'.\n"
+        self.zlib_usage = "  --compress  Use compression in server/client" \
+            " protocol.\n  --compression-algorithms=name  Use compression" \
+            " algorithm in server/client protocol. Valid values are any" \
+            " combination of 'zlib','uncompressed'.\n"
+        self.old_usage = "  -C, --compress  Use compression in" \
+            " server/client protocol.\n"
+
+    @mock.patch("mysql_clone.fetch_algs", mock.Mock(return_value=[
+        "uncompressed"]))
+    @mock.patch("mysql_clone.subprocess.Popen")
+    def test_no_common(self, mock_popen):
+
+        """Function:  test_no_common
+
+        Description:  Test with no compression algorithm in common.
+
+        Arguments:
+
+        """
+
+        mock_popen.return_value = Popen(self.new_usage)
+
+        with gen_libs.no_std_out():
+            self.assertEqual(
+                mysql_clone.crt_compress(self.server, self.prog, 3), [])
+
+    @mock.patch("mysql_clone.fetch_algs", mock.Mock(return_value=["zlib"]))
+    @mock.patch("mysql_clone.subprocess.Popen")
+    def test_old_client(self, mock_popen):
+
+        """Function:  test_old_client
+
+        Description:  Test with a client without compression algorithms.
+
+        Arguments:
+
+        """
+
+        mock_popen.return_value = Popen(self.old_usage)
+
+        self.assertEqual(
+            mysql_clone.crt_compress(self.server, self.prog, 3),
+            ["--compress"])
+
+    @mock.patch("mysql_clone.fetch_algs", mock.Mock(return_value=[
+        "zlib", "uncompressed"]))
+    @mock.patch("mysql_clone.subprocess.Popen")
+    def test_zlib_server(self, mock_popen):
+
+        """Function:  test_zlib_server
+
+        Description:  Test with a server without zstd.
+
+        Arguments:
+
+        """
+
+        mock_popen.return_value = Popen(self.new_usage)
+
+        self.assertEqual(
+            mysql_clone.crt_compress(self.server, self.prog, 3),
+            ["--compression-algorithms=zlib"])
+
+    @mock.patch("mysql_clone.fetch_algs", mock.Mock(return_value=[
+        "zlib", "zstd", "uncompressed"]))
+    @mock.patch("mysql_clone.subprocess.Popen")
+    def test_zlib_client(self, mock_popen):
+
+        """Function:  test_zlib_client
+
+        Description:  Test with a client without zstd.
+
+        Arguments:
+
+        """
+
+        mock_popen.return_value = Popen(self.zlib_usage)
+
+        self.assertEqual(
+            mysql_clone.crt_compress(self.server, self.prog, 3),
+            ["--compression-algorithms=zlib"])
+
+    @mock.patch("mysql_clone.fetch_algs", mock.Mock(return_value=[
+        "zlib", "zstd", "uncompressed"]))
+    @mock.patch("mysql_clone.subprocess.Popen")
+    def test_zstd(self, mock_popen):
+
+        """Function:  test_zstd
+
+        Description:  Test with zstd supported by the server and client.
+
+        Arguments:
+
+        """
+
+        mock_popen.return_value = Popen(self.new_usage)
+
+        self.assertEqual(
+            mysql_clone.crt_compress(self.server, self.prog, 3),
+            ["--compression-algorithms=zstd", "--zstd-compression-level=3"])
+        self.assertEqual(mock_popen.call_args[0][0], [self.prog, "--help"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,133 @@
+# Classification (U)
+
+"""Program:  crt_inserts.py
+
+    Description:  Unit testing of crt_inserts in mysql_clone.py.
+
+    Usage:
+        test/unit/mysql_clone/crt_inserts.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_clone                              # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_ignore
+        test_no_rows
+        test_oversized_row
+        test_split_stmts
+        test_single_stmt
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.cols = ["id", "name"]
+        self.rows = [(1, "a"), (2, None), (3, "c")]
+        self.prefix = "INSERT INTO `t1` (`id`,`name`) VALUES "
+
+    def test_ignore(self):
+
+        """Function:  test_ignore
+
+        Description:  Test with the rows of duplicate keys skipped.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            list(mysql_clone.crt_inserts(
+                "`t1`", self.cols, self.rows[:1], 1024, ignore=True)),
+            ["INSERT IGNORE INTO `t1` (`id`,`name`) VALUES (1,'a')"])
+
+    def test_no_rows(self):
+
+        """Function:  test_no_rows
+
+        Description:  Test with no rows.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            list(mysql_clone.crt_inserts("`t1`", self.cols, [], 1024)), [])
+
+    def test_oversized_row(self):
+
+        """Function:  test_oversized_row
+
+        Description:  Test with rows longer than the maximum length.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            list(mysql_clone.crt_inserts(
+                "`t1`", self.cols, self.rows[:2], 10)),
+            [self.prefix + "(1,'a')", self.prefix + "(2,NULL)"])
+
+    def test_split_stmts(self):
+
+        """Function:  test_split_stmts
+
+        Description:  Test with rows split across statements.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            list(mysql_clone.crt_inserts(
+                "`t1`", self.cols, self.rows, len(self.prefix) + 17)),
+            [self.prefix + "(1,'a'),(2,NULL)", self.prefix + "(3,'c')"])
+
+    def test_single_stmt(self):
+
+        """Function:  test_single_stmt
+
+        Description:  Test with all rows in a single statement.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            list(mysql_clone.crt_inserts("`t1`", self.cols, self.rows, 1024)),
+            [self.prefix + "(1,'a'),(2,NULL),(3,'c')"])
+
+
+if __name__ == "__main__":
+    unittest.main()
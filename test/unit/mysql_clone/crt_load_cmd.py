@@ -0,0 +1,244 @@
+# Classification (U)
+
+"""Program:  crt_load_cmd.py
+
+    Description:  Unit testing of crt_load_cmd in mysql_clone.py.
+
+    Usage:
+        test/unit/mysql_clone/crt_load_cmd.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_clone                              # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class ArgParser():
+
+    """Class:  ArgParser
+
+    Description:  Class stub holder for gen_class.ArgParser class.
+
+    Methods:
+        __init__
+        arg_exist
+        get_val
+        arg_set_path
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.cmdline = None
+        self.args_array = {}
+
+    def arg_exist(self, arg):
+
+        """Method:  arg_exist
+
+        Description:  Method stub holder for gen_class.ArgParser.arg_exist.
+
+        Arguments:
+
+        """
+
+        return arg in self.args_array
+
+    def get_val(self, skey, def_val=None):
+
+        """Method:  get_val
+
+        Description:  Method stub holder for gen_class.ArgParser.get_val.
+
+        Arguments:
+
+        """
+
+        return self.args_array.get(skey, def_val)
+
+    def arg_set_path(self, arg_opt, **kwargs):
+
+        """Method:  arg_set_path
+
+        Description:  Method stub holder for gen_class.ArgParser.arg_set_path.
+
+        Arguments:
+
+        """
+
+        return os.path.join(
+            self.args_array[arg_opt] if arg_opt in self.args_array else "",
+            kwargs.get("cmd", ""))
+
+
+class Server():                                         # pylint:disable=R0903
+
+    """Class:  Server
+
+    Description:  Class stub holder for mysql_class.Server class.
+
+    Methods:
+        __init__
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.gtid_mode = True
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_compress
+        test_bulk_no_log
+        test_bulk
+        test_no_log
+        test_default
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.clone = Server()
+        self.args = ArgParser()
+
+    @mock.patch("mysql_clone.mysql_libs.crt_cmd",
+                mock.Mock(return_value=["mysql"]))
+    @mock.patch("mysql_clone.crt_compress")
+    def test_compress(self, mock_compress):
+
+        """Function:  test_compress
+
+        Description:  Test with the load connection compressed.
+
+        Arguments:
+
+        """
+
+        self.args.args_array["-z"] = "3"
+        mock_compress.return_value = ["--compression-algorithms=zstd",
+                                      "--zstd-compression-level=3"]
+
+        self.assertEqual(
+            mysql_clone.crt_load_cmd(self.clone, self.args, False),
+            ["mysql", "--compression-algorithms=zstd",
+             "--zstd-compression-level=3"])
+        self.assertEqual(
+            mock_compress.call_args[0], (self.clone, "mysql", "3"))
+
+    @mock.patch("mysql_clone.mysql_libs.crt_cmd",
+                mock.Mock(return_value=["mysql"]))
+    def test_bulk_no_log(self):
+
+        """Function:  test_bulk_no_log
+
+        Description:  Test with the bulk load profile and no binary log.
+
+        Arguments:
+
+        """
+
+        self.args.args_array["-f"] = True
+
+        self.assertEqual(
+            mysql_clone.crt_load_cmd(self.clone, self.args, True),
+            ["mysql", "--init-command=SET SESSION foreign_key_checks=0,"
+             " unique_checks=0, sql_log_bin=0"])
+
+    @mock.patch("mysql_clone.mysql_libs.crt_cmd",
+                mock.Mock(return_value=["mysql"]))
+    def test_bulk(self):
+
+        """Function:  test_bulk
+
+        Description:  Test with the bulk load profile.
+
+        Arguments:
+
+        """
+
+        self.args.args_array["-f"] = True
+
+        self.assertEqual(
+            mysql_clone.crt_load_cmd(self.clone, self.args, False),
+            ["mysql", "--init-command=SET SESSION foreign_key_checks=0,"
+             " unique_checks=0"])
+
+    @mock.patch("mysql_clone.mysql_libs.crt_cmd",
+                mock.Mock(return_value=["mysql"]))
+    def test_no_log(self):
+
+        """Function:  test_no_log
+
+        Description:  Test with the binary log turned off.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            mysql_clone.crt_load_cmd(self.clone, self.args, True),
+            ["mysql", "--init-command=SET SESSION sql_log_bin=0"])
+
+    @mock.patch("mysql_clone.mysql_libs.crt_cmd",
+                mock.Mock(return_value=["mysql"]))
+    def test_default(self):
+
+        """Function:  test_default
+
+        Description:  Test with the default load command.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            mysql_clone.crt_load_cmd(self.clone, self.args, False), ["mysql"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,108 @@
+# Classification (U)
+
+"""Program:  crt_load_data.py
+
+    Description:  Unit testing of crt_load_data in mysql_clone.py.
+
+    Usage:
+        test/unit/mysql_clone/crt_load_data.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_clone                              # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_session
+        test_binary_cols
+        test_text_cols
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.cols = [("id", "int"), ("name", "varchar")]
+        self.cols2 = [("id", "int"), ("data", "blob"), ("flags", "bit")]
+
+    def test_session(self):
+
+        """Function:  test_session
+
+        Description:  Test with the session settings of the native dump.
+
+        Arguments:
+
+        """
+
+        self.assertTrue(
+            mysql_clone.crt_load_data(
+                "db1", "t1", self.cols, "/stage/000001.txt").startswith(
+                    "SET SESSION foreign_key_checks = 0, unique_checks = 0,"
+                    " time_zone = '+00:00',"
+                    " sql_mode = 'NO_AUTO_VALUE_ON_ZERO'; "))
+
+    def test_binary_cols(self):
+
+        """Function:  test_binary_cols
+
+        Description:  Test with binary and bit columns.
+
+        Arguments:
+
+        """
+
+        self.assertTrue(
+            mysql_clone.crt_load_data(
+                "db1", "t1", self.cols2, "/stage/000001.txt").endswith(
+                    " (`id`,@v0,@v1) SET `data` = unhex(@v0),"
+                    " `flags` = cast(@v1 as unsigned)"))
+
+    def test_text_cols(self):
+
+        """Function:  test_text_cols
+
+        Description:  Test with text columns.
+
+        Arguments:
+
+        """
+
+        self.assertTrue(
+            mysql_clone.crt_load_data(
+                "db1", "t1", self.cols, "/stage/000001.txt").endswith(
+                    "LOAD DATA LOCAL INFILE '/stage/000001.txt'"
+                    " INTO TABLE `db1`.`t1` CHARACTER SET utf8mb4"
+                    " (`id`,`name`)"))
+
+
+if __name__ == "__main__":
+    unittest.main()
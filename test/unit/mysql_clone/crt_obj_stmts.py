@@ -0,0 +1,152 @@
+# Classification (U)
+
+"""Program:  crt_obj_stmts.py
+
+    Description:  Unit testing of crt_obj_stmts in mysql_clone.py.
+
+    Usage:
+        test/unit/mysql_clone/crt_obj_stmts.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_clone                              # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class Server():                                         # pylint:disable=R0903
+
+    """Class:  Server
+
+    Description:  Class stub holder for mysql_class.Server class.
+
+    Methods:
+        __init__
+        col_sql
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.cmd = None
+        self.data = {}
+
+    def col_sql(self, cmd):
+
+        """Method:  col_sql
+
+        Description:  Method stub holder for mysql_class.Server.col_sql.
+
+        Arguments:
+
+        """
+
+        self.cmd = cmd
+
+        return [self.data]
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_no_definition
+        test_trigger
+        test_procedure
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.server = Server()
+
+    def test_no_definition(self):
+
+        """Function:  test_no_definition
+
+        Description:  Test with the definition hidden from the dump user.
+
+        Arguments:
+
+        """
+
+        self.server.data = {"Create Procedure": None, "sql_mode": ""}
+
+        with self.assertRaisesRegex(ValueError, "SHOW_ROUTINE privilege"):
+            mysql_clone.crt_obj_stmts(self.server, "Procedure", "db1", "proc1")
+
+    def test_trigger(self):
+
+        """Function:  test_trigger
+
+        Description:  Test with a trigger.
+
+        Arguments:
+
+        """
+
+        self.server.data = {"SQL Original Statement": "CREATE TRIGGER trg1",
+                            "sql_mode": "STRICT_TRANS_TABLES"}
+
+        self.assertEqual(
+            mysql_clone.crt_obj_stmts(self.server, "Trigger", "db1", "trg1"),
+            ["DROP TRIGGER IF EXISTS `db1`.`trg1`",
+             "SET SESSION sql_mode = 'STRICT_TRANS_TABLES'",
+             "CREATE TRIGGER trg1",
+             "SET SESSION sql_mode = 'NO_AUTO_VALUE_ON_ZERO'"])
+        self.assertEqual(self.server.cmd, "show create trigger `db1`.`trg1`")
+
+    def test_procedure(self):
+
+        """Function:  test_procedure
+
+        Description:  Test with a stored procedure.
+
+        Arguments:
+
+        """
+
+        self.server.data = {"Create Procedure": "CREATE PROCEDURE proc1",
+                            "sql_mode": ""}
+
+        self.assertEqual(
+            mysql_clone.crt_obj_stmts(
+                self.server, "Procedure", "db1", "proc1")[:3],
+            ["DROP PROCEDURE IF EXISTS `db1`.`proc1`",
+             "SET SESSION sql_mode = ''", "CREATE PROCEDURE proc1"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,254 @@
+# Classification (U)
+
+"""Program:  crt_rsc_grp.py
+
+    Description:  Unit testing of crt_rsc_grp in mysql_clone.py.
+
+    Usage:
+        test/unit/mysql_clone/crt_rsc_grp.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_clone                              # pylint:disable=E0401,C0413
+import lib.gen_libs as gen_libs             # pylint:disable=E0401,C0413,R0402
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class ArgParser():
+
+    """Class:  ArgParser
+
+    Description:  Class stub holder for gen_class.ArgParser class.
+
+    Methods:
+        __init__
+        get_val
+        arg_exist
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.cmdline = None
+        self.args_array = {}
+
+    def get_val(self, skey, def_val=None):
+
+        """Method:  get_val
+
+        Description:  Method stub holder for gen_class.ArgParser.get_val.
+
+        Arguments:
+
+        """
+
+        return self.args_array.get(skey, def_val)
+
+    def arg_exist(self, arg):
+
+        """Method:  arg_exist
+
+        Description:  Method stub holder for gen_class.ArgParser.arg_exist.
+
+        Arguments:
+
+        """
+
+        return arg in self.args_array
+
+
+class Server():                                         # pylint:disable=R0903
+
+    """Class:  Server
+
+    Description:  Class stub holder for mysql_class.Server class.
+
+    Methods:
+        __init__
+        connect
+
+    """
+
+    def __init__(self, conn_msg=None):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.conn_msg = conn_msg
+        self.version = (8, 0, 30)
+        self.connected = False
+
+    def connect(self, silent=False):
+
+        """Method:  connect
+
+        Description:  Method stub holder for mysql_class.Server.connect.
+
+        Arguments:
+
+        """
+
+        self.connected = silent
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_connect_failed
+        test_old_version
+        test_create_failed
+        test_dump_replica
+        test_created
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.args = ArgParser()
+        self.args.args_array = {"-c": "mysql_cfg", "-d": "config", "-q": "2-3"}
+        self.server = Server()
+
+    @mock.patch("mysql_clone.mysql_libs")
+    def test_connect_failed(self, mock_lib):
+
+        """Function:  test_connect_failed
+
+        Description:  Test with the server failing to connect.
+
+        Arguments:
+
+        """
+
+        mock_lib.create_instance.return_value = Server("Error")
+
+        with gen_libs.no_std_out():
+            self.assertIsNone(mysql_clone.crt_rsc_grp(self.args))
+
+    @mock.patch("mysql_clone.RscGroup.create")
+    @mock.patch("mysql_clone.mysql_libs")
+    def test_old_version(self, mock_lib, mock_create):
+
+        """Function:  test_old_version
+
+        Description:  Test with a server without resource groups.
+
+        Arguments:
+
+        """
+
+        self.server.version = (5, 7, 40)
+        mock_lib.create_instance.return_value = self.server
+
+        with gen_libs.no_std_out():
+            self.assertIsNone(mysql_clone.crt_rsc_grp(self.args))
+
+        mock_create.assert_not_called()
+        mock_lib.disconnect.assert_called_once_with(self.server)
+
+    @mock.patch("mysql_clone.RscGroup.create")
+    @mock.patch("mysql_clone.mysql_libs")
+    def test_create_failed(self, mock_lib, mock_create):
+
+        """Function:  test_create_failed
+
+        Description:  Test with the group failing to be created.
+
+        Arguments:
+
+        """
+
+        mock_lib.create_instance.return_value = self.server
+        mock_create.side_effect = Exception("Access denied")
+
+        with gen_libs.no_std_out():
+            self.assertIsNone(mysql_clone.crt_rsc_grp(self.args))
+
+        mock_lib.disconnect.assert_called_once_with(self.server)
+
+    @mock.patch("mysql_clone.RscGroup.create", mock.Mock())
+    @mock.patch("mysql_clone.mysql_libs")
+    def test_dump_replica(self, mock_lib):
+
+        """Function:  test_dump_replica
+
+        Description:  Test with the group created on the -m option replica
+            being dumped.
+
+        Arguments:
+
+        """
+
+        self.args.args_array["-m"] = "rep_cfg"
+        self.args.args_array["-y"] = "dev"
+        mock_lib.create_instance.return_value = self.server
+        rsc_grp = mysql_clone.crt_rsc_grp(self.args)
+
+        self.assertEqual(mock_lib.create_instance.call_args[0][0], "rep_cfg")
+        self.assertEqual(rsc_grp.name, "mysql_clone_dev")
+
+    @mock.patch("mysql_clone.RscGroup.create")
+    @mock.patch("mysql_clone.mysql_libs")
+    def test_created(self, mock_lib, mock_create):
+
+        """Function:  test_created
+
+        Description:  Test with the group created for the dump process ids.
+
+        Arguments:
+
+        """
+
+        pids = [4321]
+        mock_lib.create_instance.return_value = self.server
+        rsc_grp = mysql_clone.crt_rsc_grp(self.args, pids=pids)
+
+        mock_create.assert_called_once_with()
+        self.assertTrue(self.server.connected)
+        self.assertEqual(rsc_grp.server, self.server)
+        self.assertEqual(rsc_grp.name, "mysql_clone")
+        self.assertEqual((rsc_grp.vcpus, rsc_grp.priority), ("2-3", 19))
+        self.assertIs(rsc_grp.pids, pids)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,212 @@
+# Classification (U)
+
+"""Program:  crt_task_cmd.py
+
+    Description:  Unit testing of crt_task_cmd in mysql_clone.py.
+
+    Usage:
+        test/unit/mysql_clone/crt_task_cmd.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_clone                              # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class ArgParser():                                      # pylint:disable=R0903
+
+    """Class:  ArgParser
+
+    Description:  Class stub holder for gen_class.ArgParser class.
+
+    Methods:
+        __init__
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.cmdline = None
+        self.args_array = {}
+
+
+class Server():                                         # pylint:disable=R0903
+
+    """Class:  Server
+
+    Description:  Class stub holder for mysql_class.Server class.
+
+    Methods:
+        __init__
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_gtid_purged_set
+        test_strip_options
+        test_multiple_dbs
+        test_task_args
+        test_table_task
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.server = Server()
+        self.args = ArgParser()
+        self.opt_arg_list = [
+            "--single-transaction", "--all-databases", "--triggers",
+            "--source-data=2"]
+        self.task = {"name": "db1", "dbs": ["db1"]}
+        self.task2 = {"name": "bin1", "dbs": ["db1", "db2"]}
+        self.task3 = {"name": "db1:schema", "dbs": ["db1"],
+                      "args": ["--no-data"]}
+        self.task4 = {"name": "db1.t1#0", "db": "db1", "tables": ["t1"],
+                      "args": ["--where=`id` < 10"]}
+
+    @mock.patch("mysql_clone.crt_dump_cmd")
+    def test_gtid_purged_set(self, mock_cmd):
+
+        """Function:  test_gtid_purged_set
+
+        Description:  Test with GTID purged option already in command.
+
+        Arguments:
+
+        """
+
+        mock_cmd.return_value = ["mysqldump", "--set-gtid-purged=OFF"]
+
+        self.assertEqual(
+            mysql_clone.crt_task_cmd(
+                self.server, self.args, self.opt_arg_list, self.task),
+            ["mysqldump", "--set-gtid-purged=OFF", "--databases", "db1"])
+
+    @mock.patch("mysql_clone.crt_dump_cmd")
+    def test_strip_options(self, mock_cmd):
+
+        """Function:  test_strip_options
+
+        Description:  Test with removal of the all databases and source data
+            options.
+
+        Arguments:
+
+        """
+
+        mock_cmd.return_value = ["mysqldump"]
+
+        mysql_clone.crt_task_cmd(
+            self.server, self.args, self.opt_arg_list, self.task)
+
+        self.assertEqual(
+            mock_cmd.call_args[0][2], ["--single-transaction", "--triggers"])
+
+    @mock.patch("mysql_clone.crt_dump_cmd")
+    def test_multiple_dbs(self, mock_cmd):
+
+        """Function:  test_multiple_dbs
+
+        Description:  Test with multiple databases in the task.
+
+        Arguments:
+
+        """
+
+        mock_cmd.return_value = ["mysqldump"]
+
+        self.assertEqual(
+            mysql_clone.crt_task_cmd(
+                self.server, self.args, self.opt_arg_list, self.task2),
+            ["mysqldump", "--set-gtid-purged=OFF", "--databases", "db1",
+             "db2"])
+
+    @mock.patch("mysql_clone.crt_dump_cmd")
+    def test_task_args(self, mock_cmd):
+
+        """Function:  test_task_args
+
+        Description:  Test with task specific options.
+
+        Arguments:
+
+        """
+
+        mock_cmd.return_value = ["mysqldump"]
+
+        self.assertEqual(
+            mysql_clone.crt_task_cmd(
+                self.server, self.args, self.opt_arg_list, self.task3),
+            ["mysqldump", "--set-gtid-purged=OFF", "--no-data", "--databases",
+             "db1"])
+
+    @mock.patch("mysql_clone.crt_dump_cmd")
+    def test_table_task(self, mock_cmd):
+
+        """Function:  test_table_task
+
+        Description:  Test with a table task.
+
+        Arguments:
+
+        """
+
+        mock_cmd.return_value = ["mysqldump"]
+
+        self.assertEqual(
+            mysql_clone.crt_task_cmd(
+                self.server, self.args, self.opt_arg_list, self.task4),
+            ["mysqldump", "--set-gtid-purged=OFF", "--where=`id` < 10", "db1",
+             "t1"])
+
+
+if __name__ == "__main__":
+    unittest.main()
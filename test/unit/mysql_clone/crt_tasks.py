@@ -0,0 +1,293 @@
+# Classification (U)
+
+"""Program:  crt_tasks.py
+
+    Description:  Unit testing of crt_tasks in mysql_clone.py.
+
+    Usage:
+        test/unit/mysql_clone/crt_tasks.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_clone                              # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class ArgParser():
+
+    """Class:  ArgParser
+
+    Description:  Class stub holder for gen_class.ArgParser class.
+
+    Methods:
+        __init__
+        arg_exist
+        get_val
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.cmdline = None
+        self.args_array = {}
+
+    def arg_exist(self, arg):
+
+        """Method:  arg_exist
+
+        Description:  Method stub holder for gen_class.ArgParser.arg_exist.
+
+        Arguments:
+
+        """
+
+        return arg in self.args_array
+
+    def get_val(self, skey, def_val=None):
+
+        """Method:  get_val
+
+        Description:  Method stub holder for gen_class.ArgParser.get_val.
+
+        Arguments:
+
+        """
+
+        return self.args_array.get(skey, def_val)
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_largest_first
+        test_split_db
+        test_workers
+        test_small_db
+        test_string_key
+        test_pack_dbs
+        test_no_chunk_size
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.server = "Server"
+        self.args = ArgParser()
+        self.mbyte = 1024 * 1024
+        self.tbls = [
+            {"db": "a", "tbl": "t1", "engine": "InnoDB", "data_len": 10,
+             "size": 20, "col": "id", "col_type": "int"},
+            {"db": "b", "tbl": "t1", "engine": "InnoDB", "data_len": 10,
+             "size": 50, "col": "id", "col_type": "int"},
+            {"db": "db2", "tbl": "big", "engine": "InnoDB",
+             "data_len": 3 * self.mbyte, "size": 4 * self.mbyte,
+             "col": "id", "col_type": "int"},
+            {"db": "db2", "tbl": "s1", "engine": "InnoDB", "data_len": 10,
+             "size": 100, "col": "id", "col_type": "int"},
+            {"db": "db2", "tbl": "s2", "engine": "MyISAM",
+             "data_len": 2 * self.mbyte, "size": 2 * self.mbyte,
+             "col": "id", "col_type": "int"}]
+        self.chunks = [
+            {"name": "db2.big#0", "phase": 2, "size": 2 * self.mbyte},
+            {"name": "db2.big#1", "phase": 2, "size": 2 * self.mbyte}]
+
+    @mock.patch("mysql_clone.fetch_tbls")
+    @mock.patch("mysql_clone.fetch_dbs", mock.Mock(return_value=["a", "b"]))
+    def test_largest_first(self, mock_tbls):
+
+        """Function:  test_largest_first
+
+        Description:  Test with databases ordered largest first.
+
+        Arguments:
+
+        """
+
+        self.args.args_array = {"-j": "4"}
+        mock_tbls.return_value = self.tbls
+
+        self.assertEqual(
+            mysql_clone.crt_tasks(self.server, self.args),
+            [{"name": "b", "dbs": ["b"], "phase": 2, "size": 50},
+             {"name": "a", "dbs": ["a"], "phase": 2, "size": 20}])
+
+    @mock.patch("mysql_clone.crt_chunks")
+    @mock.patch("mysql_clone.fetch_tbls")
+    @mock.patch("mysql_clone.fetch_dbs", mock.Mock(return_value=["a", "db2"]))
+    def test_split_db(self, mock_tbls, mock_chunks):
+
+        """Function:  test_split_db
+
+        Description:  Test with a database larger than the chunk size and
+            its routines and events dumped only by the triggers task.
+
+        Arguments:
+
+        """
+
+        self.args.args_array = {"-k": "1", "-j": "8"}
+        mock_tbls.return_value = self.tbls
+        mock_chunks.return_value = self.chunks
+        tasks = mysql_clone.crt_tasks(self.server, self.args)
+
+        self.assertEqual(
+            [(task["name"], task["phase"]) for task in tasks],
+            [("db2:schema", 1), ("db2.big#0", 2), ("db2.big#1", 2),
+             ("db2:batch#0", 2), ("db2:batch#1", 2), ("a", 2),
+             ("db2:triggers", 3)])
+        self.assertEqual(
+            (tasks[3]["tables"], tasks[4]["tables"]), (["s2"], ["s1"]))
+        mock_chunks.assert_called_once_with(
+            self.server, self.tbls[2], self.mbyte)
+        self.assertEqual(
+            [task["name"] for task in tasks
+             if "--skip-routines" not in task.get("args", [])],
+            ["db2.big#0", "db2.big#1", "a", "db2:triggers"])
+
+    @mock.patch("mysql_clone.crt_chunks")
+    @mock.patch("mysql_clone.fetch_tbls")
+    @mock.patch("mysql_clone.fetch_dbs", mock.Mock(return_value=["a", "db2"]))
+    def test_workers(self, mock_tbls, mock_chunks):
+
+        """Function:  test_workers
+
+        Description:  Test with a database dumped whole as its tasks do not
+            fit the workers.
+
+        Arguments:
+
+        """
+
+        self.args.args_array = {"-k": "1", "-j": "3"}
+        mock_tbls.return_value = self.tbls
+
+        self.assertEqual(
+            mysql_clone.crt_tasks(self.server, self.args),
+            [{"name": "db2", "dbs": ["db2"], "phase": 2,
+              "size": 6 * self.mbyte + 100},
+             {"name": "a", "dbs": ["a"], "phase": 2, "size": 20}])
+        mock_chunks.assert_not_called()
+
+    @mock.patch("mysql_clone.crt_chunks")
+    @mock.patch("mysql_clone.fetch_tbls")
+    @mock.patch("mysql_clone.fetch_dbs", mock.Mock(return_value=["a", "b"]))
+    def test_small_db(self, mock_tbls, mock_chunks):
+
+        """Function:  test_small_db
+
+        Description:  Test with databases smaller than the chunk size.
+
+        Arguments:
+
+        """
+
+        self.args.args_array = {"-k": "1", "-j": "8"}
+        mock_tbls.return_value = self.tbls
+
+        self.assertEqual(
+            mysql_clone.crt_tasks(self.server, self.args),
+            [{"name": "bin#0", "dbs": ["b", "a"], "phase": 2, "size": 70}])
+        mock_chunks.assert_not_called()
+
+    @mock.patch("mysql_clone.crt_chunks")
+    @mock.patch("mysql_clone.fetch_tbls")
+    @mock.patch("mysql_clone.fetch_dbs", mock.Mock(return_value=["db2"]))
+    def test_string_key(self, mock_tbls, mock_chunks):
+
+        """Function:  test_string_key
+
+        Description:  Test with a large table with a string primary key
+            batched instead of split into primary key ranges.
+
+        Arguments:
+
+        """
+
+        self.args.args_array = {"-k": "1", "-j": "8"}
+        self.tbls[2]["col_type"] = "varchar"
+        mock_tbls.return_value = self.tbls
+        tasks = mysql_clone.crt_tasks(self.server, self.args)
+
+        self.assertIn(["big"], [task.get("tables") for task in tasks])
+        mock_chunks.assert_not_called()
+
+    @mock.patch("mysql_clone.fetch_tbls")
+    @mock.patch("mysql_clone.fetch_dbs")
+    def test_pack_dbs(self, mock_dbs, mock_tbls):
+
+        """Function:  test_pack_dbs
+
+        Description:  Test with many small databases spread over the
+            workers.
+
+        Arguments:
+
+        """
+
+        self.args.args_array = {"-j": "2"}
+        mock_dbs.return_value = [f"db{idx}" for idx in range(80)]
+        mock_tbls.return_value = [
+            {"db": f"db{idx}", "tbl": "t1", "engine": "InnoDB",
+             "data_len": 10, "size": 10, "col": "id", "col_type": "int"}
+            for idx in range(80)]
+        tasks = mysql_clone.crt_tasks(self.server, self.args)
+
+        self.assertEqual(len(tasks), 2)
+        self.assertEqual({task["size"] for task in tasks}, {400})
+        self.assertEqual(len({dbn for task in tasks for dbn in task["dbs"]}),
+                         80)
+
+    @mock.patch("mysql_clone.fetch_tbls", mock.Mock(return_value=[]))
+    @mock.patch("mysql_clone.fetch_dbs", mock.Mock(return_value=["a"]))
+    def test_no_chunk_size(self):
+
+        """Function:  test_no_chunk_size
+
+        Description:  Test with no -k option.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            mysql_clone.crt_tasks(self.server, self.args),
+            [{"name": "a", "dbs": ["a"], "phase": 2, "size": 0}])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,209 @@
+# Classification (U)
+
+"""Program:  crt_undo_guard.py
+
+    Description:  Unit testing of crt_undo_guard in mysql_clone.py.
+
+    Usage:
+        test/unit/mysql_clone/crt_undo_guard.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_clone                              # pylint:disable=E0401,C0413
+import lib.gen_libs as gen_libs             # pylint:disable=E0401,C0413,R0402
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class ArgParser():
+
+    """Class:  ArgParser
+
+    Description:  Class stub holder for gen_class.ArgParser class.
+
+    Methods:
+        __init__
+        get_val
+        arg_exist
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.cmdline = None
+        self.args_array = {}
+
+    def get_val(self, skey, def_val=None):
+
+        """Method:  get_val
+
+        Description:  Method stub holder for gen_class.ArgParser.get_val.
+
+        Arguments:
+
+        """
+
+        return self.args_array.get(skey, def_val)
+
+    def arg_exist(self, arg):
+
+        """Method:  arg_exist
+
+        Description:  Method stub holder for gen_class.ArgParser.arg_exist.
+
+        Arguments:
+
+        """
+
+        return arg in self.args_array
+
+
+class Server():                                         # pylint:disable=R0903
+
+    """Class:  Server
+
+    Description:  Class stub holder for mysql_class.Server class.
+
+    Methods:
+        __init__
+        connect
+
+    """
+
+    def __init__(self, conn_msg=None):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.conn_msg = conn_msg
+        self.connected = False
+
+    def connect(self, silent=False):
+
+        """Method:  connect
+
+        Description:  Method stub holder for mysql_class.Server.connect.
+
+        Arguments:
+
+        """
+
+        self.connected = silent
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_connect_failed
+        test_dump_replica
+        test_guard
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.args = ArgParser()
+        self.args.args_array = {"-c": "mysql_cfg", "-d": "config"}
+        self.undo_cfg = {"warn": {"history_len": 1000}, "interval": 10}
+
+    @mock.patch("mysql_clone.mysql_libs")
+    def test_connect_failed(self, mock_lib):
+
+        """Function:  test_connect_failed
+
+        Description:  Test with the server failing to connect.
+
+        Arguments:
+
+        """
+
+        mock_lib.create_instance.return_value = Server("Error")
+
+        with gen_libs.no_std_out():
+            self.assertIsNone(
+                mysql_clone.crt_undo_guard(self.args, self.undo_cfg))
+
+    @mock.patch("mysql_clone.mysql_libs")
+    def test_dump_replica(self, mock_lib):
+
+        """Function:  test_dump_replica
+
+        Description:  Test with the guard on the -m option replica being
+            dumped.
+
+        Arguments:
+
+        """
+
+        self.args.args_array["-m"] = "rep_cfg"
+        mock_lib.create_instance.return_value = Server()
+        mysql_clone.crt_undo_guard(self.args, self.undo_cfg)
+
+        self.assertEqual(mock_lib.create_instance.call_args[0][0], "rep_cfg")
+
+    @mock.patch("mysql_clone.mysql_libs")
+    def test_guard(self, mock_lib):
+
+        """Function:  test_guard
+
+        Description:  Test with the guard created with the throttle and the
+            dump process ids.
+
+        Arguments:
+
+        """
+
+        server = Server()
+        pids = [4321]
+        mock_lib.create_instance.return_value = server
+        guard = mysql_clone.crt_undo_guard(
+            self.args, self.undo_cfg, throttle="Throttle", pids=pids)
+
+        self.assertTrue(server.connected)
+        self.assertEqual(guard.server, server)
+        self.assertEqual(guard.throttle, "Throttle")
+        self.assertEqual(guard.limits["warn"], {"history_len": 1000})
+        self.assertIs(guard.pids, pids)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,136 @@
+# Classification (U)
+
+"""Program:  dump_bp.py
+
+    Description:  Unit testing of dump_bp in mysql_clone.py.
+
+    Usage:
+        test/unit/mysql_clone/dump_bp.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_clone                              # pylint:disable=E0401,C0413
+import lib.gen_libs as gen_libs             # pylint:disable=E0401,C0413,R0402
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class Server():                                         # pylint:disable=R0903
+
+    """Class:  Server
+
+    Description:  Class stub holder for mysql_class.Server class.
+
+    Methods:
+        __init__
+        cmd_sql
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.cmds = []
+
+    def cmd_sql(self, cmd):
+
+        """Method:  cmd_sql
+
+        Description:  Method stub holder for mysql_class.Server.cmd_sql.
+
+        Arguments:
+
+        """
+
+        self.cmds.append(cmd)
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_not_completed
+        test_completed
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.server = Server()
+
+    @mock.patch("mysql_clone.wait_bp")
+    @mock.patch("mysql_clone.fetch_bp_stat")
+    def test_not_completed(self, mock_stat, mock_wait):
+
+        """Function:  test_not_completed
+
+        Description:  Test with the dump not completed.
+
+        Arguments:
+
+        """
+
+        mock_stat.return_value = {}
+        mock_wait.return_value = (False, "Error")
+
+        with gen_libs.no_std_out():
+            self.assertFalse(mysql_clone.dump_bp(self.server))
+
+    @mock.patch("mysql_clone.wait_bp")
+    @mock.patch("mysql_clone.fetch_bp_stat")
+    def test_completed(self, mock_stat, mock_wait):
+
+        """Function:  test_completed
+
+        Description:  Test with the dump started and completed.
+
+        Arguments:
+
+        """
+
+        mock_stat.return_value = {"Innodb_buffer_pool_dump_status": "Old"}
+        mock_wait.return_value = (True, "Buffer pool(s) dump completed")
+
+        with gen_libs.no_std_out():
+            self.assertTrue(mysql_clone.dump_bp(self.server, timeout=5))
+
+        self.assertEqual(
+            self.server.cmds, ["set global innodb_buffer_pool_dump_now = on"])
+        mock_wait.assert_called_once_with(
+            self.server, "dump", "Old", timeout=5)
+
+
+if __name__ == "__main__":
+    unittest.main()
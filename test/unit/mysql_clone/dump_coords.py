@@ -0,0 +1,107 @@
+# Classification (U)
+
+"""Program:  dump_coords.py
+
+    Description:  Unit testing of dump_coords in mysql_clone.py.
+
+    Usage:
+        test/unit/mysql_clone/dump_coords.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_clone                              # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        test_no_coords
+        test_source_syntax
+        test_multi_line_gtid
+        test_master_syntax
+
+    """
+
+    def test_no_coords(self):
+
+        """Function:  test_no_coords
+
+        Description:  Test with no coordinates in the dump.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(mysql_clone.dump_coords(b"-- MySQL dump\n"), {})
+
+    def test_source_syntax(self):
+
+        """Function:  test_source_syntax
+
+        Description:  Test with the change replication source syntax.
+
+        Arguments:
+
+        """
+
+        head = b"-- CHANGE REPLICATION SOURCE TO" \
+            b" SOURCE_LOG_FILE='bin.000003', SOURCE_LOG_POS=157;\n"
+
+        self.assertEqual(
+            mysql_clone.dump_coords(head), {"file": "bin.000003", "pos": 157})
+
+    def test_multi_line_gtid(self):
+
+        """Function:  test_multi_line_gtid
+
+        Description:  Test with a GTID set over several lines.
+
+        Arguments:
+
+        """
+
+        head = b"SET @@GLOBAL.GTID_PURGED=/*!80000 '+'*/ 'uuid1:1-10,\n" \
+            b"uuid2:1-5';\n"
+
+        self.assertEqual(
+            mysql_clone.dump_coords(head), {"gtid": "uuid1:1-10,uuid2:1-5"})
+
+    def test_master_syntax(self):
+
+        """Function:  test_master_syntax
+
+        Description:  Test with the change master syntax and a GTID set.
+
+        Arguments:
+
+        """
+
+        head = b"SET @@GLOBAL.GTID_PURGED='uuid:1-10';\n" \
+            b"CHANGE MASTER TO MASTER_LOG_FILE='binlog.000001'," \
+            b" MASTER_LOG_POS=1234;\n"
+
+        self.assertEqual(
+            mysql_clone.dump_coords(head),
+            {"file": "binlog.000001", "pos": 1234, "gtid": "uuid:1-10"})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -37,6 +37,7 @@ class ArgParser():
     Methods:
         __init__
         arg_exist
+        get_val
         arg_set_path
 
     """
@@ -66,6 +67,18 @@ class ArgParser():
 
         return arg in self.args_array
 
+    def get_val(self, skey, def_val=None):
+
+        """Method:  get_val
+
+        Description:  Method stub holder for gen_class.ArgParser.get_val.
+
+        Arguments:
+
+        """
+
+        return self.args_array.get(skey, def_val)
+
     def arg_set_path(self, arg_opt, **kwargs):
 
         """Method:  arg_set_path
@@ -105,6 +118,30 @@ class FileOpen():                                       # pylint:disable=R0903
         return True
 
 
+class Pipe():                                           # pylint:disable=R0903
+
+    """Class:  Pipe
+
+    Description:  Class stub holder for a process pipe.
+
+    Methods:
+        close
+
+    """
+
+    def close(self):
+
+        """Method:  close
+
+        Description:  Stub holder for close method.
+
+        Arguments:
+
+        """
+
+        return True
+
+
 class Popen():                                          # pylint:disable=R0903
 
     """Class:  Popen
@@ -127,7 +164,10 @@ class Popen():                                          # pylint:disable=R0903
 
         """
 
-        self.stdout = ["binlog1"]
+        self.stdout = Pipe()
+        self.stdin = Pipe()
+        self.returncode = 0
+        self.pid = 4321
 
     def wait(self):
 
@@ -142,7 +182,7 @@ class Popen():                                          # pylint:disable=R0903
         return True
 
 
-class Server():                                         # pylint:disable=R0903
+class Server():
 
     """Class:  Server
 
@@ -150,6 +190,8 @@ class Server():                                         # pylint:disable=R0903
 
     Methods:
         __init__
+        col_sql
+        cmd_sql
 
     """
 
@@ -164,6 +206,35 @@ class Server():                                         # pylint:disable=R0903
         """
 
         self.gtid_mode = True
+        self.name = "Server"
+        self.version = (5, 7, 44)
+        self.cmds = []
+
+    def col_sql(self, cmd):
+
+        """Method:  col_sql
+
+        Description:  Method stub holder for mysql_class.Server.col_sql.
+
+        Arguments:
+
+        """
+
+        self.cmds.append(cmd)
+
+        return [{"id": 7}]
+
+    def cmd_sql(self, cmd):
+
+        """Method:  cmd_sql
+
+        Description:  Method stub holder for mysql_class.Server.cmd_sql.
+
+        Arguments:
+
+        """
+
+        self.cmds.append(cmd)
 
 
 class UnitTest(unittest.TestCase):
@@ -179,6 +250,23 @@ class UnitTest(unittest.TestCase):
         test_no_gtid
         test_add_opt_dump
         test_create_cmd
+        test_parallel_failed
+        test_parallel
+        test_native
+        test_tab
+        test_fan_out
+        test_no_snap_privs
+        test_backup_lock
+        test_agent
+        test_bulk_cleanup_failed
+        test_bulk_not_restored
+        test_bulk_profile
+        test_compress
+        test_throttle
+        test_health
+        test_rsc_grp
+        test_undo_guard
+        test_bp_guard
 
     """
 
@@ -201,6 +289,12 @@ class UnitTest(unittest.TestCase):
         self.args.args_array = {}
         self.args2.args_array = {"-n": True}
         self.args3.args_array = {"-n": True, "-r": True}
+        self.args4 = ArgParser()
+        self.args4.args_array = {"-n": True, "-j": "4"}
+        self.args5 = ArgParser()
+        self.args5.args_array = {"-n": True, "-e": True}
+        self.args6 = ArgParser()
+        self.args6.args_array = {"-n": True, "-s": "/stage", "-j": "4"}
         self.req_rep_cfg = {
             "master": {
                 "log_bin": "ON", "sync_binlog": "1",
@@ -218,6 +312,7 @@ class UnitTest(unittest.TestCase):
         "mysql_clone.gen_libs.is_empty_file", mock.Mock(return_value=False))
     @mock.patch(
         "mysql_clone.gen_libs.crt_file_time", mock.Mock(return_value="Fname"))
+    @mock.patch("mysql_clone.relay", mock.Mock(return_value=0))
     @mock.patch("mysql_clone.subprocess.PIPE", mock.Mock(return_value=True))
     @mock.patch("mysql_clone.open")
     @mock.patch("mysql_clone.subprocess.Popen")
@@ -245,15 +340,16 @@ class UnitTest(unittest.TestCase):
         mock_open.return_value = self.open
 
         with gen_libs.no_std_out():
-            self.assertFalse(
+            self.assertEqual(
                 mysql_clone.dump_load_dbs(
                     self.source, self.clone, self.args, self.req_rep_cfg,
-                    self.opt_arg_list))
+                    self.opt_arg_list), (True, {}))
 
     @mock.patch(
         "mysql_clone.gen_libs.is_empty_file", mock.Mock(return_value=True))
     @mock.patch(
         "mysql_clone.gen_libs.crt_file_time", mock.Mock(return_value="Fname"))
+    @mock.patch("mysql_clone.relay", mock.Mock(return_value=0))
     @mock.patch("mysql_clone.subprocess.PIPE", mock.Mock(return_value=True))
     @mock.patch("mysql_clone.open")
     @mock.patch("mysql_clone.subprocess.Popen")
@@ -280,15 +376,17 @@ class UnitTest(unittest.TestCase):
         mock_popen.side_effect = [Popen(), Popen()]
         mock_open.return_value = self.open
 
-        self.assertFalse(
-            mysql_clone.dump_load_dbs(
-                self.source, self.clone, self.args, self.req_rep_cfg,
-                self.opt_arg_list))
+        with gen_libs.no_std_out():
+            self.assertEqual(
+                mysql_clone.dump_load_dbs(
+                    self.source, self.clone, self.args, self.req_rep_cfg,
+                    self.opt_arg_list), (True, {}))
 
     @mock.patch(
         "mysql_clone.gen_libs.is_empty_file", mock.Mock(return_value=True))
     @mock.patch(
         "mysql_clone.gen_libs.crt_file_time", mock.Mock(return_value="Fname"))
+    @mock.patch("mysql_clone.relay", mock.Mock(return_value=0))
     @mock.patch("mysql_clone.subprocess.PIPE", mock.Mock(return_value=True))
     @mock.patch("mysql_clone.open")
     @mock.patch("mysql_clone.subprocess.Popen")
@@ -313,15 +411,17 @@ class UnitTest(unittest.TestCase):
         mock_popen.side_effect = [Popen(), Popen()]
         mock_open.return_value = self.open
 
-        self.assertFalse(
-            mysql_clone.dump_load_dbs(
-                self.source, self.clone, self.args2, self.req_rep_cfg,
-                self.opt_arg_list))
+        with gen_libs.no_std_out():
+            self.assertEqual(
+                mysql_clone.dump_load_dbs(
+                    self.source, self.clone, self.args2, self.req_rep_cfg,
+                    self.opt_arg_list), (True, {}))
 
     @mock.patch(
         "mysql_clone.gen_libs.is_empty_file", mock.Mock(return_value=True))
     @mock.patch(
         "mysql_clone.gen_libs.crt_file_time", mock.Mock(return_value="Fname"))
+    @mock.patch("mysql_clone.relay", mock.Mock(return_value=0))
     @mock.patch("mysql_clone.subprocess.PIPE", mock.Mock(return_value=True))
     @mock.patch("mysql_clone.open")
     @mock.patch("mysql_clone.subprocess.Popen")
@@ -349,15 +449,17 @@ class UnitTest(unittest.TestCase):
         mock_popen.side_effect = [Popen(), Popen()]
         mock_open.return_value = self.open
 
-        self.assertFalse(
-            mysql_clone.dump_load_dbs(
-                self.source, self.clone, self.args2, self.req_rep_cfg,
-                self.opt_arg_list))
+        with gen_libs.no_std_out():
+            self.assertEqual(
+                mysql_clone.dump_load_dbs(
+                    self.source, self.clone, self.args2, self.req_rep_cfg,
+                    self.opt_arg_list), (True, {}))
 
     @mock.patch(
         "mysql_clone.gen_libs.is_empty_file", mock.Mock(return_value=True))
     @mock.patch(
         "mysql_clone.gen_libs.crt_file_time", mock.Mock(return_value="Fname"))
+    @mock.patch("mysql_clone.relay", mock.Mock(return_value=0))
     @mock.patch("mysql_clone.subprocess.PIPE", mock.Mock(return_value=True))
     @mock.patch("mysql_clone.open")
     @mock.patch("mysql_clone.subprocess.Popen")
@@ -384,10 +486,616 @@ class UnitTest(unittest.TestCase):
         mock_popen.side_effect = [Popen(), Popen()]
         mock_open.return_value = self.open
 
-        self.assertFalse(
+        with gen_libs.no_std_out():
+            self.assertEqual(
+                mysql_clone.dump_load_dbs(
+                    self.source, self.clone, self.args, self.req_rep_cfg,
+                    self.opt_arg_list), (True, {}))
+
+    @mock.patch(
+        "mysql_clone.gen_libs.is_empty_file", mock.Mock(return_value=True))
+    @mock.patch(
+        "mysql_clone.gen_libs.crt_file_time", mock.Mock(return_value="Fname"))
+    @mock.patch("mysql_clone.open")
+    @mock.patch("mysql_clone.par_dump_load")
+    @mock.patch("mysql_clone.mysql_libs.reset_master")
+    @mock.patch("mysql_clone.mysql_libs.crt_cmd")
+    @mock.patch("mysql_clone.crt_dump_cmd")
+    def test_parallel_failed(                   # pylint:disable=R0913,R0917
+            self, mock_cmd, mock_crtcmd, mock_reset, mock_par, mock_open):
+
+        """Function:  test_parallel_failed
+
+        Description:  Test with parallel dump-load failing.
+
+        Arguments:
+
+        """
+
+        mock_cmd.return_value = ["command", "arg1", "arg2"]
+        mock_crtcmd.return_value = ["command", "arg1"]
+        mock_reset.return_value = True
+        mock_par.return_value = (False, {})
+        mock_open.return_value = self.open
+
+        with gen_libs.no_std_out():
+            self.assertEqual(
+                mysql_clone.dump_load_dbs(
+                    self.source, self.clone, self.args4, self.req_rep_cfg,
+                    self.opt_arg_list), (False, {}))
+
+    @mock.patch(
+        "mysql_clone.gen_libs.is_empty_file", mock.Mock(return_value=True))
+    @mock.patch(
+        "mysql_clone.gen_libs.crt_file_time", mock.Mock(return_value="Fname"))
+    @mock.patch("mysql_clone.subprocess.Popen")
+    @mock.patch("mysql_clone.open")
+    @mock.patch("mysql_clone.par_dump_load")
+    @mock.patch("mysql_clone.mysql_libs.reset_master")
+    @mock.patch("mysql_clone.mysql_libs.crt_cmd")
+    @mock.patch("mysql_clone.crt_dump_cmd")
+    def test_parallel(                          # pylint:disable=R0913,R0917
+            self, mock_cmd, mock_crtcmd, mock_reset, mock_par, mock_open,
+            mock_popen):
+
+        """Function:  test_parallel
+
+        Description:  Test with parallel dump-load option.
+
+        Arguments:
+
+        """
+
+        mock_cmd.return_value = ["command", "arg1", "arg2"]
+        mock_crtcmd.return_value = ["command", "arg1"]
+        mock_reset.return_value = True
+        mock_par.return_value = (True, {"file": "binlog.000001", "pos": 4})
+        mock_open.return_value = self.open
+
+        self.assertEqual(
+            mysql_clone.dump_load_dbs(
+                self.source, self.clone, self.args4, self.req_rep_cfg,
+                self.opt_arg_list),
+            (True, {"file": "binlog.000001", "pos": 4}))
+        mock_popen.assert_not_called()
+
+    @mock.patch(
+        "mysql_clone.gen_libs.is_empty_file", mock.Mock(return_value=True))
+    @mock.patch(
+        "mysql_clone.gen_libs.crt_file_time", mock.Mock(return_value="Fname"))
+    @mock.patch("mysql_clone.subprocess.Popen")
+    @mock.patch("mysql_clone.open")
+    @mock.patch("mysql_clone.native_dump_load")
+    @mock.patch("mysql_clone.mysql_libs.reset_master")
+    @mock.patch("mysql_clone.mysql_libs.crt_cmd")
+    @mock.patch("mysql_clone.crt_dump_cmd")
+    def test_native(                            # pylint:disable=R0913,R0917
+            self, mock_cmd, mock_crtcmd, mock_reset, mock_native, mock_open,
+            mock_popen):
+
+        """Function:  test_native
+
+        Description:  Test with native dump engine option.
+
+        Arguments:
+
+        """
+
+        mock_cmd.return_value = ["command", "arg1", "arg2"]
+        mock_crtcmd.return_value = ["command", "arg1"]
+        mock_reset.return_value = True
+        mock_native.return_value = (True, {"file": "binlog.000001", "pos": 4})
+        mock_open.return_value = self.open
+
+        self.assertEqual(
+            mysql_clone.dump_load_dbs(
+                self.source, self.clone, self.args5, self.req_rep_cfg,
+                self.opt_arg_list),
+            (True, {"file": "binlog.000001", "pos": 4}))
+        mock_popen.assert_not_called()
+
+    @mock.patch(
+        "mysql_clone.gen_libs.is_empty_file", mock.Mock(return_value=True))
+    @mock.patch(
+        "mysql_clone.gen_libs.crt_file_time", mock.Mock(return_value="Fname"))
+    @mock.patch("mysql_clone.par_dump_load")
+    @mock.patch("mysql_clone.open")
+    @mock.patch("mysql_clone.tab_dump_load")
+    @mock.patch("mysql_clone.mysql_libs.reset_master")
+    @mock.patch("mysql_clone.mysql_libs.crt_cmd")
+    @mock.patch("mysql_clone.crt_dump_cmd")
+    def test_tab(                               # pylint:disable=R0913,R0917
+            self, mock_cmd, mock_crtcmd, mock_reset, mock_tab, mock_open,
+            mock_par):
+
+        """Function:  test_tab
+
+        Description:  Test with tab separated dump-load option.
+
+        Arguments:
+
+        """
+
+        mock_cmd.return_value = ["command", "arg1", "arg2"]
+        mock_crtcmd.return_value = ["command", "arg1"]
+        mock_reset.return_value = True
+        mock_tab.return_value = (True, {"file": "binlog.000001", "pos": 4})
+        mock_open.return_value = self.open
+
+        self.assertEqual(
             mysql_clone.dump_load_dbs(
-                self.source, self.clone, self.args, self.req_rep_cfg,
-                self.opt_arg_list))
+                self.source, self.clone, self.args6, self.req_rep_cfg,
+                self.opt_arg_list),
+            (True, {"file": "binlog.000001", "pos": 4}))
+        mock_par.assert_not_called()
+
+    @mock.patch(
+        "mysql_clone.gen_libs.is_empty_file", mock.Mock(return_value=True))
+    @mock.patch(
+        "mysql_clone.gen_libs.crt_file_time", mock.Mock(return_value="Fname"))
+    @mock.patch("mysql_clone.open", mock.Mock())
+    @mock.patch("mysql_clone.chk_no_log", mock.Mock(return_value=False))
+    @mock.patch("mysql_clone.crt_load_cmd", mock.Mock(return_value=["mysql"]))
+    @mock.patch("mysql_clone.crt_dump_cmd",
+                mock.Mock(return_value=["mysqldump"]))
+    @mock.patch("mysql_clone.relay_dump_load")
+    @mock.patch("mysql_clone.mysql_libs.reset_master")
+    @mock.patch("mysql_clone.fan_dump_load")
+    def test_fan_out(self, mock_fan, mock_reset, mock_relay):
+
+        """Function:  test_fan_out
+
+        Description:  Test with several clones loaded from one dump.
+
+        Arguments:
+
+        """
+
+        clone2 = Server()
+        clone2.name = "Server2"
+        mock_fan.return_value = (True, {"file": "binlog.000001", "pos": 4})
+
+        self.assertEqual(
+            mysql_clone.dump_load_dbs(
+                self.source, self.clone, self.args2, self.req_rep_cfg,
+                self.opt_arg_list, fan_out=[clone2]),
+            (True, {"file": "binlog.000001", "pos": 4}))
+        self.assertEqual(
+            mock_fan.call_args[0][1],
+            [("Server", ["mysql"]), ("Server2", ["mysql"])])
+        self.assertEqual(mock_reset.call_count, 2)
+        mock_relay.assert_not_called()
+
+    @mock.patch(
+        "mysql_clone.gen_libs.is_empty_file", mock.Mock(return_value=True))
+    @mock.patch(
+        "mysql_clone.gen_libs.crt_file_time", mock.Mock(return_value="Fname"))
+    @mock.patch("mysql_clone.open", mock.Mock())
+    @mock.patch("mysql_clone.chk_snap_privs", mock.Mock(return_value=False))
+    @mock.patch("mysql_clone.relay_dump_load")
+    @mock.patch("mysql_clone.par_dump_load")
+    def test_no_snap_privs(self, mock_par, mock_relay):
+
+        """Function:  test_no_snap_privs
+
+        Description:  Test with the single stream dumped with --source-data
+            when the backup lock's privileges are missing.
+
+        Arguments:
+
+        """
+
+        self.source.version = (8, 0, 35)
+        mock_relay.return_value = True
+
+        self.assertTrue(
+            mysql_clone.dump_load_dbs(
+                self.source, self.clone, self.args2, self.req_rep_cfg,
+                self.opt_arg_list)[0])
+        mock_par.assert_not_called()
+
+    @mock.patch(
+        "mysql_clone.gen_libs.is_empty_file", mock.Mock(return_value=True))
+    @mock.patch(
+        "mysql_clone.gen_libs.crt_file_time", mock.Mock(return_value="Fname"))
+    @mock.patch("mysql_clone.open", mock.Mock())
+    @mock.patch("mysql_clone.chk_snap_privs", mock.Mock(return_value=True))
+    @mock.patch("mysql_clone.fetch_dbs", mock.Mock(return_value=["db1"]))
+    @mock.patch("mysql_clone.relay_dump_load")
+    @mock.patch("mysql_clone.par_dump_load")
+    def test_backup_lock(self, mock_par, mock_relay):
+
+        """Function:  test_backup_lock
+
+        Description:  Test with the single stream dumped under a backup lock.
+
+        Arguments:
+
+        """
+
+        self.source.version = (8, 0, 35)
+        mock_par.return_value = (True, {"file": "binlog.000001", "pos": 4})
+
+        self.assertEqual(
+            mysql_clone.dump_load_dbs(
+                self.source, self.clone, self.args2, self.req_rep_cfg,
+                self.opt_arg_list),
+            (True, {"file": "binlog.000001", "pos": 4}))
+        self.assertEqual(
+            mock_par.call_args[1]["tasks"],
+            [{"name": "all", "dbs": ["db1"], "phase": 1, "size": 0}])
+        mock_relay.assert_not_called()
+
+    @mock.patch(
+        "mysql_clone.gen_libs.is_empty_file", mock.Mock(return_value=True))
+    @mock.patch(
+        "mysql_clone.gen_libs.crt_file_time", mock.Mock(return_value="Fname"))
+    @mock.patch("mysql_clone.open", mock.Mock())
+    @mock.patch("mysql_clone.par_dump_load")
+    @mock.patch("mysql_clone.agent_dump_load")
+    def test_agent(self, mock_agent, mock_par):
+
+        """Function:  test_agent
+
+        Description:  Test with the databases loaded from the agent.
+
+        Arguments:
+
+        """
+
+        self.args6.args_array = {"-n": True, "-g": "master:5000"}
+        mock_agent.return_value = (True, {"file": "binlog.000001", "pos": 4})
+
+        self.assertEqual(
+            mysql_clone.dump_load_dbs(
+                self.source, self.clone, self.args6, self.req_rep_cfg,
+                self.opt_arg_list),
+            (True, {"file": "binlog.000001", "pos": 4}))
+        mock_par.assert_not_called()
+
+    @mock.patch(
+        "mysql_clone.gen_libs.is_empty_file", mock.Mock(return_value=True))
+    @mock.patch(
+        "mysql_clone.gen_libs.crt_file_time", mock.Mock(return_value="Fname"))
+    @mock.patch("mysql_clone.open", mock.Mock())
+    @mock.patch("mysql_clone.chk_no_log", mock.Mock(return_value=True))
+    @mock.patch("mysql_clone.connect_chk", mock.Mock(return_value=True))
+    @mock.patch("mysql_clone.set_bulk_cfg", mock.Mock(return_value=True))
+    @mock.patch("mysql_clone.fetch_bulk_cfg",
+                mock.Mock(return_value={"sync_binlog": "1"}))
+    @mock.patch("mysql_clone.crt_rsc_grp")
+    @mock.patch("mysql_clone.rst_bulk_cfg")
+    @mock.patch("mysql_clone.native_dump_load")
+    @mock.patch("mysql_clone.mysql_libs.reset_master", mock.Mock())
+    @mock.patch("mysql_clone.mysql_libs.crt_cmd",
+                mock.Mock(return_value=["mysql"]))
+    @mock.patch("mysql_clone.crt_dump_cmd", mock.Mock(return_value=["dump"]))
+    def test_bulk_cleanup_failed(self, mock_native, mock_rst, mock_rsc):
+
+        """Function:  test_bulk_cleanup_failed
+
+        Description:  Test with the bulk load profile restored when a later
+            cleanup step fails.
+
+        Arguments:
+
+        """
+
+        self.args5.args_array.update({"-f": True, "-q": "2-3"})
+        mock_rsc.return_value.name = "mysql_clone"
+        mock_rsc.return_value.stop.side_effect = ValueError("Drop failed")
+        mock_native.return_value = (True, {})
+        mock_rst.return_value = True
+
+        with gen_libs.no_std_out():
+            self.assertRaises(
+                ValueError, mysql_clone.dump_load_dbs, self.source,
+                self.clone, self.args5, self.req_rep_cfg, self.opt_arg_list)
+
+        mock_rst.assert_called_once()
+
+    @mock.patch(
+        "mysql_clone.gen_libs.is_empty_file", mock.Mock(return_value=True))
+    @mock.patch(
+        "mysql_clone.gen_libs.crt_file_time", mock.Mock(return_value="Fname"))
+    @mock.patch("mysql_clone.open", mock.Mock())
+    @mock.patch("mysql_clone.chk_no_log", mock.Mock(return_value=True))
+    @mock.patch("mysql_clone.connect_chk", mock.Mock(return_value=True))
+    @mock.patch("mysql_clone.set_bulk_cfg", mock.Mock(return_value=True))
+    @mock.patch("mysql_clone.fetch_bulk_cfg",
+                mock.Mock(return_value={"sync_binlog": "1"}))
+    @mock.patch("mysql_clone.rst_bulk_cfg")
+    @mock.patch("mysql_clone.native_dump_load")
+    @mock.patch("mysql_clone.mysql_libs.reset_master", mock.Mock())
+    @mock.patch("mysql_clone.mysql_libs.crt_cmd",
+                mock.Mock(return_value=["mysql"]))
+    @mock.patch("mysql_clone.crt_dump_cmd", mock.Mock(return_value=["dump"]))
+    def test_bulk_not_restored(self, mock_native, mock_rst):
+
+        """Function:  test_bulk_not_restored
+
+        Description:  Test with the bulk load profile not restored after a
+            failed load.
+
+        Arguments:
+
+        """
+
+        self.args5.args_array.update({"-f": True})
+        mock_native.side_effect = ValueError("Load failed")
+        mock_rst.return_value = False
+
+        with gen_libs.no_std_out():
+            self.assertRaises(
+                ValueError, mysql_clone.dump_load_dbs, self.source,
+                self.clone, self.args5, self.req_rep_cfg, self.opt_arg_list)
+
+        self.assertIsNone(mock_rst.call_args[1]["req_cfg"])
+
+    @mock.patch(
+        "mysql_clone.gen_libs.is_empty_file", mock.Mock(return_value=True))
+    @mock.patch(
+        "mysql_clone.gen_libs.crt_file_time", mock.Mock(return_value="Fname"))
+    @mock.patch("mysql_clone.open", mock.Mock())
+    @mock.patch("mysql_clone.chk_no_log", mock.Mock(return_value=True))
+    @mock.patch("mysql_clone.connect_chk", mock.Mock(return_value=True))
+    @mock.patch("mysql_clone.set_bulk_cfg")
+    @mock.patch("mysql_clone.fetch_bulk_cfg",
+                mock.Mock(return_value={"sync_binlog": "1"}))
+    @mock.patch("mysql_clone.rst_bulk_cfg")
+    @mock.patch("mysql_clone.native_dump_load")
+    @mock.patch("mysql_clone.mysql_libs.reset_master", mock.Mock())
+    @mock.patch("mysql_clone.mysql_libs.crt_cmd",
+                mock.Mock(return_value=["mysql"]))
+    @mock.patch("mysql_clone.crt_dump_cmd", mock.Mock(return_value=["dump"]))
+    def test_bulk_profile(self, mock_native, mock_rst, mock_set):
+
+        """Function:  test_bulk_profile
+
+        Description:  Test with the bulk load profile applied for the load.
+
+        Arguments:
+
+        """
+
+        self.args5.args_array = {"-e": True, "-f": True}
+        mock_native.return_value = (True, {"file": "binlog.000001", "pos": 4})
+        mock_rst.return_value = True
+
+        self.assertEqual(
+            mysql_clone.dump_load_dbs(
+                self.source, self.clone, self.args5, self.req_rep_cfg,
+                self.opt_arg_list),
+            (True, {"file": "binlog.000001", "pos": 4}))
+        mock_set.assert_called_once_with(self.clone, {"sync_binlog": "1"})
+        self.assertEqual(
+            mock_rst.call_args[1]["req_cfg"], self.req_rep_cfg["slave"])
+
+    @mock.patch(
+        "mysql_clone.gen_libs.is_empty_file", mock.Mock(return_value=True))
+    @mock.patch(
+        "mysql_clone.gen_libs.crt_file_time", mock.Mock(return_value="Fname"))
+    @mock.patch("mysql_clone.open", mock.Mock())
+    @mock.patch("mysql_clone.mysql_libs.disconnect", mock.Mock())
+    @mock.patch("mysql_clone.crt_xfer_meter")
+    @mock.patch("mysql_clone.crt_load_cmd", mock.Mock(return_value=["mysql"]))
+    @mock.patch("mysql_clone.xfer_report")
+    @mock.patch("mysql_clone.crt_compress")
+    @mock.patch("mysql_clone.par_dump_load")
+    @mock.patch("mysql_clone.mysql_libs.reset_master", mock.Mock())
+    @mock.patch("mysql_clone.crt_dump_cmd", mock.Mock(return_value=["dump"]))
+    def test_compress(                          # pylint:disable=R0913,R0917
+            self, mock_par, mock_compress, mock_report, mock_meter):
+
+        """Function:  test_compress
+
+        Description:  Test with the dump connections compressed.
+
+        Arguments:
+
+        """
+
+        self.args4.args_array["-z"] = "3"
+        mock_meter.return_value.stop.return_value = 2000
+        mock_par.return_value = (True, {"file": "binlog.000001", "pos": 4})
+        mock_compress.return_value = ["--compression-algorithms=zstd",
+                                      "--zstd-compression-level=3"]
+
+        self.assertEqual(
+            mysql_clone.dump_load_dbs(
+                self.source, self.clone, self.args4, self.req_rep_cfg,
+                self.opt_arg_list),
+            (True, {"file": "binlog.000001", "pos": 4}))
+        self.assertEqual(
+            mock_par.call_args[0][3],
+            self.opt_arg_list + ["--compression-algorithms=zstd",
+                                 "--zstd-compression-level=3"])
+        mock_meter.return_value.start.assert_called_once_with()
+        self.assertEqual(mock_report.call_args[0][1:], (0, 2000))
+        self.assertIsInstance(
+            mock_par.call_args[1]["throttle"], mysql_clone.Throttle)
+
+    @mock.patch(
+        "mysql_clone.gen_libs.is_empty_file", mock.Mock(return_value=True))
+    @mock.patch(
+        "mysql_clone.gen_libs.crt_file_time", mock.Mock(return_value="Fname"))
+    @mock.patch("mysql_clone.open", mock.Mock())
+    @mock.patch("mysql_clone.crt_load_cmd", mock.Mock(return_value=["mysql"]))
+    @mock.patch("mysql_clone.par_dump_load")
+    @mock.patch("mysql_clone.mysql_libs.reset_master", mock.Mock())
+    @mock.patch("mysql_clone.crt_dump_cmd", mock.Mock(return_value=["dump"]))
+    def test_throttle(self, mock_par):
+
+        """Function:  test_throttle
+
+        Description:  Test with the dump streams throttled.
+
+        Arguments:
+
+        """
+
+        self.args4.args_array["-u"] = "50,20000"
+        mock_par.return_value = (True, {"file": "binlog.000001", "pos": 4})
+
+        with gen_libs.no_std_out():
+            mysql_clone.dump_load_dbs(
+                self.source, self.clone, self.args4, self.req_rep_cfg,
+                self.opt_arg_list)
+
+        throttle = mock_par.call_args[1]["throttle"]
+        self.assertEqual((throttle.mb_rate, throttle.row_rate),
+                         (50.0, 20000.0))
+
+    @mock.patch(
+        "mysql_clone.gen_libs.is_empty_file", mock.Mock(return_value=True))
+    @mock.patch(
+        "mysql_clone.gen_libs.crt_file_time", mock.Mock(return_value="Fname"))
+    @mock.patch("mysql_clone.open", mock.Mock())
+    @mock.patch("mysql_clone.crt_load_cmd", mock.Mock(return_value=["mysql"]))
+    @mock.patch("mysql_clone.mysql_libs.disconnect", mock.Mock())
+    @mock.patch("mysql_clone.crt_health")
+    @mock.patch("mysql_clone.par_dump_load")
+    @mock.patch("mysql_clone.mysql_libs.reset_master", mock.Mock())
+    @mock.patch("mysql_clone.crt_dump_cmd", mock.Mock(return_value=["dump"]))
+    def test_health(self, mock_par, mock_health):
+
+        """Function:  test_health
+
+        Description:  Test with the throttle adapted to the source's health
+            for the length of the dump-load.
+
+        Arguments:
+
+        """
+
+        self.args4.args_array["-o"] = True
+        mock_par.side_effect = OSError("Dump failed")
+
+        with gen_libs.no_std_out():
+            with self.assertRaises(OSError):
+                mysql_clone.dump_load_dbs(
+                    self.source, self.clone, self.args4, self.req_rep_cfg,
+                    self.opt_arg_list, health_cfg={"interval": 5})
+
+        health = mock_health.return_value
+        health.start.assert_called_once_with()
+        health.stop.assert_called_once_with()
+        self.assertEqual(mock_health.call_args[0][1].mb_rate, 0.0)
+        self.assertEqual(mock_health.call_args[0][2], {"interval": 5})
+
+    @mock.patch(
+        "mysql_clone.gen_libs.is_empty_file", mock.Mock(return_value=True))
+    @mock.patch(
+        "mysql_clone.gen_libs.crt_file_time", mock.Mock(return_value="Fname"))
+    @mock.patch("mysql_clone.open", mock.Mock())
+    @mock.patch("mysql_clone.crt_load_cmd", mock.Mock(return_value=["mysql"]))
+    @mock.patch("mysql_clone.mysql_libs.disconnect", mock.Mock())
+    @mock.patch("mysql_clone.crt_rsc_grp")
+    @mock.patch("mysql_clone.native_dump_load")
+    @mock.patch("mysql_clone.mysql_libs.reset_master", mock.Mock())
+    @mock.patch("mysql_clone.crt_dump_cmd", mock.Mock(return_value=["dump"]))
+    def test_rsc_grp(self, mock_native, mock_rsc):
+
+        """Function:  test_rsc_grp
+
+        Description:  Test with the dump sessions run in a resource group for
+            the length of the dump-load.
+
+        Arguments:
+
+        """
+
+        self.args5.args_array["-q"] = "2-3"
+        mock_rsc.return_value.name = "mysql_clone"
+        mock_native.return_value = (True, {})
+
+        mysql_clone.dump_load_dbs(
+            self.source, self.clone, self.args5, self.req_rep_cfg,
+            self.opt_arg_list)
+
+        mock_rsc.return_value.start.assert_called_once_with()
+        mock_rsc.return_value.stop.assert_called_once_with()
+        self.assertEqual(
+            self.source.cmds, ["set resource group `mysql_clone`"])
+
+    @mock.patch(
+        "mysql_clone.gen_libs.is_empty_file", mock.Mock(return_value=True))
+    @mock.patch(
+        "mysql_clone.gen_libs.crt_file_time", mock.Mock(return_value="Fname"))
+    @mock.patch("mysql_clone.open", mock.Mock())
+    @mock.patch("mysql_clone.crt_load_cmd", mock.Mock(return_value=["mysql"]))
+    @mock.patch("mysql_clone.mysql_libs.disconnect", mock.Mock())
+    @mock.patch("mysql_clone.crt_undo_guard")
+    @mock.patch("mysql_clone.native_dump_load")
+    @mock.patch("mysql_clone.mysql_libs.reset_master", mock.Mock())
+    @mock.patch("mysql_clone.crt_dump_cmd", mock.Mock(return_value=["dump"]))
+    def test_undo_guard(self, mock_native, mock_guard):
+
+        """Function:  test_undo_guard
+
+        Description:  Test with the undo guard watching the dump and
+            aborting it, failing the dump-load.
+
+        Arguments:
+
+        """
+
+        guard = mock_guard.return_value
+        guard.sessions = []
+        guard.aborted = True
+        mock_native.return_value = (True, {"file": "binlog.000001", "pos": 4})
+
+        with gen_libs.no_std_out():
+            status, _ = mysql_clone.dump_load_dbs(
+                self.source, self.clone, self.args5, self.req_rep_cfg,
+                self.opt_arg_list, undo_cfg={"interval": 10})
+
+        self.assertFalse(status)
+
+        guard.start.assert_called_once_with()
+        guard.stop.assert_called_once_with()
+        self.assertEqual(guard.sessions, [7])
+        self.assertEqual(mock_guard.call_args[0][1], {"interval": 10})
+        self.assertIsNone(mock_guard.call_args[1]["throttle"])
+
+    @mock.patch(
+        "mysql_clone.gen_libs.is_empty_file", mock.Mock(return_value=True))
+    @mock.patch(
+        "mysql_clone.gen_libs.crt_file_time", mock.Mock(return_value="Fname"))
+    @mock.patch("mysql_clone.open", mock.Mock())
+    @mock.patch("mysql_clone.crt_load_cmd", mock.Mock(return_value=["mysql"]))
+    @mock.patch("mysql_clone.connect_chk", mock.Mock())
+    @mock.patch("mysql_clone.load_bp")
+    @mock.patch("mysql_clone.dump_bp")
+    @mock.patch("mysql_clone.fetch_bp_stat")
+    @mock.patch("mysql_clone.par_dump_load")
+    @mock.patch("mysql_clone.mysql_libs.reset_master", mock.Mock())
+    @mock.patch("mysql_clone.crt_dump_cmd", mock.Mock(return_value=["dump"]))
+    def test_bp_guard(                          # pylint:disable=R0913,R0917
+            self, mock_par, mock_stat, mock_dump, mock_load):
+
+        """Function:  test_bp_guard
+
+        Description:  Test with the source's buffer pool saved before the
+            dump and reloaded after a failed dump.
+
+        Arguments:
+
+        """
+
+        self.args4.args_array["-B"] = True
+        mock_par.side_effect = OSError("Dump failed")
+        mock_stat.return_value = {}
+
+        with gen_libs.no_std_out():
+            with self.assertRaises(OSError):
+                mysql_clone.dump_load_dbs(
+                    self.source, self.clone, self.args4, self.req_rep_cfg,
+                    self.opt_arg_list)
+
+        mock_dump.assert_called_once_with(self.source)
+        mock_load.assert_called_once_with(self.source)
+        self.assertEqual(mock_stat.call_count, 3)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,129 @@
+# Classification (U)
+
+"""Program:  exec_stmt.py
+
+    Description:  Unit testing of exec_stmt in mysql_clone.py.
+
+    Usage:
+        test/unit/mysql_clone/exec_stmt.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_clone                              # pylint:disable=E0401,C0413
+import lib.gen_libs as gen_libs             # pylint:disable=E0401,C0413,R0402
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class Popen():                                          # pylint:disable=R0903
+
+    """Class:  Popen
+
+    Description:  Class stub holder for subprocess.Popen class.
+
+    Methods:
+        __init__
+        wait
+
+    """
+
+    def __init__(self, returncode=0):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.returncode = returncode
+
+    def wait(self):
+
+        """Method:  wait
+
+        Description:  Wait function.
+
+        Arguments:
+
+        """
+
+        return self.returncode
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_failed
+        test_executed
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.load_cmd = ["mysql", "-u", "user"]
+        self.stmt = "ALTER TABLE `db1`.`t1` ADD KEY `a` (`a`)"
+
+    @mock.patch("mysql_clone.subprocess.Popen")
+    def test_failed(self, mock_popen):
+
+        """Function:  test_failed
+
+        Description:  Test with the statement failing.
+
+        Arguments:
+
+        """
+
+        mock_popen.return_value = Popen(returncode=1)
+
+        with gen_libs.no_std_out():
+            self.assertFalse(mysql_clone.exec_stmt(self.load_cmd, self.stmt))
+
+    @mock.patch("mysql_clone.subprocess.Popen")
+    def test_executed(self, mock_popen):
+
+        """Function:  test_executed
+
+        Description:  Test with the statement executed.
+
+        Arguments:
+
+        """
+
+        mock_popen.return_value = Popen()
+
+        self.assertTrue(mysql_clone.exec_stmt(self.load_cmd, self.stmt))
+        self.assertEqual(
+            mock_popen.call_args[0][0], self.load_cmd + ["-e", self.stmt])
+
+
+if __name__ == "__main__":
+    unittest.main()
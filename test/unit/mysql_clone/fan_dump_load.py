@@ -0,0 +1,229 @@
+# Classification (U)
+
+"""Program:  fan_dump_load.py
+
+    Description:  Unit testing of fan_dump_load in mysql_clone.py.
+
+    Usage:
+        test/unit/mysql_clone/fan_dump_load.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import io
+import threading
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_clone                              # pylint:disable=E0401,C0413
+import lib.gen_libs as gen_libs             # pylint:disable=E0401,C0413,R0402
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class Stdin():
+
+    """Class:  Stdin
+
+    Description:  Class stub holder for a process stdin pipe.
+
+    Methods:
+        __init__
+        write
+        close
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.data = b""
+        self.closed = False
+        self.error = None
+        self.ready = threading.Event()
+        self.ready.set()
+
+    def write(self, data):
+
+        """Method:  write
+
+        Description:  Stub holder for write method.
+
+        Arguments:
+
+        """
+
+        self.ready.wait()
+
+        if self.error:
+            raise self.error
+
+        self.data += data
+
+    def close(self):
+
+        """Method:  close
+
+        Description:  Stub holder for close method.
+
+        Arguments:
+
+        """
+
+        self.closed = True
+
+
+class Popen():                                          # pylint:disable=R0903
+
+    """Class:  Popen
+
+    Description:  Class stub holder for subprocess.Popen class.
+
+    Methods:
+        __init__
+        wait
+
+    """
+
+    def __init__(self, returncode=0, data=b""):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.stdin = Stdin()
+        self.stdout = io.BytesIO(data)
+        self.returncode = returncode
+        self.pid = 4321
+
+    def wait(self):
+
+        """Method:  wait
+
+        Description:  Wait function.
+
+        Arguments:
+
+        """
+
+        return self.returncode
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_dump_failed
+        test_load_failed
+        test_all_loaded
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.data = b"-- CHANGE MASTER TO MASTER_LOG_FILE='binlog.000001'," \
+            b" MASTER_LOG_POS=1234;\ninsert data;\n"
+        self.dump_cmd = ["mysqldump"]
+        self.loads = [("clone1", ["mysql", "1"]), ("clone2", ["mysql", "2"])]
+        self.err_file = "ErrFile"
+        self.dump = Popen(data=self.data)
+        self.procs = [Popen(), Popen()]
+
+    @mock.patch("mysql_clone.subprocess.Popen")
+    def test_dump_failed(self, mock_popen):
+
+        """Function:  test_dump_failed
+
+        Description:  Test with the dump process failing.
+
+        Arguments:
+
+        """
+
+        self.dump.returncode = 2
+        mock_popen.side_effect = [self.dump] + self.procs
+
+        status, _ = mysql_clone.fan_dump_load(
+            self.dump_cmd, self.loads, self.err_file)
+
+        self.assertFalse(status)
+
+    @mock.patch("mysql_clone.subprocess.Popen")
+    def test_load_failed(self, mock_popen):
+
+        """Function:  test_load_failed
+
+        Description:  Test with one clone failing to load.
+
+        Arguments:
+
+        """
+
+        self.procs[1].returncode = 1
+        mock_popen.side_effect = [self.dump] + self.procs
+
+        with gen_libs.no_std_out():
+            status, _ = mysql_clone.fan_dump_load(
+                self.dump_cmd, self.loads, self.err_file)
+
+        self.assertFalse(status)
+        self.assertEqual(self.procs[0].stdin.data, self.data)
+
+    @mock.patch("mysql_clone.subprocess.Popen")
+    def test_all_loaded(self, mock_popen):
+
+        """Function:  test_all_loaded
+
+        Description:  Test with the dump loaded into every clone.
+
+        Arguments:
+
+        """
+
+        mock_popen.side_effect = [self.dump] + self.procs
+
+        self.assertEqual(
+            mysql_clone.fan_dump_load(
+                self.dump_cmd, self.loads, self.err_file),
+            (True, {"file": "binlog.000001", "pos": 1234}))
+        self.assertEqual(
+            [proc.stdin.data for proc in self.procs], [self.data, self.data])
+        self.assertEqual(
+            [call[0][0] for call in mock_popen.call_args_list],
+            [["mysqldump"], ["mysql", "1"], ["mysql", "2"]])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,128 @@
+# Classification (U)
+
+"""Program:  fetch_algs.py
+
+    Description:  Unit testing of fetch_algs in mysql_clone.py.
+
+    Usage:
+        test/unit/mysql_clone/fetch_algs.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_clone                              # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class Server():                                         # pylint:disable=R0903
+
+    """Class:  Server
+
+    Description:  Class stub holder for mysql_class.Server class.
+
+    Methods:
+        __init__
+        col_sql
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.name = "ServerName"
+        self.version = (8, 0, 30)
+        self.algs = "zlib,zstd,uncompressed"
+        self.cmds = []
+
+    def col_sql(self, cmd):
+
+        """Method:  col_sql
+
+        Description:  Method stub holder for mysql_class.Server.col_sql.
+
+        Arguments:
+
+        """
+
+        self.cmds.append(cmd)
+
+        return [{"val": self.algs}]
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_pre_8018
+        test_algs
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.server = Server()
+
+    def test_pre_8018(self):
+
+        """Function:  test_pre_8018
+
+        Description:  Test with a server before MySQL 8.0.18.
+
+        Arguments:
+
+        """
+
+        self.server.version = (5, 7, 40)
+
+        self.assertEqual(mysql_clone.fetch_algs(self.server), ["zlib"])
+        self.assertEqual(self.server.cmds, [])
+
+    def test_algs(self):
+
+        """Function:  test_algs
+
+        Description:  Test with the server's compression algorithms.
+
+        Arguments:
+
+        """
+
+        self.server.algs = "ZLIB,zstd"
+
+        self.assertEqual(
+            mysql_clone.fetch_algs(self.server), ["zlib", "zstd"])
+
+
+if __name__ == "__main__":
+    unittest.main()
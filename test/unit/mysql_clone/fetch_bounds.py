@@ -0,0 +1,201 @@
+# Classification (U)
+
+"""Program:  fetch_bounds.py
+
+    Description:  Unit testing of fetch_bounds in mysql_clone.py.
+
+    Usage:
+        test/unit/mysql_clone/fetch_bounds.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_clone                              # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class Server():                                         # pylint:disable=R0903
+
+    """Class:  Server
+
+    Description:  Class stub holder for mysql_class.Server class.
+
+    Methods:
+        __init__
+        col_sql
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.version = (8, 0, 30)
+        self.results = {}
+        self.cmds = []
+
+    def col_sql(self, cmd, params=None):
+
+        """Method:  col_sql
+
+        Description:  Method stub holder for mysql_class.Server.col_sql.
+
+        Arguments:
+
+        """
+
+        self.cmds.append((cmd, params))
+
+        for key, data in self.results.items():
+            if key in cmd:
+                return data
+
+        return []
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_empty_table
+        test_single_value
+        test_skewed
+        test_estimates
+        test_histogram
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.server = Server()
+        self.tbl = {"db": "db1", "tbl": "t1", "tbl_rows": 1000000,
+                    "data_len": 4096, "col": "id"}
+
+    @mock.patch("mysql_clone.range_rows")
+    @mock.patch("mysql_clone.hist_bounds", mock.Mock(return_value=[]))
+    def test_empty_table(self, mock_rows):
+
+        """Function:  test_empty_table
+
+        Description:  Test with no rows in the table.
+
+        Arguments:
+
+        """
+
+        self.server.results = {"min(": [{"low": None, "high": None}]}
+
+        self.assertEqual(
+            mysql_clone.fetch_bounds(self.server, self.tbl, 4), [])
+        mock_rows.assert_not_called()
+
+    @mock.patch("mysql_clone.range_rows")
+    @mock.patch("mysql_clone.hist_bounds", mock.Mock(return_value=[]))
+    def test_single_value(self, mock_rows):
+
+        """Function:  test_single_value
+
+        Description:  Test with a single key value in the table.
+
+        Arguments:
+
+        """
+
+        self.server.results = {"min(": [{"low": 5, "high": 5}]}
+
+        self.assertEqual(
+            mysql_clone.fetch_bounds(self.server, self.tbl, 4), [])
+        mock_rows.assert_not_called()
+
+    @mock.patch("mysql_clone.range_rows")
+    @mock.patch("mysql_clone.hist_bounds", mock.Mock(return_value=[]))
+    def test_skewed(self, mock_rows):
+
+        """Function:  test_skewed
+
+        Description:  Test with most of the rows at the high end of the key.
+
+        Arguments:
+
+        """
+
+        self.server.results = {"min(": [{"low": 0, "high": 100}]}
+        mock_rows.side_effect = lambda server, tbl, val: val * val
+
+        self.assertEqual(
+            mysql_clone.fetch_bounds(
+                self.server, self.tbl, 4, tolerance=0), [50, 71, 87])
+
+    @mock.patch("mysql_clone.range_rows")
+    @mock.patch("mysql_clone.hist_bounds", mock.Mock(return_value=[]))
+    def test_estimates(self, mock_rows):
+
+        """Function:  test_estimates
+
+        Description:  Test with boundaries from the optimizer's estimates and
+            the key range read in the server's order.
+
+        Arguments:
+
+        """
+
+        self.server.results = {"min(": [{"low": 0, "high": 100}]}
+        mock_rows.side_effect = lambda server, tbl, val: val * 10
+
+        self.assertEqual(
+            mysql_clone.fetch_bounds(self.server, self.tbl, 4), [25, 49, 74])
+        self.assertEqual(
+            self.server.cmds[0][0],
+            "select min(`id`) as low, max(`id`) as high from `db1`.`t1`")
+
+    @mock.patch("mysql_clone.hist_bounds")
+    def test_histogram(self, mock_hist):
+
+        """Function:  test_histogram
+
+        Description:  Test with boundaries from a histogram.
+
+        Arguments:
+
+        """
+
+        mock_hist.return_value = [60, 50, 50]
+
+        self.assertEqual(
+            mysql_clone.fetch_bounds(self.server, self.tbl, 4), [50, 60])
+        self.assertEqual(self.server.cmds, [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,112 @@
+# Classification (U)
+
+"""Program:  fetch_bp_stat.py
+
+    Description:  Unit testing of fetch_bp_stat in mysql_clone.py.
+
+    Usage:
+        test/unit/mysql_clone/fetch_bp_stat.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_clone                              # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class Server():                                         # pylint:disable=R0903
+
+    """Class:  Server
+
+    Description:  Class stub holder for mysql_class.Server class.
+
+    Methods:
+        __init__
+        col_sql
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.cmd = None
+
+    def col_sql(self, cmd):
+
+        """Method:  col_sql
+
+        Description:  Method stub holder for mysql_class.Server.col_sql.
+
+        Arguments:
+
+        """
+
+        self.cmd = cmd
+
+        return [{"Variable_name": "Innodb_buffer_pool_reads", "Value": "10"},
+                {"Variable_name": "Innodb_buffer_pool_read_requests",
+                 "Value": "1000"}]
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_fetch
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.server = Server()
+
+    def test_fetch(self):
+
+        """Function:  test_fetch
+
+        Description:  Test with the status variables returned by name.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            mysql_clone.fetch_bp_stat(self.server),
+            {"Innodb_buffer_pool_reads": "10",
+             "Innodb_buffer_pool_read_requests": "1000"})
+        self.assertIn("Innodb_buffer_pool_load_status", self.server.cmd)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,130 @@
+# Classification (U)
+
+"""Program:  fetch_bulk_cfg.py
+
+    Description:  Unit testing of fetch_bulk_cfg in mysql_clone.py.
+
+    Usage:
+        test/unit/mysql_clone/fetch_bulk_cfg.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_clone                              # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class Server():                                         # pylint:disable=R0903
+
+    """Class:  Server
+
+    Description:  Class stub holder for mysql_class.Server class.
+
+    Methods:
+        __init__
+        col_sql
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.version = (8, 0, 30)
+        self.cfg = {"innodb_flush_log_at_trx_commit": 1, "sync_binlog": 1}
+        self.redo_log = "ON"
+
+    def col_sql(self, cmd):
+
+        """Method:  col_sql
+
+        Description:  Method stub holder for mysql_class.Server.col_sql.
+
+        Arguments:
+
+        """
+
+        if cmd.startswith("show global status"):
+            return [{"Variable_name": "Innodb_redo_log_enabled",
+                     "Value": self.redo_log}]
+
+        return [self.cfg]
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_pre_8021
+        test_redo_log
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.clone = Server()
+
+    def test_pre_8021(self):
+
+        """Function:  test_pre_8021
+
+        Description:  Test with a clone before MySQL 8.0.21.
+
+        Arguments:
+
+        """
+
+        self.clone.version = (8, 0, 20)
+
+        self.assertEqual(
+            mysql_clone.fetch_bulk_cfg(self.clone),
+            {"innodb_flush_log_at_trx_commit": "1", "sync_binlog": "1"})
+
+    def test_redo_log(self):
+
+        """Function:  test_redo_log
+
+        Description:  Test with the redo log status.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            mysql_clone.fetch_bulk_cfg(self.clone),
+            {"innodb_flush_log_at_trx_commit": "1", "sync_binlog": "1",
+             "innodb_redo_log_enabled": "ON"})
+
+
+if __name__ == "__main__":
+    unittest.main()
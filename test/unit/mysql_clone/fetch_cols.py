@@ -0,0 +1,141 @@
+# Classification (U)
+
+"""Program:  fetch_cols.py
+
+    Description:  Unit testing of fetch_cols in mysql_clone.py.
+
+    Usage:
+        test/unit/mysql_clone/fetch_cols.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_clone                              # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class Server():                                         # pylint:disable=R0903
+
+    """Class:  Server
+
+    Description:  Class stub holder for mysql_class.Server class.
+
+    Methods:
+        __init__
+        col_sql
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.cmd = None
+        self.params = None
+
+    def col_sql(self, cmd, params=None):
+
+        """Method:  col_sql
+
+        Description:  Method stub holder for mysql_class.Server.col_sql.
+
+        Arguments:
+
+        """
+
+        self.cmd = cmd
+        self.params = params
+
+        return [{"col": "id", "type": "INT"},
+                {"col": "name", "type": "varchar"}]
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_types
+        test_skip_generated
+        test_fetch_cols
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.server = Server()
+
+    def test_types(self):
+
+        """Function:  test_types
+
+        Description:  Test with columns and data types returned.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            mysql_clone.fetch_cols(self.server, "db1", "t1", types=True),
+            [("id", "int"), ("name", "varchar")])
+
+    def test_skip_generated(self):
+
+        """Function:  test_skip_generated
+
+        Description:  Test with generated columns excluded by the query.
+
+        Arguments:
+
+        """
+
+        mysql_clone.fetch_cols(self.server, "db1", "t1")
+
+        self.assertIn("generation_expression", self.server.cmd)
+
+    def test_fetch_cols(self):
+
+        """Function:  test_fetch_cols
+
+        Description:  Test with list of columns returned.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            mysql_clone.fetch_cols(self.server, "db1", "t1"), ["id", "name"])
+        self.assertEqual(self.server.params, ("db1", "t1"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,135 @@
+# Classification (U)
+
+"""Program:  fetch_dbs.py
+
+    Description:  Unit testing of fetch_dbs in mysql_clone.py.
+
+    Usage:
+        test/unit/mysql_clone/fetch_dbs.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_clone                              # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class Server():                                         # pylint:disable=R0903
+
+    """Class:  Server
+
+    Description:  Class stub holder for mysql_class.Server class.
+
+    Methods:
+        __init__
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.name = "Server_Name"
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_sys_dbs
+        test_default_sys_dbs
+        test_no_dbs
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.server = Server()
+        self.db_dict = [
+            {"Database": "information_schema"}, {"Database": "mysql"},
+            {"Database": "performance_schema"}, {"Database": "sys"},
+            {"Database": "db1"}]
+
+    @mock.patch("mysql_clone.mysql_libs.fetch_db_dict")
+    def test_sys_dbs(self, mock_fetch):
+
+        """Function:  test_sys_dbs
+
+        Description:  Test with passed list of databases to exclude.
+
+        Arguments:
+
+        """
+
+        mock_fetch.return_value = self.db_dict
+
+        self.assertEqual(
+            mysql_clone.fetch_dbs(
+                self.server, sys_dbs=["information_schema", "mysql"]),
+            ["performance_schema", "sys", "db1"])
+
+    @mock.patch("mysql_clone.mysql_libs.fetch_db_dict")
+    def test_default_sys_dbs(self, mock_fetch):
+
+        """Function:  test_default_sys_dbs
+
+        Description:  Test with default list of databases to exclude.
+
+        Arguments:
+
+        """
+
+        mock_fetch.return_value = self.db_dict
+
+        self.assertEqual(
+            mysql_clone.fetch_dbs(self.server), ["mysql", "db1"])
+
+    @mock.patch("mysql_clone.mysql_libs.fetch_db_dict")
+    def test_no_dbs(self, mock_fetch):
+
+        """Function:  test_no_dbs
+
+        Description:  Test with no databases returned.
+
+        Arguments:
+
+        """
+
+        mock_fetch.return_value = []
+
+        self.assertEqual(mysql_clone.fetch_dbs(self.server), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
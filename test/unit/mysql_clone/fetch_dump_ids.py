@@ -0,0 +1,126 @@
+# Classification (U)
+
+"""Program:  fetch_dump_ids.py
+
+    Description:  Unit testing of fetch_dump_ids in mysql_clone.py.
+
+    Usage:
+        test/unit/mysql_clone/fetch_dump_ids.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_clone                              # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class Server():
+
+    """Class:  Server
+
+    Description:  Class stub holder for mysql_class.Server class.
+
+    Methods:
+        __init__
+        col_sql
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.cmd = None
+        self.params = None
+
+    def col_sql(self, cmd, params=None):
+
+        """Method:  col_sql
+
+        Description:  Method stub holder for mysql_class.Server.col_sql.
+
+        Arguments:
+
+        """
+
+        self.cmd = cmd
+        self.params = params
+
+        return [{"id": 11, "thr_id": 51}]
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_no_pids
+        test_pids
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.server = Server()
+
+    def test_no_pids(self):
+
+        """Function:  test_no_pids
+
+        Description:  Test with no dump processes started.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(mysql_clone.fetch_dump_ids(self.server, []), [])
+        self.assertIsNone(self.server.cmd)
+
+    def test_pids(self):
+
+        """Function:  test_pids
+
+        Description:  Test with the sessions of the dump processes.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            mysql_clone.fetch_dump_ids(self.server, [4321, 4322]),
+            [{"id": 11, "thr_id": 51}])
+        self.assertTrue(self.server.cmd.endswith("in (%s, %s)"))
+        self.assertEqual(self.server.params, ("4321", "4322"))
+
+
+if __name__ == "__main__":
+    unittest.main()
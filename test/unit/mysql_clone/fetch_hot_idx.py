@@ -0,0 +1,143 @@
+# Classification (U)
+
+"""Program:  fetch_hot_idx.py
+
+    Description:  Unit testing of fetch_hot_idx in mysql_clone.py.
+
+    Usage:
+        test/unit/mysql_clone/fetch_hot_idx.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_clone                              # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class Server():                                         # pylint:disable=R0903
+
+    """Class:  Server
+
+    Description:  Class stub holder for mysql_class.Server class.
+
+    Methods:
+        __init__
+        col_sql
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.version = (8, 0, 30)
+        self.cmd = None
+        self.rows = [
+            {"tbl": "db1/t1#p#p0", "idx": "PRIMARY", "pages": 30},
+            {"tbl": "db1/t2", "idx": "a", "pages": 40},
+            {"tbl": "db1/t1#p#p1", "idx": "PRIMARY", "pages": 20},
+            {"tbl": "mysql/user", "idx": "PRIMARY", "pages": 10},
+            {"tbl": "db1/fts_00000000000004a1_being_deleted",
+             "idx": "PRIMARY", "pages": 5}]
+
+    def col_sql(self, cmd):
+
+        """Method:  col_sql
+
+        Description:  Method stub holder for mysql_class.Server.col_sql.
+
+        Arguments:
+
+        """
+
+        self.cmd = cmd
+
+        return self.rows
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_buffer_page_lru
+        test_cached_indexes
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.server = Server()
+
+    def test_buffer_page_lru(self):
+
+        """Function:  test_buffer_page_lru
+
+        Description:  Test with the pages counted from innodb_buffer_page_lru
+            before MySQL 8.
+
+        Arguments:
+
+        """
+
+        self.server.version = (5, 7, 40)
+        self.server.rows = [
+            {"tbl": "`db1`.`t1`", "idx": "PRIMARY", "pages": 10}]
+
+        self.assertEqual(
+            mysql_clone.fetch_hot_idx(self.server, limit=5),
+            [{"db": "db1", "tbl": "t1", "idx": "PRIMARY", "pages": 10}])
+        self.assertIn("innodb_buffer_page_lru", self.server.cmd)
+        self.assertIn("limit 5", self.server.cmd)
+
+    def test_cached_indexes(self):
+
+        """Function:  test_cached_indexes
+
+        Description:  Test with the pages read from innodb_cached_indexes on
+            MySQL 8, the partitions added together and the system and
+            full-text index tables left out.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            mysql_clone.fetch_hot_idx(self.server),
+            [{"db": "db1", "tbl": "t1", "idx": "PRIMARY", "pages": 50},
+             {"db": "db1", "tbl": "t2", "idx": "a", "pages": 40}])
+        self.assertIn("innodb_cached_indexes", self.server.cmd)
+        self.assertIn("limit 200", self.server.cmd)
+
+
+if __name__ == "__main__":
+    unittest.main()
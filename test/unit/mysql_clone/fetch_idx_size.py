@@ -0,0 +1,100 @@
+# Classification (U)
+
+"""Program:  fetch_idx_size.py
+
+    Description:  Unit testing of fetch_idx_size in mysql_clone.py.
+
+    Usage:
+        test/unit/mysql_clone/fetch_idx_size.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_clone                              # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class Server():                                         # pylint:disable=R0903
+
+    """Class:  Server
+
+    Description:  Class stub holder for mysql_class.Server class.
+
+    Methods:
+        __init__
+        col_sql
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.cmd = None
+
+    def col_sql(self, cmd):
+
+        """Method:  col_sql
+
+        Description:  Method stub holder for mysql_class.Server.col_sql.
+
+        Arguments:
+
+        """
+
+        self.cmd = cmd
+
+        return [{"db": "db1", "tbl": "t1#p#p0", "idx": "PRIMARY", "pages": 30},
+                {"db": "db1", "tbl": "t1#p#p1", "idx": "PRIMARY", "pages": 20},
+                {"db": "db1", "tbl": "t1#p#p0", "idx": "a", "pages": 5}]
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        test_sizes
+
+    """
+
+    def test_sizes(self):
+
+        """Function:  test_sizes
+
+        Description:  Test with the partitions of a table added together.
+
+        Arguments:
+
+        """
+
+        server = Server()
+
+        self.assertEqual(
+            mysql_clone.fetch_idx_size(server),
+            {("db1", "t1", "PRIMARY"): 50, ("db1", "t1", "a"): 5})
+        self.assertIn("stat_name = 'size'", server.cmd)
+
+
+if __name__ == "__main__":
+    unittest.main()
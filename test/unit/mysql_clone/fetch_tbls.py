@@ -0,0 +1,134 @@
+# Classification (U)
+
+"""Program:  fetch_tbls.py
+
+    Description:  Unit testing of fetch_tbls in mysql_clone.py.
+
+    Usage:
+        test/unit/mysql_clone/fetch_tbls.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_clone                              # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class Server():                                         # pylint:disable=R0903
+
+    """Class:  Server
+
+    Description:  Class stub holder for mysql_class.Server class.
+
+    Methods:
+        __init__
+        col_sql
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.version = (8, 0, 30)
+        self.results = {}
+        self.cmds = []
+
+    def col_sql(self, cmd, params=None):
+
+        """Method:  col_sql
+
+        Description:  Method stub holder for mysql_class.Server.col_sql.
+
+        Arguments:
+
+        """
+
+        self.cmds.append((cmd, params))
+
+        for key, data in self.results.items():
+            if key in cmd:
+                return data
+
+        return []
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_no_tables
+        test_filter_dbs
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.server = Server()
+        self.tbl1 = {"db": "db1", "tbl": "t1", "engine": "InnoDB",
+                     "tbl_rows": 10, "data_len": 2048, "size": 4096,
+                     "col": "id", "col_type": "int"}
+        self.tbl2 = {"db": "db2", "tbl": "t2", "engine": "MyISAM",
+                     "tbl_rows": 10, "data_len": 2048, "size": 4096,
+                     "col": None, "col_type": None}
+
+    def test_no_tables(self):
+
+        """Function:  test_no_tables
+
+        Description:  Test with no tables returned.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(mysql_clone.fetch_tbls(self.server, ["db1"]), [])
+
+    def test_filter_dbs(self):
+
+        """Function:  test_filter_dbs
+
+        Description:  Test with tables not in the list of databases.
+
+        Arguments:
+
+        """
+
+        self.server.results = {"information_schema": [self.tbl1, self.tbl2]}
+
+        self.assertEqual(
+            mysql_clone.fetch_tbls(self.server, ["db1"]), [self.tbl1])
+
+
+if __name__ == "__main__":
+    unittest.main()
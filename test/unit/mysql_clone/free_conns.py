@@ -0,0 +1,94 @@
+# Classification (U)
+
+"""Program:  free_conns.py
+
+    Description:  Unit testing of free_conns in mysql_clone.py.
+
+    Usage:
+        test/unit/mysql_clone/free_conns.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_clone                              # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class Server():                                         # pylint:disable=R0903
+
+    """Class:  Server
+
+    Description:  Class stub holder for mysql_class.Server class.
+
+    Methods:
+        col_sql
+
+    """
+
+    def col_sql(self, cmd):
+
+        """Method:  col_sql
+
+        Description:  Method stub holder for mysql_class.Server.col_sql.
+
+        Arguments:
+
+        """
+
+        if "max_connections" in cmd:
+            return [{"val": "151"}]
+
+        return [{"Variable_name": "Threads_connected", "Value": "40"}]
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_free
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.server = Server()
+
+    def test_free(self):
+
+        """Function:  test_free
+
+        Description:  Test with the connections the server will still accept.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(mysql_clone.free_conns(self.server), 111)
+
+
+if __name__ == "__main__":
+    unittest.main()
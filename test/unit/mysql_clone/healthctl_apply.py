@@ -0,0 +1,183 @@
+# Classification (U)
+
+"""Program:  healthctl_apply.py
+
+    Description:  Unit testing of HealthCtl.apply in mysql_clone.py.
+
+    Usage:
+        test/unit/mysql_clone/healthctl_apply.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_clone                              # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_pause
+        test_pause_time
+        test_resume
+        test_speed
+        test_slow_limited
+        test_slow_unlimited
+        test_slow_floor
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.health_cfg = {
+            "threads_running": 32, "row_lock_waits": 10,
+            "history_len": 1000000, "replica_lag": 60, "interval": 5}
+        self.throttle = mysql_clone.Throttle("0")
+        self.health = mysql_clone.HealthCtl(
+            "Server", self.throttle, self.health_cfg)
+
+    def test_pause(self):
+
+        """Function:  test_pause
+
+        Description:  Test with the streams paused.
+
+        Arguments:
+
+        """
+
+        self.health.apply("pause")
+
+        self.assertTrue(self.health.paused)
+        self.assertFalse(self.throttle.resume.is_set())
+
+    def test_pause_time(self):
+
+        """Function:  test_pause_time
+
+        Description:  Test with the time paused added up.
+
+        Arguments:
+
+        """
+
+        self.health.apply("pause")
+        self.health.apply("pause")
+        self.health.apply("hold")
+
+        self.assertEqual(self.health.pause_time, 10)
+
+    def test_resume(self):
+
+        """Function:  test_resume
+
+        Description:  Test with paused streams resumed by a hold.
+
+        Arguments:
+
+        """
+
+        self.health.factor = 0.5
+        self.health.apply("pause")
+        self.health.apply("hold")
+
+        self.assertFalse(self.health.paused)
+        self.assertEqual(self.throttle.factor, 0.5)
+        self.assertTrue(self.throttle.resume.is_set())
+
+    def test_speed(self):
+
+        """Function:  test_speed
+
+        Description:  Test with the rates raised up to their limits.
+
+        Arguments:
+
+        """
+
+        self.health.factor = 0.5
+        self.health.apply("speed")
+        self.assertEqual(self.throttle.factor, 0.75)
+        self.health.apply("speed")
+        self.assertEqual(self.throttle.factor, 1.0)
+
+    def test_slow_limited(self):
+
+        """Function:  test_slow_limited
+
+        Description:  Test with a limited rate halved.
+
+        Arguments:
+
+        """
+
+        self.throttle.mb_rate = 50.0
+        self.throttle.totals["bytes"] = 500 * 1024 * 1024
+        self.health.prev["bytes"] = 0
+        self.health.apply("slow")
+
+        self.assertEqual(self.throttle.mb_rate, 50.0)
+        self.assertEqual(self.throttle.factor, 0.5)
+
+    def test_slow_unlimited(self):
+
+        """Function:  test_slow_unlimited
+
+        Description:  Test with an unlimited rate limited to half of the
+            measured rate.
+
+        Arguments:
+
+        """
+
+        self.throttle.totals["bytes"] = 500 * 1024 * 1024
+        self.health.prev["bytes"] = 0
+        self.health.apply("slow")
+
+        self.assertEqual(self.throttle.mb_rate * self.throttle.factor, 50.0)
+        self.assertEqual(self.throttle.row_rate * self.throttle.factor, 5000)
+
+    def test_slow_floor(self):
+
+        """Function:  test_slow_floor
+
+        Description:  Test with an unlimited rate measured under its floor.
+
+        Arguments:
+
+        """
+
+        self.throttle.totals["bytes"] = 1024 * 1024
+        self.health.prev["bytes"] = 0
+        self.health.apply("slow")
+
+        self.assertEqual(self.throttle.mb_rate * self.throttle.factor, 5.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,178 @@
+# Classification (U)
+
+"""Program:  healthctl_decide.py
+
+    Description:  Unit testing of HealthCtl.decide in mysql_clone.py.
+
+    Usage:
+        test/unit/mysql_clone/healthctl_decide.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_clone                              # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_pause
+        test_pause_used_up
+        test_history_len
+        test_slow
+        test_between
+        test_full_rate
+        test_speed
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.health_cfg = {
+            "threads_running": 32, "row_lock_waits": 10,
+            "history_len": 1000000, "replica_lag": 60, "interval": 5}
+        self.health = mysql_clone.HealthCtl(
+            "Server", mysql_clone.Throttle("0"), self.health_cfg)
+        self.readings = {
+            "threads_running": 5, "row_lock_waits": 0.0, "history_len": 10}
+
+    def test_pause(self):
+
+        """Function:  test_pause
+
+        Description:  Test with a reading over twice its limit.
+
+        Arguments:
+
+        """
+
+        self.readings["replica_lag"] = 150
+
+        self.assertEqual(
+            self.health.decide(self.readings),
+            ("pause", "replica_lag 150 >= 120"))
+
+    def test_pause_used_up(self):
+
+        """Function:  test_pause_used_up
+
+        Description:  Test with a reading over twice its limit once the pause
+            time allowed is used up.
+
+        Arguments:
+
+        """
+
+        self.readings["replica_lag"] = 150
+        self.health.pause_time = 600
+
+        self.assertEqual(
+            self.health.decide(self.readings),
+            ("slow",
+             "replica_lag 150 >= 120, paused 600 seconds already"))
+
+    def test_history_len(self):
+
+        """Function:  test_history_len
+
+        Description:  Test with the history list length over twice its limit.
+
+        Arguments:
+
+        """
+
+        self.readings["history_len"] = 2500000
+
+        self.assertEqual(
+            self.health.decide(self.readings),
+            ("slow", "history_len 2500000 >= 1000000"))
+
+    def test_slow(self):
+
+        """Function:  test_slow
+
+        Description:  Test with readings over their limits.
+
+        Arguments:
+
+        """
+
+        self.readings["threads_running"] = 40
+        self.readings["history_len"] = 1500000
+
+        self.assertEqual(
+            self.health.decide(self.readings),
+            ("slow",
+             "threads_running 40 >= 32, history_len 1500000 >= 1000000"))
+
+    def test_between(self):
+
+        """Function:  test_between
+
+        Description:  Test with a reading between half of and its limit.
+
+        Arguments:
+
+        """
+
+        self.readings["threads_running"] = 20
+
+        self.assertEqual(self.health.decide(self.readings)[0], "hold")
+
+    def test_full_rate(self):
+
+        """Function:  test_full_rate
+
+        Description:  Test with readings under half of their limits at the
+            full rate.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(self.health.decide(self.readings)[0], "hold")
+
+    def test_speed(self):
+
+        """Function:  test_speed
+
+        Description:  Test with readings under half of their limits after a
+            slow down.
+
+        Arguments:
+
+        """
+
+        self.health.factor = 0.5
+
+        self.assertEqual(self.health.decide(self.readings)[0], "speed")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,96 @@
+# Classification (U)
+
+"""Program:  healthctl_init.py
+
+    Description:  Unit testing of HealthCtl.__init__ in mysql_clone.py.
+
+    Usage:
+        test/unit/mysql_clone/healthctl_init.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_clone                              # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_replicas
+        test_default
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.throttle = mysql_clone.Throttle("0")
+        self.health_cfg = {
+            "threads_running": 32, "row_lock_waits": 10,
+            "history_len": 1000000, "replica_lag": 60, "interval": 5}
+
+    def test_replicas(self):
+
+        """Function:  test_replicas
+
+        Description:  Test with replicas whose lag is watched.
+
+        Arguments:
+
+        """
+
+        health = mysql_clone.HealthCtl(
+            "Server", self.throttle, self.health_cfg, replicas=["Replica"])
+
+        self.assertEqual(health.replicas, ["Replica"])
+
+    def test_default(self):
+
+        """Function:  test_default
+
+        Description:  Test with the limits split from the interval.
+
+        Arguments:
+
+        """
+
+        health = mysql_clone.HealthCtl(
+            "Server", self.throttle, self.health_cfg)
+
+        self.assertEqual(health.interval, 5)
+        self.assertNotIn("interval", health.limits)
+        self.assertEqual(health.max_pause, 600)
+        self.assertEqual(health.floors, {"bytes": 5, "rows": 5000})
+        self.assertEqual(health.limits["threads_running"], 32)
+        self.assertEqual(health.replicas, [])
+        self.assertFalse(health.thr.is_alive())
+        self.assertIn("interval", self.health_cfg)
+
+
+if __name__ == "__main__":
+    unittest.main()
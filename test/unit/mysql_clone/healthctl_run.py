@@ -0,0 +1,153 @@
+# Classification (U)
+
+"""Program:  healthctl_run.py
+
+    Description:  Unit testing of HealthCtl.run in mysql_clone.py.
+
+    Usage:
+        test/unit/mysql_clone/healthctl_run.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_clone                              # pylint:disable=E0401,C0413
+import lib.gen_libs as gen_libs             # pylint:disable=E0401,C0413,R0402
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class Server():                                         # pylint:disable=R0903
+
+    """Class:  Server
+
+    Description:  Class stub holder for mysql_class.Server class.
+
+    Methods:
+        __init__
+        col_sql
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.running = 5
+        self.waits = 100
+        self.history = 10
+
+    def col_sql(self, cmd):
+
+        """Method:  col_sql
+
+        Description:  Method stub holder for mysql_class.Server.col_sql.
+
+        Arguments:
+
+        """
+
+        if "status" in cmd:
+            return [
+                {"Variable_name": "Threads_running",
+                 "Value": str(self.running)},
+                {"Variable_name": "Innodb_row_lock_waits",
+                 "Value": str(self.waits)}]
+
+        return [{"val": self.history}]
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_sample_failed
+        test_decision
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.health_cfg = {
+            "threads_running": 32, "row_lock_waits": 10,
+            "history_len": 1000000, "replica_lag": 60, "interval": 5}
+        self.server = Server()
+        self.throttle = mysql_clone.Throttle("0")
+        self.health = mysql_clone.HealthCtl(
+            self.server, self.throttle, self.health_cfg)
+        self.health.done = mock.Mock()
+        self.health.done.wait.side_effect = [False, True]
+
+    def test_sample_failed(self):
+
+        """Function:  test_sample_failed
+
+        Description:  Test with a failed sample resuming the streams.
+
+        Arguments:
+
+        """
+
+        self.health.paused = True
+        self.throttle.scale(0)
+        self.server.running = "lost"
+
+        with gen_libs.no_std_out():
+            self.health.run()
+
+        self.assertEqual(self.health.counts, {"hold": 1})
+        self.assertTrue(self.throttle.resume.is_set())
+
+    def test_decision(self):
+
+        """Function:  test_decision
+
+        Description:  Test with a decision applied and counted.
+
+        Arguments:
+
+        """
+
+        self.server.running = 40
+        self.throttle.totals["bytes"] = 1024
+
+        with gen_libs.no_std_out():
+            self.health.run()
+
+        self.assertEqual(self.health.counts, {"slow": 1})
+        self.assertEqual(self.throttle.factor, 0.5)
+        self.assertEqual(self.health.prev["bytes"], 1024)
+        self.assertEqual(self.health.done.wait.call_args[0][0], 5)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,217 @@
+# Classification (U)
+
+"""Program:  healthctl_sample.py
+
+    Description:  Unit testing of HealthCtl.sample in mysql_clone.py.
+
+    Usage:
+        test/unit/mysql_clone/healthctl_sample.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_clone                              # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class Server():                                         # pylint:disable=R0903
+
+    """Class:  Server
+
+    Description:  Class stub holder for mysql_class.Server class.
+
+    Methods:
+        __init__
+        col_sql
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.running = 5
+        self.waits = 100
+        self.history = 10
+
+    def col_sql(self, cmd):
+
+        """Method:  col_sql
+
+        Description:  Method stub holder for mysql_class.Server.col_sql.
+
+        Arguments:
+
+        """
+
+        if "status" in cmd:
+            return [
+                {"Variable_name": "Threads_running",
+                 "Value": str(self.running)},
+                {"Variable_name": "Innodb_row_lock_waits",
+                 "Value": str(self.waits)}]
+
+        return [{"val": self.history}]
+
+
+class Replica():                                        # pylint:disable=R0903
+
+    """Class:  Replica
+
+    Description:  Class stub holder for mysql_class.SlaveRep class.
+
+    Methods:
+        __init__
+        upd_slv_status
+
+    """
+
+    def __init__(self, secs_behind):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.secs_behind = secs_behind
+
+    def upd_slv_status(self):
+
+        """Method:  upd_slv_status
+
+        Description:  Method stub holder for
+            mysql_class.SlaveRep.upd_slv_status.
+
+        Arguments:
+
+        """
+
+        return True
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_replica_stopped
+        test_replica_lag
+        test_lock_wait_rate
+        test_first_sample
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.server = Server()
+        self.throttle = mysql_clone.Throttle("0")
+        self.health_cfg = {
+            "threads_running": 32, "row_lock_waits": 10,
+            "history_len": 1000000, "replica_lag": 60, "interval": 5}
+
+    def test_replica_stopped(self):
+
+        """Function:  test_replica_stopped
+
+        Description:  Test with a replica whose lag is unknown.
+
+        Arguments:
+
+        """
+
+        health = mysql_clone.HealthCtl(
+            self.server, self.throttle, self.health_cfg,
+            replicas=[Replica(None)])
+
+        self.assertNotIn("replica_lag", health.sample())
+
+    def test_replica_lag(self):
+
+        """Function:  test_replica_lag
+
+        Description:  Test with the largest lag of the replicas.
+
+        Arguments:
+
+        """
+
+        health = mysql_clone.HealthCtl(
+            self.server, self.throttle, self.health_cfg,
+            replicas=[Replica(3), Replica(None), Replica(12)])
+
+        self.assertEqual(health.sample()["replica_lag"], 12)
+
+    @mock.patch("mysql_clone.time.monotonic")
+    def test_lock_wait_rate(self, mock_time):
+
+        """Function:  test_lock_wait_rate
+
+        Description:  Test with the row lock waits a second since the last
+            sample.
+
+        Arguments:
+
+        """
+
+        mock_time.side_effect = [100.0, 105.0]
+        health = mysql_clone.HealthCtl(
+            self.server, self.throttle, self.health_cfg)
+        health.sample()
+        self.server.waits = 150
+
+        self.assertEqual(health.sample()["row_lock_waits"], 10.0)
+
+    def test_first_sample(self):
+
+        """Function:  test_first_sample
+
+        Description:  Test with the first sample of the server.
+
+        Arguments:
+
+        """
+
+        health = mysql_clone.HealthCtl(
+            self.server, self.throttle, self.health_cfg)
+
+        self.assertEqual(
+            health.sample(),
+            {"threads_running": 5, "row_lock_waits": 0.0, "history_len": 10})
+        self.assertEqual(health.prev["waits"], 100)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,75 @@
+# Classification (U)
+
+"""Program:  healthctl_start.py
+
+    Description:  Unit testing of HealthCtl.start in mysql_clone.py.
+
+    Usage:
+        test/unit/mysql_clone/healthctl_start.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_clone                              # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_start
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.health_cfg = {
+            "threads_running": 32, "row_lock_waits": 10,
+            "history_len": 1000000, "replica_lag": 60, "interval": 5}
+        self.health = mysql_clone.HealthCtl(
+            "Server", mysql_clone.Throttle("0"), self.health_cfg)
+
+    def test_start(self):
+
+        """Function:  test_start
+
+        Description:  Test with the monitor thread started.
+
+        Arguments:
+
+        """
+
+        self.health.thr = mock.Mock()
+        self.health.start()
+
+        self.health.thr.start.assert_called_once_with()
+
+
+if __name__ == "__main__":
+    unittest.main()
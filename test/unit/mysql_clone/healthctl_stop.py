@@ -0,0 +1,98 @@
+# Classification (U)
+
+"""Program:  healthctl_stop.py
+
+    Description:  Unit testing of HealthCtl.stop in mysql_clone.py.
+
+    Usage:
+        test/unit/mysql_clone/healthctl_stop.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_clone                              # pylint:disable=E0401,C0413
+import lib.gen_libs as gen_libs             # pylint:disable=E0401,C0413,R0402
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_not_started
+        test_started
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.health_cfg = {
+            "threads_running": 32, "row_lock_waits": 10,
+            "history_len": 1000000, "replica_lag": 60, "interval": 5}
+        self.throttle = mysql_clone.Throttle("0")
+        self.health = mysql_clone.HealthCtl(
+            "Server", self.throttle, self.health_cfg)
+
+    def test_not_started(self):
+
+        """Function:  test_not_started
+
+        Description:  Test with the monitor thread not started.
+
+        Arguments:
+
+        """
+
+        with gen_libs.no_std_out():
+            self.health.stop()
+
+        self.assertTrue(self.health.done.is_set())
+
+    def test_started(self):
+
+        """Function:  test_started
+
+        Description:  Test with a paused throttle resumed once the monitor
+            thread has stopped.
+
+        Arguments:
+
+        """
+
+        self.throttle.scale(0)
+        self.health.start()
+
+        with gen_libs.no_std_out():
+            self.health.stop()
+
+        self.assertFalse(self.health.thr.is_alive())
+        self.assertTrue(self.throttle.resume.is_set())
+        self.assertEqual(self.throttle.factor, 1.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
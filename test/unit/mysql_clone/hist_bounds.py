@@ -0,0 +1,185 @@
+# Classification (U)
+
+"""Program:  hist_bounds.py
+
+    Description:  Unit testing of hist_bounds in mysql_clone.py.
+
+    Usage:
+        test/unit/mysql_clone/hist_bounds.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import json
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_clone                              # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class Server():                                         # pylint:disable=R0903
+
+    """Class:  Server
+
+    Description:  Class stub holder for mysql_class.Server class.
+
+    Methods:
+        __init__
+        col_sql
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.version = (8, 0, 30)
+        self.results = {}
+        self.cmds = []
+
+    def col_sql(self, cmd, params=None):
+
+        """Method:  col_sql
+
+        Description:  Method stub holder for mysql_class.Server.col_sql.
+
+        Arguments:
+
+        """
+
+        self.cmds.append((cmd, params))
+
+        for key, data in self.results.items():
+            if key in cmd:
+                return data
+
+        return []
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_pre_mysql8
+        test_no_histogram
+        test_string_histogram
+        test_singleton
+        test_equi_height
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.server = Server()
+        self.tbl = {"db": "db1", "tbl": "t1", "tbl_rows": 100,
+                    "data_len": 4096, "col": "id"}
+        self.equi = json.dumps({"buckets": [
+            [1, 10, 0.2, 10], [11, 50, 0.5, 40], [51, 60, 0.9, 10],
+            [61, 100, 1.0, 40]]})
+
+    def test_pre_mysql8(self):
+
+        """Function:  test_pre_mysql8
+
+        Description:  Test with pre-MySQL 8.0 server.
+
+        Arguments:
+
+        """
+
+        self.server.version = (5, 7, 40)
+
+        self.assertEqual(mysql_clone.hist_bounds(self.server, self.tbl, 4), [])
+        self.assertEqual(self.server.cmds, [])
+
+    def test_no_histogram(self):
+
+        """Function:  test_no_histogram
+
+        Description:  Test with no histogram on the column.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(mysql_clone.hist_bounds(self.server, self.tbl, 4), [])
+
+    def test_string_histogram(self):
+
+        """Function:  test_string_histogram
+
+        Description:  Test with histogram on a string column.
+
+        Arguments:
+
+        """
+
+        self.server.results = {"column_statistics": [{"histogram": {
+            "buckets": [["base64:type254:YQ==", 0.5],
+                        ["base64:type254:Yg==", 1.0]]}}]}
+
+        self.assertEqual(mysql_clone.hist_bounds(self.server, self.tbl, 2), [])
+
+    def test_singleton(self):
+
+        """Function:  test_singleton
+
+        Description:  Test with a singleton histogram.
+
+        Arguments:
+
+        """
+
+        self.server.results = {"column_statistics": [{"histogram": {
+            "buckets": [[1, 0.25], [2, 0.5], [3, 0.75], [4, 1.0]]}}]}
+
+        self.assertEqual(
+            mysql_clone.hist_bounds(self.server, self.tbl, 2), [2])
+
+    def test_equi_height(self):
+
+        """Function:  test_equi_height
+
+        Description:  Test with an equi-height histogram.
+
+        Arguments:
+
+        """
+
+        self.server.results = {"column_statistics": [
+            {"histogram": self.equi}]}
+
+        self.assertEqual(
+            mysql_clone.hist_bounds(self.server, self.tbl, 4), [50, 50, 60])
+
+
+if __name__ == "__main__":
+    unittest.main()
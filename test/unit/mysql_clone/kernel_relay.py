@@ -0,0 +1,177 @@
+# Classification (U)
+
+"""Program:  kernel_relay.py
+
+    Description:  Unit testing of kernel_relay in mysql_clone.py.
+
+    Usage:
+        test/unit/mysql_clone/kernel_relay.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import os
+import errno
+import socket
+import tempfile
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_clone                              # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        tearDown
+        test_copy_error
+        test_no_splice
+        test_unsupported
+        test_file
+        test_pipe
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.data = b"insert data" * 100
+        self.src, self.src_w = os.pipe()
+        self.dst_r, self.dst = os.pipe()
+        self.ticks = []
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Clean up of unit testing.
+
+        Arguments:
+
+        """
+
+        for fdesc in [self.src, self.src_w, self.dst_r, self.dst]:
+            try:
+                os.close(fdesc)
+
+            except OSError:
+                pass
+
+    @mock.patch("mysql_clone.os.splice")
+    def test_copy_error(self, mock_splice):
+
+        """Function:  test_copy_error
+
+        Description:  Test with the copy failing.
+
+        Arguments:
+
+        """
+
+        mock_splice.side_effect = OSError(errno.EIO, "I/O error")
+
+        with self.assertRaises(OSError):
+            mysql_clone.kernel_relay(
+                self.src, self.dst, 4096, self.ticks.append)
+
+    @mock.patch("mysql_clone.os.splice")
+    def test_no_splice(self, mock_splice):
+
+        """Function:  test_no_splice
+
+        Description:  Test with the kernel not supporting splice.
+
+        Arguments:
+
+        """
+
+        mock_splice.side_effect = OSError(errno.ENOSYS, "Not implemented")
+
+        self.assertIsNone(
+            mysql_clone.kernel_relay(
+                self.src, self.dst, 4096, self.ticks.append))
+
+    def test_unsupported(self):
+
+        """Function:  test_unsupported
+
+        Description:  Test with descriptors the kernel cannot copy between.
+
+        Arguments:
+
+        """
+
+        sock1, sock2 = socket.socketpair()
+        sock2.sendall(self.data)
+
+        with sock1, sock2:
+            self.assertIsNone(
+                mysql_clone.kernel_relay(
+                    sock1.fileno(), sock2.fileno(), 4096, self.ticks.append))
+
+    def test_file(self):
+
+        """Function:  test_file
+
+        Description:  Test with a regular file copied into a pipe.
+
+        Arguments:
+
+        """
+
+        with tempfile.TemporaryFile() as fhandle:
+            fhandle.write(self.data)
+            fhandle.seek(0)
+
+            self.assertEqual(
+                mysql_clone.kernel_relay(
+                    fhandle.fileno(), self.dst, 4096, self.ticks.append),
+                len(self.data))
+
+        self.assertEqual(os.read(self.dst_r, 4096), self.data)
+
+    def test_pipe(self):
+
+        """Function:  test_pipe
+
+        Description:  Test with a pipe copied into a pipe.
+
+        Arguments:
+
+        """
+
+        os.write(self.src_w, self.data)
+        os.close(self.src_w)
+
+        self.assertEqual(
+            mysql_clone.kernel_relay(
+                self.src, self.dst, 512, self.ticks.append), len(self.data))
+        self.assertEqual(os.read(self.dst_r, 4096), self.data)
+        self.assertEqual(sum(self.ticks), len(self.data))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,91 @@
+# Classification (U)
+
+"""Program:  levelctl_init.py
+
+    Description:  Unit testing of LevelCtl.__init__ in mysql_clone.py.
+
+    Usage:
+        test/unit/mysql_clone/levelctl_init.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_clone                              # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        test_level_bounded
+        test_kwargs
+        test_default
+
+    """
+
+    def test_level_bounded(self):
+
+        """Function:  test_level_bounded
+
+        Description:  Test with a starting level out of bounds.
+
+        Arguments:
+
+        """
+
+        ctl = mysql_clone.LevelCtl(level=12, max_level=9)
+
+        self.assertEqual(ctl.level, 9)
+
+    def test_kwargs(self):
+
+        """Function:  test_kwargs
+
+        Description:  Test with the levels and interval passed.
+
+        Arguments:
+
+        """
+
+        ctl = mysql_clone.LevelCtl(
+            level=5, min_level=2, max_level=7, interval=4)
+
+        self.assertEqual(
+            (ctl.level, ctl.min_level, ctl.max_level, ctl.interval),
+            (5, 2, 7, 4))
+
+    def test_default(self):
+
+        """Function:  test_default
+
+        Description:  Test with the default settings.
+
+        Arguments:
+
+        """
+
+        ctl = mysql_clone.LevelCtl()
+
+        self.assertEqual(
+            (ctl.level, ctl.min_level, ctl.max_level, ctl.interval, ctl.cnt),
+            (3, 1, 9, 16, 0))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,161 @@
+# Classification (U)
+
+"""Program:  levelctl_update.py
+
+    Description:  Unit testing of LevelCtl.update in mysql_clone.py.
+
+    Usage:
+        test/unit/mysql_clone/levelctl_update.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_clone                              # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_max_level
+        test_no_headroom
+        test_link_bound
+        test_comp_bound
+        test_balanced
+        test_interval
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.ctl = mysql_clone.LevelCtl(level=3, interval=2)
+
+    @mock.patch("mysql_clone.os.cpu_count", mock.Mock(return_value=4))
+    @mock.patch("mysql_clone.os.getloadavg",
+                mock.Mock(return_value=(1.0, 1.0, 1.0)))
+    def test_max_level(self):
+
+        """Function:  test_max_level
+
+        Description:  Test with the level at the highest level.
+
+        Arguments:
+
+        """
+
+        self.ctl.level = 9
+        self.ctl.update(0.0, 1.0)
+
+        self.assertEqual(self.ctl.update(0.0, 1.0), 9)
+
+    @mock.patch("mysql_clone.os.cpu_count", mock.Mock(return_value=4))
+    @mock.patch("mysql_clone.os.getloadavg",
+                mock.Mock(return_value=(6.0, 1.0, 1.0)))
+    def test_no_headroom(self):
+
+        """Function:  test_no_headroom
+
+        Description:  Test with a link bound stream and no CPU headroom.
+
+        Arguments:
+
+        """
+
+        self.ctl.update(0.0, 1.0)
+
+        self.assertEqual(self.ctl.update(0.0, 1.0), 2)
+
+    @mock.patch("mysql_clone.os.cpu_count", mock.Mock(return_value=4))
+    @mock.patch("mysql_clone.os.getloadavg",
+                mock.Mock(return_value=(1.0, 1.0, 1.0)))
+    def test_link_bound(self):
+
+        """Function:  test_link_bound
+
+        Description:  Test with the stream waiting on the link.
+
+        Arguments:
+
+        """
+
+        self.ctl.update(0.1, 1.0)
+
+        self.assertEqual(self.ctl.update(0.1, 1.0), 4)
+        self.assertEqual((self.ctl.cnt, self.ctl.link_wait), (0, 0.0))
+
+    @mock.patch("mysql_clone.os.cpu_count", mock.Mock(return_value=4))
+    @mock.patch("mysql_clone.os.getloadavg",
+                mock.Mock(return_value=(1.0, 1.0, 1.0)))
+    def test_comp_bound(self):
+
+        """Function:  test_comp_bound
+
+        Description:  Test with the stream waiting on the compressors.
+
+        Arguments:
+
+        """
+
+        self.ctl.update(1.0, 0.1)
+
+        self.assertEqual(self.ctl.update(1.0, 0.1), 2)
+
+    @mock.patch("mysql_clone.os.cpu_count", mock.Mock(return_value=4))
+    @mock.patch("mysql_clone.os.getloadavg",
+                mock.Mock(return_value=(1.0, 1.0, 1.0)))
+    def test_balanced(self):
+
+        """Function:  test_balanced
+
+        Description:  Test with the compressors keeping up with the link.
+
+        Arguments:
+
+        """
+
+        self.ctl.update(0.6, 1.0)
+
+        self.assertEqual(self.ctl.update(0.6, 1.0), 3)
+
+    def test_interval(self):
+
+        """Function:  test_interval
+
+        Description:  Test with the level kept within an interval.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(self.ctl.update(0.0, 1.0), 3)
+        self.assertEqual(self.ctl.cnt, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
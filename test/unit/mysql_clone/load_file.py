@@ -0,0 +1,138 @@
+# Classification (U)
+
+"""Program:  load_file.py
+
+    Description:  Unit testing of load_file in mysql_clone.py.
+
+    Usage:
+        test/unit/mysql_clone/load_file.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_clone                              # pylint:disable=E0401,C0413
+import lib.gen_libs as gen_libs             # pylint:disable=E0401,C0413,R0402
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class Popen():                                          # pylint:disable=R0903
+
+    """Class:  Popen
+
+    Description:  Class stub holder for subprocess.Popen class.
+
+    Methods:
+        __init__
+        wait
+
+    """
+
+    def __init__(self, returncode=0):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.returncode = returncode
+
+    def wait(self):
+
+        """Method:  wait
+
+        Description:  Wait function.
+
+        Arguments:
+
+        """
+
+        return self.returncode
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_load_failed
+        test_loaded
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.load_cmd = ["mysql", "-u", "user"]
+        self.stmt = "LOAD DATA LOCAL INFILE '/stage/000001.txt'"
+        self.fname = "/stage/000001.txt"
+
+    @mock.patch("mysql_clone.os.remove")
+    @mock.patch("mysql_clone.subprocess.Popen")
+    def test_load_failed(self, mock_popen, mock_remove):
+
+        """Function:  test_load_failed
+
+        Description:  Test with the load failing and the file kept.
+
+        Arguments:
+
+        """
+
+        mock_popen.return_value = Popen(returncode=1)
+
+        with gen_libs.no_std_out():
+            self.assertFalse(
+                mysql_clone.load_file(self.load_cmd, self.stmt, self.fname))
+
+        mock_remove.assert_not_called()
+
+    @mock.patch("mysql_clone.os.remove")
+    @mock.patch("mysql_clone.subprocess.Popen")
+    def test_loaded(self, mock_popen, mock_remove):
+
+        """Function:  test_loaded
+
+        Description:  Test with the file loaded and removed.
+
+        Arguments:
+
+        """
+
+        mock_popen.return_value = Popen()
+
+        self.assertTrue(
+            mysql_clone.load_file(self.load_cmd, self.stmt, self.fname))
+        self.assertEqual(
+            mock_popen.call_args[0][0],
+            ["mysql", "-u", "user", "--local-infile=1", "-e", self.stmt])
+        mock_remove.assert_called_once_with(self.fname)
+
+
+if __name__ == "__main__":
+    unittest.main()
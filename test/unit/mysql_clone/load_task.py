@@ -0,0 +1,221 @@
+# Classification (U)
+
+"""Program:  load_task.py
+
+    Description:  Unit testing of load_task in mysql_clone.py.
+
+    Usage:
+        test/unit/mysql_clone/load_task.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_clone                              # pylint:disable=E0401,C0413
+import lib.gen_libs as gen_libs             # pylint:disable=E0401,C0413,R0402
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class Stdout():                                         # pylint:disable=R0903
+
+    """Class:  Stdout
+
+    Description:  Class stub holder for a process stdout pipe.
+
+    Methods:
+        close
+
+    """
+
+    def close(self):
+
+        """Method:  close
+
+        Description:  Stub holder for close method.
+
+        Arguments:
+
+        """
+
+        return True
+
+
+class Popen():                                          # pylint:disable=R0903
+
+    """Class:  Popen
+
+    Description:  Class stub holder for subprocess.Popen class.
+
+    Methods:
+        __init__
+        wait
+
+    """
+
+    def __init__(self, returncode=0):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.stdout = Stdout()
+        self.stdin = Stdout()
+        self.returncode = returncode
+
+    def wait(self):
+
+        """Method:  wait
+
+        Description:  Wait function.
+
+        Arguments:
+
+        """
+
+        return self.returncode
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_load_failed
+        test_dump_failed
+        test_task_loaded
+        test_load_args
+        test_throttle
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.load_cmd = ["mysql", "-u", "user"]
+        self.task = {"name": "db1", "dbs": ["db1"]}
+
+    @mock.patch("mysql_clone.subprocess.Popen")
+    def test_load_failed(self, mock_popen):
+
+        """Function:  test_load_failed
+
+        Description:  Test with load process failing.
+
+        Arguments:
+
+        """
+
+        mock_popen.return_value = Popen(returncode=1)
+
+        with gen_libs.no_std_out():
+            self.assertFalse(
+                mysql_clone.load_task(Popen(), self.load_cmd, self.task))
+
+    @mock.patch("mysql_clone.subprocess.Popen")
+    def test_dump_failed(self, mock_popen):
+
+        """Function:  test_dump_failed
+
+        Description:  Test with dump process failing.
+
+        Arguments:
+
+        """
+
+        mock_popen.return_value = Popen()
+
+        with gen_libs.no_std_out():
+            self.assertFalse(
+                mysql_clone.load_task(
+                    Popen(returncode=2), self.load_cmd, self.task))
+
+    @mock.patch("mysql_clone.subprocess.Popen")
+    def test_task_loaded(self, mock_popen):
+
+        """Function:  test_task_loaded
+
+        Description:  Test with task dumped and loaded.
+
+        Arguments:
+
+        """
+
+        mock_popen.return_value = Popen()
+
+        self.assertTrue(
+            mysql_clone.load_task(Popen(), self.load_cmd, self.task))
+
+    @mock.patch("mysql_clone.subprocess.Popen")
+    def test_load_args(self, mock_popen):
+
+        """Function:  test_load_args
+
+        Description:  Test with task specific load options.
+
+        Arguments:
+
+        """
+
+        mock_popen.return_value = Popen()
+
+        self.assertTrue(
+            mysql_clone.load_task(
+                Popen(), self.load_cmd,
+                {"name": "db1.t1#0", "load_args": ["--database=db1"]}))
+        self.assertEqual(
+            mock_popen.call_args[0][0],
+            ["mysql", "-u", "user", "--database=db1"])
+
+    @mock.patch("mysql_clone.relay")
+    @mock.patch("mysql_clone.subprocess.Popen")
+    def test_throttle(self, mock_popen, mock_relay):
+
+        """Function:  test_throttle
+
+        Description:  Test with the task relayed through the throttle.
+
+        Arguments:
+
+        """
+
+        throttle = mock.Mock()
+        dump = Popen()
+        mock_popen.return_value = Popen()
+
+        self.assertTrue(
+            mysql_clone.load_task(
+                dump, self.load_cmd, self.task, throttle=throttle))
+        self.assertEqual(
+            mock_popen.call_args[1]["stdin"], mysql_clone.subprocess.PIPE)
+        self.assertEqual(mock_relay.call_args[0][0], dump.stdout)
+        self.assertEqual(mock_relay.call_args[1]["tick"], throttle.take)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -40,6 +40,7 @@ class ArgParser():
         arg_require
         arg_cond_req
         get_val
+        arg_exist
         arg_parse2
 
     """
@@ -118,6 +119,18 @@ class ArgParser():
 
         return self.args_array.get(skey, def_val)
 
+    def arg_exist(self, arg):
+
+        """Method:  arg_exist
+
+        Description:  Method stub holder for gen_class.ArgParser.arg_exist.
+
+        Arguments:
+
+        """
+
+        return arg in self.args_array
+
     def arg_parse2(self):
 
         """Method:  arg_parse2
@@ -176,7 +189,15 @@ class UnitTest(unittest.TestCase):
         test_arg_req_true
         test_arg_dir_chk_crt_false
         test_arg_dir_chk_crt_true
+        test_int_opts_false
+        test_int_opts_true
+        test_xor_opts_false
+        test_fan_opts_false
+        test_fan_opts_true
         test_run_program
+        test_run_program_failed
+        test_run_agent
+        test_run_agent_failed
         test_programlock_true
         test_programlock_false
         test_programlock_id
@@ -385,6 +406,111 @@ class UnitTest(unittest.TestCase):
 
         self.assertFalse(mysql_clone.main())
 
+    @mock.patch("mysql_clone.gen_libs.help_func")
+    @mock.patch("mysql_clone.gen_class.ArgParser")
+    def test_int_opts_false(self, mock_arg, mock_help):
+
+        """Function:  test_int_opts_false
+
+        Description:  Test chk_int_opts if returns False.
+
+        Arguments:
+
+        """
+
+        self.args.args_array["-j"] = "zero"
+
+        mock_arg.return_value = self.args
+        mock_help.return_value = False
+
+        with gen_libs.no_std_out():
+            self.assertFalse(mysql_clone.main())
+
+    @mock.patch("mysql_clone.run_program", mock.Mock(return_value=True))
+    @mock.patch("mysql_clone.gen_class.ProgramLock")
+    @mock.patch("mysql_clone.gen_libs.help_func")
+    @mock.patch("mysql_clone.gen_class.ArgParser")
+    def test_int_opts_true(self, mock_arg, mock_help, mock_lock):
+
+        """Function:  test_int_opts_true
+
+        Description:  Test chk_int_opts if returns True.
+
+        Arguments:
+
+        """
+
+        self.args.args_array["-j"] = "4"
+
+        mock_arg.return_value = self.args
+        mock_help.return_value = False
+        mock_lock.return_value = self.proglock
+
+        self.assertFalse(mysql_clone.main())
+
+    @mock.patch("mysql_clone.gen_libs.help_func")
+    @mock.patch("mysql_clone.gen_class.ArgParser")
+    def test_xor_opts_false(self, mock_arg, mock_help):
+
+        """Function:  test_xor_opts_false
+
+        Description:  Test chk_xor_opts if returns False.
+
+        Arguments:
+
+        """
+
+        self.args.args_array.update({"-e": True, "-j": "4"})
+
+        mock_arg.return_value = self.args
+        mock_help.return_value = False
+
+        with gen_libs.no_std_out():
+            self.assertFalse(mysql_clone.main())
+
+    @mock.patch("mysql_clone.gen_libs.help_func")
+    @mock.patch("mysql_clone.gen_class.ArgParser")
+    def test_fan_opts_false(self, mock_arg, mock_help):
+
+        """Function:  test_fan_opts_false
+
+        Description:  Test chk_fan_opts if returns False.
+
+        Arguments:
+
+        """
+
+        self.args.args_array.update({"-t": "Cfg1,Cfg2", "-j": "4"})
+
+        mock_arg.return_value = self.args
+        mock_help.return_value = False
+
+        with gen_libs.no_std_out():
+            self.assertFalse(mysql_clone.main())
+
+    @mock.patch("mysql_clone.run_program")
+    @mock.patch("mysql_clone.gen_class.ProgramLock")
+    @mock.patch("mysql_clone.gen_libs.help_func")
+    @mock.patch("mysql_clone.gen_class.ArgParser")
+    def test_fan_opts_true(self, mock_arg, mock_help, mock_lock, mock_run):
+
+        """Function:  test_fan_opts_true
+
+        Description:  Test chk_fan_opts if returns True.
+
+        Arguments:
+
+        """
+
+        self.args.args_array["-t"] = "Cfg1,Cfg2"
+
+        mock_arg.return_value = self.args
+        mock_help.return_value = False
+        mock_lock.return_value = self.proglock
+
+        self.assertFalse(mysql_clone.main())
+        self.assertTrue(mock_run.called)
+
     @mock.patch("mysql_clone.run_program", mock.Mock(return_value=True))
     @mock.patch("mysql_clone.gen_class.ProgramLock")
     @mock.patch("mysql_clone.gen_libs.help_func")
@@ -405,6 +531,80 @@ class UnitTest(unittest.TestCase):
 
         self.assertFalse(mysql_clone.main())
 
+    @mock.patch("mysql_clone.run_program", mock.Mock(return_value=False))
+    @mock.patch("mysql_clone.gen_class.ProgramLock")
+    @mock.patch("mysql_clone.gen_libs.help_func")
+    @mock.patch("mysql_clone.gen_class.ArgParser")
+    def test_run_program_failed(self, mock_arg, mock_help, mock_lock):
+
+        """Function:  test_run_program_failed
+
+        Description:  Test with run_program failing and a non-zero exit
+            status returned.
+
+        Arguments:
+
+        """
+
+        mock_arg.return_value = self.args
+        mock_help.return_value = False
+        mock_lock.return_value = self.proglock
+
+        self.assertEqual(mysql_clone.main(), 1)
+
+    @mock.patch("mysql_clone.read_secret", mock.Mock(return_value=b"secret"))
+    @mock.patch("mysql_clone.run_program")
+    @mock.patch("mysql_clone.run_agent")
+    @mock.patch("mysql_clone.gen_class.ProgramLock")
+    @mock.patch("mysql_clone.gen_libs.help_func")
+    @mock.patch("mysql_clone.gen_class.ArgParser")
+    def test_run_agent(                                 # pylint:disable=R0913
+            self, mock_arg, mock_help, mock_lock, mock_agent, mock_run):
+
+        """Function:  test_run_agent
+
+        Description:  Test run_agent function with the -a option.
+
+        Arguments:
+
+        """
+
+        self.args.args_array.update(
+            {"-a": "10.0.0.1:5000", "-S": "secret_file", "-j": "4"})
+
+        mock_arg.return_value = self.args
+        mock_help.return_value = False
+        mock_lock.return_value = self.proglock
+
+        self.assertFalse(mysql_clone.main())
+        self.assertEqual(self.args.opt_req, ["-c", "-d"])
+        self.assertTrue(mock_agent.called)
+        self.assertFalse(mock_run.called)
+
+    @mock.patch("mysql_clone.read_secret", mock.Mock(return_value=b"secret"))
+    @mock.patch("mysql_clone.run_agent", mock.Mock(return_value=False))
+    @mock.patch("mysql_clone.gen_class.ProgramLock")
+    @mock.patch("mysql_clone.gen_libs.help_func")
+    @mock.patch("mysql_clone.gen_class.ArgParser")
+    def test_run_agent_failed(self, mock_arg, mock_help, mock_lock):
+
+        """Function:  test_run_agent_failed
+
+        Description:  Test with the agent failing.
+
+        Arguments:
+
+        """
+
+        self.args.args_array.update(
+            {"-a": "10.0.0.1:5000", "-S": "secret_file", "-j": "4"})
+
+        mock_arg.return_value = self.args
+        mock_help.return_value = False
+        mock_lock.return_value = self.proglock
+
+        self.assertEqual(mysql_clone.main(), 1)
+
     @mock.patch("mysql_clone.run_program", mock.Mock(return_value=True))
     @mock.patch("mysql_clone.gen_class.ProgramLock")
     @mock.patch("mysql_clone.gen_libs.help_func")
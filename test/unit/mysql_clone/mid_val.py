@@ -0,0 +1,105 @@
+# Classification (U)
+
+"""Program:  mid_val.py
+
+    Description:  Unit testing of mid_val in mysql_clone.py.
+
+    Usage:
+        test/unit/mysql_clone/mid_val.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import datetime
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_clone                              # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        test_time
+        test_datetime
+        test_date
+        test_integer
+
+    """
+
+    def test_time(self):
+
+        """Function:  test_time
+
+        Description:  Test with time values.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            mysql_clone.mid_val(
+                datetime.timedelta(hours=1), datetime.timedelta(hours=3)),
+            datetime.timedelta(hours=2))
+
+    def test_datetime(self):
+
+        """Function:  test_datetime
+
+        Description:  Test with datetime values.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            mysql_clone.mid_val(
+                datetime.datetime(2026, 1, 1),
+                datetime.datetime(2026, 1, 1, 0, 0, 1)),
+            datetime.datetime(2026, 1, 1, 0, 0, 0, 500000))
+
+    def test_date(self):
+
+        """Function:  test_date
+
+        Description:  Test with date values rounded down to the day.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            mysql_clone.mid_val(
+                datetime.date(2026, 1, 1), datetime.date(2026, 1, 4)),
+            datetime.date(2026, 1, 2))
+
+    def test_integer(self):
+
+        """Function:  test_integer
+
+        Description:  Test with integer values rounded down.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(mysql_clone.mid_val(-3, 4), 0)
+        self.assertEqual(mysql_clone.mid_val(7, 8), 7)
+
+
+if __name__ == "__main__":
+    unittest.main()
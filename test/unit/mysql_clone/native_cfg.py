@@ -0,0 +1,245 @@
+# Classification (U)
+
+"""Program:  native_cfg.py
+
+    Description:  Unit testing of native_cfg in mysql_clone.py.
+
+    Usage:
+        test/unit/mysql_clone/native_cfg.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_clone                              # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class ArgParser():
+
+    """Class:  ArgParser
+
+    Description:  Class stub holder for gen_class.ArgParser class.
+
+    Methods:
+        __init__
+        arg_exist
+        get_val
+        arg_set_path
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.cmdline = None
+        self.args_array = {"-n": True, "-s": "/stage"}
+
+    def arg_exist(self, arg):
+
+        """Method:  arg_exist
+
+        Description:  Method stub holder for gen_class.ArgParser.arg_exist.
+
+        Arguments:
+
+        """
+
+        return arg in self.args_array
+
+    def get_val(self, skey, def_val=None):
+
+        """Method:  get_val
+
+        Description:  Method stub holder for gen_class.ArgParser.get_val.
+
+        Arguments:
+
+        """
+
+        return self.args_array.get(skey, def_val)
+
+    def arg_set_path(self, arg_opt, **kwargs):
+
+        """Method:  arg_set_path
+
+        Description:  Method stub holder for gen_class.ArgParser.arg_set_path.
+
+        Arguments:
+
+        """
+
+        return os.path.join(
+            self.args_array[arg_opt] if arg_opt in self.args_array else "",
+            kwargs.get("cmd", ""))
+
+
+
+class Server():
+
+    """Class:  Server
+
+    Description:  Class stub holder for mysql_class.Server class.
+
+    Methods:
+        __init__
+        col_sql
+        cmd_sql
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.gtid_mode = True
+        self.sql_user = "user"
+        self.version = (8, 0, 30)
+        self.cmds = []
+
+    def col_sql(self, cmd):
+
+        """Method:  col_sql
+
+        Description:  Method stub holder for mysql_class.Server.col_sql.
+
+        Arguments:
+
+        """
+
+        self.cmds.append(cmd)
+
+        return [{"val": 67108864, "now": "2026-01-01 00:00:00",
+                 "File": "binlog.000001", "Position": 1234,
+                 "Executed_Gtid_Set": "uuid:1-10"}]
+
+    def cmd_sql(self, cmd):
+
+        """Method:  cmd_sql
+
+        Description:  Method stub holder for mysql_class.Server.cmd_sql.
+
+        Arguments:
+
+        """
+
+        self.cmds.append(cmd)
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_remove_gtid
+        test_set_gtid
+        test_dump_args
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.clone = Server()
+        self.args = ArgParser()
+        self.opt_arg_list = [
+            "--single-transaction", "--all-databases", "--triggers",
+            "--routines", "--ignore-table=mysql.event"]
+
+    @mock.patch("mysql_clone.mysql_libs.crt_cmd",
+                mock.Mock(return_value=["mysql"]))
+    def test_remove_gtid(self):
+
+        """Function:  test_remove_gtid
+
+        Description:  Test with the -r option removing the GTID entries.
+
+        Arguments:
+
+        """
+
+        self.args.args_array["-r"] = True
+        cfg = mysql_clone.native_cfg(self.clone, self.args, self.opt_arg_list)
+
+        self.assertFalse(cfg["set_gtid"])
+        self.assertFalse(cfg["no_log"])
+        self.assertEqual(cfg["load_cmd"], ["mysql"])
+
+    @mock.patch("mysql_clone.mysql_libs.crt_cmd",
+                mock.Mock(return_value=["mysql"]))
+    def test_set_gtid(self):
+
+        """Function:  test_set_gtid
+
+        Description:  Test with GTIDs set on the clone.
+
+        Arguments:
+
+        """
+
+        cfg = mysql_clone.native_cfg(self.clone, self.args, self.opt_arg_list)
+
+        self.assertTrue(cfg["set_gtid"])
+        self.assertTrue(cfg["no_log"])
+        self.assertEqual(
+            cfg["load_cmd"],
+            ["mysql", "--init-command=SET SESSION sql_log_bin=0"])
+
+    @mock.patch("mysql_clone.mysql_libs.crt_cmd",
+                mock.Mock(return_value=["mysql"]))
+    def test_dump_args(self):
+
+        """Function:  test_dump_args
+
+        Description:  Test with the native dump options.
+
+        Arguments:
+
+        """
+
+        cfg = mysql_clone.native_cfg(self.clone, self.args, self.opt_arg_list)
+
+        self.assertEqual(cfg["max_len"], 16 * 1024 * 1024 - 1024)
+        self.assertEqual(
+            cfg["dump_args"],
+            {"ignore": ["mysql.general_log", "mysql.slow_log", "mysql.event"],
+             "triggers": True, "routines": True, "events": False})
+
+
+if __name__ == "__main__":
+    unittest.main()
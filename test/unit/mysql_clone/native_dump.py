@@ -0,0 +1,215 @@
+# Classification (U)
+
+"""Program:  native_dump.py
+
+    Description:  Unit testing of native_dump in mysql_clone.py.
+
+    Usage:
+        test/unit/mysql_clone/native_dump.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_clone                              # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class Server():                                         # pylint:disable=R0903
+
+    """Class:  Server
+
+    Description:  Class stub holder for mysql_class.Server class.
+
+    Methods:
+        __init__
+        col_sql
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.tbls = [{"name": "t1", "type": "BASE TABLE"}]
+
+    def col_sql(self, cmd, params=None):      # pylint:disable=W0613
+
+        """Method:  col_sql
+
+        Description:  Method stub holder for mysql_class.Server.col_sql.
+
+        Arguments:
+
+        """
+
+        data = [{"name": "proc1", "type": "PROCEDURE"}]
+
+        if cmd.startswith("show create database"):
+            data = [{"Create Database": "CREATE DATABASE `db1`"}]
+
+        elif cmd.startswith("show create view"):
+            data = [{"Create View": "CREATE VIEW `v1` AS select 1 AS `id`"}]
+
+        elif "information_schema.tables" in cmd:
+            data = self.tbls
+
+        return data
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_routines_events
+        test_view
+        test_ignore
+        test_stats_merged
+        test_tables
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.server = Server()
+        self.header = [
+            "SET NAMES utf8mb4", "SET TIME_ZONE = '+00:00'",
+            "SET SESSION sql_mode = 'NO_AUTO_VALUE_ON_ZERO'",
+            "SET FOREIGN_KEY_CHECKS = 0", "SET UNIQUE_CHECKS = 0",
+            "CREATE DATABASE IF NOT EXISTS `db1`"]
+
+    @mock.patch("mysql_clone.crt_obj_stmts")
+    @mock.patch("mysql_clone.native_dump_tbl", mock.Mock(return_value=[]))
+    def test_routines_events(self, mock_obj):
+
+        """Function:  test_routines_events
+
+        Description:  Test with routines and events dumped.
+
+        Arguments:
+
+        """
+
+        mock_obj.return_value = ["CREATE OBJECT"]
+
+        self.assertEqual(
+            list(mysql_clone.native_dump(
+                self.server, ["db1"], 1024, routines=True, events=True)),
+            self.header + ["CREATE OBJECT", "CREATE OBJECT"])
+        self.assertEqual(
+            [call[0][1] for call in mock_obj.call_args_list],
+            ["Procedure", "Event"])
+
+    @mock.patch("mysql_clone.fetch_cols", mock.Mock(return_value=["id"]))
+    def test_view(self):
+
+        """Function:  test_view
+
+        Description:  Test with a view created as a placeholder table and
+            replaced once all databases are dumped.
+
+        Arguments:
+
+        """
+
+        self.server.tbls = [{"name": "v1", "type": "VIEW"}]
+
+        self.assertEqual(
+            list(mysql_clone.native_dump(self.server, ["db1"], 1024)),
+            self.header + [
+                "USE `db1`", "DROP TABLE IF EXISTS `v1`",
+                "DROP VIEW IF EXISTS `v1`", "CREATE TABLE `v1` (`id` tinyint)",
+                "USE `db1`", "DROP TABLE IF EXISTS `v1`",
+                "CREATE VIEW `v1` AS select 1 AS `id`"])
+
+    @mock.patch("mysql_clone.native_dump_tbl")
+    def test_ignore(self, mock_tbl):
+
+        """Function:  test_ignore
+
+        Description:  Test with an ignored table.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            list(mysql_clone.native_dump(
+                self.server, ["db1"], 1024, ignore=["db1.t1"])), self.header)
+        mock_tbl.assert_not_called()
+
+    @mock.patch("mysql_clone.native_dump_tbl", mock.Mock(return_value=[]))
+    def test_stats_merged(self):
+
+        """Function:  test_stats_merged
+
+        Description:  Test with the InnoDB statistics tables of the mysql
+            schema merged into the clone's.
+
+        Arguments:
+
+        """
+
+        self.server.tbls = [
+            {"name": "innodb_index_stats", "type": "BASE TABLE"},
+            {"name": "user", "type": "BASE TABLE"}]
+        list(mysql_clone.native_dump(self.server, ["mysql"], 1024))
+
+        self.assertEqual(
+            [call[1]["merge"]
+             for call in mysql_clone.native_dump_tbl.call_args_list],
+            [True, False])
+
+    @mock.patch("mysql_clone.native_dump_tbl")
+    def test_tables(self, mock_tbl):
+
+        """Function:  test_tables
+
+        Description:  Test with the tables dumped.
+
+        Arguments:
+
+        """
+
+        mock_tbl.return_value = ["CREATE TABLE `t1`"]
+
+        self.assertEqual(
+            list(mysql_clone.native_dump(
+                self.server, ["db1"], 1024, triggers=True)),
+            self.header + ["CREATE TABLE `t1`"])
+        self.assertTrue(mock_tbl.call_args[1]["triggers"])
+        self.assertFalse(mock_tbl.call_args[1]["merge"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,483 @@
+# Classification (U)
+
+"""Program:  native_dump_load.py
+
+    Description:  Unit testing of native_dump_load in mysql_clone.py.
+
+    Usage:
+        test/unit/mysql_clone/native_dump_load.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import io
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_clone                              # pylint:disable=E0401,C0413
+import lib.gen_libs as gen_libs             # pylint:disable=E0401,C0413,R0402
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class ArgParser():
+
+    """Class:  ArgParser
+
+    Description:  Class stub holder for gen_class.ArgParser class.
+
+    Methods:
+        __init__
+        arg_exist
+        get_val
+        arg_set_path
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.cmdline = None
+        self.args_array = {"-n": True, "-e": True}
+
+    def arg_exist(self, arg):
+
+        """Method:  arg_exist
+
+        Description:  Method stub holder for gen_class.ArgParser.arg_exist.
+
+        Arguments:
+
+        """
+
+        return arg in self.args_array
+
+    def get_val(self, skey, def_val=None):
+
+        """Method:  get_val
+
+        Description:  Method stub holder for gen_class.ArgParser.get_val.
+
+        Arguments:
+
+        """
+
+        return self.args_array.get(skey, def_val)
+
+    def arg_set_path(self, arg_opt, **kwargs):
+
+        """Method:  arg_set_path
+
+        Description:  Method stub holder for gen_class.ArgParser.arg_set_path.
+
+        Arguments:
+
+        """
+
+        return os.path.join(
+            self.args_array[arg_opt] if arg_opt in self.args_array else "",
+            kwargs.get("cmd", ""))
+
+
+class Stdin(io.StringIO):
+
+    """Class:  Stdin
+
+    Description:  Class stub holder for a process stdin pipe.
+
+    Methods:
+        __init__
+        write
+
+    """
+
+    def __init__(self, broken=False):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        super().__init__()
+        self.broken = broken
+
+    def write(self, data):
+
+        """Method:  write
+
+        Description:  Stub holder for write method.
+
+        Arguments:
+
+        """
+
+        if self.broken:
+            raise BrokenPipeError
+
+        return super().write(data)
+
+
+class Popen():
+
+    """Class:  Popen
+
+    Description:  Class stub holder for subprocess.Popen class.
+
+    Methods:
+        __init__
+        kill
+        wait
+
+    """
+
+    def __init__(self, returncode=0, broken=False):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.stdin = Stdin(broken=broken)
+        self.returncode = returncode
+        self.killed = False
+
+    def kill(self):
+
+        """Method:  kill
+
+        Description:  Kill function.
+
+        Arguments:
+
+        """
+
+        self.killed = True
+
+    def wait(self):
+
+        """Method:  wait
+
+        Description:  Wait function.
+
+        Arguments:
+
+        """
+
+        return self.returncode
+
+
+class Server():
+
+    """Class:  Server
+
+    Description:  Class stub holder for mysql_class.Server class.
+
+    Methods:
+        __init__
+        col_sql
+        cmd_sql
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.gtid_mode = True
+        self.sql_user = "user"
+        self.version = (8, 0, 25)
+        self.cmds = []
+
+    def col_sql(self, cmd):
+
+        """Method:  col_sql
+
+        Description:  Method stub holder for mysql_class.Server.col_sql.
+
+        Arguments:
+
+        """
+
+        self.cmds.append(cmd)
+
+        return [{"val": 67108864, "now": "2026-01-01 00:00:00",
+                 "File": "binlog.000001", "Position": 1234,
+                 "Executed_Gtid_Set": "uuid:1-10"}]
+
+    def cmd_sql(self, cmd):
+
+        """Method:  cmd_sql
+
+        Description:  Method stub holder for mysql_class.Server.cmd_sql.
+
+        Arguments:
+
+        """
+
+        self.cmds.append(cmd)
+
+
+def native_dump(*args, **kwargs):                       # pylint:disable=W0613
+
+    """Function:  native_dump
+
+    Description:  Stub holder for native_dump that defers an index.
+
+    Arguments:
+
+    """
+
+    kwargs["deferred"].append("ALTER TABLE `db1`.`t1` ADD KEY `a` (`a`)")
+
+    return ["USE `db1`"]
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_deferred_indexes
+        test_native_loader
+        test_broken_pipe
+        test_load_failed
+        test_remove_gtid
+        test_loaded
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.source = Server()
+        self.clone = Server()
+        self.args = ArgParser()
+        self.opt_arg_list = [
+            "--single-transaction", "--all-databases", "--triggers",
+            "--ignore-table=mysql.event"]
+
+    @mock.patch("mysql_clone.build_indexes")
+    @mock.patch("mysql_clone.native_load")
+    @mock.patch("mysql_clone.native_dump")
+    @mock.patch("mysql_clone.fetch_dbs", mock.Mock(return_value=["db1"]))
+    @mock.patch("mysql_clone.mysql_libs.crt_cmd",
+                mock.Mock(return_value=["mysql"]))
+    def test_deferred_indexes(self, mock_dump, mock_load, mock_build):
+
+        """Function:  test_deferred_indexes
+
+        Description:  Test with the secondary indexes built after the load.
+
+        Arguments:
+
+        """
+
+        self.args.args_array.update({"-l": True, "-x": True})
+        mock_dump.side_effect = native_dump
+        mock_load.return_value = (True, {})
+        mock_build.return_value = False
+
+        with gen_libs.no_std_out():
+            status, _ = mysql_clone.native_dump_load(
+                self.source, self.clone, self.args, self.opt_arg_list)
+
+        self.assertFalse(status)
+        self.assertEqual(
+            mock_build.call_args[0][1:],
+            (["ALTER TABLE `db1`.`t1` ADD KEY `a` (`a`)"], 4))
+        self.assertNotIn(
+            "set global gtid_purged = 'uuid:1-10'", self.clone.cmds)
+
+    @mock.patch("mysql_clone.native_load")
+    @mock.patch("mysql_clone.native_dump",
+                mock.Mock(return_value=["USE `db1`"]))
+    @mock.patch("mysql_clone.fetch_dbs", mock.Mock(return_value=["db1"]))
+    @mock.patch("mysql_clone.mysql_libs.crt_cmd",
+                mock.Mock(return_value=["mysql"]))
+    @mock.patch("mysql_clone.subprocess.Popen")
+    def test_native_loader(self, mock_popen, mock_load):
+
+        """Function:  test_native_loader
+
+        Description:  Test with the native loader option.
+
+        Arguments:
+
+        """
+
+        self.args.args_array.update({"-l": True, "-b": "8"})
+        mock_load.return_value = (True, {"`db1`.`t1`": 10})
+
+        with gen_libs.no_std_out():
+            status, _ = mysql_clone.native_dump_load(
+                self.source, self.clone, self.args, self.opt_arg_list)
+
+        self.assertTrue(status)
+        mock_popen.assert_not_called()
+        self.assertEqual(
+            mock_load.call_args[1], {"no_log": True,
+                                     "commit_size": 8 * 1024 * 1024})
+        self.assertIn("commit", self.source.cmds)
+        self.assertIn("set global gtid_purged = 'uuid:1-10'", self.clone.cmds)
+
+    @mock.patch("mysql_clone.native_dump",
+                mock.Mock(return_value=["USE `db1`"]))
+    @mock.patch("mysql_clone.fetch_dbs", mock.Mock(return_value=["db1"]))
+    @mock.patch("mysql_clone.mysql_libs.crt_cmd",
+                mock.Mock(return_value=["mysql"]))
+    @mock.patch("mysql_clone.subprocess.Popen")
+    def test_broken_pipe(self, mock_popen):
+
+        """Function:  test_broken_pipe
+
+        Description:  Test with the load process exiting during the dump.
+
+        Arguments:
+
+        """
+
+        proc = Popen(returncode=1, broken=True)
+        mock_popen.return_value = proc
+
+        with gen_libs.no_std_out():
+            status, _ = mysql_clone.native_dump_load(
+                self.source, self.clone, self.args, self.opt_arg_list)
+
+        self.assertFalse(status)
+        self.assertTrue(proc.killed)
+        self.assertIn("commit", self.source.cmds)
+
+    @mock.patch("mysql_clone.native_dump",
+                mock.Mock(return_value=["USE `db1`"]))
+    @mock.patch("mysql_clone.fetch_dbs", mock.Mock(return_value=["db1"]))
+    @mock.patch("mysql_clone.mysql_libs.crt_cmd",
+                mock.Mock(return_value=["mysql"]))
+    @mock.patch("mysql_clone.subprocess.Popen")
+    def test_load_failed(self, mock_popen):
+
+        """Function:  test_load_failed
+
+        Description:  Test with the load process failing.
+
+        Arguments:
+
+        """
+
+        mock_popen.return_value = Popen(returncode=1)
+
+        with gen_libs.no_std_out():
+            status, _ = mysql_clone.native_dump_load(
+                self.source, self.clone, self.args, self.opt_arg_list)
+
+        self.assertFalse(status)
+        self.assertNotIn(
+            "set global gtid_purged = 'uuid:1-10'", self.clone.cmds)
+
+    @mock.patch("mysql_clone.native_dump",
+                mock.Mock(return_value=["USE `db1`"]))
+    @mock.patch("mysql_clone.fetch_dbs", mock.Mock(return_value=["db1"]))
+    @mock.patch("mysql_clone.mysql_libs.crt_cmd",
+                mock.Mock(return_value=["mysql"]))
+    @mock.patch("mysql_clone.subprocess.Popen")
+    def test_remove_gtid(self, mock_popen):
+
+        """Function:  test_remove_gtid
+
+        Description:  Test with the -r option removing the GTID entries.
+
+        Arguments:
+
+        """
+
+        self.args.args_array["-r"] = True
+        mock_popen.return_value = Popen()
+
+        with gen_libs.no_std_out():
+            status, _ = mysql_clone.native_dump_load(
+                self.source, self.clone, self.args, self.opt_arg_list)
+
+        self.assertTrue(status)
+        self.assertEqual(mock_popen.call_args[0][0], ["mysql"])
+        self.assertNotIn(
+            "set global gtid_purged = 'uuid:1-10'", self.clone.cmds)
+
+    @mock.patch("mysql_clone.native_dump")
+    @mock.patch("mysql_clone.fetch_dbs", mock.Mock(return_value=["db1"]))
+    @mock.patch("mysql_clone.mysql_libs.crt_cmd",
+                mock.Mock(return_value=["mysql"]))
+    @mock.patch("mysql_clone.subprocess.Popen")
+    def test_loaded(self, mock_popen, mock_dump):
+
+        """Function:  test_loaded
+
+        Description:  Test with the databases dumped and loaded.
+
+        Arguments:
+
+        """
+
+        proc = Popen()
+        mock_popen.return_value = proc
+        mock_dump.return_value = ["USE `db1`"]
+
+        with gen_libs.no_std_out():
+            status, coords = mysql_clone.native_dump_load(
+                self.source, self.clone, self.args, self.opt_arg_list)
+
+        self.assertTrue(status)
+        self.assertEqual(coords["file"], "binlog.000001")
+        self.assertTrue(proc.stdin.closed)
+        self.assertLess(
+            self.source.cmds.index("flush tables with read lock"),
+            self.source.cmds.index(
+                "start transaction with consistent snapshot"))
+        self.assertEqual(mock_dump.call_args[0][2], 16 * 1024 * 1024 - 1024)
+        self.assertEqual(
+            mock_dump.call_args[1]["ignore"],
+            ["mysql.general_log", "mysql.slow_log", "mysql.event"])
+        self.assertTrue(mock_dump.call_args[1]["triggers"])
+        self.assertFalse(mock_dump.call_args[1]["routines"])
+        self.assertIsNone(mock_dump.call_args[1]["deferred"])
+        self.assertIn("set global gtid_purged = 'uuid:1-10'", self.clone.cmds)
+
+
+if __name__ == "__main__":
+    unittest.main()
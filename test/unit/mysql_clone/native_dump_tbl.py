@@ -0,0 +1,234 @@
+# Classification (U)
+
+"""Program:  native_dump_tbl.py
+
+    Description:  Unit testing of native_dump_tbl in mysql_clone.py.
+
+    Usage:
+        test/unit/mysql_clone/native_dump_tbl.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_clone                              # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class Server():                                         # pylint:disable=R0903
+
+    """Class:  Server
+
+    Description:  Class stub holder for mysql_class.Server class.
+
+    Methods:
+        __init__
+        col_sql
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.cmds = []
+        self.create = "CREATE TABLE `t1` (`id` int)"
+
+    def col_sql(self, cmd, params=None):
+
+        """Method:  col_sql
+
+        Description:  Method stub holder for mysql_class.Server.col_sql.
+
+        Arguments:
+
+        """
+
+        self.cmds.append((cmd, params))
+
+        if cmd.startswith("show create table"):
+            return [{"Create Table": self.create}]
+
+        return [{"name": "trg1"}]
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_triggers
+        test_no_data
+        test_where
+        test_merge
+        test_create_data
+        test_deferred
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.server = Server()
+        self.create = ["USE `db1`", "DROP TABLE IF EXISTS `t1`",
+                       "CREATE TABLE `t1` (`id` int)"]
+
+    @mock.patch("mysql_clone.crt_obj_stmts",
+                mock.Mock(return_value=["CREATE TRIGGER trg1"]))
+    @mock.patch("mysql_clone.stream_rows", mock.Mock(return_value=[]))
+    @mock.patch("mysql_clone.fetch_cols", mock.Mock(return_value=["id"]))
+    def test_triggers(self):
+
+        """Function:  test_triggers
+
+        Description:  Test with the table's triggers dumped after the data.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            list(mysql_clone.native_dump_tbl(
+                self.server, "db1", "t1", 1024, triggers=True)),
+            self.create + ["CREATE TRIGGER trg1"])
+
+    @mock.patch("mysql_clone.fetch_cols")
+    def test_no_data(self, mock_cols):
+
+        """Function:  test_no_data
+
+        Description:  Test with the table definition only.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            list(mysql_clone.native_dump_tbl(
+                self.server, "db1", "t1", 1024, no_data=True)), self.create)
+        mock_cols.assert_not_called()
+
+    @mock.patch("mysql_clone.stream_rows")
+    @mock.patch("mysql_clone.fetch_cols", mock.Mock(return_value=["id"]))
+    def test_where(self, mock_rows):
+
+        """Function:  test_where
+
+        Description:  Test with a range of rows and no table definition.
+
+        Arguments:
+
+        """
+
+        mock_rows.return_value = [(5,)]
+
+        self.assertEqual(
+            list(mysql_clone.native_dump_tbl(
+                self.server, "db1", "t1", 1024, no_create=True,
+                where="`id` >= 5")),
+            ["USE `db1`", "INSERT INTO `t1` (`id`) VALUES (5)"])
+        self.assertEqual(
+            mock_rows.call_args[0][1],
+            "select `id` from `db1`.`t1` where `id` >= 5")
+
+    @mock.patch("mysql_clone.stream_rows")
+    @mock.patch("mysql_clone.fetch_cols", mock.Mock(return_value=["id"]))
+    def test_merge(self, mock_rows):
+
+        """Function:  test_merge
+
+        Description:  Test with the table kept and its rows merged into the
+            clone's, with the indexes not deferred.
+
+        Arguments:
+
+        """
+
+        mock_rows.return_value = [(1,)]
+        self.server.create = "CREATE TABLE `t1` (\n  `id` int NOT NULL,\n" \
+            "  KEY `a` (`id`)\n) ENGINE=InnoDB"
+        deferred = []
+
+        self.assertEqual(
+            list(mysql_clone.native_dump_tbl(
+                self.server, "db1", "t1", 1024, merge=True,
+                deferred=deferred)),
+            ["USE `db1`",
+             "CREATE TABLE IF NOT EXISTS `t1` (\n  `id` int NOT NULL,\n"
+             "  KEY `a` (`id`)\n) ENGINE=InnoDB",
+             "INSERT IGNORE INTO `t1` (`id`) VALUES (1)"])
+        self.assertEqual(deferred, [])
+
+    @mock.patch("mysql_clone.stream_rows")
+    @mock.patch("mysql_clone.fetch_cols", mock.Mock(return_value=["id"]))
+    def test_create_data(self, mock_rows):
+
+        """Function:  test_create_data
+
+        Description:  Test with the table definition and data.
+
+        Arguments:
+
+        """
+
+        mock_rows.return_value = [(1,), (2,)]
+
+        self.assertEqual(
+            list(mysql_clone.native_dump_tbl(self.server, "db1", "t1", 1024)),
+            self.create + ["INSERT INTO `t1` (`id`) VALUES (1),(2)"])
+
+    @mock.patch("mysql_clone.stream_rows", mock.Mock(return_value=[]))
+    @mock.patch("mysql_clone.fetch_cols", mock.Mock(return_value=["id"]))
+    def test_deferred(self):
+
+        """Function:  test_deferred
+
+        Description:  Test with the secondary indexes deferred.
+
+        Arguments:
+
+        """
+
+        self.server.create = "CREATE TABLE `t1` (\n  `id` int NOT NULL,\n" \
+            "  PRIMARY KEY (`id`),\n  KEY `a` (`id`)\n) ENGINE=InnoDB"
+        deferred = []
+
+        self.assertEqual(
+            list(mysql_clone.native_dump_tbl(
+                self.server, "db1", "t1", 1024, deferred=deferred))[2],
+            "CREATE TABLE `t1` (\n  `id` int NOT NULL,\n"
+            "  PRIMARY KEY (`id`)\n) ENGINE=InnoDB")
+        self.assertEqual(
+            deferred, ["ALTER TABLE `db1`.`t1` ADD KEY `a` (`id`)"])
+
+
+if __name__ == "__main__":
+    unittest.main()
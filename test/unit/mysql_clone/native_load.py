@@ -0,0 +1,359 @@
+# Classification (U)
+
+"""Program:  native_load.py
+
+    Description:  Unit testing of native_load in mysql_clone.py.
+
+    Usage:
+        test/unit/mysql_clone/native_load.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_clone                              # pylint:disable=E0401,C0413
+import lib.gen_libs as gen_libs             # pylint:disable=E0401,C0413,R0402
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class Cursor():
+
+    """Class:  Cursor
+
+    Description:  Class stub holder for a database cursor class.
+
+    Methods:
+        __init__
+        execute
+        fetchone
+        close
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.cmds = []
+        self.rowcount = 0
+        self.closed = False
+        self.fail = "FAIL"
+
+    def execute(self, cmd):
+
+        """Method:  execute
+
+        Description:  Stub holder for execute method.
+
+        Arguments:
+
+        """
+
+        if cmd.startswith(self.fail):
+            raise ValueError("Statement failed")
+
+        self.cmds.append(cmd)
+        self.rowcount = cmd.count("),(") + 1
+
+    def fetchone(self):
+
+        """Method:  fetchone
+
+        Description:  Stub holder for fetchone method.
+
+        Arguments:
+
+        """
+
+        return (1, 1, "utf8mb3", None, "utf8mb3_general_ci", "SYSTEM",
+                "STRICT_TRANS_TABLES", 1)
+
+    def close(self):
+
+        """Method:  close
+
+        Description:  Stub holder for close method.
+
+        Arguments:
+
+        """
+
+        self.closed = True
+
+
+class Conn():
+
+    """Class:  Conn
+
+    Description:  Class stub holder for a database connection class.
+
+    Methods:
+        __init__
+        cursor
+        commit
+        rollback
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.cur = Cursor()
+        self.commits = 0
+        self.rollbacks = 0
+
+    def cursor(self):
+
+        """Method:  cursor
+
+        Description:  Stub holder for cursor method.
+
+        Arguments:
+
+        """
+
+        return self.cur
+
+    def commit(self):
+
+        """Method:  commit
+
+        Description:  Stub holder for commit method.
+
+        Arguments:
+
+        """
+
+        self.commits += 1
+
+    def rollback(self):
+
+        """Method:  rollback
+
+        Description:  Stub holder for rollback method.
+
+        Arguments:
+
+        """
+
+        self.rollbacks += 1
+
+
+class Server():                                         # pylint:disable=R0903
+
+    """Class:  Server
+
+    Description:  Class stub holder for mysql_class.Server class.
+
+    Methods:
+        __init__
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.conn = Conn()
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_failed
+        test_restore_failed
+        test_stream_settings
+        test_header_settings
+        test_no_log
+        test_commit_size
+        test_row_counts
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.clone = Server()
+        self.stmts = [
+            "USE `db1`", "CREATE TABLE `t1` (`id` int)",
+            "INSERT INTO `t1` (`id`) VALUES (1),(2)",
+            "INSERT INTO `t1` (`id`) VALUES (3)",
+            "USE `db2`", "INSERT INTO `t1` (`id`) VALUES (1)"]
+
+    def test_failed(self):
+
+        """Function:  test_failed
+
+        Description:  Test with a statement failing to load.
+
+        Arguments:
+
+        """
+
+        with gen_libs.no_std_out():
+            status, _ = mysql_clone.native_load(
+                self.clone, self.stmts[:3] + ["FAIL"])
+
+        self.assertFalse(status)
+        self.assertEqual(self.clone.conn.rollbacks, 1)
+        self.assertTrue(self.clone.conn.cur.closed)
+
+    def test_restore_failed(self):
+
+        """Function:  test_restore_failed
+
+        Description:  Test with the session settings failing to restore.
+
+        Arguments:
+
+        """
+
+        self.clone.conn.cur.fail = "set session"
+
+        with gen_libs.no_std_out():
+            status, _ = mysql_clone.native_load(
+                self.clone, ["SET UNIQUE_CHECKS = 0"])
+
+        self.assertFalse(status)
+        self.assertTrue(self.clone.conn.cur.closed)
+
+    def test_stream_settings(self):
+
+        """Function:  test_stream_settings
+
+        Description:  Test with only the settings changed by the stream
+            restored.
+
+        Arguments:
+
+        """
+
+        with gen_libs.no_std_out():
+            mysql_clone.native_load(
+                self.clone, ["SET FOREIGN_KEY_CHECKS = 0"] + self.stmts)
+
+        self.assertEqual(
+            self.clone.conn.cur.cmds[-1],
+            "set session foreign_key_checks = 1")
+
+    def test_header_settings(self):
+
+        """Function:  test_header_settings
+
+        Description:  Test with the character sets, time zone and SQL mode
+            set by the stream restored.
+
+        Arguments:
+
+        """
+
+        with gen_libs.no_std_out():
+            mysql_clone.native_load(
+                self.clone, ["SET NAMES utf8mb4", "SET TIME_ZONE = '+00:00'",
+                             "SET SESSION sql_mode = 'NO_AUTO_VALUE_ON_ZERO'"]
+                + self.stmts)
+
+        self.assertEqual(
+            self.clone.conn.cur.cmds[-1],
+            "set session character_set_client = 'utf8mb3',"
+            " character_set_results = NULL,"
+            " collation_connection = 'utf8mb3_general_ci',"
+            " time_zone = 'SYSTEM', sql_mode = 'STRICT_TRANS_TABLES'")
+
+    def test_no_log(self):
+
+        """Function:  test_no_log
+
+        Description:  Test with the load not written to the binary log.
+
+        Arguments:
+
+        """
+
+        with gen_libs.no_std_out():
+            mysql_clone.native_load(self.clone, [], no_log=True)
+
+        self.assertEqual(
+            self.clone.conn.cur.cmds[1:],
+            ["set session sql_log_bin = 0", "set session sql_log_bin = 1"])
+
+    def test_commit_size(self):
+
+        """Function:  test_commit_size
+
+        Description:  Test with inserts grouped into transactions of the
+            commit size.
+
+        Arguments:
+
+        """
+
+        with gen_libs.no_std_out():
+            mysql_clone.native_load(self.clone, self.stmts, commit_size=70)
+
+        self.assertEqual(self.clone.conn.commits, 2)
+
+    def test_row_counts(self):
+
+        """Function:  test_row_counts
+
+        Description:  Test with rows loaded counted per table.
+
+        Arguments:
+
+        """
+
+        with gen_libs.no_std_out():
+            self.assertEqual(
+                mysql_clone.native_load(self.clone, self.stmts),
+                (True, {"`db1`.`t1`": 3, "`db2`.`t1`": 1}))
+
+        self.assertEqual(self.clone.conn.commits, 1)
+        self.assertFalse(any(
+            cmd.startswith("set session") for cmd in self.clone.conn.cur.cmds))
+
+
+if __name__ == "__main__":
+    unittest.main()
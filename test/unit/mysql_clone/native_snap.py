@@ -0,0 +1,220 @@
+# Classification (U)
+
+"""Program:  native_snap.py
+
+    Description:  Unit testing of native_snap in mysql_clone.py.
+
+    Usage:
+        test/unit/mysql_clone/native_snap.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import json
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_clone                              # pylint:disable=E0401,C0413
+import lib.gen_libs as gen_libs             # pylint:disable=E0401,C0413,R0402
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class Server():
+
+    """Class:  Server
+
+    Description:  Class stub holder for mysql_class.Server class.
+
+    Methods:
+        __init__
+        col_sql
+        cmd_sql
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.gtid_mode = True
+        self.sql_user = "user"
+        self.version = (8, 0, 25)
+        self.cmds = []
+        self.positions = [1234]
+
+    def col_sql(self, cmd):
+
+        """Method:  col_sql
+
+        Description:  Method stub holder for mysql_class.Server.col_sql.
+
+        Arguments:
+
+        """
+
+        self.cmds.append(cmd)
+
+        if "log_status" in cmd:
+            return [{"val": json.dumps({
+                "gtid_executed": "uuid:1-10",
+                "binary_log_file": "binlog.000001",
+                "binary_log_position": self.positions.pop(0)
+                if len(self.positions) > 1 else self.positions[0]})}]
+
+        return [{"val": 67108864, "now": "2026-01-01 00:00:00",
+                 "File": "binlog.000001", "Position": 1234,
+                 "Executed_Gtid_Set": "uuid:1-10"}]
+
+    def cmd_sql(self, cmd):
+
+        """Method:  cmd_sql
+
+        Description:  Method stub holder for mysql_class.Server.cmd_sql.
+
+        Arguments:
+
+        """
+
+        self.cmds.append(cmd)
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_not_settled
+        test_backup_lock
+        test_session
+        test_snapshot
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.source = Server()
+
+    def test_not_settled(self):
+
+        """Function:  test_not_settled
+
+        Description:  Test with a write committed while the snapshot was
+            opened under the backup lock.
+
+        Arguments:
+
+        """
+
+        self.source.version = (8, 0, 30)
+        self.source.positions = [1000, 1234, 1234, 1234]
+
+        with gen_libs.no_std_out():
+            coords = mysql_clone.native_snap(self.source)
+
+        self.assertEqual(coords["pos"], 1234)
+        self.assertEqual(self.source.cmds.count("rollback"), 1)
+        self.assertEqual(
+            self.source.cmds.count(
+                "start transaction with consistent snapshot"), 2)
+
+    def test_backup_lock(self):
+
+        """Function:  test_backup_lock
+
+        Description:  Test with the snapshot opened under the backup lock.
+
+        Arguments:
+
+        """
+
+        self.source.version = (8, 0, 30)
+
+        with gen_libs.no_std_out():
+            coords = mysql_clone.native_snap(self.source)
+
+        self.assertEqual(
+            coords, {"file": "binlog.000001", "pos": 1234,
+                     "gtid": "uuid:1-10"})
+        self.assertLess(
+            self.source.cmds.index("lock instance for backup"),
+            self.source.cmds.index(
+                "start transaction with consistent snapshot"))
+        self.assertLess(
+            self.source.cmds.index(
+                "start transaction with consistent snapshot"),
+            self.source.cmds.index("unlock instance"))
+        self.assertNotIn("rollback", self.source.cmds)
+
+    def test_session(self):
+
+        """Function:  test_session
+
+        Description:  Test with the session set up before the snapshot.
+
+        Arguments:
+
+        """
+
+        with gen_libs.no_std_out():
+            mysql_clone.native_snap(self.source)
+
+        self.assertEqual(
+            self.source.cmds[:3],
+            ["set session net_write_timeout = 86400",
+             "set session time_zone = '+00:00'",
+             "set session transaction isolation level repeatable read"])
+
+    def test_snapshot(self):
+
+        """Function:  test_snapshot
+
+        Description:  Test with the snapshot opened under the lock.
+
+        Arguments:
+
+        """
+
+        with gen_libs.no_std_out():
+            coords = mysql_clone.native_snap(self.source)
+
+        self.assertEqual(
+            coords, {"file": "binlog.000001", "pos": 1234,
+                     "gtid": "uuid:1-10"})
+        self.assertLess(
+            self.source.cmds.index("flush tables with read lock"),
+            self.source.cmds.index(
+                "start transaction with consistent snapshot"))
+        self.assertLess(
+            self.source.cmds.index(
+                "start transaction with consistent snapshot"),
+            self.source.cmds.index("unlock tables"))
+
+
+if __name__ == "__main__":
+    unittest.main()
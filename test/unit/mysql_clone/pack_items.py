@@ -0,0 +1,101 @@
+# Classification (U)
+
+"""Program:  pack_items.py
+
+    Description:  Unit testing of pack_items in mysql_clone.py.
+
+    Usage:
+        test/unit/mysql_clone/pack_items.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_clone                              # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_no_items
+        test_oversized_item
+        test_first_fit_decreasing
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.items = [{"name": "a", "size": 30}, {"name": "b", "size": 70},
+                      {"name": "c", "size": 50}, {"name": "d", "size": 40},
+                      {"name": "e", "size": 10}]
+
+    def test_no_items(self):
+
+        """Function:  test_no_items
+
+        Description:  Test with no items to pack.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(mysql_clone.pack_items([], 100), [])
+
+    def test_oversized_item(self):
+
+        """Function:  test_oversized_item
+
+        Description:  Test with an item larger than the bin size.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            mysql_clone.pack_items([{"name": "a", "size": 500}], 100),
+            [[{"name": "a", "size": 500}]])
+
+    def test_first_fit_decreasing(self):
+
+        """Function:  test_first_fit_decreasing
+
+        Description:  Test with items packed first fit decreasing.
+
+        Arguments:
+
+        """
+
+        bins = mysql_clone.pack_items(self.items, 100)
+
+        self.assertEqual(
+            [[item["name"] for item in pbin] for pbin in bins],
+            [["b", "a"], ["c", "d", "e"]])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,430 @@
+# Classification (U)
+
+"""Program:  par_dump_load.py
+
+    Description:  Unit testing of par_dump_load in mysql_clone.py.
+
+    Usage:
+        test/unit/mysql_clone/par_dump_load.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_clone                              # pylint:disable=E0401,C0413
+import lib.gen_libs as gen_libs             # pylint:disable=E0401,C0413,R0402
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class ArgParser():
+
+    """Class:  ArgParser
+
+    Description:  Class stub holder for gen_class.ArgParser class.
+
+    Methods:
+        __init__
+        arg_exist
+        get_val
+        arg_set_path
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.cmdline = None
+        self.args_array = {"-n": True, "-j": "2"}
+
+    def arg_exist(self, arg):
+
+        """Method:  arg_exist
+
+        Description:  Method stub holder for gen_class.ArgParser.arg_exist.
+
+        Arguments:
+
+        """
+
+        return arg in self.args_array
+
+    def get_val(self, skey, def_val=None):
+
+        """Method:  get_val
+
+        Description:  Method stub holder for gen_class.ArgParser.get_val.
+
+        Arguments:
+
+        """
+
+        return self.args_array.get(skey, def_val)
+
+    def arg_set_path(self, arg_opt, **kwargs):
+
+        """Method:  arg_set_path
+
+        Description:  Method stub holder for gen_class.ArgParser.arg_set_path.
+
+        Arguments:
+
+        """
+
+        return os.path.join(
+            self.args_array[arg_opt] if arg_opt in self.args_array else "",
+            kwargs.get("cmd", ""))
+
+
+class Popen():                                          # pylint:disable=R0903
+
+    """Class:  Popen
+
+    Description:  Class stub holder for subprocess.Popen class.
+
+    Methods:
+        __init__
+        kill
+        wait
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.killed = False
+        self.pid = 4321
+
+    def kill(self):
+
+        """Method:  kill
+
+        Description:  Kill function.
+
+        Arguments:
+
+        """
+
+        self.killed = True
+
+    def wait(self):
+
+        """Method:  wait
+
+        Description:  Wait function.
+
+        Arguments:
+
+        """
+
+        return True
+
+
+class Server():
+
+    """Class:  Server
+
+    Description:  Class stub holder for mysql_class.Server class.
+
+    Methods:
+        __init__
+        col_sql
+        cmd_sql
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.gtid_mode = True
+        self.sql_user = "user"
+        self.version = (8, 0, 25)
+        self.cmds = []
+
+    def col_sql(self, cmd):
+
+        """Method:  col_sql
+
+        Description:  Method stub holder for mysql_class.Server.col_sql.
+
+        Arguments:
+
+        """
+
+        self.cmds.append(cmd)
+
+        return [{"val": 60, "now": "2026-01-01 00:00:00",
+                 "File": "binlog.000001", "Position": 1234,
+                 "Executed_Gtid_Set": "uuid:1-10"}]
+
+    def cmd_sql(self, cmd):
+
+        """Method:  cmd_sql
+
+        Description:  Method stub holder for mysql_class.Server.cmd_sql.
+
+        Arguments:
+
+        """
+
+        self.cmds.append(cmd)
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_no_snapshot
+        test_task_failed
+        test_no_gtid
+        test_remove_gtid
+        test_all_loaded
+        test_phases
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.source = Server()
+        self.clone = Server()
+        self.args = ArgParser()
+        self.opt_arg_list = ["--single-transaction", "--all-databases"]
+        self.err_file = "ErrFile"
+        self.procs = [Popen(), Popen()]
+
+    @mock.patch("mysql_clone.wait_snap", mock.Mock(return_value=False))
+    @mock.patch("mysql_clone.free_conns", mock.Mock(return_value=10))
+    @mock.patch("mysql_clone.crt_task_cmd", mock.Mock(return_value=["cmd"]))
+    @mock.patch("mysql_clone.mysql_libs.crt_cmd",
+                mock.Mock(return_value=["mysql"]))
+    @mock.patch("mysql_clone.crt_tasks", mock.Mock(return_value=[
+        {"name": "a", "dbs": ["a"], "phase": 2, "size": 20},
+        {"name": "b", "dbs": ["b"], "phase": 2, "size": 10}]))
+    @mock.patch("mysql_clone.subprocess.Popen")
+    def test_no_snapshot(self, mock_popen):
+
+        """Function:  test_no_snapshot
+
+        Description:  Test with dump sessions not opening a snapshot.
+
+        Arguments:
+
+        """
+
+        mock_popen.side_effect = self.procs
+
+        with gen_libs.no_std_out():
+            self.assertEqual(
+                mysql_clone.par_dump_load(
+                    self.source, self.clone, self.args, self.opt_arg_list,
+                    self.err_file), (False, {}))
+
+        self.assertTrue(self.procs[0].killed)
+        self.assertIn("unlock tables", self.source.cmds)
+
+    @mock.patch("mysql_clone.load_task", mock.Mock(side_effect=[True, False]))
+    @mock.patch("mysql_clone.wait_snap", mock.Mock(return_value=True))
+    @mock.patch("mysql_clone.free_conns", mock.Mock(return_value=10))
+    @mock.patch("mysql_clone.crt_task_cmd", mock.Mock(return_value=["cmd"]))
+    @mock.patch("mysql_clone.mysql_libs.crt_cmd",
+                mock.Mock(return_value=["mysql"]))
+    @mock.patch("mysql_clone.crt_tasks", mock.Mock(return_value=[
+        {"name": "a", "dbs": ["a"], "phase": 2, "size": 20},
+        {"name": "b", "dbs": ["b"], "phase": 2, "size": 10}]))
+    @mock.patch("mysql_clone.subprocess.Popen")
+    def test_task_failed(self, mock_popen):
+
+        """Function:  test_task_failed
+
+        Description:  Test with a task failing to load.
+
+        Arguments:
+
+        """
+
+        mock_popen.side_effect = self.procs
+
+        with gen_libs.no_std_out():
+            status, _ = mysql_clone.par_dump_load(
+                self.source, self.clone, self.args, self.opt_arg_list,
+                self.err_file)
+
+        self.assertFalse(status)
+        self.assertEqual(self.clone.cmds, [])
+
+    @mock.patch("mysql_clone.load_task", mock.Mock(return_value=True))
+    @mock.patch("mysql_clone.wait_snap", mock.Mock(return_value=True))
+    @mock.patch("mysql_clone.free_conns", mock.Mock(return_value=10))
+    @mock.patch("mysql_clone.crt_task_cmd", mock.Mock(return_value=["cmd"]))
+    @mock.patch("mysql_clone.mysql_libs.crt_cmd",
+                mock.Mock(return_value=["mysql"]))
+    @mock.patch("mysql_clone.crt_tasks", mock.Mock(return_value=[
+        {"name": "a", "dbs": ["a"], "phase": 2, "size": 20},
+        {"name": "b", "dbs": ["b"], "phase": 2, "size": 10}]))
+    @mock.patch("mysql_clone.subprocess.Popen")
+    def test_no_gtid(self, mock_popen):
+
+        """Function:  test_no_gtid
+
+        Description:  Test with GTID mode off on the clone.
+
+        Arguments:
+
+        """
+
+        self.clone.gtid_mode = False
+        mock_popen.side_effect = self.procs
+
+        with gen_libs.no_std_out():
+            status, coords = mysql_clone.par_dump_load(
+                self.source, self.clone, self.args, self.opt_arg_list,
+                self.err_file)
+
+        self.assertTrue(status)
+        self.assertEqual(coords["file"], "binlog.000001")
+        self.assertEqual(self.clone.cmds, [])
+
+    @mock.patch("mysql_clone.load_task", mock.Mock(return_value=True))
+    @mock.patch("mysql_clone.wait_snap", mock.Mock(return_value=True))
+    @mock.patch("mysql_clone.free_conns", mock.Mock(return_value=10))
+    @mock.patch("mysql_clone.crt_task_cmd", mock.Mock(return_value=["cmd"]))
+    @mock.patch("mysql_clone.mysql_libs.crt_cmd",
+                mock.Mock(return_value=["mysql"]))
+    @mock.patch("mysql_clone.crt_tasks", mock.Mock(return_value=[
+        {"name": "a", "dbs": ["a"], "phase": 2, "size": 20},
+        {"name": "b", "dbs": ["b"], "phase": 2, "size": 10}]))
+    @mock.patch("mysql_clone.subprocess.Popen")
+    def test_remove_gtid(self, mock_popen):
+
+        """Function:  test_remove_gtid
+
+        Description:  Test with the -r option removing the GTID entries.
+
+        Arguments:
+
+        """
+
+        self.args.args_array["-r"] = True
+        mock_popen.side_effect = self.procs
+
+        with gen_libs.no_std_out():
+            status, coords = mysql_clone.par_dump_load(
+                self.source, self.clone, self.args, self.opt_arg_list,
+                self.err_file)
+
+        self.assertTrue(status)
+        self.assertEqual(coords["file"], "binlog.000001")
+        self.assertEqual(self.clone.cmds, [])
+
+    @mock.patch("mysql_clone.load_task", mock.Mock(return_value=True))
+    @mock.patch("mysql_clone.wait_snap", mock.Mock(return_value=True))
+    @mock.patch("mysql_clone.free_conns", mock.Mock(return_value=10))
+    @mock.patch("mysql_clone.crt_task_cmd", mock.Mock(return_value=["cmd"]))
+    @mock.patch("mysql_clone.mysql_libs.crt_cmd",
+                mock.Mock(return_value=["mysql"]))
+    @mock.patch("mysql_clone.crt_tasks", mock.Mock(return_value=[
+        {"name": "a", "dbs": ["a"], "phase": 2, "size": 20},
+        {"name": "b", "dbs": ["b"], "phase": 2, "size": 10}]))
+    @mock.patch("mysql_clone.subprocess.Popen")
+    def test_all_loaded(self, mock_popen):
+
+        """Function:  test_all_loaded
+
+        Description:  Test with all tasks loaded.
+
+        Arguments:
+
+        """
+
+        mock_popen.side_effect = self.procs
+
+        with gen_libs.no_std_out():
+            status, coords = mysql_clone.par_dump_load(
+                self.source, self.clone, self.args, self.opt_arg_list,
+                self.err_file)
+
+        self.assertTrue(status)
+        self.assertEqual(coords["file"], "binlog.000001")
+        self.assertEqual(
+            self.clone.cmds, ["set global gtid_purged = 'uuid:1-10'"])
+
+    @mock.patch("mysql_clone.load_task")
+    @mock.patch("mysql_clone.wait_snap", mock.Mock(return_value=True))
+    @mock.patch("mysql_clone.free_conns", mock.Mock(return_value=10))
+    @mock.patch("mysql_clone.crt_task_cmd", mock.Mock(return_value=["cmd"]))
+    @mock.patch("mysql_clone.mysql_libs.crt_cmd",
+                mock.Mock(return_value=["mysql"]))
+    @mock.patch("mysql_clone.crt_tasks")
+    @mock.patch("mysql_clone.subprocess.Popen")
+    def test_phases(self, mock_popen, mock_tasks, mock_load):
+
+        """Function:  test_phases
+
+        Description:  Test with tasks loaded in order of phases.
+
+        Arguments:
+
+        """
+
+        mock_popen.side_effect = [Popen(), Popen(), Popen()]
+        mock_tasks.return_value = [
+            {"name": "a:triggers", "phase": 3}, {"name": "a:data", "phase": 2},
+            {"name": "a:schema", "phase": 1}]
+        mock_load.return_value = True
+
+        with gen_libs.no_std_out():
+            mysql_clone.par_dump_load(
+                self.source, self.clone, self.args, self.opt_arg_list,
+                self.err_file)
+
+        self.assertEqual(
+            [call[0][2]["name"] for call in mock_load.call_args_list],
+            ["a:schema", "a:data", "a:triggers"])
+
+
+if __name__ == "__main__":
+    unittest.main()
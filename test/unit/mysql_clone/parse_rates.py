@@ -0,0 +1,109 @@
+# Classification (U)
+
+"""Program:  parse_rates.py
+
+    Description:  Unit testing of parse_rates in mysql_clone.py.
+
+    Usage:
+        test/unit/mysql_clone/parse_rates.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_clone                              # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        test_negative_rate
+        test_too_many_rates
+        test_rows_only
+        test_both_rates
+        test_mb_rate
+
+    """
+
+    def test_negative_rate(self):
+
+        """Function:  test_negative_rate
+
+        Description:  Test with a negative rate.
+
+        Arguments:
+
+        """
+
+        with self.assertRaises(ValueError):
+            mysql_clone.parse_rates("-5")
+
+    def test_too_many_rates(self):
+
+        """Function:  test_too_many_rates
+
+        Description:  Test with more than two rates.
+
+        Arguments:
+
+        """
+
+        with self.assertRaises(ValueError):
+            mysql_clone.parse_rates("5,10,15")
+
+    def test_rows_only(self):
+
+        """Function:  test_rows_only
+
+        Description:  Test with only the rows a second limited.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(mysql_clone.parse_rates(",20000"), (0.0, 20000.0))
+
+    def test_both_rates(self):
+
+        """Function:  test_both_rates
+
+        Description:  Test with megabytes and rows a second.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            mysql_clone.parse_rates("50,20000\n"), (50.0, 20000.0))
+
+    def test_mb_rate(self):
+
+        """Function:  test_mb_rate
+
+        Description:  Test with only megabytes a second.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(mysql_clone.parse_rates("12.5"), (12.5, 0.0))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,109 @@
+# Classification (U)
+
+"""Program:  parse_rsc_grp.py
+
+    Description:  Unit testing of parse_rsc_grp in mysql_clone.py.
+
+    Usage:
+        test/unit/mysql_clone/parse_rsc_grp.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_clone                              # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        test_bad_priority
+        test_bad_cpus
+        test_priority_only
+        test_cpus_only
+        test_cpus_priority
+
+    """
+
+    def test_bad_priority(self):
+
+        """Function:  test_bad_priority
+
+        Description:  Test with a thread priority out of range.
+
+        Arguments:
+
+        """
+
+        self.assertRaises(ValueError, mysql_clone.parse_rsc_grp, "2-3:20")
+        self.assertRaises(ValueError, mysql_clone.parse_rsc_grp, "2-3:-1")
+
+    def test_bad_cpus(self):
+
+        """Function:  test_bad_cpus
+
+        Description:  Test with an invalid CPU list.
+
+        Arguments:
+
+        """
+
+        self.assertRaises(ValueError, mysql_clone.parse_rsc_grp, "2-")
+        self.assertRaises(ValueError, mysql_clone.parse_rsc_grp, "2;drop")
+
+    def test_priority_only(self):
+
+        """Function:  test_priority_only
+
+        Description:  Test with a thread priority and all CPUs.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(mysql_clone.parse_rsc_grp(":10"), ("", 10))
+
+    def test_cpus_only(self):
+
+        """Function:  test_cpus_only
+
+        Description:  Test with a CPU list and the default priority.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(mysql_clone.parse_rsc_grp("2-3"), ("2-3", 19))
+
+    def test_cpus_priority(self):
+
+        """Function:  test_cpus_priority
+
+        Description:  Test with a CPU list and a thread priority.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            mysql_clone.parse_rsc_grp("2-3,6:0"), ("2-3,6", 0))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,221 @@
+# Classification (U)
+
+"""Program:  phys_clone.py
+
+    Description:  Unit testing of phys_clone in mysql_clone.py.
+
+    Usage:
+        test/unit/mysql_clone/phys_clone.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_clone                              # pylint:disable=E0401,C0413
+import lib.gen_libs as gen_libs             # pylint:disable=E0401,C0413,R0402
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class Server():                                         # pylint:disable=R0903
+
+    """Class:  Server
+
+    Description:  Class stub holder for mysql_class.Server class.
+
+    Methods:
+        __init__
+        cmd_sql
+
+    """
+
+    def __init__(self, name):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.name = name
+        self.sql_user = "user"
+        self.sql_pass = "japd"
+        self.host = "10.0.0.1"
+        self.port = 3306
+        self.cmds = []
+        self.err = None
+
+    def cmd_sql(self, cmd):
+
+        """Method:  cmd_sql
+
+        Description:  Method stub holder for mysql_class.Server.cmd_sql.
+
+        Arguments:
+
+        """
+
+        self.cmds.append(cmd)
+
+        if self.err and cmd.startswith("clone instance"):
+            raise ValueError(self.err)
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_no_plugin
+        test_clone_failed
+        test_completed_error
+        test_restarted
+        test_cloned
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.source = Server("source")
+        self.clone = Server("clone")
+        self.stat = {"state": "Completed", "error_no": 0,
+                     "binlog_file": "binlog.000002", "binlog_position": 156,
+                     "gtid_executed": "uuid:1-10,\nuuid2:1-5"}
+
+    @mock.patch("mysql_clone.chk_clone_plugin")
+    def test_no_plugin(self, mock_plugin):
+
+        """Function:  test_no_plugin
+
+        Description:  Test with the clone plugin not active on the clone.
+
+        Arguments:
+
+        """
+
+        mock_plugin.side_effect = [True, False]
+
+        with gen_libs.no_std_out():
+            self.assertEqual(
+                mysql_clone.phys_clone(self.source, self.clone), (False, {}))
+
+        self.assertEqual(self.clone.cmds, [])
+
+    @mock.patch("mysql_clone.wait_clone")
+    @mock.patch("mysql_clone.clone_stat", mock.Mock(return_value={}))
+    @mock.patch("mysql_clone.chk_clone_plugin", mock.Mock(return_value=True))
+    def test_clone_failed(self, mock_wait):
+
+        """Function:  test_clone_failed
+
+        Description:  Test with the clone operation failing.
+
+        Arguments:
+
+        """
+
+        mock_wait.return_value = {
+            "state": "Failed", "error_no": 3862,
+            "error_message": "Clone Donor Error"}
+
+        with gen_libs.no_std_out():
+            self.assertEqual(
+                mysql_clone.phys_clone(self.source, self.clone), (False, {}))
+
+    @mock.patch("mysql_clone.wait_clone")
+    @mock.patch("mysql_clone.clone_stat", mock.Mock(return_value={}))
+    @mock.patch("mysql_clone.chk_clone_plugin", mock.Mock(return_value=True))
+    def test_completed_error(self, mock_wait):
+
+        """Function:  test_completed_error
+
+        Description:  Test with the copy completed but an error reported.
+
+        Arguments:
+
+        """
+
+        self.stat.update({
+            "error_no": 3707,
+            "error_message": "Restart server failed (mysqld is not managed by"
+                             " supervisor process)."})
+        mock_wait.return_value = self.stat
+
+        with gen_libs.no_std_out():
+            self.assertEqual(
+                mysql_clone.phys_clone(self.source, self.clone), (False, {}))
+
+    @mock.patch("mysql_clone.wait_clone")
+    @mock.patch("mysql_clone.clone_stat", mock.Mock(return_value={}))
+    @mock.patch("mysql_clone.chk_clone_plugin", mock.Mock(return_value=True))
+    def test_restarted(self, mock_wait):
+
+        """Function:  test_restarted
+
+        Description:  Test with the connection dropped by the restart.
+
+        Arguments:
+
+        """
+
+        self.clone.err = "Lost connection to MySQL server during query"
+        mock_wait.return_value = self.stat
+
+        status, _ = mysql_clone.phys_clone(self.source, self.clone)
+
+        self.assertTrue(status)
+
+    @mock.patch("mysql_clone.wait_clone")
+    @mock.patch("mysql_clone.clone_stat")
+    @mock.patch("mysql_clone.chk_clone_plugin", mock.Mock(return_value=True))
+    def test_cloned(self, mock_stat, mock_wait):
+
+        """Function:  test_cloned
+
+        Description:  Test with the instance cloned.
+
+        Arguments:
+
+        """
+
+        mock_stat.return_value = {"begin_time": "2026-01-01 00:00:00"}
+        mock_wait.return_value = self.stat
+
+        self.assertEqual(
+            mysql_clone.phys_clone(self.source, self.clone),
+            (True, {"file": "binlog.000002", "pos": 156,
+                    "gtid": "uuid:1-10,uuid2:1-5"}))
+        self.assertEqual(
+            self.clone.cmds,
+            ["set global clone_valid_donor_list = '10.0.0.1:3306'",
+             "clone instance from 'user'@'10.0.0.1':3306"
+             " identified by 'japd'"])
+        self.assertEqual(mock_wait.call_args[0][1], "2026-01-01 00:00:00")
+
+
+if __name__ == "__main__":
+    unittest.main()
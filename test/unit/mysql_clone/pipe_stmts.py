@@ -0,0 +1,244 @@
+# Classification (U)
+
+"""Program:  pipe_stmts.py
+
+    Description:  Unit testing of pipe_stmts in mysql_clone.py.
+
+    Usage:
+        test/unit/mysql_clone/pipe_stmts.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import io
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_clone                              # pylint:disable=E0401,C0413
+import lib.gen_libs as gen_libs             # pylint:disable=E0401,C0413,R0402
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class Stdin(io.StringIO):
+
+    """Class:  Stdin
+
+    Description:  Class stub holder for a process stdin pipe.
+
+    Methods:
+        __init__
+        write
+
+    """
+
+    def __init__(self, broken=False):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        super().__init__()
+        self.broken = broken
+
+    def write(self, data):
+
+        """Method:  write
+
+        Description:  Stub holder for write method.
+
+        Arguments:
+
+        """
+
+        if self.broken:
+            raise BrokenPipeError
+
+        return super().write(data)
+
+
+class Popen():
+
+    """Class:  Popen
+
+    Description:  Class stub holder for subprocess.Popen class.
+
+    Methods:
+        __init__
+        kill
+        wait
+
+    """
+
+    def __init__(self, returncode=0, broken=False):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.stdin = Stdin(broken=broken)
+        self.returncode = returncode
+        self.killed = False
+
+    def kill(self):
+
+        """Method:  kill
+
+        Description:  Kill function.
+
+        Arguments:
+
+        """
+
+        self.killed = True
+
+    def wait(self):
+
+        """Method:  wait
+
+        Description:  Wait function.
+
+        Arguments:
+
+        """
+
+        return self.returncode
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        failed_dump
+        test_broken_pipe
+        test_dump_failed
+        test_load_failed
+        test_loaded
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.load_cmd = ["mysql", "-u", "user"]
+        self.stmts = ["USE `db1`"]
+
+    def failed_dump(self):
+
+        """Function:  failed_dump
+
+        Description:  Yield the statements and fail the dump.
+
+        Arguments:
+
+        """
+
+        yield from self.stmts
+        raise ValueError("No definition returned")
+
+    @mock.patch("mysql_clone.subprocess.Popen")
+    def test_broken_pipe(self, mock_popen):
+
+        """Function:  test_broken_pipe
+
+        Description:  Test with the load process exiting during the write.
+
+        Arguments:
+
+        """
+
+        proc = Popen(returncode=1, broken=True)
+        mock_popen.return_value = proc
+
+        with gen_libs.no_std_out():
+            self.assertFalse(
+                mysql_clone.pipe_stmts(self.load_cmd, self.stmts))
+
+        self.assertTrue(proc.killed)
+
+    @mock.patch("mysql_clone.subprocess.Popen")
+    def test_dump_failed(self, mock_popen):
+
+        """Function:  test_dump_failed
+
+        Description:  Test with the dump failing during the write.
+
+        Arguments:
+
+        """
+
+        proc = Popen()
+        mock_popen.return_value = proc
+
+        with gen_libs.no_std_out():
+            self.assertFalse(
+                mysql_clone.pipe_stmts(self.load_cmd, self.failed_dump()))
+
+        self.assertTrue(proc.killed)
+
+    @mock.patch("mysql_clone.subprocess.Popen")
+    def test_load_failed(self, mock_popen):
+
+        """Function:  test_load_failed
+
+        Description:  Test with the load process failing.
+
+        Arguments:
+
+        """
+
+        mock_popen.return_value = Popen(returncode=1)
+
+        with gen_libs.no_std_out():
+            self.assertFalse(
+                mysql_clone.pipe_stmts(self.load_cmd, self.stmts))
+
+    @mock.patch("mysql_clone.subprocess.Popen")
+    def test_loaded(self, mock_popen):
+
+        """Function:  test_loaded
+
+        Description:  Test with the statements loaded.
+
+        Arguments:
+
+        """
+
+        proc = Popen()
+        mock_popen.return_value = proc
+
+        self.assertTrue(mysql_clone.pipe_stmts(self.load_cmd, self.stmts))
+        self.assertTrue(proc.stdin.closed)
+        self.assertFalse(proc.killed)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,139 @@
+# Classification (U)
+
+"""Program:  pool_relay.py
+
+    Description:  Unit testing of pool_relay in mysql_clone.py.
+
+    Usage:
+        test/unit/mysql_clone/pool_relay.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import os
+import errno
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_clone                              # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        tearDown
+        test_read_error
+        test_empty_stream
+        test_pool_relay
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.data = b"insert data" * 100
+        self.src, self.src_w = os.pipe()
+        self.dst_r, self.dst = os.pipe()
+        self.pool = mysql_clone.BufPool(count=2, size=64)
+        self.ticks = []
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Clean up of unit testing.
+
+        Arguments:
+
+        """
+
+        for fdesc in [self.src, self.src_w, self.dst_r, self.dst]:
+            try:
+                os.close(fdesc)
+
+            except OSError:
+                pass
+
+    @mock.patch("mysql_clone.os.readv")
+    def test_read_error(self, mock_readv):
+
+        """Function:  test_read_error
+
+        Description:  Test with the read failing.
+
+        Arguments:
+
+        """
+
+        mock_readv.side_effect = OSError(errno.EIO, "I/O error")
+
+        with self.assertRaises(OSError):
+            mysql_clone.pool_relay(
+                self.src, self.dst, self.pool, self.ticks.append)
+
+        self.assertEqual(self.pool.free.qsize(), 2)
+
+    def test_empty_stream(self):
+
+        """Function:  test_empty_stream
+
+        Description:  Test with an empty stream.
+
+        Arguments:
+
+        """
+
+        os.close(self.src_w)
+
+        self.assertEqual(
+            mysql_clone.pool_relay(
+                self.src, self.dst, self.pool, self.ticks.append), 0)
+        self.assertEqual(self.ticks, [])
+
+    def test_pool_relay(self):
+
+        """Function:  test_pool_relay
+
+        Description:  Test with a stream copied through the buffers.
+
+        Arguments:
+
+        """
+
+        os.write(self.src_w, self.data)
+        os.close(self.src_w)
+
+        self.assertEqual(
+            mysql_clone.pool_relay(
+                self.src, self.dst, self.pool, self.ticks.append),
+            len(self.data))
+        self.assertEqual(os.read(self.dst_r, 4096), self.data)
+        self.assertEqual(max(self.ticks), 64)
+        self.assertEqual(self.pool.free.qsize(), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,145 @@
+# Classification (U)
+
+"""Program:  range_rows.py
+
+    Description:  Unit testing of range_rows in mysql_clone.py.
+
+    Usage:
+        test/unit/mysql_clone/range_rows.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import datetime
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_clone                              # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class Server():                                         # pylint:disable=R0903
+
+    """Class:  Server
+
+    Description:  Class stub holder for mysql_class.Server class.
+
+    Methods:
+        __init__
+        col_sql
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.cmd = None
+        self.rows = 1200
+
+    def col_sql(self, cmd):
+
+        """Method:  col_sql
+
+        Description:  Method stub holder for mysql_class.Server.col_sql.
+
+        Arguments:
+
+        """
+
+        self.cmd = cmd
+
+        return [{"rows": self.rows}]
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_no_estimate
+        test_temporal
+        test_estimate
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.server = Server()
+        self.tbl = {"db": "db1", "tbl": "t1", "col": "id"}
+
+    def test_no_estimate(self):
+
+        """Function:  test_no_estimate
+
+        Description:  Test with no estimate from the optimizer.
+
+        Arguments:
+
+        """
+
+        self.server.rows = None
+
+        self.assertEqual(mysql_clone.range_rows(self.server, self.tbl, 5), 0)
+
+    def test_temporal(self):
+
+        """Function:  test_temporal
+
+        Description:  Test with a temporal key value.
+
+        Arguments:
+
+        """
+
+        mysql_clone.range_rows(
+            self.server, self.tbl, datetime.date(2026, 1, 2))
+
+        self.assertTrue(self.server.cmd.endswith("`id` < '2026-01-02'"))
+
+    def test_estimate(self):
+
+        """Function:  test_estimate
+
+        Description:  Test with the estimate from a primary key range.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            mysql_clone.range_rows(self.server, self.tbl, 5), 1200)
+        self.assertEqual(
+            self.server.cmd,
+            "explain select 1 from `db1`.`t1` force index (primary)"
+            " where `id` < 5")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,118 @@
+# Classification (U)
+
+"""Program:  read_frames.py
+
+    Description:  Unit testing of read_frames in mysql_clone.py.
+
+    Usage:
+        test/unit/mysql_clone/read_frames.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import io
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_clone                              # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_bad_checksum
+        test_truncated_frame
+        test_truncated_header
+        test_round_trip
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.blocks = [b"INSERT INTO `t1` VALUES (1);\n" * 50,
+                       b"INSERT INTO `t2` VALUES (2);\n" * 50]
+        self.frames = b"".join(
+            mysql_clone.compress_block(block, 6) for block in self.blocks)
+
+    def test_bad_checksum(self):
+
+        """Function:  test_bad_checksum
+
+        Description:  Test with a block not matching its checksum.
+
+        Arguments:
+
+        """
+
+        frame = bytearray(self.frames)
+        frame[4] ^= 0xFF
+
+        with self.assertRaises(ValueError):
+            list(mysql_clone.read_frames(io.BytesIO(bytes(frame))))
+
+    def test_truncated_frame(self):
+
+        """Function:  test_truncated_frame
+
+        Description:  Test with a stream ending within a frame.
+
+        Arguments:
+
+        """
+
+        with self.assertRaises(ValueError):
+            list(mysql_clone.read_frames(io.BytesIO(self.frames[:-5])))
+
+    def test_truncated_header(self):
+
+        """Function:  test_truncated_header
+
+        Description:  Test with a stream ending within a frame header.
+
+        Arguments:
+
+        """
+
+        with self.assertRaises(ValueError):
+            list(mysql_clone.read_frames(io.BytesIO(self.frames[:3])))
+
+    def test_round_trip(self):
+
+        """Function:  test_round_trip
+
+        Description:  Test with the blocks decompressed in order.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            list(mysql_clone.read_frames(io.BytesIO(self.frames))),
+            self.blocks)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,102 @@
+# Classification (U)
+
+"""Program:  read_secret.py
+
+    Description:  Unit testing of read_secret in mysql_clone.py.
+
+    Usage:
+        test/unit/mysql_clone/read_secret.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import tempfile
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_clone                              # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        tearDown
+        test_empty
+        test_secret
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.tmp = tempfile.TemporaryDirectory()
+        self.fname = os.path.join(self.tmp.name, "secret")
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Clean up of unit testing.
+
+        Arguments:
+
+        """
+
+        self.tmp.cleanup()
+
+    def test_empty(self):
+
+        """Function:  test_empty
+
+        Description:  Test with an empty secret file.
+
+        Arguments:
+
+        """
+
+        with open(self.fname, mode="w", encoding="UTF-8") as fhdr:
+            fhdr.write("\n")
+
+        with self.assertRaises(ValueError):
+            mysql_clone.read_secret(self.fname)
+
+    def test_secret(self):
+
+        """Function:  test_secret
+
+        Description:  Test with the secret read without its line end.
+
+        Arguments:
+
+        """
+
+        with open(self.fname, mode="w", encoding="UTF-8") as fhdr:
+            fhdr.write("s3cret\n")
+
+        self.assertEqual(mysql_clone.read_secret(self.fname), b"s3cret")
+
+
+if __name__ == "__main__":
+    unittest.main()
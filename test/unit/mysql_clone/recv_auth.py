@@ -0,0 +1,147 @@
+# Classification (U)
+
+"""Program:  recv_auth.py
+
+    Description:  Unit testing of recv_auth in mysql_clone.py.
+
+    Usage:
+        test/unit/mysql_clone/recv_auth.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import socket
+import threading
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_clone                              # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        tearDown
+        agent
+        test_no_challenge
+        test_wrong_answer
+        test_auth
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.sock, self.peer = socket.socketpair()
+        self.nonce = b"n" * 32
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Clean up of unit testing.
+
+        Arguments:
+
+        """
+
+        self.sock.close()
+        self.peer.close()
+
+    def agent(self):
+
+        """Function:  agent
+
+        Description:  Check the receiver's answer and answer its challenge
+            as the agent.
+
+        Arguments:
+
+        """
+
+        payload = mysql_clone.recv_msg(self.peer)[2]
+
+        if payload[32:] == mysql_clone.auth_digest(
+                b"secret", "receiver", self.nonce, payload[:32]):
+            mysql_clone.send_msg(
+                self.peer, threading.Lock(), 0, mysql_clone.MSG_AUTH,
+                mysql_clone.auth_digest(
+                    b"secret", "agent", payload[:32], self.nonce))
+
+        else:
+            self.peer.shutdown(socket.SHUT_RDWR)
+
+    def test_no_challenge(self):
+
+        """Function:  test_no_challenge
+
+        Description:  Test with another message in place of the challenge.
+
+        Arguments:
+
+        """
+
+        self.peer.sendall(
+            mysql_clone.MSG.pack(0, mysql_clone.MSG_META, 2) + b"{}")
+
+        self.assertFalse(mysql_clone.recv_auth(self.sock, b"secret"))
+
+    def test_wrong_answer(self):
+
+        """Function:  test_wrong_answer
+
+        Description:  Test with the agent answering with a wrong digest.
+
+        Arguments:
+
+        """
+
+        self.peer.sendall(
+            mysql_clone.MSG.pack(0, mysql_clone.MSG_AUTH, 32) + self.nonce
+            + mysql_clone.MSG.pack(0, mysql_clone.MSG_AUTH, 32) + b"x" * 32)
+
+        self.assertFalse(mysql_clone.recv_auth(self.sock, b"secret"))
+
+    def test_auth(self):
+
+        """Function:  test_auth
+
+        Description:  Test with the agent answering the receiver's challenge.
+
+        Arguments:
+
+        """
+
+        self.peer.sendall(
+            mysql_clone.MSG.pack(0, mysql_clone.MSG_AUTH, 32) + self.nonce)
+        thr = threading.Thread(target=self.agent)
+        thr.start()
+
+        self.assertTrue(mysql_clone.recv_auth(self.sock, b"secret"))
+
+        thr.join()
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,118 @@
+# Classification (U)
+
+"""Program:  recv_exact.py
+
+    Description:  Unit testing of recv_exact in mysql_clone.py.
+
+    Usage:
+        test/unit/mysql_clone/recv_exact.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import socket
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_clone                              # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        tearDown
+        test_closed
+        test_short_read
+        test_exact
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.sock, self.peer = socket.socketpair()
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Clean up of unit testing.
+
+        Arguments:
+
+        """
+
+        self.sock.close()
+        self.peer.close()
+
+    def test_closed(self):
+
+        """Function:  test_closed
+
+        Description:  Test with the connection closed before all the bytes
+            are received.
+
+        Arguments:
+
+        """
+
+        self.peer.sendall(b"abc")
+        self.peer.close()
+
+        self.assertEqual(mysql_clone.recv_exact(self.sock, 10), b"abc")
+
+    def test_short_read(self):
+
+        """Function:  test_short_read
+
+        Description:  Test with the bytes sent in several pieces.
+
+        Arguments:
+
+        """
+
+        self.peer.sendall(b"ab")
+        self.peer.sendall(b"cd")
+        self.peer.sendall(b"ef")
+
+        self.assertEqual(mysql_clone.recv_exact(self.sock, 5), b"abcde")
+
+    def test_exact(self):
+
+        """Function:  test_exact
+
+        Description:  Test with all the bytes received.
+
+        Arguments:
+
+        """
+
+        self.peer.sendall(b"abcdef")
+
+        self.assertEqual(mysql_clone.recv_exact(self.sock, 6), b"abcdef")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,153 @@
+# Classification (U)
+
+"""Program:  recv_msg.py
+
+    Description:  Unit testing of recv_msg in mysql_clone.py.
+
+    Usage:
+        test/unit/mysql_clone/recv_msg.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import socket
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_clone                              # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        tearDown
+        test_closed
+        test_truncated_header
+        test_truncated_payload
+        test_too_long
+        test_recv_msg
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.sock, self.peer = socket.socketpair()
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Clean up of unit testing.
+
+        Arguments:
+
+        """
+
+        self.sock.close()
+        self.peer.close()
+
+    def test_closed(self):
+
+        """Function:  test_closed
+
+        Description:  Test with the connection closed.
+
+        Arguments:
+
+        """
+
+        self.peer.close()
+
+        self.assertIsNone(mysql_clone.recv_msg(self.sock))
+
+    def test_truncated_header(self):
+
+        """Function:  test_truncated_header
+
+        Description:  Test with the connection closed inside the header.
+
+        Arguments:
+
+        """
+
+        self.peer.sendall(b"\x00\x00")
+        self.peer.close()
+
+        with self.assertRaises(ValueError):
+            mysql_clone.recv_msg(self.sock)
+
+    def test_truncated_payload(self):
+
+        """Function:  test_truncated_payload
+
+        Description:  Test with the connection closed inside the payload.
+
+        Arguments:
+
+        """
+
+        self.peer.sendall(
+            mysql_clone.MSG.pack(1, mysql_clone.MSG_DATA, 10) + b"abc")
+        self.peer.close()
+
+        with self.assertRaises(ValueError):
+            mysql_clone.recv_msg(self.sock)
+
+    def test_too_long(self):
+
+        """Function:  test_too_long
+
+        Description:  Test with a payload longer than the largest accepted.
+
+        Arguments:
+
+        """
+
+        self.peer.sendall(
+            mysql_clone.MSG.pack(0, mysql_clone.MSG_AUTH, 1 << 30))
+
+        with self.assertRaises(ValueError):
+            mysql_clone.recv_msg(self.sock, max_len=64)
+
+    def test_recv_msg(self):
+
+        """Function:  test_recv_msg
+
+        Description:  Test with a whole message received.
+
+        Arguments:
+
+        """
+
+        self.peer.sendall(
+            mysql_clone.MSG.pack(2, mysql_clone.MSG_END, 3) + b"abc")
+
+        self.assertEqual(
+            mysql_clone.recv_msg(self.sock), (2, mysql_clone.MSG_END, b"abc"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,138 @@
+# Classification (U)
+
+"""Program:  relay.py
+
+    Description:  Unit testing of relay in mysql_clone.py.
+
+    Usage:
+        test/unit/mysql_clone/relay.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import os
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_clone                              # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        tearDown
+        test_pool_fallback
+        test_kernel
+        test_file_objects
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.data = b"insert data" * 100
+        self.src, self.src_w = os.pipe()
+        self.dst_r, self.dst = os.pipe()
+        self.pool = mysql_clone.BufPool(count=2, size=64)
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Clean up of unit testing.
+
+        Arguments:
+
+        """
+
+        for fdesc in [self.src, self.src_w, self.dst_r, self.dst]:
+            try:
+                os.close(fdesc)
+
+            except OSError:
+                pass
+
+    @mock.patch("mysql_clone.pool_relay", mock.Mock(return_value=10))
+    @mock.patch("mysql_clone.kernel_relay", mock.Mock(return_value=None))
+    def test_pool_fallback(self):
+
+        """Function:  test_pool_fallback
+
+        Description:  Test with the kernel not able to copy the stream.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            mysql_clone.relay(self.src, self.dst, pool=self.pool), 10)
+
+    @mock.patch("mysql_clone.pool_relay")
+    @mock.patch("mysql_clone.kernel_relay")
+    def test_kernel(self, mock_kernel, mock_pool):
+
+        """Function:  test_kernel
+
+        Description:  Test with the stream copied by the kernel.
+
+        Arguments:
+
+        """
+
+        mock_kernel.return_value = 10
+
+        self.assertEqual(
+            mysql_clone.relay(self.src, self.dst, pool=self.pool), 10)
+        self.assertEqual(
+            mock_kernel.call_args[0][:3], (self.src, self.dst, 64))
+        mock_pool.assert_not_called()
+
+    def test_file_objects(self):
+
+        """Function:  test_file_objects
+
+        Description:  Test with file objects and a tick function.
+
+        Arguments:
+
+        """
+
+        ticks = []
+        os.write(self.src_w, self.data)
+        os.close(self.src_w)
+
+        with open(self.src, "rb", closefd=False) as src, \
+                open(self.dst, "wb", closefd=False) as dst:
+            self.assertEqual(
+                mysql_clone.relay(src, dst, tick=ticks.append),
+                len(self.data))
+
+        self.assertEqual(os.read(self.dst_r, 4096), self.data)
+        self.assertEqual(sum(ticks), len(self.data))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,247 @@
+# Classification (U)
+
+"""Program:  relay_dump_load.py
+
+    Description:  Unit testing of relay_dump_load in mysql_clone.py.
+
+    Usage:
+        test/unit/mysql_clone/relay_dump_load.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_clone                              # pylint:disable=E0401,C0413
+import lib.gen_libs as gen_libs             # pylint:disable=E0401,C0413,R0402
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class Pipe():                                           # pylint:disable=R0903
+
+    """Class:  Pipe
+
+    Description:  Class stub holder for a process pipe.
+
+    Methods:
+        __init__
+        close
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.closed = False
+
+    def close(self):
+
+        """Method:  close
+
+        Description:  Stub holder for close method.
+
+        Arguments:
+
+        """
+
+        self.closed = True
+
+
+class Popen():
+
+    """Class:  Popen
+
+    Description:  Class stub holder for subprocess.Popen class.
+
+    Methods:
+        __init__
+        kill
+        wait
+
+    """
+
+    def __init__(self, returncode=0):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.stdout = Pipe()
+        self.stdin = Pipe()
+        self.returncode = returncode
+        self.killed = False
+        self.pid = 4321
+
+    def kill(self):
+
+        """Method:  kill
+
+        Description:  Kill function.
+
+        Arguments:
+
+        """
+
+        self.killed = True
+
+    def wait(self):
+
+        """Method:  wait
+
+        Description:  Wait function.
+
+        Arguments:
+
+        """
+
+        return self.returncode
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_load_exited
+        test_dump_failed
+        test_throttle
+        test_relayed
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.dump_cmd = ["mysqldump"]
+        self.load_cmd = ["mysql"]
+        self.err_file = "ErrFile"
+        self.dump = Popen()
+        self.load = Popen()
+
+    @mock.patch("mysql_clone.relay", mock.Mock(side_effect=BrokenPipeError))
+    @mock.patch("mysql_clone.subprocess.Popen")
+    def test_load_exited(self, mock_popen):
+
+        """Function:  test_load_exited
+
+        Description:  Test with the load process exiting before the end of
+            the dump.
+
+        Arguments:
+
+        """
+
+        self.load.returncode = 1
+        mock_popen.side_effect = [self.dump, self.load]
+
+        with gen_libs.no_std_out():
+            self.assertFalse(
+                mysql_clone.relay_dump_load(
+                    self.dump_cmd, self.load_cmd, self.err_file))
+
+        self.assertTrue(self.dump.killed)
+        self.assertTrue(self.load.stdin.closed)
+
+    @mock.patch("mysql_clone.relay", mock.Mock(return_value=1024))
+    @mock.patch("mysql_clone.subprocess.Popen")
+    def test_dump_failed(self, mock_popen):
+
+        """Function:  test_dump_failed
+
+        Description:  Test with the dump process failing.
+
+        Arguments:
+
+        """
+
+        self.dump.returncode = 2
+        mock_popen.side_effect = [self.dump, self.load]
+
+        with gen_libs.no_std_out():
+            self.assertFalse(
+                mysql_clone.relay_dump_load(
+                    self.dump_cmd, self.load_cmd, self.err_file))
+
+    @mock.patch("mysql_clone.relay")
+    @mock.patch("mysql_clone.subprocess.Popen")
+    def test_throttle(self, mock_popen, mock_relay):
+
+        """Function:  test_throttle
+
+        Description:  Test with the relay ticking the throttle.
+
+        Arguments:
+
+        """
+
+        throttle = mock.Mock()
+        mock_popen.side_effect = [self.dump, self.load]
+        mock_relay.return_value = 1024
+
+        with gen_libs.no_std_out():
+            mysql_clone.relay_dump_load(
+                self.dump_cmd, self.load_cmd, self.err_file,
+                throttle=throttle)
+
+        self.assertEqual(mock_relay.call_args[1]["tick"], throttle.take)
+
+    @mock.patch("mysql_clone.relay", mock.Mock(return_value=1024))
+    @mock.patch("mysql_clone.subprocess.Popen")
+    def test_relayed(self, mock_popen):
+
+        """Function:  test_relayed
+
+        Description:  Test with the dump relayed into the load process.
+
+        Arguments:
+
+        """
+
+        mock_popen.side_effect = [self.dump, self.load]
+        pids = []
+
+        with gen_libs.no_std_out():
+            self.assertTrue(
+                mysql_clone.relay_dump_load(
+                    self.dump_cmd, self.load_cmd, self.err_file, pids=pids))
+
+        self.assertTrue(self.dump.stdout.closed)
+        self.assertTrue(self.load.stdin.closed)
+        self.assertFalse(self.dump.killed)
+        self.assertEqual(pids, [4321])
+
+
+if __name__ == "__main__":
+    unittest.main()
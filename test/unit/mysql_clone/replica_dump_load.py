@@ -0,0 +1,247 @@
+# Classification (U)
+
+"""Program:  replica_dump_load.py
+
+    Description:  Unit testing of replica_dump_load in mysql_clone.py.
+
+    Usage:
+        test/unit/mysql_clone/replica_dump_load.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_clone                              # pylint:disable=E0401,C0413
+import lib.gen_libs as gen_libs             # pylint:disable=E0401,C0413,R0402
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class Replica():
+
+    """Class:  Replica
+
+    Description:  Class stub holder for mysql_class.SlaveRep class.
+
+    Methods:
+        __init__
+        upd_slv_status
+        get_thr_stat
+        get_log_info
+        get_name
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.gtid_mode = False
+        self.exe_gtid = "uuid1:1-10,\nuuid2:1-5"
+        self.sql_thr = "Yes"
+
+    def upd_slv_status(self):
+
+        """Method:  upd_slv_status
+
+        Description:  Method stub holder for
+            mysql_class.SlaveRep.upd_slv_status.
+
+        Arguments:
+
+        """
+
+        return True
+
+    def get_thr_stat(self):
+
+        """Method:  get_thr_stat
+
+        Description:  Method stub holder for mysql_class.SlaveRep.get_thr_stat.
+
+        Arguments:
+
+        """
+
+        return "Waiting", "Yes", self.sql_thr, "Yes"
+
+    def get_log_info(self):
+
+        """Method:  get_log_info
+
+        Description:  Method stub holder for mysql_class.SlaveRep.get_log_info.
+
+        Arguments:
+
+        """
+
+        return "binlog.000003", "binlog.000002", 200, 100
+
+    def get_name(self):
+
+        """Method:  get_name
+
+        Description:  Method stub holder for mysql_class.SlaveRep.get_name.
+
+        Arguments:
+
+        """
+
+        return "replica"
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_dump_failed
+        test_not_running
+        test_gtid
+        test_file_pos
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.replica = Replica()
+        self.clone = "Clone"
+        self.args = "Args"
+        self.req_rep_cfg = {}
+        self.opt_arg_list = ["--single-transaction", "--source-data=1"]
+
+    @mock.patch("mysql_clone.connect_chk", mock.Mock(return_value=True))
+    @mock.patch("mysql_clone.dump_load_dbs")
+    @mock.patch("mysql_clone.replica_sql_thread")
+    def test_dump_failed(self, mock_thread, mock_dump):
+
+        """Function:  test_dump_failed
+
+        Description:  Test with the SQL thread restarted after the dump-load
+            fails.
+
+        Arguments:
+
+        """
+
+        mock_dump.side_effect = OSError("Dump failed")
+
+        with gen_libs.no_std_out():
+            with self.assertRaises(OSError):
+                mysql_clone.replica_dump_load(
+                    self.replica, self.clone, self.args, self.req_rep_cfg,
+                    self.opt_arg_list)
+
+        self.assertEqual(
+            [call[0][1] for call in mock_thread.call_args_list],
+            ["stop", "start"])
+
+    @mock.patch("mysql_clone.dump_load_dbs",
+                mock.Mock(return_value=(True, {})))
+    @mock.patch("mysql_clone.replica_sql_thread")
+    def test_not_running(self, mock_thread):
+
+        """Function:  test_not_running
+
+        Description:  Test with the SQL thread already stopped.
+
+        Arguments:
+
+        """
+
+        self.replica.sql_thr = "No"
+
+        with gen_libs.no_std_out():
+            self.assertEqual(
+                mysql_clone.replica_dump_load(
+                    self.replica, self.clone, self.args, self.req_rep_cfg,
+                    self.opt_arg_list)[1]["pos"], 100)
+
+        mock_thread.assert_not_called()
+
+    @mock.patch("mysql_clone.connect_chk", mock.Mock(return_value=True))
+    @mock.patch("mysql_clone.dump_load_dbs",
+                mock.Mock(return_value=(True, {})))
+    @mock.patch("mysql_clone.replica_sql_thread", mock.Mock())
+    def test_gtid(self):
+
+        """Function:  test_gtid
+
+        Description:  Test with the executed GTID set of the replica.
+
+        Arguments:
+
+        """
+
+        self.replica.gtid_mode = True
+
+        with gen_libs.no_std_out():
+            self.assertEqual(
+                mysql_clone.replica_dump_load(
+                    self.replica, self.clone, self.args, self.req_rep_cfg,
+                    self.opt_arg_list),
+                (True, {"file": "binlog.000002", "pos": 100,
+                        "gtid": "uuid1:1-10,uuid2:1-5"}))
+
+    @mock.patch("mysql_clone.connect_chk", mock.Mock(return_value=True))
+    @mock.patch("mysql_clone.dump_load_dbs")
+    @mock.patch("mysql_clone.replica_sql_thread")
+    def test_file_pos(self, mock_thread, mock_dump):
+
+        """Function:  test_file_pos
+
+        Description:  Test with the source coordinates the replica executed
+            up to, the dump taken from the replica and its status returned.
+
+        Arguments:
+
+        """
+
+        mock_dump.return_value = (False, {"file": "replica.000001", "pos": 4})
+
+        with gen_libs.no_std_out():
+            self.assertEqual(
+                mysql_clone.replica_dump_load(
+                    self.replica, self.clone, self.args, self.req_rep_cfg,
+                    self.opt_arg_list, fan_out=[]),
+                (False, {"file": "binlog.000002", "pos": 100, "gtid": ""}))
+
+        self.assertEqual(mock_dump.call_args[0][0], self.replica)
+        self.assertEqual(
+            mock_dump.call_args[0][4], ["--single-transaction"])
+        self.assertEqual(mock_dump.call_args[1], {"fan_out": []})
+        self.assertEqual(
+            [call[0][1] for call in mock_thread.call_args_list],
+            ["stop", "start"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,138 @@
+# Classification (U)
+
+"""Program:  replica_sql_thread.py
+
+    Description:  Unit testing of replica_sql_thread in mysql_clone.py.
+
+    Usage:
+        test/unit/mysql_clone/replica_sql_thread.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_clone                              # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class Server():                                         # pylint:disable=R0903
+
+    """Class:  Server
+
+    Description:  Class stub holder for mysql_class.SlaveRep class.
+
+    Methods:
+        __init__
+        cmd_sql
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.version = (8, 0, 30)
+        self.cmds = []
+
+    def cmd_sql(self, cmd):
+
+        """Method:  cmd_sql
+
+        Description:  Method stub holder for mysql_class.Server.cmd_sql.
+
+        Arguments:
+
+        """
+
+        self.cmds.append(cmd)
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_pre_replica
+        test_start
+        test_stop
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.server = Server()
+
+    def test_pre_replica(self):
+
+        """Function:  test_pre_replica
+
+        Description:  Test with a version before the replica keywords.
+
+        Arguments:
+
+        """
+
+        self.server.version = (5, 7, 40)
+        mysql_clone.replica_sql_thread(self.server, "stop")
+
+        self.assertEqual(self.server.cmds, ["stop slave sql_thread"])
+
+    def test_start(self):
+
+        """Function:  test_start
+
+        Description:  Test with starting the SQL thread.
+
+        Arguments:
+
+        """
+
+        mysql_clone.replica_sql_thread(self.server, "start")
+
+        self.assertEqual(self.server.cmds, ["start replica sql_thread"])
+
+    def test_stop(self):
+
+        """Function:  test_stop
+
+        Description:  Test with stopping the SQL thread.
+
+        Arguments:
+
+        """
+
+        mysql_clone.replica_sql_thread(self.server, "stop")
+
+        self.assertEqual(self.server.cmds, ["stop replica sql_thread"])
+
+
+if __name__ == "__main__":
+    unittest.main()
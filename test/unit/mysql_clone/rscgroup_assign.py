@@ -0,0 +1,182 @@
+# Classification (U)
+
+"""Program:  rscgroup_assign.py
+
+    Description:  Unit testing of RscGroup.assign in mysql_clone.py.
+
+    Usage:
+        test/unit/mysql_clone/rscgroup_assign.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_clone                              # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class Server():
+
+    """Class:  Server
+
+    Description:  Class stub holder for mysql_class.Server class.
+
+    Methods:
+        __init__
+        col_sql
+        cmd_sql
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.data = []
+        self.params = None
+        self.cmds = []
+
+    def col_sql(self, cmd, params=None):
+
+        """Method:  col_sql
+
+        Description:  Method stub holder for mysql_class.Server.col_sql.
+
+        Arguments:
+
+        """
+
+        self.cmds.append(cmd)
+        self.params = params
+
+        return self.data
+
+    def cmd_sql(self, cmd):
+
+        """Method:  cmd_sql
+
+        Description:  Method stub holder for mysql_class.Server.cmd_sql.
+
+        Arguments:
+
+        """
+
+        self.cmds.append(cmd)
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_no_pids
+        test_no_sessions
+        test_sessions
+        test_assigned
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.server = Server()
+        self.rsc_grp = mysql_clone.RscGroup(
+            self.server, "mysql_clone", "2-3", 19, pids=[4321, 4322])
+
+    def test_no_pids(self):
+
+        """Function:  test_no_pids
+
+        Description:  Test with no dump processes started yet.
+
+        Arguments:
+
+        """
+
+        self.rsc_grp.pids = []
+
+        self.assertEqual(self.rsc_grp.assign(), 0)
+        self.assertEqual(self.server.cmds, [])
+
+    def test_no_sessions(self):
+
+        """Function:  test_no_sessions
+
+        Description:  Test with no new dump sessions.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(self.rsc_grp.assign(), 0)
+        self.assertEqual(len(self.server.cmds), 1)
+        self.assertEqual(self.server.params, ("4321", "4322"))
+
+    def test_sessions(self):
+
+        """Function:  test_sessions
+
+        Description:  Test with new dump sessions moved into the group.
+
+        Arguments:
+
+        """
+
+        self.server.data = [{"id": 11, "thr_id": 51},
+                            {"id": 12, "thr_id": 52}]
+
+        self.assertEqual(self.rsc_grp.assign(), 2)
+        self.assertEqual(
+            self.server.cmds[-1],
+            "set resource group `mysql_clone` for 51, 52")
+        self.assertEqual(self.rsc_grp.assigned, {"51", "52"})
+
+    def test_assigned(self):
+
+        """Function:  test_assigned
+
+        Description:  Test with the sessions already in the group left as
+            they are.
+
+        Arguments:
+
+        """
+
+        self.server.data = [{"id": 11, "thr_id": 51},
+                            {"id": 12, "thr_id": 52}]
+        self.rsc_grp.assigned = {"51"}
+
+        self.assertEqual(self.rsc_grp.assign(), 1)
+        self.assertEqual(
+            self.server.cmds[-1], "set resource group `mysql_clone` for 52")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,167 @@
+# Classification (U)
+
+"""Program:  rscgroup_create.py
+
+    Description:  Unit testing of RscGroup.create in mysql_clone.py.
+
+    Usage:
+        test/unit/mysql_clone/rscgroup_create.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_clone                              # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class Server():
+
+    """Class:  Server
+
+    Description:  Class stub holder for mysql_class.Server class.
+
+    Methods:
+        __init__
+        col_sql
+        cmd_sql
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.data = []
+        self.params = None
+        self.cmds = []
+
+    def col_sql(self, cmd, params=None):
+
+        """Method:  col_sql
+
+        Description:  Method stub holder for mysql_class.Server.col_sql.
+
+        Arguments:
+
+        """
+
+        self.cmds.append(cmd)
+        self.params = params
+
+        return self.data
+
+    def cmd_sql(self, cmd):
+
+        """Method:  cmd_sql
+
+        Description:  Method stub holder for mysql_class.Server.cmd_sql.
+
+        Arguments:
+
+        """
+
+        self.cmds.append(cmd)
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_all_cpus
+        test_reused
+        test_created
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.server = Server()
+        self.rsc_grp = mysql_clone.RscGroup(
+            self.server, "mysql_clone", "2-3", 19)
+
+    def test_all_cpus(self):
+
+        """Function:  test_all_cpus
+
+        Description:  Test with the group not bound to any CPUs.
+
+        Arguments:
+
+        """
+
+        self.server.data = [{"cnt": 0}]
+        self.rsc_grp.vcpus = ""
+        self.rsc_grp.create()
+
+        self.assertEqual(
+            self.server.cmds[-1], "create resource group `mysql_clone`"
+            " type = user thread_priority = 19")
+
+    def test_reused(self):
+
+        """Function:  test_reused
+
+        Description:  Test with the group left by an earlier run reused.
+
+        Arguments:
+
+        """
+
+        self.server.data = [{"cnt": 1}]
+        self.rsc_grp.create()
+
+        self.assertEqual(
+            self.server.cmds[-1], "alter resource group `mysql_clone`"
+            " vcpu = 2-3 thread_priority = 19 enable")
+
+    def test_created(self):
+
+        """Function:  test_created
+
+        Description:  Test with the group created.
+
+        Arguments:
+
+        """
+
+        self.server.data = [{"cnt": 0}]
+        self.rsc_grp.create()
+
+        self.assertEqual(self.server.params, ("mysql_clone",))
+        self.assertEqual(
+            self.server.cmds[-1], "create resource group `mysql_clone`"
+            " type = user vcpu = 2-3 thread_priority = 19")
+
+
+if __name__ == "__main__":
+    unittest.main()
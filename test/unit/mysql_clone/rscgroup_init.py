@@ -0,0 +1,76 @@
+# Classification (U)
+
+"""Program:  rscgroup_init.py
+
+    Description:  Unit testing of RscGroup.__init__ in mysql_clone.py.
+
+    Usage:
+        test/unit/mysql_clone/rscgroup_init.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_clone                              # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        test_interval
+        test_default
+
+    """
+
+    def test_interval(self):
+
+        """Function:  test_interval
+
+        Description:  Test with the interval between checks passed.
+
+        Arguments:
+
+        """
+
+        rsc_grp = mysql_clone.RscGroup(
+            "Server", "mysql_clone", "2-3", 19, interval=5)
+
+        self.assertEqual(rsc_grp.interval, 5)
+
+    def test_default(self):
+
+        """Function:  test_default
+
+        Description:  Test with the default settings.
+
+        Arguments:
+
+        """
+
+        rsc_grp = mysql_clone.RscGroup("Server", "mysql_clone", "2-3", 19)
+
+        self.assertEqual(rsc_grp.name, "mysql_clone")
+        self.assertEqual(rsc_grp.interval, 1)
+        self.assertEqual(rsc_grp.assigned, set())
+        self.assertEqual(rsc_grp.pids, [])
+        self.assertFalse(rsc_grp.thr.is_alive())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,98 @@
+# Classification (U)
+
+"""Program:  rscgroup_run.py
+
+    Description:  Unit testing of RscGroup.run in mysql_clone.py.
+
+    Usage:
+        test/unit/mysql_clone/rscgroup_run.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_clone                              # pylint:disable=E0401,C0413
+import lib.gen_libs as gen_libs             # pylint:disable=E0401,C0413,R0402
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_assign_failed
+        test_assign
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.rsc_grp = mysql_clone.RscGroup(
+            "Server", "mysql_clone", "2-3", 19)
+        self.rsc_grp.done = mock.Mock()
+        self.rsc_grp.done.wait.side_effect = [False, False, False, True]
+
+    @mock.patch("mysql_clone.RscGroup.assign")
+    def test_assign_failed(self, mock_assign):
+
+        """Function:  test_assign_failed
+
+        Description:  Test with a failed check logged once and retried.
+
+        Arguments:
+
+        """
+
+        mock_assign.side_effect = [
+            Exception("Access denied"), Exception("Access denied"), 1]
+
+        with gen_libs.no_std_out():
+            self.rsc_grp.run()
+
+        self.assertEqual(mock_assign.call_count, 3)
+
+    @mock.patch("mysql_clone.RscGroup.assign")
+    def test_assign(self, mock_assign):
+
+        """Function:  test_assign
+
+        Description:  Test with the sessions assigned once an interval until
+            stopped.
+
+        Arguments:
+
+        """
+
+        mock_assign.return_value = 0
+        self.rsc_grp.run()
+
+        self.assertEqual(mock_assign.call_count, 3)
+        self.rsc_grp.done.wait.assert_called_with(1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,72 @@
+# Classification (U)
+
+"""Program:  rscgroup_start.py
+
+    Description:  Unit testing of RscGroup.start in mysql_clone.py.
+
+    Usage:
+        test/unit/mysql_clone/rscgroup_start.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_clone                              # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_start
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.rsc_grp = mysql_clone.RscGroup(
+            "Server", "mysql_clone", "2-3", 19)
+
+    def test_start(self):
+
+        """Function:  test_start
+
+        Description:  Test with the assignment thread started.
+
+        Arguments:
+
+        """
+
+        self.rsc_grp.thr = mock.Mock()
+        self.rsc_grp.start()
+
+        self.rsc_grp.thr.start.assert_called_once_with()
+
+
+if __name__ == "__main__":
+    unittest.main()
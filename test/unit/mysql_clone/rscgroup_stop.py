@@ -0,0 +1,135 @@
+# Classification (U)
+
+"""Program:  rscgroup_stop.py
+
+    Description:  Unit testing of RscGroup.stop in mysql_clone.py.
+
+    Usage:
+        test/unit/mysql_clone/rscgroup_stop.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_clone                              # pylint:disable=E0401,C0413
+import lib.gen_libs as gen_libs             # pylint:disable=E0401,C0413,R0402
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class Server():                                         # pylint:disable=R0903
+
+    """Class:  Server
+
+    Description:  Class stub holder for mysql_class.Server class.
+
+    Methods:
+        __init__
+        cmd_sql
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.cmds = []
+
+    def cmd_sql(self, cmd):
+
+        """Method:  cmd_sql
+
+        Description:  Method stub holder for mysql_class.Server.cmd_sql.
+
+        Arguments:
+
+        """
+
+        self.cmds.append(cmd)
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_not_started
+        test_started
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.server = Server()
+        self.rsc_grp = mysql_clone.RscGroup(
+            self.server, "mysql_clone", "2-3", 19, interval=0.01)
+
+    def test_not_started(self):
+
+        """Function:  test_not_started
+
+        Description:  Test with the assignment thread not started.
+
+        Arguments:
+
+        """
+
+        with gen_libs.no_std_out():
+            self.rsc_grp.stop()
+
+        self.assertTrue(self.rsc_grp.done.is_set())
+        self.assertEqual(
+            self.server.cmds, ["drop resource group `mysql_clone` force"])
+
+    def test_started(self):
+
+        """Function:  test_started
+
+        Description:  Test with the group dropped once the assignment thread
+            has stopped.
+
+        Arguments:
+
+        """
+
+        self.rsc_grp.assign = mock.Mock(return_value=0)
+        self.rsc_grp.start()
+
+        with gen_libs.no_std_out():
+            self.rsc_grp.stop()
+
+        self.assertFalse(self.rsc_grp.thr.is_alive())
+        self.assertEqual(
+            self.server.cmds[-1], "drop resource group `mysql_clone` force")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,217 @@
+# Classification (U)
+
+"""Program:  rst_bulk_cfg.py
+
+    Description:  Unit testing of rst_bulk_cfg in mysql_clone.py.
+
+    Usage:
+        test/unit/mysql_clone/rst_bulk_cfg.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_clone                              # pylint:disable=E0401,C0413
+import lib.gen_libs as gen_libs             # pylint:disable=E0401,C0413,R0402
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class Server():
+
+    """Class:  Server
+
+    Description:  Class stub holder for mysql_class.Server class.
+
+    Methods:
+        __init__
+        col_sql
+        cmd_sql
+        upd_slv_rep_stat
+        fetch_slv_rep_cfg
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.version = (8, 0, 30)
+        self.cfg = {"innodb_flush_log_at_trx_commit": 1, "sync_binlog": 1}
+        self.redo_log = "ON"
+        self.rep_cfg = {"log_bin": "ON", "read_only": "ON"}
+        self.cmds = []
+
+    def col_sql(self, cmd):
+
+        """Method:  col_sql
+
+        Description:  Method stub holder for mysql_class.Server.col_sql.
+
+        Arguments:
+
+        """
+
+        if cmd.startswith("show global status"):
+            return [{"Variable_name": "Innodb_redo_log_enabled",
+                     "Value": self.redo_log}]
+
+        return [self.cfg]
+
+    def cmd_sql(self, cmd):
+
+        """Method:  cmd_sql
+
+        Description:  Method stub holder for mysql_class.Server.cmd_sql.
+
+        Arguments:
+
+        """
+
+        self.cmds.append(cmd)
+
+    def upd_slv_rep_stat(self):
+
+        """Method:  upd_slv_rep_stat
+
+        Description:  Method stub holder for
+            mysql_class.Server.upd_slv_rep_stat.
+
+        Arguments:
+
+        """
+
+        self.cmds.append("upd_slv_rep_stat")
+
+    def fetch_slv_rep_cfg(self):
+
+        """Method:  fetch_slv_rep_cfg
+
+        Description:  Method stub holder for
+            mysql_class.Server.fetch_slv_rep_cfg.
+
+        Arguments:
+
+        """
+
+        return self.rep_cfg
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_req_cfg_failed
+        test_req_cfg
+        test_not_restored
+        test_restored
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.clone = Server()
+        self.cfg = {"innodb_flush_log_at_trx_commit": "1", "sync_binlog": "1",
+                    "innodb_redo_log_enabled": "ON"}
+        self.req_cfg = {"log_bin": "ON", "read_only": "ON"}
+
+    def test_req_cfg_failed(self):
+
+        """Function:  test_req_cfg_failed
+
+        Description:  Test with the replication settings not matching.
+
+        Arguments:
+
+        """
+
+        self.clone.rep_cfg = {"log_bin": "OFF", "read_only": "ON"}
+
+        with gen_libs.no_std_out():
+            self.assertFalse(
+                mysql_clone.rst_bulk_cfg(
+                    self.clone, self.cfg, req_cfg=self.req_cfg))
+
+    def test_req_cfg(self):
+
+        """Function:  test_req_cfg
+
+        Description:  Test with the replication settings checked.
+
+        Arguments:
+
+        """
+
+        with gen_libs.no_std_out():
+            self.assertTrue(
+                mysql_clone.rst_bulk_cfg(
+                    self.clone, self.cfg, req_cfg=self.req_cfg))
+
+        self.assertIn("upd_slv_rep_stat", self.clone.cmds)
+
+    def test_not_restored(self):
+
+        """Function:  test_not_restored
+
+        Description:  Test with a setting not restored.
+
+        Arguments:
+
+        """
+
+        self.clone.cfg = {"innodb_flush_log_at_trx_commit": 2,
+                          "sync_binlog": 1}
+
+        with gen_libs.no_std_out():
+            self.assertFalse(mysql_clone.rst_bulk_cfg(self.clone, self.cfg))
+
+    def test_restored(self):
+
+        """Function:  test_restored
+
+        Description:  Test with the settings restored.
+
+        Arguments:
+
+        """
+
+        with gen_libs.no_std_out():
+            self.assertTrue(mysql_clone.rst_bulk_cfg(self.clone, self.cfg))
+
+        self.assertEqual(
+            self.clone.cmds,
+            ["set global innodb_flush_log_at_trx_commit = 1",
+             "set global sync_binlog = 1",
+             "alter instance enable innodb redo_log"])
+
+
+if __name__ == "__main__":
+    unittest.main()
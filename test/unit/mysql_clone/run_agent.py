@@ -0,0 +1,275 @@
+# Classification (U)
+
+"""Program:  run_agent.py
+
+    Description:  Unit testing of run_agent in mysql_clone.py.
+
+    Usage:
+        test/unit/mysql_clone/run_agent.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_clone                              # pylint:disable=E0401,C0413
+import lib.gen_libs as gen_libs             # pylint:disable=E0401,C0413,R0402
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class ArgParser():                                      # pylint:disable=R0903
+
+    """Class:  ArgParser
+
+    Description:  Class stub holder for gen_class.ArgParser class.
+
+    Methods:
+        __init__
+        get_val
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.cmdline = None
+        self.args_array = {"-c": "mysql_cfg", "-d": "config",
+                           "-a": "10.0.0.1:5000", "-S": "secret_file",
+                           "-j": "4"}
+
+    def get_val(self, skey, def_val=None):
+
+        """Method:  get_val
+
+        Description:  Method stub holder for gen_class.ArgParser.get_val.
+
+        Arguments:
+
+        """
+
+        return self.args_array.get(skey, def_val)
+
+
+class Server():
+
+    """Class:  Server
+
+    Description:  Class stub holder for mysql_class.Server class.
+
+    Methods:
+        __init__
+        connect
+        set_srv_gtid
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.conn_msg = None
+        self.gtid_mode = True
+
+    def connect(self, silent=False):
+
+        """Method:  connect
+
+        Description:  connect function.
+
+        Arguments:
+
+        """
+
+        return silent
+
+    def set_srv_gtid(self):
+
+        """Method:  set_srv_gtid
+
+        Description:  set_srv_gtid function.
+
+        Arguments:
+
+        """
+
+        return True
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_no_connect
+        test_dump_failed
+        test_auth_failed
+        test_agent
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.source = Server()
+        self.args = ArgParser()
+        self.opt_arg_list = ["--single-transaction", "--all-databases"]
+        self.sock = mock.MagicMock()
+
+    @mock.patch("mysql_clone.mysql_libs.disconnect", mock.Mock())
+    @mock.patch("mysql_clone.socket.create_server")
+    @mock.patch("mysql_clone.mysql_libs.create_instance")
+    def test_no_connect(self, mock_inst, mock_server):
+
+        """Function:  test_no_connect
+
+        Description:  Test with not connecting to source.
+
+        Arguments:
+
+        """
+
+        self.source.conn_msg = "Error connecting to source database"
+        mock_inst.return_value = self.source
+
+        with gen_libs.no_std_out():
+            self.assertFalse(
+                mysql_clone.run_agent(self.args, self.opt_arg_list))
+
+        mock_server.assert_not_called()
+
+    @mock.patch(
+        "mysql_clone.gen_libs.is_empty_file", mock.Mock(return_value=False))
+    @mock.patch(
+        "mysql_clone.gen_libs.crt_file_time", mock.Mock(return_value="Fname"))
+    @mock.patch("mysql_clone.read_secret", mock.Mock(return_value=b"secret"))
+    @mock.patch("mysql_clone.mysql_libs.disconnect", mock.Mock())
+    @mock.patch("mysql_clone.open", mock.MagicMock())
+    @mock.patch("mysql_clone.agent_auth", mock.Mock(return_value=True))
+    @mock.patch("mysql_clone.agent_send", mock.Mock(return_value=False))
+    @mock.patch("mysql_clone.socket.create_server")
+    @mock.patch("mysql_clone.mysql_libs.create_instance")
+    def test_dump_failed(self, mock_inst, mock_server):
+
+        """Function:  test_dump_failed
+
+        Description:  Test with the agent dump failing.
+
+        Arguments:
+
+        """
+
+        mock_inst.return_value = self.source
+        mock_server.return_value.__enter__.return_value.accept.return_value = (
+            self.sock, ("10.0.0.2", 40000))
+
+        with gen_libs.no_std_out():
+            self.assertFalse(
+                mysql_clone.run_agent(self.args, self.opt_arg_list))
+
+    @mock.patch(
+        "mysql_clone.gen_libs.is_empty_file", mock.Mock(return_value=True))
+    @mock.patch(
+        "mysql_clone.gen_libs.crt_file_time", mock.Mock(return_value="Fname"))
+    @mock.patch("mysql_clone.read_secret", mock.Mock(return_value=b"secret"))
+    @mock.patch("mysql_clone.mysql_libs.disconnect", mock.Mock())
+    @mock.patch("mysql_clone.open", mock.MagicMock())
+    @mock.patch("mysql_clone.agent_auth")
+    @mock.patch("mysql_clone.agent_send")
+    @mock.patch("mysql_clone.socket.create_server")
+    @mock.patch("mysql_clone.mysql_libs.create_instance")
+    def test_auth_failed(                       # pylint:disable=R0913,R0917
+            self, mock_inst, mock_server, mock_send, mock_auth):
+
+        """Function:  test_auth_failed
+
+        Description:  Test with a connection failing to authenticate closed
+            and the next receiver served.
+
+        Arguments:
+
+        """
+
+        sock2 = mock.MagicMock()
+        mock_inst.return_value = self.source
+        mock_server.return_value.__enter__.return_value.accept.side_effect = [
+            (self.sock, ("10.0.0.9", 40000)), (sock2, ("10.0.0.2", 40001))]
+        mock_auth.side_effect = [False, True]
+        mock_send.return_value = True
+
+        with gen_libs.no_std_out():
+            mysql_clone.run_agent(self.args, self.opt_arg_list)
+
+        self.assertEqual(mock_send.call_count, 1)
+        self.assertEqual(mock_send.call_args[0][0], sock2)
+        self.sock.__exit__.assert_called_once()
+
+    @mock.patch(
+        "mysql_clone.gen_libs.is_empty_file", mock.Mock(return_value=True))
+    @mock.patch(
+        "mysql_clone.gen_libs.crt_file_time", mock.Mock(return_value="Fname"))
+    @mock.patch("mysql_clone.read_secret", mock.Mock(return_value=b"secret"))
+    @mock.patch("mysql_clone.mysql_libs.disconnect", mock.Mock())
+    @mock.patch("mysql_clone.open", mock.MagicMock())
+    @mock.patch("mysql_clone.agent_auth", mock.Mock(return_value=True))
+    @mock.patch("mysql_clone.agent_send")
+    @mock.patch("mysql_clone.socket.create_server")
+    @mock.patch("mysql_clone.mysql_libs.create_instance")
+    def test_agent(self, mock_inst, mock_server, mock_send):
+
+        """Function:  test_agent
+
+        Description:  Test with the databases sent to the receiver.
+
+        Arguments:
+
+        """
+
+        mock_inst.return_value = self.source
+        mock_server.return_value.__enter__.return_value.accept.return_value = (
+            self.sock, ("10.0.0.2", 40000))
+        mock_send.return_value = True
+
+        with gen_libs.no_std_out():
+            self.assertTrue(
+                mysql_clone.run_agent(self.args, self.opt_arg_list))
+
+        self.assertEqual(mock_server.call_args[0][0], ("10.0.0.1", 5000))
+        self.assertEqual(mock_send.call_args[0][0], self.sock)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -206,6 +206,96 @@ class Master():
         return True
 
 
+class Replica():
+
+    """Class:  Replica
+
+    Description:  Class stub holder for mysql_class.SlaveRep class.
+
+    Methods:
+        __init__
+        connect
+        set_srv_gtid
+        upd_slv_status
+        get_log_info
+        get_name
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.conn_msg = None
+        self.relay_file = "binlog.000002"
+
+    def connect(self, silent=False):
+
+        """Method:  connect
+
+        Description:  connect method.
+
+        Arguments:
+
+        """
+
+        return silent
+
+    def set_srv_gtid(self):
+
+        """Method:  set_srv_gtid
+
+        Description:  set_srv_gtid method.
+
+        Arguments:
+
+        """
+
+        return True
+
+    def upd_slv_status(self):
+
+        """Method:  upd_slv_status
+
+        Description:  upd_slv_status method.
+
+        Arguments:
+
+        """
+
+        return True
+
+    def get_log_info(self):
+
+        """Method:  get_log_info
+
+        Description:  get_log_info method.
+
+        Arguments:
+
+        """
+
+        return "binlog.000003", self.relay_file, 200, 100
+
+    def get_name(self):
+
+        """Method:  get_name
+
+        Description:  get_name method.
+
+        Arguments:
+
+        """
+
+        return "replica"
+
+
 class UnitTest(unittest.TestCase):
 
     """Class:  UnitTest
@@ -225,6 +315,15 @@ class UnitTest(unittest.TestCase):
         test_gtid_no_match
         test_status_false
         test_status_true
+        test_physical_failed
+        test_physical
+        test_fan_out_rep_failed
+        test_fan_out
+        test_replica_no_connect
+        test_not_replica
+        test_replica
+        test_warm
+        test_dump_failed
 
     """
 
@@ -331,7 +430,8 @@ class UnitTest(unittest.TestCase):
                 mock.Mock(return_value=True))
     @mock.patch("mysql_clone.chk_rep", mock.Mock(return_value=True))
     @mock.patch("mysql_clone.stop_clr_rep", mock.Mock(return_value=True))
-    @mock.patch("mysql_clone.dump_load_dbs", mock.Mock(return_value=True))
+    @mock.patch("mysql_clone.dump_load_dbs",
+                mock.Mock(return_value=(True, {})))
     @mock.patch("mysql_clone.chk_rep_cfg")
     @mock.patch("mysql_clone.mysql_libs")
     def test_clone_disconnect(self, mock_lib, mock_cfg):
@@ -351,7 +451,7 @@ class UnitTest(unittest.TestCase):
         mock_cfg.return_value = (self.opt_arg_list, True)
 
         with gen_libs.no_std_out():
-            self.assertFalse(
+            self.assertTrue(
                 mysql_clone.run_program(
                     self.args, self.req_rep_cfg, self.opt_arg_list))
 
@@ -383,7 +483,8 @@ class UnitTest(unittest.TestCase):
                 mock.Mock(return_value=True))
     @mock.patch("mysql_clone.chk_rep", mock.Mock(return_value=True))
     @mock.patch("mysql_clone.stop_clr_rep", mock.Mock(return_value=True))
-    @mock.patch("mysql_clone.dump_load_dbs", mock.Mock(return_value=True))
+    @mock.patch("mysql_clone.dump_load_dbs",
+                mock.Mock(return_value=(True, {})))
     @mock.patch("mysql_clone.chk_rep_cfg")
     @mock.patch("mysql_clone.mysql_libs")
     def test_master_loop_no_rep(self, mock_lib, mock_cfg):
@@ -402,7 +503,7 @@ class UnitTest(unittest.TestCase):
         mock_cfg.return_value = (self.opt_arg_list, True)
 
         with gen_libs.no_std_out():
-            self.assertFalse(
+            self.assertTrue(
                 mysql_clone.run_program(
                     self.args2, self.req_rep_cfg, self.opt_arg_list))
 
@@ -410,7 +511,8 @@ class UnitTest(unittest.TestCase):
                 mock.Mock(return_value=True))
     @mock.patch("mysql_clone.chk_rep", mock.Mock(return_value=True))
     @mock.patch("mysql_clone.stop_clr_rep", mock.Mock(return_value=True))
-    @mock.patch("mysql_clone.dump_load_dbs", mock.Mock(return_value=True))
+    @mock.patch("mysql_clone.dump_load_dbs",
+                mock.Mock(return_value=(True, {})))
     @mock.patch("mysql_clone.chk_rep_cfg")
     @mock.patch("mysql_clone.mysql_libs")
     def test_master_loop_rep(self, mock_lib, mock_cfg):
@@ -437,7 +539,8 @@ class UnitTest(unittest.TestCase):
                 mock.Mock(return_value=True))
     @mock.patch("mysql_clone.chk_rep", mock.Mock(return_value=True))
     @mock.patch("mysql_clone.stop_clr_rep", mock.Mock(return_value=True))
-    @mock.patch("mysql_clone.dump_load_dbs", mock.Mock(return_value=True))
+    @mock.patch("mysql_clone.dump_load_dbs",
+                mock.Mock(return_value=(True, {})))
     @mock.patch("mysql_clone.chk_rep_cfg")
     @mock.patch("mysql_clone.mysql_libs")
     def test_master_ip_rep(self, mock_lib, mock_cfg):
@@ -455,7 +558,7 @@ class UnitTest(unittest.TestCase):
         mock_cfg.return_value = (self.opt_arg_list, True)
 
         with gen_libs.no_std_out():
-            self.assertFalse(
+            self.assertTrue(
                 mysql_clone.run_program(
                     self.args, self.req_rep_cfg, self.opt_arg_list))
 
@@ -463,7 +566,8 @@ class UnitTest(unittest.TestCase):
                 mock.Mock(return_value=True))
     @mock.patch("mysql_clone.chk_rep", mock.Mock(return_value=True))
     @mock.patch("mysql_clone.stop_clr_rep", mock.Mock(return_value=True))
-    @mock.patch("mysql_clone.dump_load_dbs", mock.Mock(return_value=True))
+    @mock.patch("mysql_clone.dump_load_dbs",
+                mock.Mock(return_value=(True, {})))
     @mock.patch("mysql_clone.chk_rep_cfg")
     @mock.patch("mysql_clone.mysql_libs")
     def test_gtid_no_match(self, mock_lib, mock_cfg):
@@ -490,7 +594,8 @@ class UnitTest(unittest.TestCase):
                 mock.Mock(return_value=True))
     @mock.patch("mysql_clone.chk_rep", mock.Mock(return_value=True))
     @mock.patch("mysql_clone.stop_clr_rep", mock.Mock(return_value=True))
-    @mock.patch("mysql_clone.dump_load_dbs", mock.Mock(return_value=True))
+    @mock.patch("mysql_clone.dump_load_dbs",
+                mock.Mock(return_value=(True, {})))
     @mock.patch("mysql_clone.chk_rep_cfg")
     @mock.patch("mysql_clone.mysql_libs")
     def test_status_false(self, mock_lib, mock_cfg):
@@ -508,7 +613,7 @@ class UnitTest(unittest.TestCase):
         mock_cfg.return_value = (self.opt_arg_list, True)
 
         with gen_libs.no_std_out():
-            self.assertFalse(
+            self.assertTrue(
                 mysql_clone.run_program(
                     self.args, self.req_rep_cfg, self.opt_arg_list))
 
@@ -516,7 +621,8 @@ class UnitTest(unittest.TestCase):
                 mock.Mock(return_value=True))
     @mock.patch("mysql_clone.chk_rep", mock.Mock(return_value=True))
     @mock.patch("mysql_clone.stop_clr_rep", mock.Mock(return_value=True))
-    @mock.patch("mysql_clone.dump_load_dbs", mock.Mock(return_value=True))
+    @mock.patch("mysql_clone.dump_load_dbs",
+                mock.Mock(return_value=(True, {})))
     @mock.patch("mysql_clone.chk_rep_cfg")
     @mock.patch("mysql_clone.mysql_libs")
     def test_status_true(self, mock_lib, mock_cfg):
@@ -533,11 +639,326 @@ class UnitTest(unittest.TestCase):
         mock_lib.is_cfg_valid.return_value = (True, [])
         mock_cfg.return_value = (self.opt_arg_list, True)
 
+        with gen_libs.no_std_out():
+            self.assertTrue(
+                mysql_clone.run_program(
+                    self.args, self.req_rep_cfg, self.opt_arg_list))
+
+    @mock.patch("mysql_clone.mysql_libs.disconnect",
+                mock.Mock(return_value=True))
+    @mock.patch("mysql_clone.stop_clr_rep", mock.Mock(return_value=True))
+    @mock.patch("mysql_clone.chk_rep")
+    @mock.patch("mysql_clone.phys_clone")
+    @mock.patch("mysql_clone.chk_rep_cfg")
+    @mock.patch("mysql_clone.mysql_libs")
+    def test_physical_failed(self, mock_lib, mock_cfg, mock_phys, mock_rep):
+
+        """Function:  test_physical_failed
+
+        Description:  Test with the physical clone failing.
+
+        Arguments:
+
+        """
+
+        self.args.args_array["-i"] = True
+        mock_lib.create_instance.side_effect = [self.master, self.slave]
+        mock_lib.is_cfg_valid.return_value = (True, [])
+        mock_cfg.return_value = (self.opt_arg_list, True)
+        mock_phys.return_value = (False, {})
+
+        with gen_libs.no_std_out():
+            mysql_clone.run_program(
+                self.args, self.req_rep_cfg, self.opt_arg_list)
+
+        mock_rep.assert_not_called()
+
+    @mock.patch("mysql_clone.mysql_libs.disconnect",
+                mock.Mock(return_value=True))
+    @mock.patch("mysql_clone.stop_clr_rep", mock.Mock(return_value=True))
+    @mock.patch("mysql_clone.dump_load_dbs")
+    @mock.patch("mysql_clone.chk_rep")
+    @mock.patch("mysql_clone.phys_clone")
+    @mock.patch("mysql_clone.chk_rep_cfg")
+    @mock.patch("mysql_clone.mysql_libs")
+    def test_physical(                          # pylint:disable=R0913,R0917
+            self, mock_lib, mock_cfg, mock_phys, mock_rep, mock_dump):
+
+        """Function:  test_physical
+
+        Description:  Test with the physical clone option.
+
+        Arguments:
+
+        """
+
+        self.args.args_array["-i"] = True
+        mock_lib.create_instance.side_effect = [self.master, self.slave]
+        mock_lib.is_cfg_valid.return_value = (True, [])
+        mock_cfg.return_value = (self.opt_arg_list, True)
+        mock_phys.return_value = (True, {"file": "binlog.000002", "pos": 4})
+
+        with gen_libs.no_std_out():
+            mysql_clone.run_program(
+                self.args, self.req_rep_cfg, self.opt_arg_list)
+
+        mock_dump.assert_not_called()
+        self.assertEqual(
+            mock_rep.call_args[1], {"coords": {"file": "binlog.000002",
+                                               "pos": 4},
+                                    "clone_cfg": "mysql_cfg2"})
+
+
+    @mock.patch("mysql_clone.mysql_libs.disconnect",
+                mock.Mock(return_value=True))
+    @mock.patch("mysql_clone.stop_clr_rep", mock.Mock(return_value=True))
+    @mock.patch("mysql_clone.dump_load_dbs")
+    @mock.patch("mysql_clone.chk_rep_cfg")
+    @mock.patch("mysql_clone.mysql_libs")
+    def test_fan_out_rep_failed(self, mock_lib, mock_cfg, mock_dump):
+
+        """Function:  test_fan_out_rep_failed
+
+        Description:  Test with one of several clones failing the replication
+            config check.
+
+        Arguments:
+
+        """
+
+        self.args.args_array["-t"] = "mysql_cfg2,mysql_cfg3"
+        mock_lib.create_instance.side_effect = [
+            self.master, self.slave, Slave()]
+        mock_lib.is_cfg_valid.return_value = (True, [])
+        mock_cfg.side_effect = [
+            (self.opt_arg_list, True), (self.opt_arg_list, False)]
+
+        with gen_libs.no_std_out():
+            mysql_clone.run_program(
+                self.args, self.req_rep_cfg, self.opt_arg_list)
+
+        mock_dump.assert_not_called()
+
+    @mock.patch("mysql_clone.mysql_libs.disconnect",
+                mock.Mock(return_value=True))
+    @mock.patch("mysql_clone.stop_clr_rep", mock.Mock(return_value=True))
+    @mock.patch("mysql_clone.dump_load_dbs")
+    @mock.patch("mysql_clone.chk_rep")
+    @mock.patch("mysql_clone.chk_rep_cfg")
+    @mock.patch("mysql_clone.mysql_libs")
+    def test_fan_out(                           # pylint:disable=R0913,R0917
+            self, mock_lib, mock_cfg, mock_rep, mock_dump):
+
+        """Function:  test_fan_out
+
+        Description:  Test with several clones loaded from one dump and set
+            up with the same coordinates.
+
+        Arguments:
+
+        """
+
+        slave2 = Slave()
+        self.args.args_array["-t"] = "mysql_cfg2,mysql_cfg3"
+        mock_lib.create_instance.side_effect = [
+            self.master, self.slave, slave2]
+        mock_lib.is_cfg_valid.return_value = (True, [])
+        mock_cfg.return_value = (self.opt_arg_list, True)
+        mock_dump.return_value = (True, {"file": "binlog.000002", "pos": 4})
+
+        with gen_libs.no_std_out():
+            mysql_clone.run_program(
+                self.args, self.req_rep_cfg, self.opt_arg_list)
+
+        self.assertEqual(mock_dump.call_args[0][1], self.slave)
+        self.assertEqual(mock_dump.call_args[1]["fan_out"], [slave2])
+        self.assertEqual(
+            [(call[0][0], call[1]) for call in mock_rep.call_args_list],
+            [(self.slave, {"coords": {"file": "binlog.000002", "pos": 4},
+                           "clone_cfg": "mysql_cfg2"}),
+             (slave2, {"coords": {"file": "binlog.000002", "pos": 4},
+                       "clone_cfg": "mysql_cfg3"})])
+
+
+    @mock.patch("mysql_clone.mysql_libs.disconnect",
+                mock.Mock(return_value=True))
+    @mock.patch("mysql_clone.stop_clr_rep", mock.Mock(return_value=True))
+    @mock.patch("mysql_clone.replica_dump_load")
+    @mock.patch("mysql_clone.chk_rep_cfg")
+    @mock.patch("mysql_clone.mysql_libs")
+    def test_replica_no_connect(self, mock_lib, mock_cfg, mock_dump):
+
+        """Function:  test_replica_no_connect
+
+        Description:  Test with the replica not connecting.
+
+        Arguments:
+
+        """
+
+        replica = Replica()
+        replica.conn_msg = "Error"
+        self.args.args_array["-m"] = "mysql_cfg3"
+        mock_lib.create_instance.side_effect = [
+            self.master, self.slave, replica]
+        mock_lib.is_cfg_valid.return_value = (True, [])
+        mock_cfg.return_value = (self.opt_arg_list, True)
+
         with gen_libs.no_std_out():
             self.assertFalse(
                 mysql_clone.run_program(
                     self.args, self.req_rep_cfg, self.opt_arg_list))
 
+        mock_dump.assert_not_called()
+
+    @mock.patch("mysql_clone.mysql_libs.disconnect",
+                mock.Mock(return_value=True))
+    @mock.patch("mysql_clone.stop_clr_rep", mock.Mock(return_value=True))
+    @mock.patch("mysql_clone.replica_dump_load")
+    @mock.patch("mysql_clone.chk_rep_cfg")
+    @mock.patch("mysql_clone.mysql_libs")
+    def test_not_replica(self, mock_lib, mock_cfg, mock_dump):
+
+        """Function:  test_not_replica
+
+        Description:  Test with the -m option server not being a replica.
+
+        Arguments:
+
+        """
+
+        replica = Replica()
+        replica.relay_file = None
+        self.args.args_array["-m"] = "mysql_cfg3"
+        mock_lib.create_instance.side_effect = [
+            self.master, self.slave, replica]
+        mock_lib.is_cfg_valid.return_value = (True, [])
+        mock_cfg.return_value = (self.opt_arg_list, True)
+
+        with gen_libs.no_std_out():
+            self.assertFalse(
+                mysql_clone.run_program(
+                    self.args, self.req_rep_cfg, self.opt_arg_list))
+
+        mock_dump.assert_not_called()
+
+    @mock.patch("mysql_clone.mysql_libs.disconnect",
+                mock.Mock(return_value=True))
+    @mock.patch("mysql_clone.stop_clr_rep", mock.Mock(return_value=True))
+    @mock.patch("mysql_clone.dump_load_dbs")
+    @mock.patch("mysql_clone.replica_dump_load")
+    @mock.patch("mysql_clone.chk_rep")
+    @mock.patch("mysql_clone.chk_rep_cfg")
+    @mock.patch("mysql_clone.mysql_libs")
+    def test_replica(                           # pylint:disable=R0913,R0917
+            self, mock_lib, mock_cfg, mock_rep, mock_replica, mock_dump):
+
+        """Function:  test_replica
+
+        Description:  Test with the dump taken from a replica and the
+            replica's source coordinates used for the clone.
+
+        Arguments:
+
+        """
+
+        replica = Replica()
+        self.args.args_array["-m"] = "mysql_cfg3"
+        mock_lib.create_instance.side_effect = [
+            self.master, self.slave, replica]
+        mock_lib.is_cfg_valid.return_value = (True, [])
+        mock_cfg.return_value = (self.opt_arg_list, True)
+        mock_replica.return_value = (
+            True, {"file": "binlog.000002", "pos": 100})
+
+        with gen_libs.no_std_out():
+            mysql_clone.run_program(
+                self.args, self.req_rep_cfg, self.opt_arg_list)
+
+        mock_dump.assert_not_called()
+        self.assertEqual(mock_replica.call_args[0][:2], (replica, self.slave))
+        self.assertEqual(
+            mock_rep.call_args[1]["coords"],
+            {"file": "binlog.000002", "pos": 100})
+
+    @mock.patch("mysql_clone.mysql_libs.disconnect",
+                mock.Mock(return_value=True))
+    @mock.patch("mysql_clone.stop_clr_rep", mock.Mock(return_value=True))
+    @mock.patch("mysql_clone.dump_load_dbs",
+                mock.Mock(return_value=(True, {})))
+    @mock.patch("mysql_clone.warm_clone")
+    @mock.patch("mysql_clone.fetch_hot_idx")
+    @mock.patch("mysql_clone.chk_rep")
+    @mock.patch("mysql_clone.chk_rep_cfg")
+    @mock.patch("mysql_clone.mysql_libs")
+    def test_warm(                              # pylint:disable=R0913,R0917
+            self, mock_lib, mock_cfg, mock_rep, mock_hot, mock_warm):
+
+        """Function:  test_warm
+
+        Description:  Test with the -H option warming the clone from the
+            source's hot indexes before its replication is checked.
+
+        Arguments:
+
+        """
+
+        hot = [{"db": "db1", "tbl": "t1", "idx": "PRIMARY", "pages": 10}]
+        manager = mock.Mock()
+        manager.attach_mock(mock_warm, "warm_clone")
+        manager.attach_mock(mock_rep, "chk_rep")
+        self.args.args_array["-H"] = True
+        mock_lib.create_instance.side_effect = [self.master, self.slave]
+        mock_lib.is_cfg_valid.return_value = (True, [])
+        mock_cfg.return_value = (self.opt_arg_list, True)
+        mock_hot.return_value = hot
+
+        with gen_libs.no_std_out():
+            mysql_clone.run_program(
+                self.args, self.req_rep_cfg, self.opt_arg_list)
+
+        mock_hot.assert_called_once_with(self.master)
+        mock_warm.assert_called_once_with(self.slave, self.args, hot)
+        self.assertEqual(
+            [call[0] for call in manager.mock_calls],
+            ["warm_clone", "chk_rep"])
+
+
+    @mock.patch("mysql_clone.mysql_libs.disconnect",
+                mock.Mock(return_value=True))
+    @mock.patch("mysql_clone.stop_clr_rep", mock.Mock(return_value=True))
+    @mock.patch("mysql_clone.fetch_hot_idx", mock.Mock(return_value=[{}]))
+    @mock.patch("mysql_clone.dump_load_dbs")
+    @mock.patch("mysql_clone.warm_clone")
+    @mock.patch("mysql_clone.chk_rep")
+    @mock.patch("mysql_clone.chk_rep_cfg")
+    @mock.patch("mysql_clone.mysql_libs")
+    def test_dump_failed(                       # pylint:disable=R0913,R0917
+            self, mock_lib, mock_cfg, mock_rep, mock_warm, mock_dump):
+
+        """Function:  test_dump_failed
+
+        Description:  Test with the dump-load failing and the clone neither
+            warmed nor set up for replication.
+
+        Arguments:
+
+        """
+
+        self.args.args_array["-H"] = True
+        mock_lib.create_instance.side_effect = [self.master, self.slave]
+        mock_lib.is_cfg_valid.return_value = (True, [])
+        mock_cfg.return_value = (self.opt_arg_list, True)
+        mock_dump.return_value = (False, {"file": "binlog.000002", "pos": 4})
+
+        with gen_libs.no_std_out():
+            self.assertFalse(
+                mysql_clone.run_program(
+                    self.args, self.req_rep_cfg, self.opt_arg_list))
+
+        mock_warm.assert_not_called()
+        mock_rep.assert_not_called()
+
 
 if __name__ == "__main__":
     unittest.main()
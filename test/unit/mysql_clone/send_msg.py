@@ -0,0 +1,108 @@
+# Classification (U)
+
+"""Program:  send_msg.py
+
+    Description:  Unit testing of send_msg in mysql_clone.py.
+
+    Usage:
+        test/unit/mysql_clone/send_msg.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import socket
+import threading
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_clone                              # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        tearDown
+        test_empty_payload
+        test_send_msg
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.sock, self.peer = socket.socketpair()
+        self.lock = threading.Lock()
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Clean up of unit testing.
+
+        Arguments:
+
+        """
+
+        self.sock.close()
+        self.peer.close()
+
+    def test_empty_payload(self):
+
+        """Function:  test_empty_payload
+
+        Description:  Test with an empty payload.
+
+        Arguments:
+
+        """
+
+        mysql_clone.send_msg(
+            self.sock, self.lock, 0, mysql_clone.MSG_DONE, b"")
+
+        self.assertEqual(
+            self.peer.recv(100),
+            mysql_clone.MSG.pack(0, mysql_clone.MSG_DONE, 0))
+
+    def test_send_msg(self):
+
+        """Function:  test_send_msg
+
+        Description:  Test with a message sent with its header.
+
+        Arguments:
+
+        """
+
+        mysql_clone.send_msg(
+            self.sock, self.lock, 3, mysql_clone.MSG_DATA, b"data")
+
+        self.assertEqual(
+            self.peer.recv(100),
+            mysql_clone.MSG.pack(3, mysql_clone.MSG_DATA, 4) + b"data")
+        self.assertFalse(self.lock.locked())
+
+
+if __name__ == "__main__":
+    unittest.main()
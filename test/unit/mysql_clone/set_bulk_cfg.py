@@ -0,0 +1,130 @@
+# Classification (U)
+
+"""Program:  set_bulk_cfg.py
+
+    Description:  Unit testing of set_bulk_cfg in mysql_clone.py.
+
+    Usage:
+        test/unit/mysql_clone/set_bulk_cfg.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_clone                              # pylint:disable=E0401,C0413
+import lib.gen_libs as gen_libs             # pylint:disable=E0401,C0413,R0402
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class Server():                                         # pylint:disable=R0903
+
+    """Class:  Server
+
+    Description:  Class stub holder for mysql_class.Server class.
+
+    Methods:
+        __init__
+        cmd_sql
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.cmds = []
+
+    def cmd_sql(self, cmd):
+
+        """Method:  cmd_sql
+
+        Description:  Method stub holder for mysql_class.Server.cmd_sql.
+
+        Arguments:
+
+        """
+
+        self.cmds.append(cmd)
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_redo_log_disabled
+        test_redo_log
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.clone = Server()
+        self.cmds = ["set global innodb_flush_log_at_trx_commit = 2",
+                     "set global sync_binlog = 0"]
+
+    def test_redo_log_disabled(self):
+
+        """Function:  test_redo_log_disabled
+
+        Description:  Test with the redo log already disabled.
+
+        Arguments:
+
+        """
+
+        with gen_libs.no_std_out():
+            mysql_clone.set_bulk_cfg(
+                self.clone, {"innodb_redo_log_enabled": "OFF"})
+
+        self.assertEqual(self.clone.cmds, self.cmds)
+
+    def test_redo_log(self):
+
+        """Function:  test_redo_log
+
+        Description:  Test with the redo log disabled for the load.
+
+        Arguments:
+
+        """
+
+        with gen_libs.no_std_out():
+            mysql_clone.set_bulk_cfg(
+                self.clone, {"innodb_redo_log_enabled": "ON"})
+
+        self.assertEqual(
+            self.clone.cmds,
+            self.cmds + ["alter instance disable innodb redo_log"])
+
+
+if __name__ == "__main__":
+    unittest.main()
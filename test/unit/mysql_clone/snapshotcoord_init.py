@@ -0,0 +1,164 @@
+# Classification (U)
+
+"""Program:  snapshotcoord_init.py
+
+    Description:  Unit testing of SnapshotCoord.__init__ in mysql_clone.py.
+
+    Usage:
+        test/unit/mysql_clone/snapshotcoord_init.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_clone                              # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class Server():
+
+    """Class:  Server
+
+    Description:  Class stub holder for mysql_class.Server class.
+
+    Methods:
+        __init__
+        col_sql
+        cmd_sql
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.sql_user = "user"
+        self.version = (8, 0, 30)
+        self.cmds = []
+        self.status = [{
+            "File": "binlog.000001", "Position": 1234,
+            "Executed_Gtid_Set": "uuid:1-10,\nuuid2:1-5"}]
+
+    def col_sql(self, cmd, params=None):
+
+        """Method:  col_sql
+
+        Description:  Method stub holder for mysql_class.Server.col_sql.
+
+        Arguments:
+
+        """
+
+        self.cmds.append((cmd, params))
+
+        if cmd.startswith("show"):
+            return self.status
+
+        return [{"val": 60, "now": "2026-01-01 00:00:00"}]
+
+    def cmd_sql(self, cmd):
+
+        """Method:  cmd_sql
+
+        Description:  Method stub holder for mysql_class.Server.cmd_sql.
+
+        Arguments:
+
+        """
+
+        self.cmds.append(cmd)
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_read_lock
+        test_timeout
+        test_default
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.server = Server()
+
+    def test_read_lock(self):
+
+        """Function:  test_read_lock
+
+        Description:  Test with a source before MySQL 8.0.26 locked with a
+            global read lock.
+
+        Arguments:
+
+        """
+
+        self.server.version = (8, 0, 25)
+        snap = mysql_clone.SnapshotCoord(self.server)
+
+        self.assertFalse(snap.backup)
+
+    def test_timeout(self):
+
+        """Function:  test_timeout
+
+        Description:  Test with timeout passed.
+
+        Arguments:
+
+        """
+
+        snap = mysql_clone.SnapshotCoord(self.server, timeout=10, tries=2)
+
+        self.assertEqual((snap.timeout, snap.tries), (10, 2))
+
+    def test_default(self):
+
+        """Function:  test_default
+
+        Description:  Test with default arguments.
+
+        Arguments:
+
+        """
+
+        snap = mysql_clone.SnapshotCoord(self.server)
+
+        self.assertEqual(
+            (snap.server, snap.timeout, snap.coords, snap.locked),
+            (self.server, 60, {}, False))
+        self.assertEqual((snap.backup, snap.tries), (True, 5))
+
+
+if __name__ == "__main__":
+    unittest.main()
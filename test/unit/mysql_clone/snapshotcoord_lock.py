@@ -0,0 +1,242 @@
+# Classification (U)
+
+"""Program:  snapshotcoord_lock.py
+
+    Description:  Unit testing of SnapshotCoord.lock in mysql_clone.py.
+
+    Usage:
+        test/unit/mysql_clone/snapshotcoord_lock.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import json
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_clone                              # pylint:disable=E0401,C0413
+import lib.gen_libs as gen_libs             # pylint:disable=E0401,C0413,R0402
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class Server():
+
+    """Class:  Server
+
+    Description:  Class stub holder for mysql_class.Server class.
+
+    Methods:
+        __init__
+        col_sql
+        cmd_sql
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.sql_user = "user"
+        self.version = (8, 0, 25)
+        self.cmds = []
+        self.status = [{
+            "File": "binlog.000001", "Position": 1234,
+            "Executed_Gtid_Set": "uuid:1-10,\nuuid2:1-5"}]
+        self.log_status = [{"val": json.dumps({
+            "gtid_executed": "uuid:1-10,\nuuid2:1-5",
+            "binary_log_file": "binlog.000001",
+            "binary_log_position": 1234})}]
+        self.fail = None
+
+    def col_sql(self, cmd, params=None):
+
+        """Method:  col_sql
+
+        Description:  Method stub holder for mysql_class.Server.col_sql.
+
+        Arguments:
+
+        """
+
+        self.cmds.append((cmd, params))
+
+        if cmd.startswith("show"):
+            return self.status
+
+        if "log_status" in cmd:
+            return self.log_status
+
+        return [{"val": 60, "now": "2026-01-01 00:00:00"}]
+
+    def cmd_sql(self, cmd):
+
+        """Method:  cmd_sql
+
+        Description:  Method stub holder for mysql_class.Server.cmd_sql.
+
+        Arguments:
+
+        """
+
+        if cmd == self.fail:
+            raise ValueError("Access denied")
+
+        self.cmds.append(cmd)
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_lock_failed
+        test_backup_failed
+        test_backup_lock
+        test_no_binlog
+        test_binary_log_status
+        test_master_status
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.server = Server()
+        self.snap = mysql_clone.SnapshotCoord(self.server)
+        self.results = {
+            "file": "binlog.000001", "pos": 1234,
+            "gtid": "uuid:1-10,uuid2:1-5"}
+
+    def test_lock_failed(self):
+
+        """Function:  test_lock_failed
+
+        Description:  Test with no lock taken and the net_write_timeout put
+            back.
+
+        Arguments:
+
+        """
+
+        self.server.fail = "flush tables with read lock"
+
+        with self.assertRaises(ValueError):
+            self.snap.lock()
+
+        self.assertFalse(self.snap.locked)
+        self.assertEqual(
+            self.server.cmds[-1], "set global net_write_timeout = 60")
+
+    def test_backup_failed(self):
+
+        """Function:  test_backup_failed
+
+        Description:  Test with a backup lock not taken falling back to the
+            global read lock.
+
+        Arguments:
+
+        """
+
+        self.server.version = (8, 0, 30)
+        self.server.fail = "lock instance for backup"
+        snap = mysql_clone.SnapshotCoord(self.server)
+
+        with gen_libs.no_std_out():
+            self.assertEqual(snap.lock(), self.results)
+
+        self.assertIn("flush tables with read lock", self.server.cmds)
+        self.assertEqual(snap.mode, "global read")
+
+    def test_backup_lock(self):
+
+        """Function:  test_backup_lock
+
+        Description:  Test with MySQL 8.0.26 and above backup lock and the
+            coordinates read from log_status.
+
+        Arguments:
+
+        """
+
+        self.server.version = (8, 0, 30)
+        snap = mysql_clone.SnapshotCoord(self.server)
+
+        self.assertEqual(snap.lock(), self.results)
+        self.assertIn("lock instance for backup", self.server.cmds)
+        self.assertNotIn("flush tables with read lock", self.server.cmds)
+        self.assertEqual(snap.mode, "backup")
+
+    def test_no_binlog(self):
+
+        """Function:  test_no_binlog
+
+        Description:  Test with binary logging disabled on the source.
+
+        Arguments:
+
+        """
+
+        self.server.status = []
+
+        self.assertEqual(self.snap.lock(), {})
+        self.assertTrue(self.snap.locked)
+
+    def test_binary_log_status(self):
+
+        """Function:  test_binary_log_status
+
+        Description:  Test with MySQL 8.2 and above status command.
+
+        Arguments:
+
+        """
+
+        self.server.version = (8, 4, 0)
+
+        self.assertEqual(self.snap.lock(), self.results)
+        self.assertIn(("show binary log status", None), self.server.cmds)
+
+    def test_master_status(self):
+
+        """Function:  test_master_status
+
+        Description:  Test with pre-MySQL 8.2 status command.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(self.snap.lock(), self.results)
+        self.assertIn(("show master status", None), self.server.cmds)
+        self.assertIn("flush tables with read lock", self.server.cmds)
+        self.assertEqual(self.snap.net_timeout, 60)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,171 @@
+# Classification (U)
+
+"""Program:  snapshotcoord_read_coords.py
+
+    Description:  Unit testing of SnapshotCoord.read_coords in mysql_clone.py.
+
+    Usage:
+        test/unit/mysql_clone/snapshotcoord_read_coords.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import json
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_clone                              # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class Server():                                         # pylint:disable=R0903
+
+    """Class:  Server
+
+    Description:  Class stub holder for mysql_class.Server class.
+
+    Methods:
+        __init__
+        col_sql
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.version = (8, 0, 30)
+        self.cmds = []
+        self.status = [{
+            "File": "binlog.000001", "Position": 1234,
+            "Executed_Gtid_Set": "uuid:1-10,\nuuid2:1-5"}]
+        self.log_status = [{"val": json.dumps({
+            "gtid_executed": "uuid:1-10,\nuuid2:1-5",
+            "binary_log_file": "binlog.000001",
+            "binary_log_position": 1234})}]
+
+    def col_sql(self, cmd):
+
+        """Method:  col_sql
+
+        Description:  Method stub holder for mysql_class.Server.col_sql.
+
+        Arguments:
+
+        """
+
+        self.cmds.append(cmd)
+
+        return self.log_status if "log_status" in cmd else self.status
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_read_lock
+        test_no_binlog
+        test_json_column
+        test_log_status
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.server = Server()
+        self.snap = mysql_clone.SnapshotCoord(self.server)
+        self.results = {
+            "file": "binlog.000001", "pos": 1234,
+            "gtid": "uuid:1-10,uuid2:1-5"}
+
+    def test_read_lock(self):
+
+        """Function:  test_read_lock
+
+        Description:  Test with the coordinates read from the binary log
+            status under the global read lock.
+
+        Arguments:
+
+        """
+
+        self.snap.backup = False
+
+        self.assertEqual(self.snap.read_coords(), self.results)
+        self.assertEqual(self.server.cmds, ["show master status"])
+
+    def test_no_binlog(self):
+
+        """Function:  test_no_binlog
+
+        Description:  Test with binary logging disabled on the source.
+
+        Arguments:
+
+        """
+
+        self.server.log_status = [{"val": json.dumps(
+            {"gtid_executed": "", "binary_log_file": "",
+             "binary_log_position": 0})}]
+
+        self.assertEqual(self.snap.read_coords(), {})
+
+    def test_json_column(self):
+
+        """Function:  test_json_column
+
+        Description:  Test with the log_status column returned as a
+            dictionary.
+
+        Arguments:
+
+        """
+
+        self.server.log_status = [
+            {"val": json.loads(self.server.log_status[0]["val"])}]
+
+        self.assertEqual(self.snap.read_coords(), self.results)
+
+    def test_log_status(self):
+
+        """Function:  test_log_status
+
+        Description:  Test with the coordinates read from log_status.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(self.snap.read_coords(), self.results)
+        self.assertIn("performance_schema.log_status", self.server.cmds[0])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,175 @@
+# Classification (U)
+
+"""Program:  snapshotcoord_settled.py
+
+    Description:  Unit testing of SnapshotCoord.settled in mysql_clone.py.
+
+    Usage:
+        test/unit/mysql_clone/snapshotcoord_settled.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import json
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_clone                              # pylint:disable=E0401,C0413
+import lib.gen_libs as gen_libs             # pylint:disable=E0401,C0413,R0402
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class Server():                                         # pylint:disable=R0903
+
+    """Class:  Server
+
+    Description:  Class stub holder for mysql_class.Server class.
+
+    Methods:
+        __init__
+        col_sql
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.version = (8, 0, 30)
+        self.cmds = []
+        self.status = [{
+            "File": "binlog.000001", "Position": 1234,
+            "Executed_Gtid_Set": "uuid:1-10,\nuuid2:1-5"}]
+        self.log_status = [{"val": json.dumps({
+            "gtid_executed": "uuid:1-10,\nuuid2:1-5",
+            "binary_log_file": "binlog.000001",
+            "binary_log_position": 1234})}]
+
+    def col_sql(self, cmd):
+
+        """Method:  col_sql
+
+        Description:  Method stub holder for mysql_class.Server.col_sql.
+
+        Arguments:
+
+        """
+
+        self.cmds.append(cmd)
+
+        return self.log_status if "log_status" in cmd else self.status
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_read_lock
+        test_tries_used
+        test_not_settled
+        test_settled
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.server = Server()
+        self.snap = mysql_clone.SnapshotCoord(self.server, tries=2)
+        self.snap.mode = "backup"
+        self.snap.coords = {
+            "file": "binlog.000001", "pos": 1000,
+            "gtid": "uuid:1-9,uuid2:1-5"}
+
+    def test_read_lock(self):
+
+        """Function:  test_read_lock
+
+        Description:  Test with the global read lock always settled.
+
+        Arguments:
+
+        """
+
+        self.snap.mode = "global read"
+
+        self.assertTrue(self.snap.settled())
+        self.assertEqual(self.server.cmds, [])
+
+    def test_tries_used(self):
+
+        """Function:  test_tries_used
+
+        Description:  Test with the tries used up falling back to the global
+            read lock.
+
+        Arguments:
+
+        """
+
+        with gen_libs.no_std_out():
+            self.assertFalse(self.snap.settled())
+            self.assertFalse(self.snap.settled())
+
+        self.assertFalse(self.snap.backup)
+
+    def test_not_settled(self):
+
+        """Function:  test_not_settled
+
+        Description:  Test with a write committed since the coordinates were
+            captured.
+
+        Arguments:
+
+        """
+
+        self.assertFalse(self.snap.settled())
+        self.assertTrue(self.snap.backup)
+        self.assertEqual(self.snap.tries, 1)
+
+    def test_settled(self):
+
+        """Function:  test_settled
+
+        Description:  Test with no write committed since the coordinates were
+            captured.
+
+        Arguments:
+
+        """
+
+        self.snap.coords = self.snap.read_coords()
+
+        self.assertTrue(self.snap.settled())
+        self.assertEqual(self.snap.tries, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
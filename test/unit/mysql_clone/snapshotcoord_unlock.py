@@ -0,0 +1,179 @@
+# Classification (U)
+
+"""Program:  snapshotcoord_unlock.py
+
+    Description:  Unit testing of SnapshotCoord.unlock in mysql_clone.py.
+
+    Usage:
+        test/unit/mysql_clone/snapshotcoord_unlock.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_clone                              # pylint:disable=E0401,C0413
+import lib.gen_libs as gen_libs             # pylint:disable=E0401,C0413,R0402
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class Server():
+
+    """Class:  Server
+
+    Description:  Class stub holder for mysql_class.Server class.
+
+    Methods:
+        __init__
+        col_sql
+        cmd_sql
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.sql_user = "user"
+        self.version = (8, 0, 25)
+        self.cmds = []
+        self.status = [{
+            "File": "binlog.000001", "Position": 1234,
+            "Executed_Gtid_Set": "uuid:1-10,\nuuid2:1-5"}]
+
+    def col_sql(self, cmd, params=None):
+
+        """Method:  col_sql
+
+        Description:  Method stub holder for mysql_class.Server.col_sql.
+
+        Arguments:
+
+        """
+
+        self.cmds.append((cmd, params))
+
+        if cmd.startswith("show"):
+            return self.status
+
+        return [{"val": 60, "now": "2026-01-01 00:00:00"}]
+
+    def cmd_sql(self, cmd):
+
+        """Method:  cmd_sql
+
+        Description:  Method stub holder for mysql_class.Server.cmd_sql.
+
+        Arguments:
+
+        """
+
+        self.cmds.append(cmd)
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_not_locked
+        test_backup_locked
+        test_locked
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.server = Server()
+        self.snap = mysql_clone.SnapshotCoord(self.server)
+
+    def test_not_locked(self):
+
+        """Function:  test_not_locked
+
+        Description:  Test with no lock held.
+
+        Arguments:
+
+        """
+
+        self.snap.unlock()
+
+        self.assertEqual(self.server.cmds, [])
+
+    def test_backup_locked(self):
+
+        """Function:  test_backup_locked
+
+        Description:  Test with backup lock held.
+
+        Arguments:
+
+        """
+
+        self.snap.locked = True
+        self.snap.mode = "backup"
+        self.snap.start = 0.0
+        self.snap.net_timeout = 60
+
+        with gen_libs.no_std_out():
+            self.snap.unlock()
+
+        self.assertEqual(
+            self.server.cmds,
+            ["unlock instance", "set global net_write_timeout = 60"])
+        self.assertGreater(self.snap.held, 0.0)
+
+    def test_locked(self):
+
+        """Function:  test_locked
+
+        Description:  Test with lock held.
+
+        Arguments:
+
+        """
+
+        self.snap.locked = True
+        self.snap.mode = "global read"
+        self.snap.start = 0.0
+        self.snap.net_timeout = 60
+
+        with gen_libs.no_std_out():
+            self.snap.unlock()
+
+        self.assertEqual(
+            self.server.cmds,
+            ["unlock tables", "set global net_write_timeout = 60"])
+        self.assertFalse(self.snap.locked)
+
+
+if __name__ == "__main__":
+    unittest.main()
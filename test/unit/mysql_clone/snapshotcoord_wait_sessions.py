@@ -0,0 +1,151 @@
+# Classification (U)
+
+"""Program:  snapshotcoord_wait_sessions.py
+
+    Description:  Unit testing of SnapshotCoord.wait_sessions in mysql_clone.py.
+
+    Usage:
+        test/unit/mysql_clone/snapshotcoord_wait_sessions.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_clone                              # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class Server():
+
+    """Class:  Server
+
+    Description:  Class stub holder for mysql_class.Server class.
+
+    Methods:
+        __init__
+        col_sql
+        cmd_sql
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.sql_user = "user"
+        self.version = (8, 0, 30)
+        self.cmds = []
+        self.status = [{
+            "File": "binlog.000001", "Position": 1234,
+            "Executed_Gtid_Set": "uuid:1-10,\nuuid2:1-5"}]
+
+    def col_sql(self, cmd, params=None):
+
+        """Method:  col_sql
+
+        Description:  Method stub holder for mysql_class.Server.col_sql.
+
+        Arguments:
+
+        """
+
+        self.cmds.append((cmd, params))
+
+        if cmd.startswith("show"):
+            return self.status
+
+        return [{"val": 60, "now": "2026-01-01 00:00:00"}]
+
+    def cmd_sql(self, cmd):
+
+        """Method:  cmd_sql
+
+        Description:  Method stub holder for mysql_class.Server.cmd_sql.
+
+        Arguments:
+
+        """
+
+        self.cmds.append(cmd)
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_not_opened
+        test_opened
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.server = Server()
+        self.snap = mysql_clone.SnapshotCoord(self.server, timeout=5)
+        self.snap.lock_time = "2026-01-01 00:00:00"
+
+    @mock.patch("mysql_clone.wait_snap")
+    def test_not_opened(self, mock_wait):
+
+        """Function:  test_not_opened
+
+        Description:  Test with sessions not opening snapshots.
+
+        Arguments:
+
+        """
+
+        mock_wait.return_value = False
+
+        self.assertFalse(self.snap.wait_sessions(3))
+
+    @mock.patch("mysql_clone.wait_snap")
+    def test_opened(self, mock_wait):
+
+        """Function:  test_opened
+
+        Description:  Test with sessions opening snapshots.
+
+        Arguments:
+
+        """
+
+        mock_wait.return_value = True
+
+        self.assertTrue(self.snap.wait_sessions(3))
+        mock_wait.assert_called_once_with(
+            self.server, 3, "2026-01-01 00:00:00", timeout=5)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,150 @@
+# Classification (U)
+
+"""Program:  split_indexes.py
+
+    Description:  Unit testing of split_indexes in mysql_clone.py.
+
+    Usage:
+        test/unit/mysql_clone/split_indexes.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_clone                              # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_foreign_key
+        test_no_keys
+        test_auto_increment
+        test_last_key
+        test_keys
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.head = "CREATE TABLE `t1` (\n  `id` int NOT NULL,\n" \
+                    "  `a` int DEFAULT NULL,\n  `b` varchar(10) NOT NULL,\n" \
+                    "  PRIMARY KEY (`id`),\n"
+        self.tail = ") ENGINE=InnoDB DEFAULT CHARSET=utf8mb4"
+
+    def test_foreign_key(self):
+
+        """Function:  test_foreign_key
+
+        Description:  Test with a table with a foreign key.
+
+        Arguments:
+
+        """
+
+        create = self.head + "  KEY `a` (`a`),\n  CONSTRAINT `fk` FOREIGN" \
+            " KEY (`a`) REFERENCES `t2` (`id`)\n" + self.tail
+
+        self.assertEqual(mysql_clone.split_indexes(create), (create, []))
+
+    def test_no_keys(self):
+
+        """Function:  test_no_keys
+
+        Description:  Test with a table with only unique keys.
+
+        Arguments:
+
+        """
+
+        create = self.head + "  UNIQUE KEY `b` (`b`)\n" + self.tail
+
+        self.assertEqual(mysql_clone.split_indexes(create), (create, []))
+
+    def test_auto_increment(self):
+
+        """Function:  test_auto_increment
+
+        Description:  Test with the only index on the AUTO_INCREMENT column
+            kept in the table definition.
+
+        Arguments:
+
+        """
+
+        head = "CREATE TABLE `t1` (\n  `id` int NOT NULL,\n" \
+            "  `seq` int NOT NULL AUTO_INCREMENT,\n" \
+            "  `a` int DEFAULT NULL,\n  PRIMARY KEY (`id`),\n"
+        create = head + "  KEY `seq` (`seq`),\n  KEY `a` (`a`)\n" \
+            + self.tail.replace("InnoDB", "InnoDB AUTO_INCREMENT=5")
+
+        self.assertEqual(
+            mysql_clone.split_indexes(create),
+            (head + "  KEY `seq` (`seq`)\n"
+             + self.tail.replace("InnoDB", "InnoDB AUTO_INCREMENT=5"),
+             ["KEY `a` (`a`)"]))
+
+    def test_last_key(self):
+
+        """Function:  test_last_key
+
+        Description:  Test with the indexes last in the table definition.
+
+        Arguments:
+
+        """
+
+        create = self.head + "  UNIQUE KEY `b` (`b`),\n  KEY `a` (`a`)\n" \
+            + self.tail
+
+        self.assertEqual(
+            mysql_clone.split_indexes(create),
+            (self.head + "  UNIQUE KEY `b` (`b`)\n" + self.tail,
+             ["KEY `a` (`a`)"]))
+
+    def test_keys(self):
+
+        """Function:  test_keys
+
+        Description:  Test with the table's secondary indexes removed.
+
+        Arguments:
+
+        """
+
+        create = self.head + "  KEY `a` (`a`),\n  KEY `ab` (`a`,`b`(5)),\n" \
+            "  FULLTEXT KEY `ft` (`b`)\n" + self.tail
+
+        self.assertEqual(
+            mysql_clone.split_indexes(create),
+            (self.head + "  FULLTEXT KEY `ft` (`b`)\n" + self.tail,
+             ["KEY `a` (`a`)", "KEY `ab` (`a`,`b`(5))"]))
+
+
+if __name__ == "__main__":
+    unittest.main()
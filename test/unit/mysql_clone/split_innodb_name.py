@@ -0,0 +1,102 @@
+# Classification (U)
+
+"""Program:  split_innodb_name.py
+
+    Description:  Unit testing of split_innodb_name in mysql_clone.py.
+
+    Usage:
+        test/unit/mysql_clone/split_innodb_name.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_clone                              # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        test_quoted_name
+        test_encoded_name
+        test_partition
+        test_plain_name
+
+    """
+
+    def test_quoted_name(self):
+
+        """Function:  test_quoted_name
+
+        Description:  Test with a `db`.`tbl` name of a partition.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            mysql_clone.split_innodb_name(
+                "`db1`.`t``1` /* Partition `p0` */"), ("db1", "t`1"))
+
+    def test_encoded_name(self):
+
+        """Function:  test_encoded_name
+
+        Description:  Test with special characters encoded in the name.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            mysql_clone.split_innodb_name("db@002d1/t@00201"),
+            ("db-1", "t 1"))
+
+    def test_partition(self):
+
+        """Function:  test_partition
+
+        Description:  Test with the name of a partition.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            mysql_clone.split_innodb_name("db1/t1#p#p0"), ("db1", "t1"))
+        self.assertEqual(
+            mysql_clone.split_innodb_name("db1/t1#P#p0#SP#sp0"),
+            ("db1", "t1"))
+
+    def test_plain_name(self):
+
+        """Function:  test_plain_name
+
+        Description:  Test with a plain db/tbl name.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            mysql_clone.split_innodb_name("db1/t1"), ("db1", "t1"))
+
+
+if __name__ == "__main__":
+    unittest.main()
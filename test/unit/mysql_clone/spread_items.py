@@ -0,0 +1,86 @@
+# Classification (U)
+
+"""Program:  spread_items.py
+
+    Description:  Unit testing of spread_items in mysql_clone.py.
+
+    Usage:
+        test/unit/mysql_clone/spread_items.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_clone                              # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        test_no_items
+        test_fewer_items
+        test_spread
+
+    """
+
+    def test_no_items(self):
+
+        """Function:  test_no_items
+
+        Description:  Test with no items to spread.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(mysql_clone.spread_items([], 4), [])
+
+    def test_fewer_items(self):
+
+        """Function:  test_fewer_items
+
+        Description:  Test with fewer items than bins.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            mysql_clone.spread_items([{"size": 5}], 3), [[{"size": 5}]])
+
+    def test_spread(self):
+
+        """Function:  test_spread
+
+        Description:  Test with the largest items placed first into the least
+            filled bin.
+
+        Arguments:
+
+        """
+
+        items = [{"size": size} for size in [3, 8, 5, 4]]
+
+        self.assertEqual(
+            mysql_clone.spread_items(items, 2),
+            [[{"size": 8}, {"size": 3}], [{"size": 5}, {"size": 4}]])
+
+
+if __name__ == "__main__":
+    unittest.main()
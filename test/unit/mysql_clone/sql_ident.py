@@ -0,0 +1,67 @@
+# Classification (U)
+
+"""Program:  sql_ident.py
+
+    Description:  Unit testing of sql_ident in mysql_clone.py.
+
+    Usage:
+        test/unit/mysql_clone/sql_ident.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_clone                              # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        test_backtick
+        test_name
+
+    """
+
+    def test_backtick(self):
+
+        """Function:  test_backtick
+
+        Description:  Test with a name containing a backtick.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(mysql_clone.sql_ident("a`b"), "`a``b`")
+
+    def test_name(self):
+
+        """Function:  test_name
+
+        Description:  Test with a plain name.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(mysql_clone.sql_ident("tbl1"), "`tbl1`")
+
+
+if __name__ == "__main__":
+    unittest.main()
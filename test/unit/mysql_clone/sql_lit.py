@@ -0,0 +1,223 @@
+# Classification (U)
+
+"""Program:  sql_lit.py
+
+    Description:  Unit testing of sql_lit in mysql_clone.py.
+
+    Usage:
+        test/unit/mysql_clone/sql_lit.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import decimal
+import datetime
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_clone                              # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        test_null
+        test_time
+        test_negative_time
+        test_set
+        test_empty_bytes
+        test_string_null_byte
+        test_boolean
+        test_decimal
+        test_small_decimal
+        test_integer
+        test_bytes
+        test_string_escape
+        test_string
+
+    """
+
+    def test_null(self):
+
+        """Function:  test_null
+
+        Description:  Test with a null value.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(mysql_clone.sql_lit(None), "NULL")
+
+    def test_time(self):
+
+        """Function:  test_time
+
+        Description:  Test with a time value over 24 hours.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            mysql_clone.sql_lit(datetime.timedelta(hours=30, seconds=5)),
+            "'30:00:05.000000'")
+
+    def test_negative_time(self):
+
+        """Function:  test_negative_time
+
+        Description:  Test with a negative time value.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            mysql_clone.sql_lit(datetime.timedelta(microseconds=-500000)),
+            "'-0:00:00.500000'")
+
+    def test_set(self):
+
+        """Function:  test_set
+
+        Description:  Test with a set column value.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(mysql_clone.sql_lit({"b", "a"}), "'a,b'")
+
+    def test_empty_bytes(self):
+
+        """Function:  test_empty_bytes
+
+        Description:  Test with an empty binary value.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(mysql_clone.sql_lit(b""), "''")
+
+    def test_string_null_byte(self):
+
+        """Function:  test_string_null_byte
+
+        Description:  Test with a string containing a null byte.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(mysql_clone.sql_lit("a\0b"), "'a\\0b'")
+
+    def test_boolean(self):
+
+        """Function:  test_boolean
+
+        Description:  Test with a boolean value.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(mysql_clone.sql_lit(True), "'True'")
+
+    def test_decimal(self):
+
+        """Function:  test_decimal
+
+        Description:  Test with a decimal value.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            mysql_clone.sql_lit(decimal.Decimal("10.50")), "10.50")
+
+    def test_small_decimal(self):
+
+        """Function:  test_small_decimal
+
+        Description:  Test with a decimal value whose string form has an
+            exponent.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            mysql_clone.sql_lit(
+                decimal.Decimal("0.000000123456789012345678900")),
+            "0.000000123456789012345678900")
+
+    def test_integer(self):
+
+        """Function:  test_integer
+
+        Description:  Test with an integer value.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(mysql_clone.sql_lit(42), "42")
+
+    def test_bytes(self):
+
+        """Function:  test_bytes
+
+        Description:  Test with a binary value.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(mysql_clone.sql_lit(b"\x01\xff"), "0x01ff")
+
+    def test_string_escape(self):
+
+        """Function:  test_string_escape
+
+        Description:  Test with a string containing quotes and backslashes.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(mysql_clone.sql_lit("a'b\\c"), "'a\\'b\\\\c'")
+
+    def test_string(self):
+
+        """Function:  test_string
+
+        Description:  Test with a string value.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            mysql_clone.sql_lit("2026-01-01 00:00:00"),
+            "'2026-01-01 00:00:00'")
+
+
+if __name__ == "__main__":
+    unittest.main()
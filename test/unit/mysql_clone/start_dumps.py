@@ -0,0 +1,293 @@
+# Classification (U)
+
+"""Program:  start_dumps.py
+
+    Description:  Unit testing of start_dumps in mysql_clone.py.
+
+    Usage:
+        test/unit/mysql_clone/start_dumps.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_clone                              # pylint:disable=E0401,C0413
+import lib.gen_libs as gen_libs             # pylint:disable=E0401,C0413,R0402
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class Popen():                                          # pylint:disable=R0903
+
+    """Class:  Popen
+
+    Description:  Class stub holder for subprocess.Popen class.
+
+    Methods:
+        __init__
+        kill
+        wait
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.killed = False
+        self.pid = 4321
+
+    def kill(self):
+
+        """Method:  kill
+
+        Description:  Kill function.
+
+        Arguments:
+
+        """
+
+        self.killed = True
+
+    def wait(self):
+
+        """Method:  wait
+
+        Description:  Wait function.
+
+        Arguments:
+
+        """
+
+        return True
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_no_conns
+        test_dump_failed
+        test_no_snapshot
+        test_not_settled
+        test_settled
+        test_tasks
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.tasks = [{"name": "a"}, {"name": "b"}]
+        self.coords = {"file": "binlog.000001", "pos": 1234, "gtid": ""}
+        self.opt_arg_list = ["--single-transaction", "--all-databases"]
+
+    @mock.patch("mysql_clone.free_conns", mock.Mock(return_value=1))
+    @mock.patch("mysql_clone.subprocess.Popen")
+    @mock.patch("mysql_clone.SnapshotCoord")
+    @mock.patch("mysql_clone.crt_tasks")
+    def test_no_conns(self, mock_tasks, mock_snap, mock_popen):
+
+        """Function:  test_no_conns
+
+        Description:  Test with too few free connections on the source for
+            the dump sessions.
+
+        Arguments:
+
+        """
+
+        mock_tasks.return_value = self.tasks
+
+        with gen_libs.no_std_out():
+            self.assertEqual(
+                mysql_clone.start_dumps(
+                    "Server", "Args", self.opt_arg_list, "ErrFile"),
+                (False, [], [], {}))
+
+        mock_snap.assert_not_called()
+        mock_popen.assert_not_called()
+
+    @mock.patch("mysql_clone.free_conns", mock.Mock(return_value=10))
+    @mock.patch("mysql_clone.crt_task_cmd", mock.Mock(return_value=["cmd"]))
+    @mock.patch("mysql_clone.subprocess.Popen")
+    @mock.patch("mysql_clone.SnapshotCoord")
+    @mock.patch("mysql_clone.crt_tasks")
+    def test_dump_failed(self, mock_tasks, mock_snap, mock_popen):
+
+        """Function:  test_dump_failed
+
+        Description:  Test with the dumps already started killed when a later
+            dump fails to start.
+
+        Arguments:
+
+        """
+
+        proc = Popen()
+        mock_tasks.return_value = self.tasks
+        mock_popen.side_effect = [proc, OSError("Too many open files")]
+
+        with self.assertRaises(OSError):
+            mysql_clone.start_dumps(
+                "Server", "Args", self.opt_arg_list, "ErrFile")
+
+        self.assertTrue(proc.killed)
+        mock_snap.return_value.unlock.assert_called_once_with()
+
+    @mock.patch("mysql_clone.free_conns", mock.Mock(return_value=10))
+    @mock.patch("mysql_clone.crt_task_cmd", mock.Mock(return_value=["cmd"]))
+    @mock.patch("mysql_clone.subprocess.Popen")
+    @mock.patch("mysql_clone.SnapshotCoord")
+    @mock.patch("mysql_clone.crt_tasks")
+    def test_no_snapshot(self, mock_tasks, mock_snap, mock_popen):
+
+        """Function:  test_no_snapshot
+
+        Description:  Test with dump sessions not opening a snapshot.
+
+        Arguments:
+
+        """
+
+        procs = [Popen(), Popen()]
+        mock_tasks.return_value = self.tasks
+        mock_snap.return_value.wait_sessions.return_value = False
+        mock_popen.side_effect = procs
+
+        with gen_libs.no_std_out():
+            self.assertEqual(
+                mysql_clone.start_dumps(
+                    "Server", "Args", self.opt_arg_list, "ErrFile"),
+                (False, [], [], {}))
+
+        self.assertTrue(all(proc.killed for proc in procs))
+        mock_snap.return_value.unlock.assert_called_once_with()
+
+    @mock.patch("mysql_clone.free_conns", mock.Mock(return_value=10))
+    @mock.patch("mysql_clone.crt_task_cmd", mock.Mock(return_value=["cmd"]))
+    @mock.patch("mysql_clone.subprocess.Popen")
+    @mock.patch("mysql_clone.SnapshotCoord")
+    @mock.patch("mysql_clone.crt_tasks")
+    def test_not_settled(self, mock_tasks, mock_snap, mock_popen):
+
+        """Function:  test_not_settled
+
+        Description:  Test with the dump sessions started again after a write
+            was committed while they opened their snapshots.
+
+        Arguments:
+
+        """
+
+        procs = [Popen(), Popen(), Popen(), Popen()]
+        mock_tasks.return_value = self.tasks
+        mock_snap.return_value.lock.return_value = self.coords
+        mock_snap.return_value.wait_sessions.return_value = True
+        mock_snap.return_value.settled.side_effect = [False, True]
+        mock_popen.side_effect = procs
+
+        with gen_libs.no_std_out():
+            status, _, dumps, _ = mysql_clone.start_dumps(
+                "Server", "Args", self.opt_arg_list, "ErrFile")
+
+        self.assertTrue(status)
+        self.assertEqual(dumps, procs[2:])
+        self.assertTrue(all(proc.killed for proc in procs[:2]))
+        self.assertFalse(any(proc.killed for proc in procs[2:]))
+        self.assertEqual(mock_snap.return_value.unlock.call_count, 2)
+
+    @mock.patch("mysql_clone.free_conns", mock.Mock(return_value=10))
+    @mock.patch("mysql_clone.crt_task_cmd", mock.Mock(return_value=["cmd"]))
+    @mock.patch("mysql_clone.subprocess.Popen")
+    @mock.patch("mysql_clone.SnapshotCoord")
+    @mock.patch("mysql_clone.crt_tasks")
+    def test_settled(self, mock_tasks, mock_snap, mock_popen):
+
+        """Function:  test_settled
+
+        Description:  Test with all dump sessions sharing the snapshot.
+
+        Arguments:
+
+        """
+
+        procs = [Popen(), Popen()]
+        mock_tasks.return_value = self.tasks
+        mock_snap.return_value.lock.return_value = self.coords
+        mock_snap.return_value.wait_sessions.return_value = True
+        mock_snap.return_value.settled.return_value = True
+        mock_popen.side_effect = procs
+
+        pids = []
+
+        with gen_libs.no_std_out():
+            self.assertEqual(
+                mysql_clone.start_dumps(
+                    "Server", "Args", self.opt_arg_list, "ErrFile",
+                    pids=pids), (True, self.tasks, procs, self.coords))
+
+        mock_snap.return_value.wait_sessions.assert_called_once_with(2)
+        self.assertEqual(pids, [4321, 4321])
+
+    @mock.patch("mysql_clone.free_conns", mock.Mock(return_value=10))
+    @mock.patch("mysql_clone.crt_task_cmd", mock.Mock(return_value=["cmd"]))
+    @mock.patch("mysql_clone.subprocess.Popen")
+    @mock.patch("mysql_clone.SnapshotCoord")
+    @mock.patch("mysql_clone.crt_tasks")
+    def test_tasks(self, mock_tasks, mock_snap, mock_popen):
+
+        """Function:  test_tasks
+
+        Description:  Test with the tasks passed in.
+
+        Arguments:
+
+        """
+
+        procs = [Popen()]
+        tasks = [{"name": "all", "dbs": ["db1"], "phase": 1, "size": 0}]
+        mock_snap.return_value.lock.return_value = self.coords
+        mock_snap.return_value.wait_sessions.return_value = True
+        mock_snap.return_value.settled.return_value = True
+        mock_popen.side_effect = procs
+
+        with gen_libs.no_std_out():
+            self.assertEqual(
+                mysql_clone.start_dumps(
+                    "Server", "Args", self.opt_arg_list, "ErrFile",
+                    tasks=tasks), (True, tasks, procs, self.coords))
+
+        mock_tasks.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()
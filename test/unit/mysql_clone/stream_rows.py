@@ -0,0 +1,262 @@
+# Classification (U)
+
+"""Program:  stream_rows.py
+
+    Description:  Unit testing of stream_rows in mysql_clone.py.
+
+    Usage:
+        test/unit/mysql_clone/stream_rows.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_clone                              # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class Cursor():
+
+    """Class:  Cursor
+
+    Description:  Class stub holder for an unbuffered cursor class.
+
+    Methods:
+        __init__
+        execute
+        fetchmany
+        close
+
+    """
+
+    def __init__(self, rows):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.rows = list(rows)
+        self.cmd = None
+        self.params = None
+        self.with_rows = True
+        self.closed = False
+
+    def execute(self, cmd, params=None):
+
+        """Method:  execute
+
+        Description:  Stub holder for execute method.
+
+        Arguments:
+
+        """
+
+        self.cmd = cmd
+        self.params = params
+
+    def fetchmany(self, size):
+
+        """Method:  fetchmany
+
+        Description:  Stub holder for fetchmany method.
+
+        Arguments:
+
+        """
+
+        rows, self.rows = self.rows[:size], self.rows[size:]
+
+        return rows
+
+    def close(self):
+
+        """Method:  close
+
+        Description:  Stub holder for close method.
+
+        Arguments:
+
+        """
+
+        self.closed = True
+
+
+class Conn():                                           # pylint:disable=R0903
+
+    """Class:  Conn
+
+    Description:  Class stub holder for a database connection class.
+
+    Methods:
+        __init__
+        cursor
+
+    """
+
+    def __init__(self, cur):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.cur = cur
+        self.buffered = None
+
+    def cursor(self, buffered=None):
+
+        """Method:  cursor
+
+        Description:  Stub holder for cursor method.
+
+        Arguments:
+
+        """
+
+        self.buffered = buffered
+
+        return self.cur
+
+
+class Server():                                         # pylint:disable=R0903
+
+    """Class:  Server
+
+    Description:  Class stub holder for mysql_class.Server class.
+
+    Methods:
+        __init__
+
+    """
+
+    def __init__(self, cur):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.conn = Conn(cur)
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_stopped_early
+        test_params
+        test_throttle
+        test_all_rows
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.cur = Cursor([(1,), (2,), (3,)])
+        self.server = Server(self.cur)
+        self.cmd = "select id from t1"
+
+    def test_stopped_early(self):
+
+        """Function:  test_stopped_early
+
+        Description:  Test with the rest of the rows drained when the stream
+            is stopped early.
+
+        Arguments:
+
+        """
+
+        rows = mysql_clone.stream_rows(self.server, self.cmd, fetch_size=1)
+        next(rows)
+        rows.close()
+
+        self.assertEqual(self.cur.rows, [])
+        self.assertTrue(self.cur.closed)
+
+    def test_params(self):
+
+        """Function:  test_params
+
+        Description:  Test with parameters passed to the query.
+
+        Arguments:
+
+        """
+
+        list(mysql_clone.stream_rows(self.server, self.cmd, params=("a",)))
+
+        self.assertEqual(self.cur.params, ("a",))
+
+    def test_throttle(self):
+
+        """Function:  test_throttle
+
+        Description:  Test with the rows of each fetch taken from the
+            throttle.
+
+        Arguments:
+
+        """
+
+        throttle = mock.Mock()
+        list(mysql_clone.stream_rows(
+            self.server, self.cmd, fetch_size=2, throttle=throttle))
+
+        self.assertEqual(
+            throttle.take.call_args_list,
+            [mock.call(rows=2), mock.call(rows=1)])
+
+    def test_all_rows(self):
+
+        """Function:  test_all_rows
+
+        Description:  Test with all rows streamed over several fetches.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            list(mysql_clone.stream_rows(self.server, self.cmd, fetch_size=2)),
+            [(1,), (2,), (3,)])
+        self.assertFalse(self.server.conn.buffered)
+        self.assertTrue(self.cur.closed)
+
+
+if __name__ == "__main__":
+    unittest.main()
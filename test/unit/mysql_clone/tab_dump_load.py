@@ -0,0 +1,401 @@
+# Classification (U)
+
+"""Program:  tab_dump_load.py
+
+    Description:  Unit testing of tab_dump_load in mysql_clone.py.
+
+    Usage:
+        test/unit/mysql_clone/tab_dump_load.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_clone                              # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class ArgParser():
+
+    """Class:  ArgParser
+
+    Description:  Class stub holder for gen_class.ArgParser class.
+
+    Methods:
+        __init__
+        arg_exist
+        get_val
+        arg_set_path
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.cmdline = None
+        self.args_array = {"-n": True, "-s": "/stage"}
+
+    def arg_exist(self, arg):
+
+        """Method:  arg_exist
+
+        Description:  Method stub holder for gen_class.ArgParser.arg_exist.
+
+        Arguments:
+
+        """
+
+        return arg in self.args_array
+
+    def get_val(self, skey, def_val=None):
+
+        """Method:  get_val
+
+        Description:  Method stub holder for gen_class.ArgParser.get_val.
+
+        Arguments:
+
+        """
+
+        return self.args_array.get(skey, def_val)
+
+    def arg_set_path(self, arg_opt, **kwargs):
+
+        """Method:  arg_set_path
+
+        Description:  Method stub holder for gen_class.ArgParser.arg_set_path.
+
+        Arguments:
+
+        """
+
+        return os.path.join(
+            self.args_array[arg_opt] if arg_opt in self.args_array else "",
+            kwargs.get("cmd", ""))
+
+
+class Server():                                         # pylint:disable=R0903
+
+    """Class:  Server
+
+    Description:  Class stub holder for mysql_class.Server class.
+
+    Methods:
+        __init__
+        cmd_sql
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.cmds = []
+
+    def cmd_sql(self, cmd):
+
+        """Method:  cmd_sql
+
+        Description:  Method stub holder for mysql_class.Server.cmd_sql.
+
+        Arguments:
+
+        """
+
+        self.cmds.append(cmd)
+
+
+def native_dump(*args, **kwargs):                       # pylint:disable=W0613
+
+    """Function:  native_dump
+
+    Description:  Stub holder for native_dump that defers an index.
+
+    Arguments:
+
+    """
+
+    kwargs["deferred"].append("ALTER TABLE `db1`.`t1` ADD KEY `a` (`a`)")
+
+    return []
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_schema_failed
+        test_load_failed
+        test_load_bounded
+        test_empty_table
+        test_deferred_indexes
+        test_loaded
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.source = Server()
+        self.clone = Server()
+        self.args = ArgParser()
+        self.opt_arg_list = ["--single-transaction", "--triggers"]
+        self.cfg = {
+            "load_cmd": ["mysql"], "set_gtid": True, "max_len": 1024,
+            "dump_args": {"ignore": ["db1.t3"], "triggers": True,
+                          "routines": False, "events": False}}
+        self.tbls = [{"db": "db1", "tbl": "t1"}, {"db": "db1", "tbl": "t2"},
+                     {"db": "db1", "tbl": "t3"}]
+        self.coords = {"file": "binlog.000001", "pos": 4, "gtid": "uuid:1-10"}
+
+    @mock.patch("mysql_clone.tab_dump_tbl")
+    @mock.patch("mysql_clone.pipe_stmts", mock.Mock(return_value=False))
+    @mock.patch("mysql_clone.native_dump", mock.Mock(return_value=[]))
+    @mock.patch("mysql_clone.fetch_tbls")
+    @mock.patch("mysql_clone.fetch_dbs", mock.Mock(return_value=["db1"]))
+    @mock.patch("mysql_clone.native_snap")
+    @mock.patch("mysql_clone.native_cfg")
+    def test_schema_failed(                     # pylint:disable=R0913,R0917
+            self, mock_cfg, mock_snap, mock_tbls, mock_dump):
+
+        """Function:  test_schema_failed
+
+        Description:  Test with the schema failing to load.
+
+        Arguments:
+
+        """
+
+        mock_cfg.return_value = self.cfg
+        mock_snap.return_value = self.coords
+        mock_tbls.return_value = self.tbls
+
+        self.assertEqual(
+            mysql_clone.tab_dump_load(
+                self.source, self.clone, self.args, self.opt_arg_list),
+            (False, self.coords))
+        mock_dump.assert_not_called()
+        self.assertEqual(self.source.cmds, ["commit"])
+        self.assertEqual(self.clone.cmds, [])
+
+    @mock.patch("mysql_clone.load_file", mock.Mock(side_effect=[True, False]))
+    @mock.patch("mysql_clone.tab_dump_tbl", mock.Mock(return_value=10))
+    @mock.patch("mysql_clone.fetch_cols",
+                mock.Mock(return_value=[("id", "int")]))
+    @mock.patch("mysql_clone.pipe_stmts")
+    @mock.patch("mysql_clone.native_dump", mock.Mock(return_value=[]))
+    @mock.patch("mysql_clone.fetch_tbls")
+    @mock.patch("mysql_clone.fetch_dbs", mock.Mock(return_value=["db1"]))
+    @mock.patch("mysql_clone.native_snap")
+    @mock.patch("mysql_clone.native_cfg")
+    def test_load_failed(                       # pylint:disable=R0913,R0917
+            self, mock_cfg, mock_snap, mock_tbls, mock_pipe):
+
+        """Function:  test_load_failed
+
+        Description:  Test with a table failing to load.
+
+        Arguments:
+
+        """
+
+        mock_cfg.return_value = self.cfg
+        mock_snap.return_value = self.coords
+        mock_tbls.return_value = self.tbls
+        mock_pipe.return_value = True
+
+        status, _ = mysql_clone.tab_dump_load(
+            self.source, self.clone, self.args, self.opt_arg_list)
+
+        self.assertFalse(status)
+        self.assertEqual(mock_pipe.call_count, 1)
+        self.assertEqual(self.clone.cmds, [])
+
+    @mock.patch("mysql_clone.load_file", mock.Mock(return_value=False))
+    @mock.patch("mysql_clone.tab_dump_tbl")
+    @mock.patch("mysql_clone.fetch_cols",
+                mock.Mock(return_value=[("id", "int")]))
+    @mock.patch("mysql_clone.pipe_stmts", mock.Mock(return_value=True))
+    @mock.patch("mysql_clone.native_dump", mock.Mock(return_value=[]))
+    @mock.patch("mysql_clone.fetch_tbls")
+    @mock.patch("mysql_clone.fetch_dbs", mock.Mock(return_value=["db1"]))
+    @mock.patch("mysql_clone.native_snap")
+    @mock.patch("mysql_clone.native_cfg")
+    def test_load_bounded(                      # pylint:disable=R0913,R0917
+            self, mock_cfg, mock_snap, mock_tbls, mock_tab):
+
+        """Function:  test_load_bounded
+
+        Description:  Test with the dump waiting on the files queued to load
+            and stopping once a load fails.
+
+        Arguments:
+
+        """
+
+        self.args.args_array["-j"] = "1"
+        self.cfg["dump_args"]["ignore"] = []
+        mock_cfg.return_value = self.cfg
+        mock_snap.return_value = self.coords
+        mock_tbls.return_value = self.tbls
+        mock_tab.return_value = 10
+
+        status, _ = mysql_clone.tab_dump_load(
+            self.source, self.clone, self.args, self.opt_arg_list)
+
+        self.assertFalse(status)
+        self.assertEqual(mock_tab.call_count, 2)
+
+    @mock.patch("mysql_clone.os.remove")
+    @mock.patch("mysql_clone.load_file")
+    @mock.patch("mysql_clone.tab_dump_tbl", mock.Mock(return_value=0))
+    @mock.patch("mysql_clone.fetch_cols",
+                mock.Mock(return_value=[("id", "int")]))
+    @mock.patch("mysql_clone.pipe_stmts", mock.Mock(return_value=True))
+    @mock.patch("mysql_clone.native_dump", mock.Mock(return_value=[]))
+    @mock.patch("mysql_clone.fetch_tbls")
+    @mock.patch("mysql_clone.fetch_dbs", mock.Mock(return_value=["db1"]))
+    @mock.patch("mysql_clone.native_snap")
+    @mock.patch("mysql_clone.native_cfg")
+    def test_empty_table(                       # pylint:disable=R0913,R0917
+            self, mock_cfg, mock_snap, mock_tbls, mock_load, mock_remove):
+
+        """Function:  test_empty_table
+
+        Description:  Test with empty tables not loaded.
+
+        Arguments:
+
+        """
+
+        mock_cfg.return_value = self.cfg
+        mock_snap.return_value = self.coords
+        mock_tbls.return_value = self.tbls[:1]
+
+        status, _ = mysql_clone.tab_dump_load(
+            self.source, self.clone, self.args, self.opt_arg_list)
+
+        self.assertTrue(status)
+        mock_load.assert_not_called()
+        mock_remove.assert_called_once_with("/stage/000000.txt")
+
+    @mock.patch("mysql_clone.build_indexes")
+    @mock.patch("mysql_clone.load_file", mock.Mock(return_value=True))
+    @mock.patch("mysql_clone.tab_dump_tbl", mock.Mock(return_value=10))
+    @mock.patch("mysql_clone.fetch_cols",
+                mock.Mock(return_value=[("id", "int")]))
+    @mock.patch("mysql_clone.pipe_stmts", mock.Mock(return_value=True))
+    @mock.patch("mysql_clone.native_dump")
+    @mock.patch("mysql_clone.fetch_tbls")
+    @mock.patch("mysql_clone.fetch_dbs", mock.Mock(return_value=["db1"]))
+    @mock.patch("mysql_clone.native_snap")
+    @mock.patch("mysql_clone.native_cfg")
+    def test_deferred_indexes(                  # pylint:disable=R0913,R0917
+            self, mock_cfg, mock_snap, mock_tbls, mock_dump, mock_build):
+
+        """Function:  test_deferred_indexes
+
+        Description:  Test with the secondary indexes built after the load.
+
+        Arguments:
+
+        """
+
+        self.args.args_array.update({"-x": True, "-j": "8"})
+        self.cfg["dump_args"]["triggers"] = False
+        mock_cfg.return_value = self.cfg
+        mock_snap.return_value = self.coords
+        mock_tbls.return_value = self.tbls
+        mock_dump.side_effect = native_dump
+        mock_build.return_value = True
+
+        self.assertEqual(
+            mysql_clone.tab_dump_load(
+                self.source, self.clone, self.args, self.opt_arg_list),
+            (True, self.coords))
+        self.assertEqual(
+            mock_build.call_args[0],
+            (["mysql"], ["ALTER TABLE `db1`.`t1` ADD KEY `a` (`a`)"], 8))
+
+    @mock.patch("mysql_clone.native_dump_tbl", mock.Mock(return_value=[]))
+    @mock.patch("mysql_clone.load_file")
+    @mock.patch("mysql_clone.tab_dump_tbl", mock.Mock(return_value=10))
+    @mock.patch("mysql_clone.fetch_cols",
+                mock.Mock(return_value=[("id", "int")]))
+    @mock.patch("mysql_clone.pipe_stmts")
+    @mock.patch("mysql_clone.native_dump")
+    @mock.patch("mysql_clone.fetch_tbls")
+    @mock.patch("mysql_clone.fetch_dbs", mock.Mock(return_value=["db1"]))
+    @mock.patch("mysql_clone.native_snap")
+    @mock.patch("mysql_clone.native_cfg")
+    def test_loaded(                            # pylint:disable=R0913,R0917
+            self, mock_cfg, mock_snap, mock_tbls, mock_dump, mock_pipe,
+            mock_load):
+
+        """Function:  test_loaded
+
+        Description:  Test with the schema, tables and triggers loaded.
+
+        Arguments:
+
+        """
+
+        mock_cfg.return_value = self.cfg
+        mock_snap.return_value = self.coords
+        mock_tbls.return_value = self.tbls
+        mock_dump.return_value = []
+        mock_pipe.return_value = True
+        mock_load.return_value = True
+
+        self.assertEqual(
+            mysql_clone.tab_dump_load(
+                self.source, self.clone, self.args, self.opt_arg_list),
+            (True, self.coords))
+        self.assertTrue(mock_dump.call_args[1]["no_data"])
+        self.assertFalse(mock_dump.call_args[1]["triggers"])
+        self.assertEqual(
+            [call[0][2] for call in mock_load.call_args_list],
+            ["/stage/000000.txt", "/stage/000001.txt"])
+        self.assertEqual(mock_pipe.call_count, 2)
+        self.assertEqual(
+            self.clone.cmds, ["set global gtid_purged = 'uuid:1-10'"])
+
+
+if __name__ == "__main__":
+    unittest.main()
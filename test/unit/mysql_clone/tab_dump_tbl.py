@@ -0,0 +1,100 @@
+# Classification (U)
+
+"""Program:  tab_dump_tbl.py
+
+    Description:  Unit testing of tab_dump_tbl in mysql_clone.py.
+
+    Usage:
+        test/unit/mysql_clone/tab_dump_tbl.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_clone                              # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_no_rows
+        test_rows
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.server = "Server"
+        self.cols = [("id", "int"), ("data", "blob"), ("name", "varchar")]
+        self.fname = "/stage/000001.txt"
+
+    @mock.patch("mysql_clone.open", new_callable=mock.mock_open)
+    @mock.patch("mysql_clone.stream_rows", mock.Mock(return_value=[]))
+    def test_no_rows(self, mock_open):
+
+        """Function:  test_no_rows
+
+        Description:  Test with an empty table.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            mysql_clone.tab_dump_tbl(
+                self.server, "db1", "t1", self.cols, self.fname), 0)
+        mock_open().write.assert_not_called()
+
+    @mock.patch("mysql_clone.open", new_callable=mock.mock_open)
+    @mock.patch("mysql_clone.stream_rows")
+    def test_rows(self, mock_rows, mock_open):
+
+        """Function:  test_rows
+
+        Description:  Test with rows written to the file.
+
+        Arguments:
+
+        """
+
+        mock_rows.return_value = [(1, b"\x01", "a\tb"), (2, None, None)]
+
+        self.assertEqual(
+            mysql_clone.tab_dump_tbl(
+                self.server, "db1", "t1", self.cols, self.fname), 2)
+        self.assertEqual(
+            mock_rows.call_args[0][1],
+            "select `id`,`data`,`name` from `db1`.`t1`")
+        self.assertEqual(
+            [call[0][0] for call in mock_open().write.call_args_list],
+            [b"1\t01\ta\\tb\n", b"2\t\\N\t\\N\n"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,201 @@
+# Classification (U)
+
+"""Program:  teesink_init.py
+
+    Description:  Unit testing of TeeSink.__init__ in mysql_clone.py.
+
+    Usage:
+        test/unit/mysql_clone/teesink_init.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import threading
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_clone                              # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class Stdin():
+
+    """Class:  Stdin
+
+    Description:  Class stub holder for a process stdin pipe.
+
+    Methods:
+        __init__
+        write
+        close
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.data = b""
+        self.closed = False
+        self.error = None
+        self.ready = threading.Event()
+        self.ready.set()
+
+    def write(self, data):
+
+        """Method:  write
+
+        Description:  Stub holder for write method.
+
+        Arguments:
+
+        """
+
+        self.ready.wait()
+
+        if self.error:
+            raise self.error
+
+        self.data += data
+
+    def close(self):
+
+        """Method:  close
+
+        Description:  Stub holder for close method.
+
+        Arguments:
+
+        """
+
+        self.closed = True
+
+
+class Popen():                                          # pylint:disable=R0903
+
+    """Class:  Popen
+
+    Description:  Class stub holder for subprocess.Popen class.
+
+    Methods:
+        __init__
+        wait
+
+    """
+
+    def __init__(self, returncode=0):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.stdin = Stdin()
+        self.returncode = returncode
+
+    def wait(self):
+
+        """Method:  wait
+
+        Description:  Wait function.
+
+        Arguments:
+
+        """
+
+        return self.returncode
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        tearDown
+        test_kwargs
+        test_default
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.proc = Popen()
+        self.sink = None
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Clean up of unit testing.
+
+        Arguments:
+
+        """
+
+        self.sink.close()
+        self.sink.wait()
+
+    def test_kwargs(self):
+
+        """Function:  test_kwargs
+
+        Description:  Test with the depth and spill directory passed.
+
+        Arguments:
+
+        """
+
+        self.sink = mysql_clone.TeeSink(self.proc, depth=4, spill_dir="/tmp")
+
+        self.assertEqual(self.sink.queue.maxsize, 4)
+        self.assertEqual(self.sink.spill_dir, "/tmp")
+
+    def test_default(self):
+
+        """Function:  test_default
+
+        Description:  Test with the default settings.
+
+        Arguments:
+
+        """
+
+        self.sink = mysql_clone.TeeSink(self.proc)
+
+        self.assertEqual(self.sink.queue.maxsize, 32)
+        self.assertIsNone(self.sink.spill)
+        self.assertFalse(self.sink.done)
+        self.assertTrue(self.sink.thr.is_alive())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,226 @@
+# Classification (U)
+
+"""Program:  teesink_put.py
+
+    Description:  Unit testing of TeeSink.put in mysql_clone.py.
+
+    Usage:
+        test/unit/mysql_clone/teesink_put.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import threading
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_clone                              # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class Stdin():
+
+    """Class:  Stdin
+
+    Description:  Class stub holder for a process stdin pipe.
+
+    Methods:
+        __init__
+        write
+        close
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.data = b""
+        self.closed = False
+        self.error = None
+        self.ready = threading.Event()
+        self.ready.set()
+
+    def write(self, data):
+
+        """Method:  write
+
+        Description:  Stub holder for write method.
+
+        Arguments:
+
+        """
+
+        self.ready.wait()
+
+        if self.error:
+            raise self.error
+
+        self.data += data
+
+    def close(self):
+
+        """Method:  close
+
+        Description:  Stub holder for close method.
+
+        Arguments:
+
+        """
+
+        self.closed = True
+
+
+class Popen():                                          # pylint:disable=R0903
+
+    """Class:  Popen
+
+    Description:  Class stub holder for subprocess.Popen class.
+
+    Methods:
+        __init__
+        wait
+
+    """
+
+    def __init__(self, returncode=0):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.stdin = Stdin()
+        self.returncode = returncode
+
+    def wait(self):
+
+        """Method:  wait
+
+        Description:  Wait function.
+
+        Arguments:
+
+        """
+
+        return self.returncode
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_load_failed
+        test_spill
+        test_queued
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.proc = Popen()
+
+    def test_load_failed(self):
+
+        """Function:  test_load_failed
+
+        Description:  Test with the load process failed.
+
+        Arguments:
+
+        """
+
+        sink = mysql_clone.TeeSink(self.proc, depth=1)
+        sink.error = BrokenPipeError()
+        sink.put(b"chunk")
+
+        self.assertTrue(sink.queue.empty())
+        self.assertIsNone(sink.spill)
+
+        sink.close()
+        sink.wait()
+
+    def test_spill(self):
+
+        """Function:  test_spill
+
+        Description:  Test with the queue full and the chunks spilled to
+            disk.
+
+        Arguments:
+
+        """
+
+        self.proc.stdin.ready.clear()
+        sink = mysql_clone.TeeSink(self.proc, depth=1)
+        sink.put(b"one,")
+
+        # Wait until the writer holds the first chunk
+        while not sink.queue.empty():
+            sink.thr.join(0.01)
+
+        sink.put(b"two,")
+        sink.put(b"three,")
+        sink.put(b"four")
+
+        self.assertIsNotNone(sink.spill)
+        self.assertEqual(sink.spilled, 10)
+
+        self.proc.stdin.ready.set()
+        sink.close()
+
+        self.assertTrue(sink.wait())
+        self.assertEqual(self.proc.stdin.data, b"one,two,three,four")
+
+    def test_queued(self):
+
+        """Function:  test_queued
+
+        Description:  Test with the chunks queued.
+
+        Arguments:
+
+        """
+
+        sink = mysql_clone.TeeSink(self.proc)
+        sink.put(b"one,")
+        sink.put(b"two")
+        sink.close()
+
+        self.assertTrue(sink.wait())
+        self.assertIsNone(sink.spill)
+        self.assertEqual(self.proc.stdin.data, b"one,two")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,193 @@
+# Classification (U)
+
+"""Program:  teesink_run.py
+
+    Description:  Unit testing of TeeSink.run in mysql_clone.py.
+
+    Usage:
+        test/unit/mysql_clone/teesink_run.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import threading
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_clone                              # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class Stdin():
+
+    """Class:  Stdin
+
+    Description:  Class stub holder for a process stdin pipe.
+
+    Methods:
+        __init__
+        write
+        close
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.data = b""
+        self.closed = False
+        self.error = None
+        self.ready = threading.Event()
+        self.ready.set()
+
+    def write(self, data):
+
+        """Method:  write
+
+        Description:  Stub holder for write method.
+
+        Arguments:
+
+        """
+
+        self.ready.wait()
+
+        if self.error:
+            raise self.error
+
+        self.data += data
+
+    def close(self):
+
+        """Method:  close
+
+        Description:  Stub holder for close method.
+
+        Arguments:
+
+        """
+
+        self.closed = True
+
+
+class Popen():                                          # pylint:disable=R0903
+
+    """Class:  Popen
+
+    Description:  Class stub holder for subprocess.Popen class.
+
+    Methods:
+        __init__
+        wait
+
+    """
+
+    def __init__(self, returncode=0):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.stdin = Stdin()
+        self.returncode = returncode
+
+    def wait(self):
+
+        """Method:  wait
+
+        Description:  Wait function.
+
+        Arguments:
+
+        """
+
+        return self.returncode
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_broken_pipe
+        test_stdin_closed
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.proc = Popen()
+
+    def test_broken_pipe(self):
+
+        """Function:  test_broken_pipe
+
+        Description:  Test with the load process exiting early.
+
+        Arguments:
+
+        """
+
+        self.proc.stdin.error = BrokenPipeError()
+        sink = mysql_clone.TeeSink(self.proc)
+        sink.put(b"chunk")
+        sink.close()
+        sink.thr.join()
+
+        self.assertIsInstance(sink.error, BrokenPipeError)
+        self.assertTrue(self.proc.stdin.closed)
+
+    def test_stdin_closed(self):
+
+        """Function:  test_stdin_closed
+
+        Description:  Test with the load process stdin closed at the end of
+            the stream.
+
+        Arguments:
+
+        """
+
+        sink = mysql_clone.TeeSink(self.proc)
+        sink.put(b"chunk")
+        sink.close()
+        sink.thr.join()
+
+        self.assertIsNone(sink.error)
+        self.assertTrue(self.proc.stdin.closed)
+        self.assertEqual(self.proc.stdin.data, b"chunk")
+
+
+if __name__ == "__main__":
+    unittest.main()
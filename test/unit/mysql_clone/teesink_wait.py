@@ -0,0 +1,195 @@
+# Classification (U)
+
+"""Program:  teesink_wait.py
+
+    Description:  Unit testing of TeeSink.wait in mysql_clone.py.
+
+    Usage:
+        test/unit/mysql_clone/teesink_wait.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import threading
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_clone                              # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class Stdin():
+
+    """Class:  Stdin
+
+    Description:  Class stub holder for a process stdin pipe.
+
+    Methods:
+        __init__
+        write
+        close
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.data = b""
+        self.closed = False
+        self.error = None
+        self.ready = threading.Event()
+        self.ready.set()
+
+    def write(self, data):
+
+        """Method:  write
+
+        Description:  Stub holder for write method.
+
+        Arguments:
+
+        """
+
+        self.ready.wait()
+
+        if self.error:
+            raise self.error
+
+        self.data += data
+
+    def close(self):
+
+        """Method:  close
+
+        Description:  Stub holder for close method.
+
+        Arguments:
+
+        """
+
+        self.closed = True
+
+
+class Popen():                                          # pylint:disable=R0903
+
+    """Class:  Popen
+
+    Description:  Class stub holder for subprocess.Popen class.
+
+    Methods:
+        __init__
+        wait
+
+    """
+
+    def __init__(self, returncode=0):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.stdin = Stdin()
+        self.returncode = returncode
+
+    def wait(self):
+
+        """Method:  wait
+
+        Description:  Wait function.
+
+        Arguments:
+
+        """
+
+        return self.returncode
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        test_load_failed
+        test_spill_removed
+        test_loaded
+
+    """
+
+    def test_load_failed(self):
+
+        """Function:  test_load_failed
+
+        Description:  Test with the load process failing.
+
+        Arguments:
+
+        """
+
+        sink = mysql_clone.TeeSink(Popen(returncode=1))
+        sink.close()
+
+        self.assertFalse(sink.wait())
+
+    def test_spill_removed(self):
+
+        """Function:  test_spill_removed
+
+        Description:  Test with the spill file closed.
+
+        Arguments:
+
+        """
+
+        proc = Popen()
+        proc.stdin.ready.clear()
+        sink = mysql_clone.TeeSink(proc, depth=1)
+        sink.put(b"one,")
+        sink.put(b"two,")
+        sink.put(b"three")
+        proc.stdin.ready.set()
+        sink.close()
+
+        self.assertTrue(sink.wait())
+        self.assertTrue(sink.spill.closed)
+        self.assertEqual(proc.stdin.data, b"one,two,three")
+
+    def test_loaded(self):
+
+        """Function:  test_loaded
+
+        Description:  Test with the stream loaded.
+
+        Arguments:
+
+        """
+
+        sink = mysql_clone.TeeSink(Popen())
+        sink.close()
+
+        self.assertTrue(sink.wait())
+
+
+if __name__ == "__main__":
+    unittest.main()
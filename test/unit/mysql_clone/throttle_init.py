@@ -0,0 +1,82 @@
+# Classification (U)
+
+"""Program:  throttle_init.py
+
+    Description:  Unit testing of Throttle.__init__ in mysql_clone.py.
+
+    Usage:
+        test/unit/mysql_clone/throttle_init.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import tempfile
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_clone                              # pylint:disable=E0401,C0413
+import lib.gen_libs as gen_libs             # pylint:disable=E0401,C0413,R0402
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        test_ctl_file
+        test_rates
+
+    """
+
+    def test_ctl_file(self):
+
+        """Function:  test_ctl_file
+
+        Description:  Test with the rates read from a control file.
+
+        Arguments:
+
+        """
+
+        with tempfile.NamedTemporaryFile(mode="w") as fhandle:
+            fhandle.write("20,5000")
+            fhandle.flush()
+
+            with gen_libs.no_std_out():
+                throttle = mysql_clone.Throttle(fhandle.name)
+
+        self.assertEqual(throttle.ctl_file, fhandle.name)
+        self.assertEqual(
+            (throttle.mb_rate, throttle.row_rate), (20.0, 5000.0))
+
+    def test_rates(self):
+
+        """Function:  test_rates
+
+        Description:  Test with fixed rates.
+
+        Arguments:
+
+        """
+
+        throttle = mysql_clone.Throttle("50", burst=2.0)
+
+        self.assertIsNone(throttle.ctl_file)
+        self.assertEqual((throttle.mb_rate, throttle.row_rate), (50.0, 0.0))
+        self.assertEqual(throttle.burst, 2.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
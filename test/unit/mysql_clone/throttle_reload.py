@@ -0,0 +1,186 @@
+# Classification (U)
+
+"""Program:  throttle_reload.py
+
+    Description:  Unit testing of Throttle.reload in mysql_clone.py.
+
+    Usage:
+        test/unit/mysql_clone/throttle_reload.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import tempfile
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_clone                              # pylint:disable=E0401,C0413
+import lib.gen_libs as gen_libs             # pylint:disable=E0401,C0413,R0402
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+def rewrite(fhandle, text):
+
+    """Function:  rewrite
+
+    Description:  Rewrite the control file with a new modification time.
+
+    Arguments:
+
+    """
+
+    fhandle.seek(0)
+    fhandle.truncate()
+    fhandle.write(text)
+    fhandle.flush()
+    os.utime(fhandle.name, (1, 1))
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        tearDown
+        test_fixed_rates
+        test_checked_recently
+        test_unchanged
+        test_invalid_file
+        test_changed
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.fhandle = tempfile.NamedTemporaryFile(   # pylint:disable=R1732
+            mode="w")
+        self.fhandle.write("20")
+        self.fhandle.flush()
+
+        with gen_libs.no_std_out():
+            self.throttle = mysql_clone.Throttle(self.fhandle.name)
+
+        self.throttle.checked = 0.0
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Clean up of unit testing.
+
+        Arguments:
+
+        """
+
+        self.fhandle.close()
+
+    def test_fixed_rates(self):
+
+        """Function:  test_fixed_rates
+
+        Description:  Test with fixed rates and no control file.
+
+        Arguments:
+
+        """
+
+        throttle = mysql_clone.Throttle("50")
+        throttle.reload()
+
+        self.assertEqual(throttle.mb_rate, 50.0)
+        self.assertEqual(throttle.checked, 0.0)
+
+    def test_checked_recently(self):
+
+        """Function:  test_checked_recently
+
+        Description:  Test with the control file checked less than a second
+            ago.
+
+        Arguments:
+
+        """
+
+        self.throttle.checked = mysql_clone.time.monotonic()
+        self.throttle.ctl_mtime = None
+        rewrite(self.fhandle, "40")
+        self.throttle.reload()
+
+        self.assertEqual(self.throttle.mb_rate, 20.0)
+
+    def test_unchanged(self):
+
+        """Function:  test_unchanged
+
+        Description:  Test with the control file not changed since it was
+            read.
+
+        Arguments:
+
+        """
+
+        self.throttle.mb_rate = 10.0
+        self.throttle.reload()
+
+        self.assertEqual(self.throttle.mb_rate, 10.0)
+
+    def test_invalid_file(self):
+
+        """Function:  test_invalid_file
+
+        Description:  Test with an invalid control file leaving the rates
+            unchanged.
+
+        Arguments:
+
+        """
+
+        rewrite(self.fhandle, "fast")
+
+        with gen_libs.no_std_out():
+            self.throttle.reload()
+
+        self.assertEqual(self.throttle.mb_rate, 20.0)
+        self.assertIsNone(self.throttle.ctl_mtime)
+
+    def test_changed(self):
+
+        """Function:  test_changed
+
+        Description:  Test with the rates changed in the control file.
+
+        Arguments:
+
+        """
+
+        rewrite(self.fhandle, "40,1000")
+
+        with gen_libs.no_std_out():
+            self.throttle.reload()
+
+        self.assertEqual(
+            (self.throttle.mb_rate, self.throttle.row_rate), (40.0, 1000.0))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,106 @@
+# Classification (U)
+
+"""Program:  throttle_report.py
+
+    Description:  Unit testing of Throttle.report in mysql_clone.py.
+
+    Usage:
+        test/unit/mysql_clone/throttle_report.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_clone                              # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_nothing_moved
+        test_unlimited_rows
+        test_limits
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.throttle = mysql_clone.Throttle("50")
+        self.throttle.start = 100.0
+        self.throttle.end = 110.0
+        self.throttle.waited = 2.5
+
+    def test_nothing_moved(self):
+
+        """Function:  test_nothing_moved
+
+        Description:  Test with nothing moved through the throttle.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            self.throttle.report(),
+            "Throttle:  nothing moved, waited 2.5 seconds")
+
+    def test_unlimited_rows(self):
+
+        """Function:  test_unlimited_rows
+
+        Description:  Test with rows moved without a rows limit.
+
+        Arguments:
+
+        """
+
+        self.throttle.totals["rows"] = 5000
+
+        self.assertEqual(
+            self.throttle.report(),
+            "Throttle:  500.0 rows/s, waited 2.5 seconds")
+
+    def test_limits(self):
+
+        """Function:  test_limits
+
+        Description:  Test with the rate against the limit.
+
+        Arguments:
+
+        """
+
+        self.throttle.totals["bytes"] = 450 * 1024 * 1024
+
+        self.assertEqual(
+            self.throttle.report(),
+            "Throttle:  45.0 MB/s of 50 MB/s limit (90%), waited 2.5 seconds")
+
+
+if __name__ == "__main__":
+    unittest.main()
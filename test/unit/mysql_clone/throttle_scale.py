@@ -0,0 +1,102 @@
+# Classification (U)
+
+"""Program:  throttle_scale.py
+
+    Description:  Unit testing of Throttle.scale in mysql_clone.py.
+
+    Usage:
+        test/unit/mysql_clone/throttle_scale.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_clone                              # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_resume
+        test_pause
+        test_scale
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.throttle = mysql_clone.Throttle("50")
+
+    def test_resume(self):
+
+        """Function:  test_resume
+
+        Description:  Test with paused streams resumed.
+
+        Arguments:
+
+        """
+
+        self.throttle.scale(0)
+        self.throttle.scale(0.25)
+
+        self.assertTrue(self.throttle.resume.is_set())
+        self.assertEqual(self.throttle.factor, 0.25)
+
+    def test_pause(self):
+
+        """Function:  test_pause
+
+        Description:  Test with the streams paused.
+
+        Arguments:
+
+        """
+
+        self.throttle.scale(0)
+
+        self.assertFalse(self.throttle.resume.is_set())
+
+    def test_scale(self):
+
+        """Function:  test_scale
+
+        Description:  Test with the rates scaled.
+
+        Arguments:
+
+        """
+
+        self.throttle.scale(0.5)
+
+        self.assertEqual(self.throttle.factor, 0.5)
+        self.assertTrue(self.throttle.resume.is_set())
+
+
+if __name__ == "__main__":
+    unittest.main()
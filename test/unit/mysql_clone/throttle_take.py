@@ -0,0 +1,134 @@
+# Classification (U)
+
+"""Program:  throttle_take.py
+
+    Description:  Unit testing of Throttle.take in mysql_clone.py.
+
+    Usage:
+        test/unit/mysql_clone/throttle_take.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_clone                              # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_unlimited
+        test_in_credit
+        test_rows_short
+        test_bytes_short
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.mbyte = 1024 * 1024
+
+    @mock.patch("mysql_clone.time.sleep")
+    def test_unlimited(self, mock_sleep):
+
+        """Function:  test_unlimited
+
+        Description:  Test with no limits set.
+
+        Arguments:
+
+        """
+
+        throttle = mysql_clone.Throttle("0,0")
+        throttle.take(10 * self.mbyte, rows=1000)
+
+        mock_sleep.assert_not_called()
+        self.assertEqual(
+            throttle.totals, {"bytes": 10 * self.mbyte, "rows": 1000})
+
+    @mock.patch("mysql_clone.time.monotonic")
+    @mock.patch("mysql_clone.time.sleep")
+    def test_in_credit(self, mock_sleep, mock_time):
+
+        """Function:  test_in_credit
+
+        Description:  Test with the tokens refilled since the last take.
+
+        Arguments:
+
+        """
+
+        mock_time.side_effect = [100.0, 100.0, 100.0, 101.0, 101.0]
+        throttle = mysql_clone.Throttle("10")
+        throttle.tokens["bytes"] = 5.0 * self.mbyte
+        throttle.take(self.mbyte)
+        throttle.take(10 * self.mbyte)
+
+        mock_sleep.assert_not_called()
+        self.assertEqual(throttle.tokens["bytes"], 0.0)
+
+    @mock.patch("mysql_clone.time.monotonic", mock.Mock(return_value=100.0))
+    @mock.patch("mysql_clone.time.sleep")
+    def test_rows_short(self, mock_sleep):
+
+        """Function:  test_rows_short
+
+        Description:  Test with a shortfall of row tokens.
+
+        Arguments:
+
+        """
+
+        throttle = mysql_clone.Throttle("100,1000")
+        throttle.take(self.mbyte, rows=2000)
+
+        mock_sleep.assert_called_once_with(2.0)
+        self.assertEqual(throttle.end, 102.0)
+
+    @mock.patch("mysql_clone.time.monotonic", mock.Mock(return_value=100.0))
+    @mock.patch("mysql_clone.time.sleep")
+    def test_bytes_short(self, mock_sleep):
+
+        """Function:  test_bytes_short
+
+        Description:  Test with a shortfall of byte tokens, sleeping it off.
+
+        Arguments:
+
+        """
+
+        throttle = mysql_clone.Throttle("4")
+        throttle.take(2 * self.mbyte)
+
+        mock_sleep.assert_called_once_with(0.5)
+        self.assertEqual(throttle.waited, 0.5)
+
+
+if __name__ == "__main__":
+    unittest.main()
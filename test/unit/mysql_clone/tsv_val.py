@@ -0,0 +1,122 @@
+# Classification (U)
+
+"""Program:  tsv_val.py
+
+    Description:  Unit testing of tsv_val in mysql_clone.py.
+
+    Usage:
+        test/unit/mysql_clone/tsv_val.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_clone                              # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        test_null
+        test_hexed_bytes
+        test_hexed_string
+        test_bytes
+        test_escape
+        test_value
+
+    """
+
+    def test_null(self):
+
+        """Function:  test_null
+
+        Description:  Test with a null value.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(mysql_clone.tsv_val(None, hexed=True), b"\\N")
+
+    def test_hexed_bytes(self):
+
+        """Function:  test_hexed_bytes
+
+        Description:  Test with a binary value written in hex.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(mysql_clone.tsv_val(b"\x01\t", hexed=True), b"0109")
+
+    def test_hexed_string(self):
+
+        """Function:  test_hexed_string
+
+        Description:  Test with a string value written in hex.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(mysql_clone.tsv_val("AB", hexed=True), b"4142")
+
+    def test_bytes(self):
+
+        """Function:  test_bytes
+
+        Description:  Test with a binary value not written in hex, kept as
+            it is when it is not valid UTF-8.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(mysql_clone.tsv_val(b"a\xff\tb"), b"a\xff\\tb")
+
+    def test_escape(self):
+
+        """Function:  test_escape
+
+        Description:  Test with a string containing special characters.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            mysql_clone.tsv_val("a\tb\nc\rd\\e\0"),
+            b"a\\tb\\nc\\rd\\\\e\\0")
+
+    def test_value(self):
+
+        """Function:  test_value
+
+        Description:  Test with a numeric value.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(mysql_clone.tsv_val(42), b"42")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,260 @@
+# Classification (U)
+
+"""Program:  undoguard_act.py
+
+    Description:  Unit testing of UndoGuard.act in mysql_clone.py.
+
+    Usage:
+        test/unit/mysql_clone/undoguard_act.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_clone                              # pylint:disable=E0401,C0413
+import lib.gen_libs as gen_libs             # pylint:disable=E0401,C0413,R0402
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class Server():
+
+    """Class:  Server
+
+    Description:  Class stub holder for mysql_class.Server class.
+
+    Methods:
+        __init__
+        col_sql
+        cmd_sql
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.sql_user = "user"
+        self.version = (8, 0, 30)
+        self.history = 1500
+        self.undo = 150 * 1024 * 1024
+        self.sessions = [{"id": 51}, {"id": 52}]
+        self.params = None
+        self.cmds = []
+
+    def col_sql(self, cmd, params=None):
+
+        """Method:  col_sql
+
+        Description:  Method stub holder for mysql_class.Server.col_sql.
+
+        Arguments:
+
+        """
+
+        self.cmds.append(cmd)
+        self.params = params
+
+        if "innodb_metrics" in cmd:
+            return [{"val": self.history}]
+
+        if "innodb_tablespaces" in cmd:
+            return [{"val": self.undo}]
+
+        return self.sessions
+
+    def cmd_sql(self, cmd):
+
+        """Method:  cmd_sql
+
+        Description:  Method stub holder for mysql_class.Server.cmd_sql.
+
+        Arguments:
+
+        """
+
+        self.cmds.append(cmd)
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_abort_once
+        test_abort
+        test_abort_no_pids
+        test_no_throttle
+        test_restored
+        test_throttle
+        test_warn
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.undo_cfg = {
+            "warn": {"history_len": 1000, "undo_mb": 100},
+            "throttle": {"history_len": 2000, "undo_mb": 200},
+            "abort": {"history_len": 5000, "undo_mb": 0}, "interval": 10}
+        self.server = Server()
+        self.throttle = mysql_clone.Throttle("50")
+        self.guard = mysql_clone.UndoGuard(
+            self.server, self.undo_cfg, throttle=self.throttle,
+            sessions=[7], pids=[4321])
+
+    def test_abort_once(self):
+
+        """Function:  test_abort_once
+
+        Description:  Test with the dump sessions only killed the first time
+            the abort level is reached.
+
+        Arguments:
+
+        """
+
+        with gen_libs.no_std_out():
+            self.guard.act("abort", "history_len 6000 >= 5000")
+            self.guard.act("abort", "history_len 6000 >= 5000")
+
+        self.assertEqual(self.server.cmds.count("kill 51"), 1)
+        self.assertEqual(self.guard.counts["abort"], 2)
+
+    def test_abort(self):
+
+        """Function:  test_abort
+
+        Description:  Test with the dump sessions killed.
+
+        Arguments:
+
+        """
+
+        with gen_libs.no_std_out():
+            self.guard.act("abort", "history_len 6000 >= 5000")
+
+        self.assertTrue(self.guard.aborted)
+        self.assertEqual(self.server.params, ("4321",))
+        self.assertEqual(
+            [cmd for cmd in self.server.cmds if cmd.startswith("kill")],
+            ["kill query 7", "kill 51", "kill 52"])
+        self.assertEqual(self.throttle.factor, 0.5)
+
+    def test_abort_no_pids(self):
+
+        """Function:  test_abort_no_pids
+
+        Description:  Test with no dump processes started by the run, so no
+            other mysqldump session is killed.
+
+        Arguments:
+
+        """
+
+        self.guard.pids = []
+
+        with gen_libs.no_std_out():
+            self.guard.act("abort", "history_len 6000 >= 5000")
+
+        self.assertEqual(self.server.cmds, ["kill query 7"])
+
+    def test_no_throttle(self):
+
+        """Function:  test_no_throttle
+
+        Description:  Test with the throttle level reached without a
+            throttle.
+
+        Arguments:
+
+        """
+
+        self.guard.throttle = None
+
+        with gen_libs.no_std_out():
+            self.guard.act("throttle", "history_len 2500 >= 2000")
+
+        self.assertEqual(self.guard.level, "throttle")
+        self.assertEqual(self.throttle.factor, 1.0)
+
+    def test_restored(self):
+
+        """Function:  test_restored
+
+        Description:  Test with the throttle restored below the throttle
+            level.
+
+        Arguments:
+
+        """
+
+        with gen_libs.no_std_out():
+            self.guard.act("throttle", "history_len 2500 >= 2000")
+            self.guard.act("warn", "history_len 1500 >= 1000")
+
+        self.assertEqual(self.throttle.factor, 1.0)
+
+    def test_throttle(self):
+
+        """Function:  test_throttle
+
+        Description:  Test with the throttle halved.
+
+        Arguments:
+
+        """
+
+        with gen_libs.no_std_out():
+            self.guard.act("throttle", "history_len 2500 >= 2000")
+
+        self.assertEqual(self.throttle.factor, 0.5)
+        self.assertFalse(self.guard.aborted)
+
+    def test_warn(self):
+
+        """Function:  test_warn
+
+        Description:  Test with the warn level logged.
+
+        Arguments:
+
+        """
+
+        with gen_libs.no_std_out():
+            self.guard.act("warn", "history_len 1500 >= 1000")
+
+        self.assertEqual(self.guard.level, "warn")
+        self.assertEqual(self.throttle.factor, 1.0)
+        self.assertEqual(self.server.cmds, [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,152 @@
+# Classification (U)
+
+"""Program:  undoguard_decide.py
+
+    Description:  Unit testing of UndoGuard.decide in mysql_clone.py.
+
+    Usage:
+        test/unit/mysql_clone/undoguard_decide.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_clone                              # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_abort
+        test_throttle
+        test_no_throttle
+        test_warn
+        test_not_checked
+        test_ok
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.undo_cfg = {
+            "warn": {"history_len": 1000, "undo_mb": 100},
+            "throttle": {"history_len": 2000, "undo_mb": 200},
+            "abort": {"history_len": 5000, "undo_mb": 0}, "interval": 10}
+        self.guard = mysql_clone.UndoGuard(
+            "Server", self.undo_cfg, throttle="Throttle")
+
+    def test_abort(self):
+
+        """Function:  test_abort
+
+        Description:  Test with a reading over the abort threshold.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            self.guard.decide({"history_len": 6000, "undo_mb": 250}),
+            ("abort", "history_len 6000 >= 5000"))
+
+    def test_throttle(self):
+
+        """Function:  test_throttle
+
+        Description:  Test with a reading over the throttle threshold.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            self.guard.decide({"history_len": 1500, "undo_mb": 250.5}),
+            ("throttle", "undo_mb 250.5 >= 200"))
+
+    def test_no_throttle(self):
+
+        """Function:  test_no_throttle
+
+        Description:  Test with the throttle threshold not checked without a
+            throttle.
+
+        Arguments:
+
+        """
+
+        guard = mysql_clone.UndoGuard("Server", self.undo_cfg)
+
+        self.assertEqual(
+            guard.decide({"history_len": 1500, "undo_mb": 250.5}),
+            ("warn", "history_len 1500 >= 1000, undo_mb 250.5 >= 100"))
+
+    def test_warn(self):
+
+        """Function:  test_warn
+
+        Description:  Test with readings over the warn threshold.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            self.guard.decide({"history_len": 1500, "undo_mb": 150}),
+            ("warn", "history_len 1500 >= 1000, undo_mb 150 >= 100"))
+
+    def test_not_checked(self):
+
+        """Function:  test_not_checked
+
+        Description:  Test with a threshold of 0 not checked.
+
+        Arguments:
+
+        """
+
+        self.guard.limits["warn"]["history_len"] = 0
+
+        self.assertEqual(
+            self.guard.decide({"history_len": 1500})[0], "ok")
+
+    def test_ok(self):
+
+        """Function:  test_ok
+
+        Description:  Test with readings under the thresholds.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            self.guard.decide({"history_len": 10, "undo_mb": 10})[0], "ok")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,100 @@
+# Classification (U)
+
+"""Program:  undoguard_init.py
+
+    Description:  Unit testing of UndoGuard.__init__ in mysql_clone.py.
+
+    Usage:
+        test/unit/mysql_clone/undoguard_init.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_clone                              # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_throttle
+        test_default
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.undo_cfg = {
+            "warn": {"history_len": 1000, "undo_mb": 100},
+            "throttle": {"history_len": 2000, "undo_mb": 200},
+            "abort": {"history_len": 5000, "undo_mb": 0}, "interval": 10}
+
+    def test_throttle(self):
+
+        """Function:  test_throttle
+
+        Description:  Test with a throttle, native sessions and the dump
+            process ids passed.
+
+        Arguments:
+
+        """
+
+        pids = [4321]
+        guard = mysql_clone.UndoGuard(
+            "Server", self.undo_cfg, throttle="Throttle", sessions=[7],
+            pids=pids)
+
+        self.assertEqual((guard.throttle, guard.sessions), ("Throttle", [7]))
+        self.assertEqual(list(guard.limits), ["abort", "throttle", "warn"])
+        self.assertIs(guard.pids, pids)
+
+    def test_default(self):
+
+        """Function:  test_default
+
+        Description:  Test with the thresholds ordered from the highest
+            level and the throttle threshold dropped without a throttle.
+
+        Arguments:
+
+        """
+
+        guard = mysql_clone.UndoGuard("Server", self.undo_cfg)
+
+        self.assertEqual(list(guard.limits), ["abort", "warn"])
+        self.assertEqual(guard.limits["warn"]["history_len"], 1000)
+        self.assertEqual(guard.interval, 10)
+        self.assertEqual((guard.level, guard.aborted), ("ok", False))
+        self.assertIsNone(guard.throttle)
+        self.assertEqual(guard.pids, [])
+        self.assertFalse(guard.thr.is_alive())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,104 @@
+# Classification (U)
+
+"""Program:  undoguard_run.py
+
+    Description:  Unit testing of UndoGuard.run in mysql_clone.py.
+
+    Usage:
+        test/unit/mysql_clone/undoguard_run.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_clone                              # pylint:disable=E0401,C0413
+import lib.gen_libs as gen_libs             # pylint:disable=E0401,C0413,R0402
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_sample_failed
+        test_sampled
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.undo_cfg = {
+            "warn": {"history_len": 1000, "undo_mb": 100},
+            "throttle": {"history_len": 2000, "undo_mb": 200},
+            "abort": {"history_len": 5000, "undo_mb": 0}, "interval": 10}
+        self.guard = mysql_clone.UndoGuard("Server", self.undo_cfg)
+        self.guard.done = mock.Mock()
+        self.guard.done.wait.side_effect = [False, False, True]
+
+    @mock.patch("mysql_clone.UndoGuard.act")
+    @mock.patch("mysql_clone.UndoGuard.sample")
+    def test_sample_failed(self, mock_sample, mock_act):
+
+        """Function:  test_sample_failed
+
+        Description:  Test with a failed sample leaving the level as it is.
+
+        Arguments:
+
+        """
+
+        mock_sample.side_effect = [Exception("Lost connection"),
+                                   {"history_len": 1500}]
+
+        with gen_libs.no_std_out():
+            self.guard.run()
+
+        mock_act.assert_called_once_with(
+            "warn", "history_len 1500 >= 1000")
+
+    @mock.patch("mysql_clone.UndoGuard.act")
+    @mock.patch("mysql_clone.UndoGuard.sample")
+    def test_sampled(self, mock_sample, mock_act):
+
+        """Function:  test_sampled
+
+        Description:  Test with the thresholds checked once an interval
+            until stopped.
+
+        Arguments:
+
+        """
+
+        mock_sample.return_value = {"history_len": 10}
+        self.guard.run()
+
+        self.assertEqual(mock_act.call_count, 2)
+        self.guard.done.wait.assert_called_with(10)
+
+
+if __name__ == "__main__":
+    unittest.main()
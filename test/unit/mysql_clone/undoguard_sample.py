@@ -0,0 +1,172 @@
+# Classification (U)
+
+"""Program:  undoguard_sample.py
+
+    Description:  Unit testing of UndoGuard.sample in mysql_clone.py.
+
+    Usage:
+        test/unit/mysql_clone/undoguard_sample.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_clone                              # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class Server():
+
+    """Class:  Server
+
+    Description:  Class stub holder for mysql_class.Server class.
+
+    Methods:
+        __init__
+        col_sql
+        cmd_sql
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.sql_user = "user"
+        self.version = (8, 0, 30)
+        self.history = 1500
+        self.undo = 150 * 1024 * 1024
+        self.sessions = [{"id": 51}, {"id": 52}]
+        self.params = None
+        self.cmds = []
+
+    def col_sql(self, cmd, params=None):
+
+        """Method:  col_sql
+
+        Description:  Method stub holder for mysql_class.Server.col_sql.
+
+        Arguments:
+
+        """
+
+        self.cmds.append(cmd)
+        self.params = params
+
+        if "innodb_metrics" in cmd:
+            return [{"val": self.history}]
+
+        if "innodb_tablespaces" in cmd:
+            return [{"val": self.undo}]
+
+        return self.sessions
+
+    def cmd_sql(self, cmd):
+
+        """Method:  cmd_sql
+
+        Description:  Method stub holder for mysql_class.Server.cmd_sql.
+
+        Arguments:
+
+        """
+
+        self.cmds.append(cmd)
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_peaks
+        test_no_undo_size
+        test_sample
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.undo_cfg = {
+            "warn": {"history_len": 1000, "undo_mb": 100},
+            "throttle": {"history_len": 2000, "undo_mb": 200},
+            "abort": {"history_len": 5000, "undo_mb": 0}, "interval": 10}
+        self.server = Server()
+        self.guard = mysql_clone.UndoGuard(self.server, self.undo_cfg)
+
+    def test_peaks(self):
+
+        """Function:  test_peaks
+
+        Description:  Test with the peaks kept across samples.
+
+        Arguments:
+
+        """
+
+        self.guard.sample()
+        self.server.history = 500
+        self.guard.sample()
+
+        self.assertEqual(
+            self.guard.peaks, {"history_len": 1500, "undo_mb": 150.0})
+
+    def test_no_undo_size(self):
+
+        """Function:  test_no_undo_size
+
+        Description:  Test with a server before MySQL 8.0.14.
+
+        Arguments:
+
+        """
+
+        self.server.version = (5, 7, 40)
+
+        self.assertEqual(self.guard.sample(), {"history_len": 1500})
+        self.assertEqual(len(self.server.cmds), 1)
+
+    def test_sample(self):
+
+        """Function:  test_sample
+
+        Description:  Test with the history list and undo size read.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            self.guard.sample(), {"history_len": 1500, "undo_mb": 150.0})
+
+
+if __name__ == "__main__":
+    unittest.main()
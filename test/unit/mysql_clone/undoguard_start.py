@@ -0,0 +1,71 @@
+# Classification (U)
+
+"""Program:  undoguard_start.py
+
+    Description:  Unit testing of UndoGuard.start in mysql_clone.py.
+
+    Usage:
+        test/unit/mysql_clone/undoguard_start.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_clone                              # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_start
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.guard = mysql_clone.UndoGuard("Server", {"interval": 10})
+
+    def test_start(self):
+
+        """Function:  test_start
+
+        Description:  Test with the watchdog thread started.
+
+        Arguments:
+
+        """
+
+        self.guard.thr = mock.Mock()
+        self.guard.start()
+
+        self.guard.thr.start.assert_called_once_with()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,123 @@
+# Classification (U)
+
+"""Program:  undoguard_stop.py
+
+    Description:  Unit testing of UndoGuard.stop in mysql_clone.py.
+
+    Usage:
+        test/unit/mysql_clone/undoguard_stop.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import io
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_clone                              # pylint:disable=E0401,C0413
+import lib.gen_libs as gen_libs             # pylint:disable=E0401,C0413,R0402
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_not_started
+        test_throttled
+        test_report
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.undo_cfg = {
+            "warn": {"history_len": 1000, "undo_mb": 100},
+            "throttle": {"history_len": 2000, "undo_mb": 200},
+            "abort": {"history_len": 5000, "undo_mb": 0}, "interval": 10}
+        self.throttle = mysql_clone.Throttle("50")
+        self.guard = mysql_clone.UndoGuard(
+            "Server", self.undo_cfg, throttle=self.throttle)
+
+    def test_not_started(self):
+
+        """Function:  test_not_started
+
+        Description:  Test with the watchdog thread not started.
+
+        Arguments:
+
+        """
+
+        with gen_libs.no_std_out():
+            self.guard.stop()
+
+        self.assertTrue(self.guard.done.is_set())
+
+    def test_throttled(self):
+
+        """Function:  test_throttled
+
+        Description:  Test with the throttle restored once the watchdog
+            thread has stopped.
+
+        Arguments:
+
+        """
+
+        self.guard.level = "throttle"
+        self.throttle.scale(0.5)
+        self.guard.start()
+
+        with gen_libs.no_std_out():
+            self.guard.stop()
+
+        self.assertFalse(self.guard.thr.is_alive())
+        self.assertEqual(self.throttle.factor, 1.0)
+
+    @mock.patch("sys.stdout", new_callable=io.StringIO)
+    def test_report(self, mock_out):
+
+        """Function:  test_report
+
+        Description:  Test with the peaks and levels reported.
+
+        Arguments:
+
+        """
+
+        self.guard.peaks = {"history_len": 2500, "undo_mb": 150.25}
+        self.guard.counts.update(["ok", "warn", "warn"])
+        self.guard.aborted = True
+
+        self.guard.stop()
+
+        self.assertEqual(
+            mock_out.getvalue(), "Undo guard:  peak history_len 2500,"
+            " peak undo_mb 150.2, 1 ok, 2 warn, dump aborted\n")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -6,17 +6,162 @@
 
 echo ""
 echo "Unit testing..."
+/usr/bin/python test/unit/mysql_clone/agent_auth.py
+/usr/bin/python test/unit/mysql_clone/agent_dump_load.py
+/usr/bin/python test/unit/mysql_clone/agent_recv.py
+/usr/bin/python test/unit/mysql_clone/agent_send.py
+/usr/bin/python test/unit/mysql_clone/agent_task.py
+/usr/bin/python test/unit/mysql_clone/auth_digest.py
+/usr/bin/python test/unit/mysql_clone/bp_report.py
+/usr/bin/python test/unit/mysql_clone/bufpool_get.py
+/usr/bin/python test/unit/mysql_clone/bufpool_init.py
+/usr/bin/python test/unit/mysql_clone/bufpool_put.py
+/usr/bin/python test/unit/mysql_clone/build_indexes.py
 /usr/bin/python test/unit/mysql_clone/cfg_chk.py
+/usr/bin/python test/unit/mysql_clone/chk_agent_opts.py
+/usr/bin/python test/unit/mysql_clone/chk_clone_plugin.py
+/usr/bin/python test/unit/mysql_clone/chk_fan_opts.py
+/usr/bin/python test/unit/mysql_clone/chk_int_opts.py
+/usr/bin/python test/unit/mysql_clone/chk_load_args.py
 /usr/bin/python test/unit/mysql_clone/chk_mst_log.py
+/usr/bin/python test/unit/mysql_clone/chk_no_log.py
+/usr/bin/python test/unit/mysql_clone/chk_rate_opts.py
 /usr/bin/python test/unit/mysql_clone/chk_rep.py
 /usr/bin/python test/unit/mysql_clone/chk_rep_cfg.py
+/usr/bin/python test/unit/mysql_clone/chk_rsc_opts.py
 /usr/bin/python test/unit/mysql_clone/chk_slv.py
 /usr/bin/python test/unit/mysql_clone/chk_slv_err.py
 /usr/bin/python test/unit/mysql_clone/chk_slv_thr.py
+/usr/bin/python test/unit/mysql_clone/chk_snap_privs.py
+/usr/bin/python test/unit/mysql_clone/chk_xor_opts.py
+/usr/bin/python test/unit/mysql_clone/clone_stat.py
+/usr/bin/python test/unit/mysql_clone/compress_block.py
+/usr/bin/python test/unit/mysql_clone/compress_stream.py
 /usr/bin/python test/unit/mysql_clone/connect_chk.py
+/usr/bin/python test/unit/mysql_clone/crt_chunks.py
+/usr/bin/python test/unit/mysql_clone/crt_compress.py
 /usr/bin/python test/unit/mysql_clone/crt_dump_cmd.py
+/usr/bin/python test/unit/mysql_clone/crt_health.py
+/usr/bin/python test/unit/mysql_clone/crt_inserts.py
+/usr/bin/python test/unit/mysql_clone/crt_load_cmd.py
+/usr/bin/python test/unit/mysql_clone/crt_load_data.py
+/usr/bin/python test/unit/mysql_clone/crt_obj_stmts.py
+/usr/bin/python test/unit/mysql_clone/crt_rsc_grp.py
+/usr/bin/python test/unit/mysql_clone/crt_task_cmd.py
+/usr/bin/python test/unit/mysql_clone/crt_tasks.py
+/usr/bin/python test/unit/mysql_clone/crt_undo_guard.py
+/usr/bin/python test/unit/mysql_clone/crt_xfer_meter.py
+/usr/bin/python test/unit/mysql_clone/dump_bp.py
+/usr/bin/python test/unit/mysql_clone/dump_coords.py
 /usr/bin/python test/unit/mysql_clone/dump_load_dbs.py
+/usr/bin/python test/unit/mysql_clone/exec_stmt.py
+/usr/bin/python test/unit/mysql_clone/fan_dump_load.py
+/usr/bin/python test/unit/mysql_clone/fetch_algs.py
+/usr/bin/python test/unit/mysql_clone/fetch_bounds.py
+/usr/bin/python test/unit/mysql_clone/fetch_bp_stat.py
+/usr/bin/python test/unit/mysql_clone/fetch_bulk_cfg.py
+/usr/bin/python test/unit/mysql_clone/fetch_cols.py
+/usr/bin/python test/unit/mysql_clone/fetch_dbs.py
+/usr/bin/python test/unit/mysql_clone/fetch_dump_ids.py
+/usr/bin/python test/unit/mysql_clone/fetch_hot_idx.py
+/usr/bin/python test/unit/mysql_clone/fetch_idx_size.py
+/usr/bin/python test/unit/mysql_clone/fetch_tbls.py
+/usr/bin/python test/unit/mysql_clone/free_conns.py
+/usr/bin/python test/unit/mysql_clone/healthctl_apply.py
+/usr/bin/python test/unit/mysql_clone/healthctl_decide.py
+/usr/bin/python test/unit/mysql_clone/healthctl_init.py
+/usr/bin/python test/unit/mysql_clone/healthctl_run.py
+/usr/bin/python test/unit/mysql_clone/healthctl_sample.py
+/usr/bin/python test/unit/mysql_clone/healthctl_start.py
+/usr/bin/python test/unit/mysql_clone/healthctl_stop.py
 /usr/bin/python test/unit/mysql_clone/help_message.py
+/usr/bin/python test/unit/mysql_clone/hist_bounds.py
+/usr/bin/python test/unit/mysql_clone/kernel_relay.py
+/usr/bin/python test/unit/mysql_clone/levelctl_init.py
+/usr/bin/python test/unit/mysql_clone/levelctl_update.py
+/usr/bin/python test/unit/mysql_clone/load_bp.py
+/usr/bin/python test/unit/mysql_clone/load_file.py
+/usr/bin/python test/unit/mysql_clone/load_task.py
 /usr/bin/python test/unit/mysql_clone/main.py
+/usr/bin/python test/unit/mysql_clone/mid_val.py
+/usr/bin/python test/unit/mysql_clone/native_cfg.py
+/usr/bin/python test/unit/mysql_clone/native_dump.py
+/usr/bin/python test/unit/mysql_clone/native_dump_load.py
+/usr/bin/python test/unit/mysql_clone/native_dump_tbl.py
+/usr/bin/python test/unit/mysql_clone/native_load.py
+/usr/bin/python test/unit/mysql_clone/native_snap.py
+/usr/bin/python test/unit/mysql_clone/pack_items.py
+/usr/bin/python test/unit/mysql_clone/par_dump_load.py
+/usr/bin/python test/unit/mysql_clone/parse_rates.py
+/usr/bin/python test/unit/mysql_clone/parse_rsc_grp.py
+/usr/bin/python test/unit/mysql_clone/phys_clone.py
+/usr/bin/python test/unit/mysql_clone/pipe_stmts.py
+/usr/bin/python test/unit/mysql_clone/pool_relay.py
+/usr/bin/python test/unit/mysql_clone/range_rows.py
+/usr/bin/python test/unit/mysql_clone/read_frames.py
+/usr/bin/python test/unit/mysql_clone/read_secret.py
+/usr/bin/python test/unit/mysql_clone/recv_auth.py
+/usr/bin/python test/unit/mysql_clone/recv_exact.py
+/usr/bin/python test/unit/mysql_clone/recv_msg.py
+/usr/bin/python test/unit/mysql_clone/relay.py
+/usr/bin/python test/unit/mysql_clone/relay_dump_load.py
+/usr/bin/python test/unit/mysql_clone/replica_dump_load.py
+/usr/bin/python test/unit/mysql_clone/replica_sql_thread.py
+/usr/bin/python test/unit/mysql_clone/rscgroup_assign.py
+/usr/bin/python test/unit/mysql_clone/rscgroup_create.py
+/usr/bin/python test/unit/mysql_clone/rscgroup_init.py
+/usr/bin/python test/unit/mysql_clone/rscgroup_run.py
+/usr/bin/python test/unit/mysql_clone/rscgroup_start.py
+/usr/bin/python test/unit/mysql_clone/rscgroup_stop.py
+/usr/bin/python test/unit/mysql_clone/rst_bulk_cfg.py
+/usr/bin/python test/unit/mysql_clone/run_agent.py
 /usr/bin/python test/unit/mysql_clone/run_program.py
+/usr/bin/python test/unit/mysql_clone/send_msg.py
+/usr/bin/python test/unit/mysql_clone/set_bulk_cfg.py
+/usr/bin/python test/unit/mysql_clone/snapshotcoord_init.py
+/usr/bin/python test/unit/mysql_clone/snapshotcoord_lock.py
+/usr/bin/python test/unit/mysql_clone/snapshotcoord_read_coords.py
+/usr/bin/python test/unit/mysql_clone/snapshotcoord_settled.py
+/usr/bin/python test/unit/mysql_clone/snapshotcoord_unlock.py
+/usr/bin/python test/unit/mysql_clone/snapshotcoord_wait_sessions.py
+/usr/bin/python test/unit/mysql_clone/split_indexes.py
+/usr/bin/python test/unit/mysql_clone/split_innodb_name.py
+/usr/bin/python test/unit/mysql_clone/spread_items.py
+/usr/bin/python test/unit/mysql_clone/sql_ident.py
+/usr/bin/python test/unit/mysql_clone/sql_lit.py
+/usr/bin/python test/unit/mysql_clone/start_dumps.py
 /usr/bin/python test/unit/mysql_clone/stop_clr_rep.py
+/usr/bin/python test/unit/mysql_clone/stream_rows.py
+/usr/bin/python test/unit/mysql_clone/tab_dump_load.py
+/usr/bin/python test/unit/mysql_clone/tab_dump_tbl.py
+/usr/bin/python test/unit/mysql_clone/teesink_close.py
+/usr/bin/python test/unit/mysql_clone/teesink_init.py
+/usr/bin/python test/unit/mysql_clone/teesink_put.py
+/usr/bin/python test/unit/mysql_clone/teesink_run.py
+/usr/bin/python test/unit/mysql_clone/teesink_wait.py
+/usr/bin/python test/unit/mysql_clone/throttle_init.py
+/usr/bin/python test/unit/mysql_clone/throttle_reload.py
+/usr/bin/python test/unit/mysql_clone/throttle_report.py
+/usr/bin/python test/unit/mysql_clone/throttle_scale.py
+/usr/bin/python test/unit/mysql_clone/throttle_take.py
+/usr/bin/python test/unit/mysql_clone/tsv_val.py
+/usr/bin/python test/unit/mysql_clone/undoguard_act.py
+/usr/bin/python test/unit/mysql_clone/undoguard_decide.py
+/usr/bin/python test/unit/mysql_clone/undoguard_init.py
+/usr/bin/python test/unit/mysql_clone/undoguard_run.py
+/usr/bin/python test/unit/mysql_clone/undoguard_sample.py
+/usr/bin/python test/unit/mysql_clone/undoguard_start.py
+/usr/bin/python test/unit/mysql_clone/undoguard_stop.py
+/usr/bin/python test/unit/mysql_clone/val_str.py
+/usr/bin/python test/unit/mysql_clone/wait_bp.py
+/usr/bin/python test/unit/mysql_clone/wait_clone.py
+/usr/bin/python test/unit/mysql_clone/wait_slv.py
+/usr/bin/python test/unit/mysql_clone/wait_snap.py
+/usr/bin/python test/unit/mysql_clone/warm_clone.py
+/usr/bin/python test/unit/mysql_clone/warm_stmt.py
+/usr/bin/python test/unit/mysql_clone/write_stmts.py
+/usr/bin/python test/unit/mysql_clone/xfer_report.py
+/usr/bin/python test/unit/mysql_clone/xfermeter_init.py
+/usr/bin/python test/unit/mysql_clone/xfermeter_sample.py
+/usr/bin/python test/unit/mysql_clone/xfermeter_start.py
+/usr/bin/python test/unit/mysql_clone/xfermeter_stop.py
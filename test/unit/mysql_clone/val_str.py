@@ -0,0 +1,98 @@
+# Classification (U)
+
+"""Program:  val_str.py
+
+    Description:  Unit testing of val_str in mysql_clone.py.
+
+    Usage:
+        test/unit/mysql_clone/val_str.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import datetime
+import decimal
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_clone                              # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        test_time
+        test_set
+        test_decimal
+        test_string
+
+    """
+
+    def test_time(self):
+
+        """Function:  test_time
+
+        Description:  Test with a time value.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            mysql_clone.val_str(datetime.timedelta(minutes=90)),
+            "1:30:00.000000")
+
+    def test_set(self):
+
+        """Function:  test_set
+
+        Description:  Test with a set column value.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(mysql_clone.val_str({"b", "a"}), "a,b")
+
+    def test_decimal(self):
+
+        """Function:  test_decimal
+
+        Description:  Test with a decimal value written without an exponent.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            mysql_clone.val_str(decimal.Decimal("1.23E-7")), "0.000000123")
+
+    def test_string(self):
+
+        """Function:  test_string
+
+        Description:  Test with a string value.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(mysql_clone.val_str(10), "10")
+
+
+if __name__ == "__main__":
+    unittest.main()
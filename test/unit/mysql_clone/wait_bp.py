@@ -0,0 +1,136 @@
+# Classification (U)
+
+"""Program:  wait_bp.py
+
+    Description:  Unit testing of wait_bp in mysql_clone.py.
+
+    Usage:
+        test/unit/mysql_clone/wait_bp.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_clone                              # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_timeout
+        test_error
+        test_second_poll
+        test_completed
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.prev = "Buffer pool(s) dump completed at 260101 10:00:00"
+        self.done = "Buffer pool(s) dump completed at 260101 12:00:00"
+
+    @mock.patch("mysql_clone.time.sleep", mock.Mock(return_value=True))
+    @mock.patch("mysql_clone.fetch_bp_stat")
+    def test_timeout(self, mock_stat):
+
+        """Function:  test_timeout
+
+        Description:  Test with the dump not completed before the timeout.
+
+        Arguments:
+
+        """
+
+        mock_stat.return_value = {
+            "Innodb_buffer_pool_dump_status": self.prev}
+
+        self.assertEqual(
+            mysql_clone.wait_bp("Server", "dump", self.prev, timeout=0),
+            (False, self.prev))
+
+    @mock.patch("mysql_clone.fetch_bp_stat")
+    def test_error(self, mock_stat):
+
+        """Function:  test_error
+
+        Description:  Test with the load failing.
+
+        Arguments:
+
+        """
+
+        mock_stat.return_value = {
+            "Innodb_buffer_pool_load_status": "Error: cannot open file"}
+
+        self.assertEqual(
+            mysql_clone.wait_bp("Server", "load", "")[0], False)
+
+    @mock.patch("mysql_clone.time.sleep", mock.Mock(return_value=True))
+    @mock.patch("mysql_clone.fetch_bp_stat")
+    def test_second_poll(self, mock_stat):
+
+        """Function:  test_second_poll
+
+        Description:  Test with the earlier dump's status not taken as
+            completed.
+
+        Arguments:
+
+        """
+
+        mock_stat.side_effect = [
+            {"Innodb_buffer_pool_dump_status": self.prev},
+            {"Innodb_buffer_pool_dump_status": self.done}]
+
+        self.assertEqual(
+            mysql_clone.wait_bp("Server", "dump", self.prev),
+            (True, self.done))
+        self.assertEqual(mock_stat.call_count, 2)
+
+    @mock.patch("mysql_clone.fetch_bp_stat")
+    def test_completed(self, mock_stat):
+
+        """Function:  test_completed
+
+        Description:  Test with the dump completed on the first poll.
+
+        Arguments:
+
+        """
+
+        mock_stat.return_value = {
+            "Innodb_buffer_pool_dump_status": self.done}
+
+        self.assertEqual(
+            mysql_clone.wait_bp("Server", "dump", self.prev),
+            (True, self.done))
+
+
+if __name__ == "__main__":
+    unittest.main()
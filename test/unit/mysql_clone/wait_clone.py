@@ -0,0 +1,181 @@
+# Classification (U)
+
+"""Program:  wait_clone.py
+
+    Description:  Unit testing of wait_clone in mysql_clone.py.
+
+    Usage:
+        test/unit/mysql_clone/wait_clone.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_clone                              # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class Server():
+
+    """Class:  Server
+
+    Description:  Class stub holder for mysql_class.Server class.
+
+    Methods:
+        __init__
+        is_connected
+        connect
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.connected = False
+        self.connects = 0
+
+    def is_connected(self):
+
+        """Method:  is_connected
+
+        Description:  Method stub holder for mysql_class.Server.is_connected.
+
+        Arguments:
+
+        """
+
+        return self.connected
+
+    def connect(self, silent=False):
+
+        """Method:  connect
+
+        Description:  Method stub holder for mysql_class.Server.connect.
+
+        Arguments:
+
+        """
+
+        self.connects += 1
+        self.connected = silent
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_timeout
+        test_restarting
+        test_old_status
+        test_completed
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.clone = Server()
+        self.begin_time = "2026-01-01 00:00:00"
+        self.stat = {"state": "Completed", "begin_time": "2026-01-02 00:00:00"}
+
+    @mock.patch("mysql_clone.time.sleep", mock.Mock(return_value=True))
+    @mock.patch("mysql_clone.clone_stat", mock.Mock(return_value={}))
+    def test_timeout(self):
+
+        """Function:  test_timeout
+
+        Description:  Test with the clone not restarting before the timeout.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            mysql_clone.wait_clone(self.clone, self.begin_time, timeout=0), {})
+
+    @mock.patch("mysql_clone.time.sleep", mock.Mock(return_value=True))
+    @mock.patch("mysql_clone.clone_stat")
+    def test_restarting(self, mock_stat):
+
+        """Function:  test_restarting
+
+        Description:  Test with the clone shutting down on the first check.
+
+        Arguments:
+
+        """
+
+        mock_stat.side_effect = [ValueError("Lost connection"), self.stat]
+
+        self.assertEqual(
+            mysql_clone.wait_clone(self.clone, self.begin_time), self.stat)
+
+    @mock.patch("mysql_clone.time.sleep", mock.Mock(return_value=True))
+    @mock.patch("mysql_clone.clone_stat")
+    def test_old_status(self, mock_stat):
+
+        """Function:  test_old_status
+
+        Description:  Test with the status of a previous clone operation on
+            the first check.
+
+        Arguments:
+
+        """
+
+        mock_stat.side_effect = [
+            {"state": "Completed", "begin_time": self.begin_time}, self.stat]
+
+        self.assertEqual(
+            mysql_clone.wait_clone(self.clone, self.begin_time), self.stat)
+
+    @mock.patch("mysql_clone.clone_stat")
+    def test_completed(self, mock_stat):
+
+        """Function:  test_completed
+
+        Description:  Test with the clone reconnected and completed.
+
+        Arguments:
+
+        """
+
+        mock_stat.return_value = self.stat
+
+        self.assertEqual(
+            mysql_clone.wait_clone(self.clone, self.begin_time), self.stat)
+        self.assertEqual(self.clone.connects, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
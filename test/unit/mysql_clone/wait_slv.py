@@ -0,0 +1,194 @@
+# Classification (U)
+
+"""Program:  wait_slv.py
+
+    Description:  Unit testing of wait_slv in mysql_clone.py.
+
+    Usage:
+        test/unit/mysql_clone/wait_slv.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_clone                              # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class Slave():
+
+    """Class:  Slave
+
+    Description:  Class stub holder for mysql_class.SlaveRep class.
+
+    Methods:
+        __init__
+        upd_slv_status
+        get_thr_stat
+        get_err_stat
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.thr = [("Connecting", "Yes"), ("Yes", "Yes")]
+        self.err = None
+        self.polls = 0
+
+    def upd_slv_status(self):
+
+        """Method:  upd_slv_status
+
+        Description:  Method stub holder for
+            mysql_class.SlaveRep.upd_slv_status.
+
+        Arguments:
+
+        """
+
+        self.polls += 1
+
+    def get_thr_stat(self):
+
+        """Method:  get_thr_stat
+
+        Description:  Method stub holder for mysql_class.SlaveRep.get_thr_stat.
+
+        Arguments:
+
+        """
+
+        io_thr, sql_thr = self.thr[min(self.polls, len(self.thr)) - 1]
+
+        return "Waiting", io_thr, sql_thr, "ON"
+
+    def get_err_stat(self):
+
+        """Method:  get_err_stat
+
+        Description:  Method stub holder for mysql_class.SlaveRep.get_err_stat.
+
+        Arguments:
+
+        """
+
+        return self.err, None, None, None, None, None
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_timeout
+        test_error
+        test_backoff
+        test_first_poll
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.slave = Slave()
+
+    @mock.patch("mysql_clone.time.sleep", mock.Mock(return_value=True))
+    def test_timeout(self):
+
+        """Function:  test_timeout
+
+        Description:  Test with the threads not running before the timeout.
+
+        Arguments:
+
+        """
+
+        self.slave.thr = [("Connecting", "Yes")]
+
+        self.assertFalse(mysql_clone.wait_slv(self.slave, timeout=0))
+        self.assertEqual(self.slave.polls, 1)
+
+    @mock.patch("mysql_clone.time.sleep")
+    def test_error(self, mock_sleep):
+
+        """Function:  test_error
+
+        Description:  Test with a thread reporting an error.
+
+        Arguments:
+
+        """
+
+        self.slave.err = 1045
+
+        self.assertFalse(mysql_clone.wait_slv(self.slave))
+        mock_sleep.assert_not_called()
+
+    @mock.patch("mysql_clone.time.sleep")
+    def test_backoff(self, mock_sleep):
+
+        """Function:  test_backoff
+
+        Description:  Test with the threads running after a few polls and the
+            wait between polls doubled up to the cap.
+
+        Arguments:
+
+        """
+
+        self.slave.thr = [("Connecting", "Yes")] * 4 + [("Yes", "Yes")]
+
+        self.assertTrue(
+            mysql_clone.wait_slv(self.slave, interval=1, max_interval=4))
+        self.assertEqual(
+            [call[0][0] for call in mock_sleep.call_args_list], [1, 2, 4, 4])
+
+    @mock.patch("mysql_clone.time.sleep")
+    def test_first_poll(self, mock_sleep):
+
+        """Function:  test_first_poll
+
+        Description:  Test with the threads running on the first poll.
+
+        Arguments:
+
+        """
+
+        self.slave.thr = [("Yes", "Yes")]
+
+        self.assertTrue(mysql_clone.wait_slv(self.slave))
+        mock_sleep.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,144 @@
+# Classification (U)
+
+"""Program:  wait_snap.py
+
+    Description:  Unit testing of wait_snap in mysql_clone.py.
+
+    Usage:
+        test/unit/mysql_clone/wait_snap.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_clone                              # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class Server():                                         # pylint:disable=R0903
+
+    """Class:  Server
+
+    Description:  Class stub holder for mysql_class.Server class.
+
+    Methods:
+        __init__
+        col_sql
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.sql_user = "user"
+        self.cnt = [2]
+        self.params = None
+
+    def col_sql(self, cmd, params=None):
+
+        """Method:  col_sql
+
+        Description:  Method stub holder for mysql_class.Server.col_sql.
+
+        Arguments:
+
+        """
+
+        self.params = params
+
+        return [{"cnt": self.cnt.pop(0) if len(self.cnt) > 1 else self.cnt[0]}]
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_timeout
+        test_second_poll
+        test_first_poll
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.server = Server()
+        self.lock_time = "2026-01-01 00:00:00"
+
+    @mock.patch("mysql_clone.time.sleep", mock.Mock(return_value=True))
+    def test_timeout(self):
+
+        """Function:  test_timeout
+
+        Description:  Test with snapshots not opened before timeout.
+
+        Arguments:
+
+        """
+
+        self.server.cnt = [1]
+
+        self.assertFalse(
+            mysql_clone.wait_snap(self.server, 2, self.lock_time, timeout=0))
+
+    @mock.patch("mysql_clone.time.sleep", mock.Mock(return_value=True))
+    def test_second_poll(self):
+
+        """Function:  test_second_poll
+
+        Description:  Test with snapshots opened on second poll.
+
+        Arguments:
+
+        """
+
+        self.server.cnt = [1, 2]
+
+        self.assertTrue(mysql_clone.wait_snap(self.server, 2, self.lock_time))
+
+    def test_first_poll(self):
+
+        """Function:  test_first_poll
+
+        Description:  Test with snapshots opened on first poll.
+
+        Arguments:
+
+        """
+
+        self.assertTrue(mysql_clone.wait_snap(self.server, 2, self.lock_time))
+        self.assertEqual(self.server.params, ("user", self.lock_time))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,245 @@
+# Classification (U)
+
+"""Program:  warm_clone.py
+
+    Description:  Unit testing of warm_clone in mysql_clone.py.
+
+    Usage:
+        test/unit/mysql_clone/warm_clone.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_clone                              # pylint:disable=E0401,C0413
+import lib.gen_libs as gen_libs             # pylint:disable=E0401,C0413,R0402
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class ArgParser():
+
+    """Class:  ArgParser
+
+    Description:  Class stub holder for gen_class.ArgParser class.
+
+    Methods:
+        __init__
+        get_val
+        arg_exist
+        arg_set_path
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.cmdline = None
+        self.args_array = {}
+
+    def get_val(self, skey, def_val=None):
+
+        """Method:  get_val
+
+        Description:  Method stub holder for gen_class.ArgParser.get_val.
+
+        Arguments:
+
+        """
+
+        return self.args_array.get(skey, def_val)
+
+    def arg_exist(self, arg):
+
+        """Method:  arg_exist
+
+        Description:  Method stub holder for gen_class.ArgParser.arg_exist.
+
+        Arguments:
+
+        """
+
+        return arg in self.args_array
+
+    def arg_set_path(self, arg_opt, **kwargs):
+
+        """Method:  arg_set_path
+
+        Description:  Method stub holder for gen_class.ArgParser.arg_set_path.
+
+        Arguments:
+
+        """
+
+        return os.path.join(
+            self.args_array[arg_opt] if arg_opt in self.args_array else "",
+            kwargs.get("cmd", ""))
+
+
+
+class Server():                                         # pylint:disable=R0903
+
+    """Class:  Server
+
+    Description:  Class stub holder for mysql_class.Server class.
+
+    Methods:
+        __init__
+        col_sql
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.name = "clone"
+        self.cmd = None
+
+    def col_sql(self, cmd):
+
+        """Method:  col_sql
+
+        Description:  Method stub holder for mysql_class.Server.col_sql.
+
+        Arguments:
+
+        """
+
+        self.cmd = cmd
+
+        return [{"pages": 100}]
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_failed
+        test_budget
+        test_workers
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.clone = Server()
+        self.args = ArgParser()
+        self.hot = [
+            {"db": "db1", "tbl": "t1", "idx": "PRIMARY", "pages": 40},
+            {"db": "db1", "tbl": "t2", "idx": "PRIMARY", "pages": 30},
+            {"db": "db1", "tbl": "t3", "idx": "a", "pages": 20}]
+
+    @mock.patch("mysql_clone.fetch_idx_size", mock.Mock(return_value={}))
+    @mock.patch("mysql_clone.mysql_libs.crt_cmd",
+                mock.Mock(return_value=["mysql"]))
+    @mock.patch("mysql_clone.exec_stmt")
+    def test_failed(self, mock_exec):
+
+        """Function:  test_failed
+
+        Description:  Test with an index failing to warm.
+
+        Arguments:
+
+        """
+
+        mock_exec.side_effect = [True, False]
+
+        with gen_libs.no_std_out():
+            self.assertFalse(
+                mysql_clone.warm_clone(self.clone, self.args, self.hot[:2]))
+
+    @mock.patch("mysql_clone.fetch_idx_size")
+    @mock.patch("mysql_clone.mysql_libs.crt_cmd",
+                mock.Mock(return_value=["mysql"]))
+    @mock.patch("mysql_clone.exec_stmt")
+    def test_budget(self, mock_exec, mock_size):
+
+        """Function:  test_budget
+
+        Description:  Test with an index larger than what is left of the
+            clone's buffer pool skipped and the smaller ones after it warmed.
+
+        Arguments:
+
+        """
+
+        mock_exec.return_value = True
+        mock_size.return_value = {("db1", "t2", "PRIMARY"): 60}
+
+        with gen_libs.no_std_out():
+            self.assertTrue(
+                mysql_clone.warm_clone(self.clone, self.args, self.hot))
+
+        self.assertEqual(
+            sorted(call[0][1] for call in mock_exec.call_args_list),
+            ["select count(*) into @warm from `db1`.`t1`"
+             " force index (`PRIMARY`)",
+             "select count(*) into @warm from `db1`.`t3` force index (`a`)"])
+        self.assertIn("@@innodb_buffer_pool_size", self.clone.cmd)
+
+    @mock.patch("mysql_clone.concurrent.futures.ThreadPoolExecutor")
+    @mock.patch("mysql_clone.fetch_idx_size", mock.Mock(return_value={}))
+    @mock.patch("mysql_clone.mysql_libs.crt_cmd",
+                mock.Mock(return_value=["mysql"]))
+    def test_workers(self, mock_pool):
+
+        """Function:  test_workers
+
+        Description:  Test with the number of workers set by the -j option.
+
+        Arguments:
+
+        """
+
+        self.args.args_array["-j"] = "8"
+        mock_pool.return_value.__enter__.return_value.map.return_value = [
+            True]
+
+        with gen_libs.no_std_out():
+            self.assertTrue(
+                mysql_clone.warm_clone(
+                    self.clone, self.args, self.hot[:1], pct=50))
+
+        self.assertEqual(mock_pool.call_args[1]["max_workers"], 8)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,75 @@
+# Classification (U)
+
+"""Program:  warm_stmt.py
+
+    Description:  Unit testing of warm_stmt in mysql_clone.py.
+
+    Usage:
+        test/unit/mysql_clone/warm_stmt.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_clone                              # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        test_no_primary_key
+        test_index
+
+    """
+
+    def test_no_primary_key(self):
+
+        """Function:  test_no_primary_key
+
+        Description:  Test with the clustered index of a table without a
+            primary key.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            mysql_clone.warm_stmt(
+                {"db": "db1", "tbl": "t1", "idx": "GEN_CLUST_INDEX"}),
+            "select count(*) into @warm from `db1`.`t1`")
+
+    def test_index(self):
+
+        """Function:  test_index
+
+        Description:  Test with the index forced on the scan.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            mysql_clone.warm_stmt(
+                {"db": "db1", "tbl": "t1", "idx": "PRIMARY"}),
+            "select count(*) into @warm from `db1`.`t1`"
+            " force index (`PRIMARY`)")
+
+
+if __name__ == "__main__":
+    unittest.main()
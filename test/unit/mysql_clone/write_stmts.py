@@ -0,0 +1,114 @@
+# Classification (U)
+
+"""Program:  write_stmts.py
+
+    Description:  Unit testing of write_stmts in mysql_clone.py.
+
+    Usage:
+        test/unit/mysql_clone/write_stmts.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import io
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_clone                              # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_insert_semicolon
+        test_body_delimiter
+        test_stmts
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.fhandle = io.StringIO()
+
+    def test_insert_semicolon(self):
+
+        """Function:  test_insert_semicolon
+
+        Description:  Test with insert statements containing a semicolon.
+
+        Arguments:
+
+        """
+
+        mysql_clone.write_stmts(
+            ["INSERT INTO `t1` VALUES ('a;b')"], self.fhandle)
+
+        mysql_clone.write_stmts(
+            ["INSERT IGNORE INTO `t1` VALUES ('a;b')"], self.fhandle)
+
+        self.assertEqual(
+            self.fhandle.getvalue(),
+            "INSERT INTO `t1` VALUES ('a;b');\n"
+            "INSERT IGNORE INTO `t1` VALUES ('a;b');\n")
+
+    def test_body_delimiter(self):
+
+        """Function:  test_body_delimiter
+
+        Description:  Test with a statement with a body.
+
+        Arguments:
+
+        """
+
+        mysql_clone.write_stmts(
+            ["CREATE TRIGGER trg1 BEGIN SET @a = 1; END"], self.fhandle)
+
+        self.assertEqual(
+            self.fhandle.getvalue(),
+            "DELIMITER ;;\nCREATE TRIGGER trg1 BEGIN SET @a = 1; END;;\n"
+            "DELIMITER ;\n")
+
+    def test_stmts(self):
+
+        """Function:  test_stmts
+
+        Description:  Test with statements written and counted.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            mysql_clone.write_stmts(
+                ["USE `db1`", "DROP TABLE IF EXISTS `t1`"], self.fhandle), 2)
+        self.assertEqual(
+            self.fhandle.getvalue(),
+            "USE `db1`;\nDROP TABLE IF EXISTS `t1`;\n")
+
+
+if __name__ == "__main__":
+    unittest.main()
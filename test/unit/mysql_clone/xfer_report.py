@@ -0,0 +1,108 @@
+# Classification (U)
+
+"""Program:  xfer_report.py
+
+    Description:  Unit testing of xfer_report in mysql_clone.py.
+
+    Usage:
+        test/unit/mysql_clone/xfer_report.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_clone                              # pylint:disable=E0401,C0413
+import lib.gen_libs as gen_libs             # pylint:disable=E0401,C0413,R0402
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_no_bytes_sent
+        test_not_counted
+        test_report
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.start = 100.0
+
+    @mock.patch("mysql_clone.time.time", mock.Mock(return_value=100.0))
+    def test_no_bytes_sent(self):
+
+        """Function:  test_no_bytes_sent
+
+        Description:  Test with no bytes measured for the dump sessions.
+
+        Arguments:
+
+        """
+
+        with gen_libs.no_std_out():
+            stats = mysql_clone.xfer_report(self.start, 8000, 0)
+
+        self.assertEqual(stats["sent"], 1)
+        self.assertEqual(stats["secs"], 0.001)
+
+    @mock.patch("mysql_clone.time.time", mock.Mock(return_value=104.0))
+    def test_not_counted(self):
+
+        """Function:  test_not_counted
+
+        Description:  Test with the bytes of the dump streams not counted.
+
+        Arguments:
+
+        """
+
+        with gen_libs.no_std_out():
+            stats = mysql_clone.xfer_report(self.start, 0, 2000)
+
+        self.assertIsNone(stats["ratio"])
+
+    @mock.patch("mysql_clone.time.time", mock.Mock(return_value=104.0))
+    def test_report(self):
+
+        """Function:  test_report
+
+        Description:  Test with the compression ratio and throughput.
+
+        Arguments:
+
+        """
+
+        with gen_libs.no_std_out():
+            self.assertEqual(
+                mysql_clone.xfer_report(self.start, 8000, 2000),
+                {"dumped": 8000, "sent": 2000, "secs": 4.0, "ratio": 4.0})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,57 @@
+# Classification (U)
+
+"""Program:  xfermeter_init.py
+
+    Description:  Unit testing of XferMeter.__init__ in mysql_clone.py.
+
+    Usage:
+        test/unit/mysql_clone/xfermeter_init.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_clone                              # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        test_default
+
+    """
+
+    def test_default(self):
+
+        """Function:  test_default
+
+        Description:  Test with the default settings.
+
+        Arguments:
+
+        """
+
+        meter = mysql_clone.XferMeter("Server")
+
+        self.assertEqual(meter.server, "Server")
+        self.assertIsNone(meter.base)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,125 @@
+# Classification (U)
+
+"""Program:  xfermeter_sample.py
+
+    Description:  Unit testing of XferMeter.sample in mysql_clone.py.
+
+    Usage:
+        test/unit/mysql_clone/xfermeter_sample.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_clone                              # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class Server():                                         # pylint:disable=R0903
+
+    """Class:  Server
+
+    Description:  Class stub holder for mysql_class.Server class.
+
+    Methods:
+        __init__
+        col_sql
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.cmds = []
+        self.rows = [{"val": 0}]
+
+    def col_sql(self, cmd):
+
+        """Method:  col_sql
+
+        Description:  Method stub holder for mysql_class.Server.col_sql.
+
+        Arguments:
+
+        """
+
+        self.cmds.append(cmd)
+
+        return self.rows
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_no_bytes
+        test_account
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.server = Server()
+        self.meter = mysql_clone.XferMeter(self.server)
+
+    def test_no_bytes(self):
+
+        """Function:  test_no_bytes
+
+        Description:  Test with no bytes sent to the account.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(self.meter.sample(), 0)
+
+    def test_account(self):
+
+        """Function:  test_account
+
+        Description:  Test with the bytes sent to the meter's own account.
+
+        Arguments:
+
+        """
+
+        self.server.rows = [{"val": "1500"}]
+
+        self.assertEqual(self.meter.sample(), 1500)
+        self.assertIn("status_by_account", self.server.cmds[0])
+        self.assertIn("connection_id()", self.server.cmds[0])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,90 @@
+# Classification (U)
+
+"""Program:  xfermeter_start.py
+
+    Description:  Unit testing of XferMeter.start in mysql_clone.py.
+
+    Usage:
+        test/unit/mysql_clone/xfermeter_start.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_clone                              # pylint:disable=E0401,C0413
+import lib.gen_libs as gen_libs             # pylint:disable=E0401,C0413,R0402
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_sample_failed
+        test_start
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.meter = mysql_clone.XferMeter("Server")
+
+    def test_sample_failed(self):
+
+        """Function:  test_sample_failed
+
+        Description:  Test with the first reading failing.
+
+        Arguments:
+
+        """
+
+        self.meter.sample = mock.Mock(side_effect=Exception("Access denied"))
+
+        with gen_libs.no_std_out():
+            self.meter.start()
+
+        self.assertIsNone(self.meter.base)
+
+    def test_start(self):
+
+        """Function:  test_start
+
+        Description:  Test with the reading the bytes are measured from.
+
+        Arguments:
+
+        """
+
+        self.meter.sample = mock.Mock(return_value=500)
+        self.meter.start()
+
+        self.assertEqual(self.meter.base, 500)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,106 @@
+# Classification (U)
+
+"""Program:  xfermeter_stop.py
+
+    Description:  Unit testing of XferMeter.stop in mysql_clone.py.
+
+    Usage:
+        test/unit/mysql_clone/xfermeter_stop.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_clone                              # pylint:disable=E0401,C0413
+import lib.gen_libs as gen_libs             # pylint:disable=E0401,C0413,R0402
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_sample_failed
+        test_not_started
+        test_stop
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.meter = mysql_clone.XferMeter("Server")
+        self.meter.base = 500
+
+    def test_sample_failed(self):
+
+        """Function:  test_sample_failed
+
+        Description:  Test with the last reading failing.
+
+        Arguments:
+
+        """
+
+        self.meter.sample = mock.Mock(side_effect=Exception("Gone away"))
+
+        with gen_libs.no_std_out():
+            self.assertEqual(self.meter.stop(), 0)
+
+    def test_not_started(self):
+
+        """Function:  test_not_started
+
+        Description:  Test with no first reading taken.
+
+        Arguments:
+
+        """
+
+        self.meter.base = None
+        self.meter.sample = mock.Mock(return_value=1500)
+
+        self.assertEqual(self.meter.stop(), 0)
+        self.meter.sample.assert_not_called()
+
+    def test_stop(self):
+
+        """Function:  test_stop
+
+        Description:  Test with the bytes sent since the first reading,
+            including the sessions that have disconnected.
+
+        Arguments:
+
+        """
+
+        self.meter.sample = mock.Mock(return_value=2000)
+
+        self.assertEqual(self.meter.stop(), 1500)
+
+
+if __name__ == "__main__":
+    unittest.main()
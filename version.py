@@ -6,4 +6,4 @@
 
 """
 
-__version__ = "3.1.1"
+__version__ = "3.2.0"